@@ -0,0 +1,136 @@
+from typing import Dict, List, Tuple
+
+from .hair_color import hair_color_addresses
+from .quest_items import quest_item_locations, well_water_id, gate_angles
+from .stats import level_memory_ids
+from .store_info import tech_check_locations, appraisal_items_buy_cost, appraisal_l_armor_buy_cost, key_item_buy_cost, quest_item_buy_cost, store_sanity_buy_cost
+
+#how far the japanese addresses are from the english ones, by the part of RAM they are in
+SAVE_OFFSET = -0xea0 #player, save flags and the current area
+LEVEL_TABLE_OFFSET = -0xea4 #xp and stats needed for each level
+LIMIT_OFFSET = -0xdb0 #limit break levels
+PORTAL_OFFSET = -0xe70 #destination table read when a zone loads
+AREA_OFFSET = 0xa70 #objects of the loaded area
+MINIGAME_OFFSET = 0x200 #steamwood, raft and scroll event code
+PRICE_OFFSET = 0x1d10 #shop prices and hair color
+
+
+class AddressMap:
+    """Named RAM addresses of one language, built once validate_rom knows which version is loaded.
+    Addresses used by a single area handler on entering the area are still written inline"""
+
+    def __init__(self, jp_version: bool):
+        self.jp_version = jp_version
+        jp = int(jp_version)
+        self.save = jp * SAVE_OFFSET #for tables of save addresses such as npc_rescues
+        self.level_table = jp * LEVEL_TABLE_OFFSET #for tables of level stat addresses such as body_stat
+        self.area_objects = jp * AREA_OFFSET #for lists of addresses in the loaded area such as the elevator parts
+
+        #player
+        self.steps = 0x078e7c + self.save #first byte of the player block read every tick
+        self.progression_state = 0x078e80 + self.save
+        self.money = 0x078e8c + self.save
+        self.max_hp = 0x078eb2 + self.save
+        self.hp = 0x078eb4 + self.save
+        self.max_bp = 0x078eb6 + self.save
+        self.bp = 0x078eb8 + self.save
+        self.equipped_lumina = 0x078ec0 + self.save
+
+        #save flags
+        self.save_flags = 0x0ae64a + self.save #scrolls and L armor, first of the flag block 0x0ae64a-0x0ae67a
+        self.legendary_armor = 0x0ae64b + self.save
+        self.minku = 0x0ae650 + self.save
+        self.chests = 0x0ae651 + self.save
+        self.lumina = 0x0ae658 + self.save
+        self.cores = 0x0ae659 + self.save
+        self.logs = 0x0ae65a + self.save
+        self.twinpeak_rock = 0x0ae65b + self.save
+        self.bell = 0x0ae65f + self.save
+        self.guard = 0x0ae666 + self.save
+        self.well_rope = 0x0ae668 + self.save
+        self.bincho = 0x0ae671 + self.save
+        self.main_menu = 0x0b99de + self.save
+        self.current_location = 0x0b9a08 + self.save
+
+        #world state
+        self.save_world = 0x0ba1c2 + self.save #first of the block 0x0ba1c2-0x0ba318
+        self.inventory = 0x0ba1e7 + self.save
+        self.geezer = 0x0ba1f3 + self.save
+        self.toys = 0x0ba21b + self.save
+        self.toy_storage = 0x0ba239 + self.save
+        self.boons = 0x0ba246 + self.save
+        self.manual_progression = 0x0ba247 + self.save
+        self.leno = 0x0ba284 + self.save
+        self.steamwood_status = 0x0ba285 + self.save
+        self.raft_hp = 0x0ba287 + self.save
+        self.rice_ball = 0x0ba202 + self.save
+        self.neatball = 0x0ba213 + self.save
+
+        #xp and stats per level, 16 bytes per level
+        self.body_xp = 0x0638f8 + self.level_table
+        self.body_stat = 0x0638fa + self.level_table
+        self.mind_xp = 0x0638fc + self.level_table
+        self.mind_stat = 0x0638fe + self.level_table
+        self.lumina_xp = 0x063900 + self.level_table
+        self.lumina_stat = 0x063902 + self.level_table
+        self.fusion_xp = 0x063904 + self.level_table
+        self.fusion_stat = 0x063906 + self.level_table
+
+        #limit break
+        self.limit_lvl_8 = 0x02aa98 + jp * LIMIT_OFFSET
+        self.limit_lvl_16 = 0x02aa90 + jp * LIMIT_OFFSET
+        self.limit_lvl_16_state_check = 0x02aa78 + jp * LIMIT_OFFSET
+        self.limit_lvl_22 = 0x02aa80 + jp * LIMIT_OFFSET
+        self.limit_lvl_27 = 0x02aa70 + jp * LIMIT_OFFSET
+        self.limit_lvl_30 = 0x02aa50 + jp * LIMIT_OFFSET
+        self.levels = 0x078ee4 + jp * LIMIT_OFFSET
+
+        #connections
+        self.portal_table = 0x075400 + jp * PORTAL_OFFSET #zone loaded flag followed by the destinations
+        self.portal_states = 0x075422 + jp * PORTAL_OFFSET
+        self.hotelo_entrance = 0x18e096 + jp * 0xe8
+
+        #loaded area
+        self.shop_cursor = 0x115130 + self.area_objects
+        self.shop_state = 0x11514a + self.area_objects
+        self.zoom = 0x12695c + self.area_objects
+        self.musashi_position = 0x126b5e + self.area_objects
+        self.musashi_y = 0x126b66 + self.area_objects
+        #musashi on the elevator, his height, his height again, elevator state and floor, each read from the first or second part
+        self.steamwood_elevator: List[int] = [address + self.area_objects for address in [0x120744, 0x126b62, 0x1206d2, 0x120704, 0x120638, 0x1205c6, 0x1205f8]]
+        self.steamwood_2_elevator: List[int] = [address + self.area_objects for address in [0x120638, 0x126b62, 0x1205c6, 0x1205f8, 0x12052c, 0x1204ba, 0x1204ec]]
+        self.wind_scroll_hole = 0x1206da + self.area_objects
+        self.dialog_pointer = 0x1269f0 + self.area_objects #pointed at shop_dialog to show a row's text
+        self.dialog_shown = 0x1269f4 + self.area_objects
+        self.dialog_state = 0x126a00 + self.area_objects
+        self.shop_dialog = 0x1faae0 #same in both versions
+        self.handle_dialog = [0x19bf90, 0x19c0d4][jp] #steamwood 2 handles
+        self.gizmo_dialog = [0x184360, 0x184424][jp] #scrap depository gondola gizmos
+        self.gizmo_dialog_2 = [0x184450, 0x1844ec][jp]
+        self.bracelet_chest_progression = 0x18570c + jp * MINIGAME_OFFSET
+        self.raft_hp_displayed = 0x17ec48 + jp * MINIGAME_OFFSET
+        self.steamwood_valves = 0x17f6cc + jp * MINIGAME_OFFSET
+        self.steamwood_2_valves = 0x180704 + jp * MINIGAME_OFFSET
+
+        #code patches
+        self.fast_walk = 0x15a7e4 + jp * 0x2a8
+        self.fast_walk_jump = 0x1e + jp * 0xaa #low byte of the jump target written by the fast walk patch
+        self.bp_cap = 0x14bcf8 + jp * 0x2d0
+        self.scroll_cursor = 0x13f430 + jp * 0x344
+        self.minigame_timer = 0x14ae6c + jp * 0x2d0 #steamwood and aqualin timer
+        self.minku_healing = 0x0d1490 + jp * -0xe80
+        self.patch_version = 0x047dc0 + jp * -0xe94 #version of the game patch, three bytes
+
+        #tables
+        self.tech_checks: List[Tuple[int, int, str]] = tech_check_locations[jp]
+        self.level_ids: List[Tuple[int, int, str]] = level_memory_ids[jp]
+        self.quest_items: List[Tuple[int, int, str]] = quest_item_locations[jp]
+        self.well_water: Dict[int, int] = well_water_id[jp]
+        self.gate_angles: Dict[int, List[int]] = gate_angles[jp]
+        self.hair_color: List[int] = [address + jp * PRICE_OFFSET for address in hair_color_addresses]
+        self.appraisal_items_buy_cost: List[int] = [address + jp * PRICE_OFFSET for address in appraisal_items_buy_cost]
+        self.appraisal_l_armor_buy_cost: List[int] = [address + jp * PRICE_OFFSET for address in appraisal_l_armor_buy_cost]
+        self.key_item_buy_cost: List[int] = [address + jp * PRICE_OFFSET for address in key_item_buy_cost]
+        self.quest_item_buy_cost: List[int] = [address + jp * PRICE_OFFSET for address in quest_item_buy_cost]
+        self.store_sanity_buy_cost: List[int] = [address + jp * PRICE_OFFSET for address in store_sanity_buy_cost]
+        self.s_revive_price = 0x10ee64 + jp * PRICE_OFFSET
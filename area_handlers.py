@@ -0,0 +1,38 @@
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+class AreaHandlerRegistry:
+    """Maps an area id to the handlers game_watcher runs when Musashi enters that area.
+    Handlers run in the order they were registered, handlers registered without areas run on every area."""
+
+    def __init__(self):
+        self.registered: List[Tuple[Optional[FrozenSet[int]], Callable]] = []
+        self.table: Dict[int, Tuple[Callable, ...]] = {}
+        self.every_area: Tuple[Callable, ...] = ()
+        self.built = False
+
+    def register(self, areas: Optional[Iterable[int]] = None) -> Callable[[Callable], Callable]:
+        def decorator(handler: Callable) -> Callable:
+            self.registered.append((None if areas is None else frozenset(areas), handler))
+            self.built = False
+            return handler
+        return decorator
+
+    def build(self) -> None:
+        self.every_area = tuple(handler for areas, handler in self.registered if areas is None)
+        area_ids = set()
+        for areas, _ in self.registered:
+            if(areas is not None):
+                area_ids.update(areas)
+        self.table = {area: tuple(handler for areas, handler in self.registered if areas is None or area in areas) for area in area_ids}
+        self.built = True
+
+    def handlers_for(self, area: int) -> Tuple[Callable, ...]:
+        if(not self.built):
+            self.build()
+        return self.table.get(area, self.every_area)
+
+    def areas(self) -> List[int]:
+        if(not self.built):
+            self.build()
+        return sorted(self.table)
@@ -0,0 +1,37 @@
+from typing import Any, Iterable, List, Sequence
+
+
+class SegmentWatch:
+    """Remembers the raw bytes of the game_state segments a stage of game_watcher last ran on.
+    While those bytes and the extra inputs stay the same, and the last run had nothing left to do,
+    running the stage again would give the same result so it can be skipped."""
+
+    def __init__(self, segments: Iterable[int]):
+        self.segments = list(segments)
+        self.last: List[bytes] = []
+        self.extra: Any = None
+        self.settled = False
+        self.ticks = 0
+        self.fast_ticks = 0
+
+    def unchanged(self, game_state: Sequence[memoryview], extra: Any = None) -> bool:
+        self.ticks += 1
+        if(self.settled and extra == self.extra and all(game_state[segment] == last for segment, last in zip(self.segments, self.last))):
+            self.fast_ticks += 1
+            return True
+        self.last = [bytes(game_state[segment]) for segment in self.segments]
+        self.extra = extra
+        self.settled = False
+        return False
+
+    def finish(self, settled: bool) -> None:
+        # a run that sent locations, wrote to RAM or changed client state must be followed by another full run
+        self.settled = settled
+
+    def reset(self) -> None:
+        self.settled = False
+
+    def fast_path_ratio(self) -> float:
+        if(self.ticks == 0):
+            return 0.0
+        return self.fast_ticks / self.ticks
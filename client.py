@@ -5,7 +5,7 @@ A module containing the BizHawkClient base class and metaclass
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Any, ClassVar, List
+from typing import TYPE_CHECKING, Any, ClassVar, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 from worlds.LauncherComponents import Component, SuffixIdentifier, Type, components, launch as launch_component
 
@@ -15,18 +15,33 @@ from .dialog_locations import dialog_location_table, short_text_boxes, castle_di
 #    from .context import BizHawkClientContext
 from .utils import Constants
 from .version import __version__
-from .hair_color import hair_color_addresses, default_hair_color, new_hair_color
+from .hair_color import default_hair_color, new_hair_color
 from .items import npc_ids, item_id_to_name, item_name_to_id, item_name_groups, jp_id_offset
-from .store_info import bakery_locations, store_table, restaurant_pointers, restaurant_pointers_pointers, restaurant_locations, grocery_locations, toy_shop_locations, toy_shop_fix, toy_shop_dialog, toy_shop_dialog_length, tech_fix, tech_check_locations, appraisal_items_buy_cost, appraisal_l_armor_buy_cost, key_item_buy_cost, store_sanity_buy_cost, quest_item_buy_cost
-from .stats import body_xp, mind_xp, lumina_xp, fusion_xp, body_stat, mind_stat, lumina_stat, fusion_stat, level_memory_ids
-from .jp_encoding import jp_encoding
-from .quest_items import quest_item_locations, well_water_id, gate_angles
+from .store_info import bakery_locations, store_table, restaurant_pointers, restaurant_pointers_pointers, restaurant_locations, grocery_locations, toy_shop_locations, toy_shop_fix, toy_shop_dialog, toy_shop_dialog_length, tech_fix
+from .stats import body_xp, mind_xp, lumina_xp, fusion_xp, body_stat, mind_stat, lumina_stat, fusion_stat
+from .jp_text import jp_encoder, STOP, PAD
 from .portals import bfm_portals, BFMConnection
-from .progression_state import calc_completed_progression_state, calc_progression_state, progression_state_table
+from .progression_state import CompletedProgressionTracker, progression_state_table, progression_states_in, progression_states_mask, ProgressionDecisionCache
+from .portal_index import portal_indexes
+from .address_map import AddressMap
+from .destinations import resolve_destination, TOWNS, UPPER_TOWNS
+from .read_plan import ReadPlan
+from .write_buffer import WriteBuffer
+from .polling import PollScheduler, fast_poll_locations
+from .change_detection import SegmentWatch
+from .area_handlers import AreaHandlerRegistry
+from .received_items import ReceivedItemIndex
+from .location_checks import check_location_ids, newly_checked, set_bits, flag_mask, encode_booleans
+from .progression_trace import TraceWriter
+from .debug_trace import DebugTrace, TraceEvent, format_event, COMPLETED, AREA, CONNECTION, DATA
+from .dialog_cache import DialogCache, AreaDialog, scouted_textboxes, TEXTBOX, SHORT_TEXTBOX, BOSS_TEXTBOX, TOYSHOP
+from .shop_dialog import ShopDialog, PURCHASED
+from .portal_plan import PortalPlan, PortalPlanCache, code_patch_writes, PORTAL_TABLE_SIZE, PORTAL_STATES_SIZE
+import asyncio
 import math
 import random
 from NetUtils import ClientStatus, NetworkItem
-from collections import Counter
+from collections import Counter, deque
 import worlds._bizhawk as bizhawk
 from worlds._bizhawk.client import BizHawkClient
 from pathlib import Path
@@ -56,7 +71,45 @@ def cmd_debug_dump(self: "BizHawkClientCommandProcessor") -> None:
     client = ctx.client_handler
     assert isinstance(client, BFMClient)
     
-    logger.info("%s\n%s\n%s\n%s\n%s",client.debug_text[not client.debug_index], client.debug_text[client.debug_index], ctx.slot_data, client.old_game_state, [item_id_to_name[received_item[0] - ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)] for received_item in ctx.items_received])
+    logger.info("Polling phase: %s, every %s seconds", client.poll_scheduler.phase, ctx.watcher_timeout)
+    logger.info("Check decoding skipped on %s of %s ticks (%.0f%%)", client.decode_watch.fast_ticks, client.decode_watch.ticks, client.decode_watch.fast_path_ratio() * 100)
+    logger.info("Progression decisions cached: %s hits, %s misses (%.0f%%), %s invalidations", client.progression_cache.hits, client.progression_cache.misses, client.progression_cache.hit_ratio() * 100, client.progression_cache.invalidations)
+    logger.info("Completed progression recomputed fully %s times, incrementally %s times", client.completed_tracker.full_updates, client.completed_tracker.incremental_updates)
+    logger.info("Portal plans written %s times, unchanged %s times", client.portal_plans.written, client.portal_plans.skipped)
+    logger.info("Dialog rendered %s times on area entry, %s times ahead of it, reused %s times", client.dialog_cache.misses, client.dialog_cache.prerendered, client.dialog_cache.hits)
+    round_trips = list(client.round_trip_history)
+    if(len(round_trips) > 0):
+        logger.info("Emulator round trips per tick: last %s, max %s, average %.2f over %s ticks", round_trips[-1], max(round_trips), sum(round_trips) / len(round_trips), len(round_trips))
+    logger.info("%s\n%s\n%s\n%s","\n".join(client.debug_trace.lines(last=2)), ctx.slot_data, [bytes(segment) for segment in client.old_game_state], [item_id_to_name[received_item[0] - ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)] for received_item in ctx.items_received])
+    path = Utils.user_path("logs", "bfm_debug_trace.jsonl")
+    with open(path, "w") as file:
+        events = client.debug_trace.export(file)
+    logger.info(f"Wrote the last {events} connection trace events to {path}")
+
+def cmd_trace_progression(self: "BizHawkClientCommandProcessor", path = "") -> None:
+    """Record the inputs of every connection recalculation to a file that test/bench_replay can replay, run again to stop"""
+    from CommonClient import logger
+    from worlds._bizhawk.context import BizHawkClientContext
+    if self.ctx.game != "Brave Fencer Musashi":
+        logger.warning("This command can only be used when playing Brave Fencer Musashi.")
+        return
+    if not self.ctx.server or not self.ctx.slot:
+        logger.warning("You must be connected to a server to use this command.")
+        return
+
+    ctx = self.ctx
+    assert isinstance(ctx, BizHawkClientContext)
+    client = ctx.client_handler
+    assert isinstance(client, BFMClient)
+    if client.trace_writer is not None:
+        client.trace_writer.close()
+        logger.info(f"Stopped tracing after {client.trace_writer.ticks} recalculations")
+        client.trace_writer = None
+        return
+    if path == "":
+        path = Utils.user_path("logs", "bfm_progression_trace.jsonl")
+    client.trace_writer = TraceWriter(open(path, "w"), ctx.slot_data)
+    logger.info(f"Tracing connection recalculations to {path}, run /trace_progression again to stop")
 
 def cmd_message_level(self: "BizHawkClientCommandProcessor", status = "") -> None:
     """Change Bizhawk Client Message Level"""
@@ -181,7 +234,22 @@ def cmd_goal(self: "BizHawkClientCommandProcessor") -> None:
 
 
 MAIN_RAM: typing.Final[str] = "MainRAM"
-PLAYER_CURR_HP_MEMORY: typing.Final[int] = 0x078EB4
+
+#client attributes saved at the start of a tick: plain values as they are, containers as shallow copies
+TICK_STATE_VALUES = (bool, int, float, str, bytes, tuple, type(None))
+TICK_STATE_CONTAINERS = (list, set, dict)
+
+#the handlers BFMClient runs when entering an area, registered with the areas they apply to
+area_entry_handlers = AreaHandlerRegistry()
+#areas where quest item sanity removes vanilla quest items, closes gates or writes quest item dialog
+quest_item_areas: List[int] = [0x1010, 0x1052, 0x1077, 0x1094, 0x3022, 0x3029, 0x3047, 0x2057, 0x3034, 0x304b, 0x301e, 0x3020, 0x3014] + list(quest_item_dialog)
+#andi $v0 $s0 0x4000 to andi $v0 $s0 0x09 in each chapter's Conners, (addresses, jp offset)
+conners_bracelet_fix: Dict[int, Tuple[List[int], int]] = {
+    0x2018: ([0x18c630, 0x18c578], 0x258), #chapter 2 Conners
+    0x2059: ([0x1891e0, 0x189298], 0x21c), #chapter 3 Conners
+    0x207e: ([0x189ab8, 0x189b70], 0x21c), #chapter 4 Conners
+    0x209b: ([0x1897b8, 0x189870], 0x21c), #chapter 5 Conners
+}
 
 class BFMClient(BizHawkClient):
     system: ClassVar[str | tuple[str, ...]] = "PSX"
@@ -192,32 +260,26 @@ class BFMClient(BizHawkClient):
 
     patch_suffix: ClassVar[str | tuple[str, ...] | None] = ".apbfm"
     """The file extension(s) this client is meant to open and patch (e.g. ".apz3")"""
-    bincho_checks = [False] * 35
-    minku_checks = [False] * 13
-    chest_checks = [False] * 33
+    check_masks: Dict[str, int] = dict.fromkeys(check_location_ids, 0) #bit i set when location i of the category is checked
     bakery_checks = [False] * 7
     grocery_checks = [False] * 12
     restaurant_checks = [False] * 7
     toy_checks = [False] * 30
     tech_checks = [False] * 7
-    scroll_checks = [False] * 5
-    core_checks = [False] * 4
     quest_item_checks = [False] * 29
-    bp_checks = [False] * 41
-    chest_indices_to_skip = [0, 1, 2, 3, 4, 25]
     bakery_inventory_default = [0xd,0xe,0xf,0x10,0x53]
     bakery_inventory_sanity = [0x3e,0x3e,0x3e,0x3e,0x3e]
     bakery_inventory_expansion = []
     bakery_inventory = []
-    bakery_dialog: List[str] = [] 
+    bakery_dialog: ShopDialog = ShopDialog()
     restaurant_inventory_default = [0x71,0x72,0x73,0x74,0x75,0x76,0x77]
     restaurant_inventory_sanity = [0x40,0x40,0x40,0x40,0x40,0x40,0x40]
     restaurant_inventory = []
-    restaurant_dialog: List[str] = [] 
+    restaurant_dialog: ShopDialog = ShopDialog()
     grocery_inventory_default = [0x04,0x05,0x06,0x0a,0x08,0x09,0x6b]
     grocery_inventory_sanity = [0x42,0x42,0x42,0x42,0x42,0x42,0x42]
     grocery_inventory = []
-    grocery_dialog: List[str] = [] 
+    grocery_dialog: ShopDialog = ShopDialog()
     toy_inventory = [False] * 30
     toy_dialog: List[bytearray] = [bytearray()] * 30 
     tech_dialog: List[bytearray] = [bytearray()] * 7 
@@ -225,19 +287,20 @@ class BFMClient(BizHawkClient):
     found_wind_scroll = False
     progression_state = 0
     received_count = 0
+    tick_state: Dict[str, Any] = {} #attributes as they were at the start of the tick, put back if its writes are dropped
+    tick_state_kept: ClassVar[FrozenSet[str]] = frozenset({"tick_state", "tick_round_trips", "Commands_Dict"}) #never put back
+    tick_state_names: ClassVar[Optional[FrozenSet[str]]] = None #class attributes holding values saved with the tick state
     old_location = 0
     old_step_count = 0
     level_transition = 0
     request_hints = 0
     hair_color_updated = 0
     has_died = 0
-    death_link_timer = 240
+    death_link_timer: float = 60 #seconds
     previous_death_link: float = 0
     legendary_armor = [False] * 7
     curr_inventory = [0] * 12
-    counter_for_delayed_check = 0
     check_for_logs = 0
-    list_of_received_items: List[int] = []
     check_if_lumina_was_found = 1
     check_if_lumina_needs_removed = 1
     cursor_pos = 0
@@ -256,10 +319,12 @@ class BFMClient(BizHawkClient):
     raft_hp = 4
     elevator_active = True
     jp_version = False
+    address: AddressMap = AddressMap(False)
     table_ids_to_hint = []
     deathlink = -1
     num_bosses_killed = -1
     completed_progression: set[int] = set()
+    completed_progression_mask = 0
     manually_checked_progression: set[int] = set()
     manually_checked_progression_states: List[int] = [0xd2, 0x136, 0x186, 0x280, 0x294, 0x2b2, 0x2bc, 0x2c6, 0x2e4, 0x3ac, 0x3b6, 0x3c0, 0x47e, 0x488, 0x492]
     save_manual_progression = False
@@ -269,20 +334,31 @@ class BFMClient(BizHawkClient):
     chapter4_items = []
     chapter5_items = []
     message_level = 2
-    debug_text: List[str] = ["", ""]
-    debug_index = 0
+    debug_trace: DebugTrace = DebugTrace()
     old_game_state = []
     messagequeue = []
-    messagetimer = 0
     musashi_old_floor = 1
     old_closest_gizmo = 0
     last_displayed_hint: str = ""
     hint_dictionary: Dict[int, str] = {}
+    read_plan: ReadPlan = ReadPlan()
+    write_buffer: WriteBuffer = WriteBuffer()
+    poll_scheduler: PollScheduler = PollScheduler()
+    decode_watch: SegmentWatch = SegmentWatch(range(1, 25)) #check decoding reads the save segments 1-24
+    tick_round_trips = 0
+    round_trip_history: Deque[int] = deque(maxlen=240)
+    received_items: ReceivedItemIndex = ReceivedItemIndex()
+    progression_cache: ProgressionDecisionCache = ProgressionDecisionCache()
+    completed_tracker: CompletedProgressionTracker = CompletedProgressionTracker()
+    trace_writer: Optional[TraceWriter] = None
+    portal_plans: PortalPlanCache = PortalPlanCache()
+    dialog_cache: DialogCache = DialogCache()
     Commands_Dict = {
         "deathlink": "cmd_deathlink",
         "message_level": "cmd_message_level",
         "debug_dump": "cmd_debug_dump",
         "goal": "cmd_goal",
+        "trace_progression": "cmd_trace_progression",
     }
 
 
@@ -298,6 +374,7 @@ class BFMClient(BizHawkClient):
         bfm_identifier_ram_address: int = 0x00ba94
 
         self.jp_version = False
+        self.address = AddressMap(self.jp_version)
         # = SLUS-00726MUSASHI in ASCII, code taken from AP Forbidden Memories
         bytes_expected: bytes = bytes.fromhex("534C55532D30303732364D555341534849")
         Commands_List = list(self.Commands_Dict.keys())
@@ -363,6 +440,7 @@ class BFMClient(BizHawkClient):
                                                                         ctx.command_processor.commands.pop(command)
                                                                 return False
                                                         self.jp_version = True
+                                                        self.address = AddressMap(self.jp_version)
                                                         logger.info("JP Version Detected")
         except Exception:
             for command in Commands_List:
@@ -391,12 +469,134 @@ class BFMClient(BizHawkClient):
         """sets player HP to 0"""
         # # Player HP at 078EB4 2 Bytes MAINRAM
         #     await bizhawk.write
-        await bizhawk.write(
-            ctx.bizhawk_ctx,
-            [(PLAYER_CURR_HP_MEMORY + (self.jp_version * -0xea0), (0).to_bytes(2, "little"), MAIN_RAM)]
+        await self.write_ram(
+            ctx,
+            [(self.address.hp, (0).to_bytes(2, "little"), MAIN_RAM)]
         )
         return
 
+    async def read_ram(self, ctx: "BizHawkClientContext", reads: List[Tuple[int, int, str]]) -> List[bytes]:
+        """bizhawk.read that is answered from this tick's read plan when every range was planned,
+        otherwise it goes to the emulator and counts as a round trip. Writes still waiting in the
+        write buffer are applied on top so read-modify-write sequences see their own changes"""
+        planned = [self.read_plan.lookup(address, size) for address, size, domain in reads if domain == MAIN_RAM]
+        if(len(planned) == len(reads) and all(view is not None for view in planned)):
+            data = [bytes(view) for view in planned]
+        else:
+            self.tick_round_trips += 1
+            data = await bizhawk.read(ctx.bizhawk_ctx, reads)
+        if(len(self.write_buffer) > 0):
+            data = [self.write_buffer.overlay(address, block) if domain == MAIN_RAM else block for (address, _, domain), block in zip(reads, data)]
+        return data
+
+    async def write_ram(self, ctx: "BizHawkClientContext", writes: List[Tuple[int, Any, str]]) -> None:
+        """Queues writes in the write buffer, they are sent together by flush_writes at the end of the tick"""
+        for address, data, domain in writes:
+            if(domain == MAIN_RAM):
+                self.write_buffer.enqueue(address, data)
+            else:
+                self.tick_round_trips += 1
+                await bizhawk.write(ctx.bizhawk_ctx, [(address, data, domain)])
+
+    async def write_area_dialog(self, ctx: "BizHawkClientContext", dialog: AreaDialog) -> None:
+        """Every textbox of the area in one write_ram"""
+        from CommonClient import logger
+        if(len(dialog.cut) > 0 and self.message_level > 0):
+            logger.info("dialog too long for its textbox was cut at %s", [hex(address) for address in dialog.cut])
+        if(len(dialog) > 0):
+            await self.write_ram(ctx, dialog.writes)
+
+    def save_tick_state(self) -> None:
+        """Remembers the plain values and copies of the lists, sets and dicts of the client. The handlers change them
+        along with queueing writes, so a tick whose writes are dropped is put back as if it never ran"""
+        if(self.tick_state_names is None):
+            type(self).tick_state_names = frozenset(name for name, value in vars(type(self)).items()
+                if not name.startswith("__") and isinstance(value, TICK_STATE_VALUES + TICK_STATE_CONTAINERS))
+        self.tick_state = {}
+        for name in (self.tick_state_names | vars(self).keys()) - self.tick_state_kept:
+            value = getattr(self, name)
+            if(isinstance(value, TICK_STATE_VALUES)):
+                self.tick_state[name] = value
+            elif(isinstance(value, TICK_STATE_CONTAINERS)):
+                self.tick_state[name] = value.copy()
+
+    def restore_tick_state(self) -> None:
+        """Puts back the attributes saved at the start of the tick, the next tick makes the same decisions and queues the
+        same writes again"""
+        for name, value in self.tick_state.items():
+            setattr(self, name, value.copy() if isinstance(value, TICK_STATE_CONTAINERS) else value)
+
+    def keep_tick_state(self, *names: str) -> None:
+        """The attributes record something already sent to the server this tick, a dropped tick leaves them as they are"""
+        for name in names:
+            self.tick_state.pop(name, None)
+
+    async def flush_writes(self, ctx: "BizHawkClientContext") -> None:
+        if(len(self.write_buffer) > 0):
+            writes = self.write_buffer.pending()
+            self.write_buffer.clear()
+            self.tick_round_trips += 1
+            await bizhawk.write(ctx.bizhawk_ctx, writes)
+
+    def plan_tick_reads(self, ctx: "BizHawkClientContext") -> ReadPlan:
+        """Declares every range the handlers need this tick. Keys 0-29 are the game_state segments, area specific
+        ranges are declared for the area of the previous tick since the current one is not known yet"""
+        plan = ReadPlan()
+        #the save area is read as contiguous blocks, the game_state segments are slices of them and
+        #single byte reads such as lumina 0x0ae658, guard 0x0ae666, cores 0x0ae659, raft hp 0x0ba287, npc flags,
+        #boons 0x0ba246 and the toy bytes are answered from them without another round trip
+        plan.add("save_flags", self.address.save_flags, 0x30) #0x0ae64a-0x0ae67a
+        plan.add("save_world", self.address.save_world, 0x156) #0x0ba1c2-0x0ba318
+        plan.add("player", self.address.steps, 0x81) #steps, progression state, hp, bp, levels, equipped lumina
+        plan.add("area", self.address.main_menu, 0x2c) #main menu check and current location
+
+        plan.add(0, self.address.main_menu, 1) #is in main menu
+        plan.add(1, self.address.bincho, 9) #bincho sanity
+        plan.add(2, self.address.minku, 2) #minku sanity
+        plan.add(3, self.address.chests, 5) #chest sanity
+        plan.add(4, self.address.toys, 43) #toy sanity
+        plan.add_segments(5, self.address.tech_checks)
+        plan.add_segments(12, self.address.level_ids)
+        plan.add_segments(16, self.address.quest_items)
+        plan.add(25, self.address.current_location, 2) #current location
+        plan.add(26, self.address.save_flags, 3) #Scrolls and LArmor
+        plan.add(27, self.address.geezer, 1) #Geezer
+        plan.add(28, self.address.steamwood_status, 1) #Steamwood Status
+        plan.add(29, self.address.portal_table, 1) #Zone Loaded
+        plan.add("portal_table", self.address.portal_table, PORTAL_TABLE_SIZE + PORTAL_STATES_SIZE) #destinations and their progression states
+        for address, data in self.code_patches(ctx):
+            plan.add(("code_patch", address), address, len(data))
+
+        if(self.hair_color_updated == 0):
+            plan.add("hair_color", self.address.hair_color[0], 3)
+
+        area = self.old_location
+        if(area == 0x300b): #running from boulder
+            plan.add("zoom", self.address.zoom, 2)
+        if(area == 0x301d): #steamwood elevator
+            for address in self.address.steamwood_elevator:
+                plan.add(("elevator", address), address, 2)
+        if(area == 0x3020): #steamwood 2 elevator
+            for address in self.address.steamwood_2_elevator:
+                plan.add(("elevator", address), address, 2)
+        if(area == 0x302a): #rafting minigame
+            plan.add("raft_hp_displayed", self.address.raft_hp_displayed, 1)
+        if(area == 0x304b): #gizmo hunt in the scrap depository
+            plan.add("musashi_position", self.address.musashi_position, 10)
+        if(area in bakery_locations or area in restaurant_locations or area in grocery_locations): #shop cursor
+            plan.add("shop_cursor", self.address.shop_cursor, 0x1b)
+        return plan
+
+    def code_patches(self, ctx: "BizHawkClientContext") -> List[Tuple[int, bytes]]:
+        """Patches to the game code written with the connections, they stay until the emulator loads another image"""
+        patches = []
+        if(ctx.slot_data["fast_walk"] == True):
+            patches.append((self.address.fast_walk, bytes([0xa0, 0xff, 0x03, 0x3c, 0x2c, 0x00, 0x23, 0xae, self.address.fast_walk_jump, 0x6a, 0x05, 0x08, 0x00, 0x00, 0x00, 0x00]))) #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09 #jmp c8 6a 05 08 for jp version JP 8015ab20
+        if(ctx.slot_data["bp_sanity"] == True):
+            patches.append((self.address.bp_cap, bytes([0x0, 0x0, 0x0]))) #noop the max bp calc 21 10 45 00	addu $v0, $a1
+        patches.append((self.address.scroll_cursor, bytes([0x06, 0x01, 0x02, 0x24]))) #fix scroll cursor
+        return patches
+
     async def set_auth(self, ctx: "BizHawkClientContext") -> None:
         """Should set ctx.auth in anticipation of sending a `Connected` packet. You may override this if you store slot
         name in your patched ROM. If ctx.auth is not set after calling, the player will be prompted to enter their
@@ -408,24 +608,19 @@ class BFMClient(BizHawkClient):
         to have passed your validator when this function is called, and the emulator is very likely to be connected."""
         if ctx.server is None or ctx.server.socket.closed or ctx.slot_data is None:
             return
+        self.tick_round_trips = 0
+        self.write_buffer.clear()
+        self.save_tick_state()
+        self.poll_scheduler.start_tick()
+        self.debug_trace.start_tick()
         try:
             check_game_state: bytes = bytes.fromhex("0b")
             #game_state: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
             #    0x0b99de + (self.jp_version * -0xea0) , 1, MAIN_RAM
             #)]))[0]
-            game_state: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [
-                (0x0b99de + (self.jp_version * -0xea0), 1, MAIN_RAM), #is in main menu
-                (0x0ae671 + (self.jp_version * -0xea0), 9, MAIN_RAM), #bincho sanity
-                (0x0ae650 + (self.jp_version * -0xea0), 2, MAIN_RAM), #minku sanity
-                (0x0ae651 + (self.jp_version * -0xea0), 5, MAIN_RAM), #chest sanity
-                (0x0ba21b + (self.jp_version * -0xea0), 43, MAIN_RAM), #toy sanity
-            ] + tech_check_locations[self.jp_version] + level_memory_ids[self.jp_version] + quest_item_locations[self.jp_version] +
-            [(0x0b9a08 + (self.jp_version * -0xea0), 2, MAIN_RAM),#25 current location
-            (0x0ae64a + (self.jp_version * -0xea0), 3, MAIN_RAM), #26 Scrolls and LArmor
-            (0x0ba1f3 + (self.jp_version * -0xea0), 1, MAIN_RAM), #27 Geezer   
-            (0x0ba285 + (self.jp_version * -0xea0), 1, MAIN_RAM), #28 Steamwood Status
-            (0x075400 + (self.jp_version * -0xe70), 1, MAIN_RAM)] #29 Zone Loaded   
-            ))
+            self.read_plan = self.plan_tick_reads(ctx)
+            await self.read_plan.execute(lambda reads: self.read_ram(ctx, reads))
+            game_state: List[memoryview] = [self.read_plan.get(i) for i in range(30)]
             if check_game_state != game_state[0]:
                 self.received_count = 0
                 self.hair_color_updated = 0
@@ -434,12 +629,17 @@ class BFMClient(BizHawkClient):
                 self.max_hp_updated = False
                 self.xp_gain_updated = False
                 self.num_bosses_killed = -1
+                self.decode_watch.reset()
+                self.completed_tracker.reset()
+                self.portal_plans.reset()
+                ctx.watcher_timeout = self.poll_scheduler.next_interval(in_menu=True)
                 return
             self.old_game_state = game_state
             #global bincho_checks
             from CommonClient import logger
             #logger.info("data dump %s", game_state)
-            received_list: List[int] = [received_item[0] - ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) for received_item in ctx.items_received]
+            self.received_items.sync(ctx.items_received, (ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+            received_list: ReceivedItemIndex = self.received_items
 
 
             curr_location_data: bytes = game_state[25]
@@ -459,198 +659,28 @@ class BFMClient(BizHawkClient):
                             self.save_manual_progression = True
             if(game_state[29][0] == 0b1 or (old_progression_state != self.progression_state and self.level_transition == 0) or self.try_to_update_connections == True):
                 self.try_to_update_connections = False
-                self.completed_progression = calc_completed_progression_state(ctx, game_state)
-                self.completed_progression.update(self.manually_checked_progression)
-                s = "caclulating completed progression : %s" % list(map(hex,sorted(self.completed_progression)))
-                if(self.message_level == 3):
-                    logger.info(s)
-                destinations = []
-                progression_states = []#[0,0]
-                fix_town_id = []
-                if(curr_location in bfm_portals):
-                    connection_data = bfm_portals[curr_location]
-                    #logger.info("len %s", len(connection_data.connections))
-                    s = s + ("\nconnections %s" % (connection_data,))
-                    if(self.message_level == 3):
-                        logger.info("connections %s", connection_data)
-                    for connection in connection_data.connections:
-                        #logger.info("con %s", connection)
-                        dest = connection.destination
-                        if(dest in bfm_portals):
-                            calc_progression, hint_text = calc_progression_state(ctx, dest, self.progression_state, game_state, self.completed_progression, received_list)
-                            if(curr_location in [0x3069, 0x3075] or connection_data.is_cutscene == True): #Chapter 4 town on fire, queen ant, thirstquencher cutscenes
-                                calc_progression = 0
-                            if(curr_location == 0x3021 and dest == 0x3003):
-                                calc_progression = 0
-                            if(curr_location in [0x2018, 0x2059, 0x207e, 0x209b]): #in conners
-                                if(self.progression_state == 0x64): #appraised Bracelet
-                                    calc_progression = 0
-                                elif(self.progression_state == 0x181 and (ctx.slot_data["playthrough_method"] == 2 or game_state[17][13] & 0b1000 == 0b1000)): #appraised ugly belt
-                                    calc_progression = 0
-                            if(curr_location == 0x3051): #church fight
-                                calc_progression = 0
-                            if(curr_location == 0x2057 and self.progression_state in [0x118, 0x122]):#orange cutscene
-                                calc_progression = 0
-                            if(curr_location == 0x3029 and dest == 0x302c): #twinpeak second peak
-                                #await self.update_progression(ctx)
-                                if(self.progression_state == 0xf0 or calc_progression == 0xf0): #about to meet Hotelo at twinpeak
-                                    fix_town_id = fix_town_id + [(0x18e096 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)] #change entrance from 1 to 0 to prevent softlock
-                                    if(self.message_level > 0):
-                                        logger.info("applied shortcut to hotelo softlock fix")
-                            if(dest in [0x1010, 0x1052, 0x1077, 0x1094]): #town
-                                if(calc_progression == 0):
-                                    if(self.progression_state < 0xc8):
-                                        dest = 0x1010
-                                    elif(self.progression_state < 0x258):
-                                        dest = 0x1052
-                                    elif(self.progression_state < 0x398):
-                                        dest = 0x1077
-                                    else:
-                                        dest = 0x1094
-                                elif(calc_progression < 0xc8):
-                                    dest = 0x1010
-                                elif(calc_progression < 0x258):
-                                    dest = 0x1052
-                                elif(calc_progression < 0x398):
-                                    dest = 0x1077
-                                else:
-                                    dest = 0x1094
-                            if(dest in [0x1011, 0x1053, 0x1078, 0x1095]): #upper town
-                                if(calc_progression == 0):
-                                    if(self.progression_state < 0xc8):
-                                        dest = 0x1011
-                                    elif(self.progression_state < 0x258):
-                                        dest = 0x1053
-                                    elif(self.progression_state < 0x398):
-                                        dest = 0x1078
-                                    else:
-                                        dest = 0x1095
-                                elif(calc_progression < 0xc8):
-                                    dest = 0x1011
-                                elif(calc_progression < 0x258):
-                                    dest = 0x1053
-                                elif(calc_progression < 0x398):
-                                    dest = 0x1078
-                                else:
-                                    dest = 0x1095
-                            if(dest == 0x3034 and curr_location in [0x201a, 0x205b, 0x2080, 0x209d] and not (game_state[17][14] & 0b100000 == 0b100000 or game_state[17][14] & 0b1000000 == 0b1000000)): #basement lobby
-                                dest = 0x3000
-                            if(dest == 0x3043 and curr_location in [0x1010, 0x1052, 0x1077, 0x1094]):#town to Mine
-                                if(ctx.slot_data["quest_item_sanity"] == True and not item_name_to_id["Key"] in received_list):
-                                    dest = 0x3000
-                            if(dest == 0x304e and curr_location in [0x1010, 0x1052, 0x1077, 0x1094]):#town to Well
-                                if(ctx.slot_data["quest_item_sanity"] == True and not item_name_to_id["Rope"] in received_list or game_state[17][6] & 0b1 == 0b1):
-                                    dest = 0x3000
-                                    fix_town_id = fix_town_id + [(connection.memory + 0x2 + (self.jp_version * connection_data.jp_offset), [0], MAIN_RAM)] #change door
-                            #if(dest in [0x207b, 0x2098] and self.num_bosses_killed <2): #bakery chapter 4, 5/6
-                            #    dest = 0x2056
-                            #if(dest in [0x207c, 0x2099] and self.num_bosses_killed <2): #grocery chapter 4, 5/6
-                            #    dest = 0x2057
-                            if(dest in [0x2080, 0x209d] and not (game_state[17][14] & 0b100000 == 0b100000 or game_state[17][14] & 0b1000000 == 0b1000000)): #restaurant chapter 4, 5/6
-                                dest = 0x201a
-                            if(dest != connection.destination or dest in [0x3034, 0x3043, 0x304e] or (curr_location in [0x1011, 0x1053, 0x1078, 0x1095] and dest in [0x1010, 0x1052, 0x1077, 0x1094])):
-                                fix_town_id = fix_town_id + [(connection.memory + (self.jp_version * connection_data.jp_offset), dest.to_bytes(2, 'little'), MAIN_RAM)]
-                            if(len(hint_text) > 0):
-                                #logger.info("destination %x, hint_text %s", dest, hint_text)
-                                self.hint_dictionary[dest] = hint_text
-                            if((dest + 1 & 0xff) in destinations):
-                                continue
-                            destinations = destinations + [(dest + 1) & 0xff] #need to offset by 1 due to 0x3000
-                            calc_array = calc_progression.to_bytes(2, 'little')
-                            progression_states = progression_states + [calc_array[0], calc_array[1]]#[calc_progression & 0xff, calc_progression >> 8]
-                            
-                            s = s + "\nconnection : %s : name : %s" % (hex(dest), bfm_portals[dest].region)
-                            if(self.message_level == 3):
-                                logger.info("connection : %s : name : %s", hex(dest), bfm_portals[dest].region)
-
-                            if(calc_progression == 0):
-                                s = s + "\nno change to game state"
-                                if(self.message_level == 3):
-                                    logger.info("no change to game state")
-                                calc_progression = self.progression_state
-                            if(calc_progression in progression_state_table):
-                                s = s + "\ngame state : %s : name : %s" % (hex(calc_progression), progression_state_table[calc_progression])
-                                if(self.message_level == 3):
-                                    logger.info("game state : %s : name : %s", hex(calc_progression), progression_state_table[calc_progression])
-                            else:
-                                s = s + "\ngame state : %s " % hex(calc_progression)
-                                if(self.message_level == 3):
-                                    logger.info("game state : %s ", hex(calc_progression))
-                    if(self.save_manual_progression == True):
-                        self.save_manual_progression = False
-                        if(self.message_level == 3):
-                            logger.info("saving manually checked progression : %s", list(map(hex,sorted(self.manually_checked_progression))))
-                        vals = sum([(1 << i) * (val in self.manually_checked_progression) for i, val in enumerate(self.manually_checked_progression_states)])
-                        fix_town_id = fix_town_id + [(0x0ba247 + (self.jp_version * -0xea0), vals.to_bytes(2, 'little'), MAIN_RAM)]
-                        if(self.message_level == 3):
-                            logger.info("recording manual prog to RAM %s", vals.to_bytes(2, 'little'))
-                    s = s + "\ndata: %s : %s : %s" % (destinations, progression_states, fix_town_id)
-                    if(self.message_level == 3):
-                        logger.info("data: %s : %s : %s", destinations, progression_states, fix_town_id)
-                if(ctx.slot_data["fast_walk"] == True):
-                    fix_town_id = fix_town_id + [(0x15a7e4 + (self.jp_version * 0x2a8), [0xa0, 0xff, 0x03, 0x3c, 0x2c, 0x00, 0x23, 0xae, 0x1e + (self.jp_version * 0xaa), 0x6a, 0x05, 0x08, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09 #jmp c8 6a 05 08 for jp version JP 8015ab20
-                
-                if(ctx.slot_data["bp_sanity"] == True):
-                    fix_town_id = fix_town_id + [(0x14bcf8 + (self.jp_version * 0x2d0), [0x0, 0x0, 0x0], MAIN_RAM)] #noop the max bp calc 21 10 45 00	addu $v0, $a1
-                
-                fix_town_id = fix_town_id + [(0x13f430 + (self.jp_version * 0x344), [0x06, 0x01, 0x02, 0x24], MAIN_RAM)] #fix scroll cursor
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    [(0x075400 + (self.jp_version * -0xe70), [2] + destinations + [0], MAIN_RAM),
-                    (0x075422 + (self.jp_version * -0xe70), progression_states, MAIN_RAM)] + fix_town_id
+                if(self.trace_writer is not None):
+                    self.trace_writer.record(curr_location, self.progression_state, game_state, [received_item[0] for received_item in ctx.items_received], ctx.checked_locations, self.manually_checked_progression)
+                destinations, progression_states, fix_town_id = self.calc_connections(ctx, curr_location, game_state, received_list)
+                portal_plan = PortalPlan(curr_location, bytes([2] + destinations + [0]), bytes(progression_states), tuple((address, bytes(data)) for address, data, _ in fix_town_id))
+                patches = self.code_patches(ctx)
+                await self.write_ram(
+                    ctx,
+                    self.portal_plans.writes(portal_plan, self.address.portal_table, self.address.portal_states, self.read_plan.get("portal_table"), game_state[29][0] == 0b1)
+                    + code_patch_writes(patches, [self.read_plan.get(("code_patch", address)) for address, _ in patches])
                 )
 
-                self.debug_text[self.debug_index] = s
-                self.debug_index = not self.debug_index
 
 
-
-            save_data: bytes = game_state[1]
-            #save_data: bytes = (await bizhawk.read(
-            #    ctx.bizhawk_ctx,
-            #    [(0x0ae671 + (self.jp_version * -0xea0), 9, MAIN_RAM)] #jp version 0x0ad7d1
-            #))[0]
-            holdint = [save_data[0],save_data[1],save_data[2],save_data[3]]
-            new_bincho_checks = self.decode_booleans(int.from_bytes(holdint, byteorder='little'), 32)
-            #logger.info("What was read 0 in 0aae671 %s",self.bincho_checks)
-            holdint = [save_data[4],save_data[5]]
-            new_bincho_checks.extend(self.decode_booleans(int.from_bytes(holdint, byteorder='little'), 3))
-            if(ctx.slot_data["bakery_sanity"] == True):
-                new_bakery_checks = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 10, [0,1,2])
-            else:
-                new_bakery_checks = self.bakery_checks
-            if(ctx.slot_data["restaurant_sanity"] == True):
-                holdint = [save_data[5],save_data[6]]
-                new_restaurant_checks = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 9, [0,1])
-            else:
-                new_restaurant_checks = self.restaurant_checks
-            if(ctx.slot_data["grocery_sanity"] == True):
-                holdint = [save_data[6],save_data[7]]
-                new_grocery_checks = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 13, [0])
-            else:
-                new_grocery_checks = self.grocery_checks
-            holdint = [save_data[7],save_data[8]]
-            new_scroll_checks = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 10, [0,1,2,3,4])
-            save_data = game_state[2]
-            #save_data = (await bizhawk.read(
-            #    ctx.bizhawk_ctx,
-            #    [(0x0ae650 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
-            #))[0]
-            holdint = [save_data[0],save_data[1]]
-            new_minku_checks = self.decode_booleans(int.from_bytes(holdint, byteorder='little'), 13)
-            
-            save_data = game_state[3]
-            #save_data: bytes = (await bizhawk.read(
-            #    ctx.bizhawk_ctx,
-            #    [(0x0ae651 + (self.jp_version * -0xea0), 5, MAIN_RAM)]
-            #))[0]
-            holdint = [save_data[0],save_data[1],save_data[2],save_data[3]]
-            new_chest_checks = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 32, self.chest_indices_to_skip)
-            #logger.info("What was read 0 in 0aae671 %s",self.bincho_checks)
-            holdint = [save_data[4]]
-            new_chest_checks.extend(self.decode_booleans(int.from_bytes(holdint, byteorder='little'), 7))
+            decode_inputs = (self.progression_state, curr_location, len(ctx.items_received))
+            skip_decode = self.decode_watch.unchanged(game_state, decode_inputs)
+            writes_before_decode = self.write_buffer.writes
+            toy_inventory_before_decode = self.toy_inventory
 
             save_data_toys: bytes = bytes()
+            new_masks: Dict[str, int] = self.check_masks.copy() #categories that are not decoded keep their old mask
+            new_toy_purchased_awaiting: List[bool] = [False] * 30
+            new_toy_in_storage: List[bool] = [False] * 30
             if(ctx.slot_data["toy_sanity"] == True or ctx.slot_data["core_sanity"] == True or ctx.slot_data["goal"] > 2):
                 save_data_toys = game_state[4]
             #    save_data_toys = (await bizhawk.read(
@@ -660,390 +690,373 @@ class BFMClient(BizHawkClient):
 
             if(ctx.slot_data["toy_sanity"] == True):
                 save_data: bytes = save_data_toys[:30]
-                new_toy_checks: List[bool] = [val & 0b10000 == 0b10000 for val in save_data]
+                new_masks["toy"] = flag_mask(save_data, 0b10000)
                 new_toy_inventory: List[bool] = [val & 0b11110000 == 0b10000000 for val in save_data]
-                new_toy_purchased_awaiting: List[bool] = [val & 0b11110000 == 0b10010000 for val in save_data]
-                new_toy_in_storage: List[bool] = [val & 0b01000000 == 0b01000000 for val in save_data]
+                new_toy_purchased_awaiting = [val & 0b11110000 == 0b10010000 for val in save_data]
+                new_toy_in_storage = [val & 0b01000000 == 0b01000000 for val in save_data]
                 new_toy_needs_fixed: List[bool] = [val & 0b11010000 == 0b11000000 for val in save_data]
                 if(True in new_toy_needs_fixed):
                     for i in range(len(new_toy_needs_fixed)):
                         if(new_toy_needs_fixed[i]):
                             toy_data = save_data[i] | 0b10000
                             toy_data = toy_data & 0b10011111
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba21b+i + (self.jp_version * -0xea0), [toy_data], MAIN_RAM)]
+                            await self.write_ram(
+                                ctx,
+                                [(self.address.toys + i, [toy_data], MAIN_RAM)]
                             )
             else:
-                new_toy_checks = self.toy_checks
                 new_toy_inventory = self.toy_inventory
 
             
             save_data: bytes = bytes([save_data_toys[11], save_data_toys[17], save_data_toys[23], save_data_toys[29], save_data_toys[35]])
             if(ctx.slot_data["core_sanity"] == True):
-                new_core_checks: List[bool] = [val & 0b10000000 == 0b10000000 for val in save_data] 
-            else:
-                new_core_checks = self.core_checks
+                new_masks["core"] = flag_mask(save_data, 0b10000000)
             new_num_bosses_killed = sum(val & 0b10000000 == 0b10000000 for val in save_data)
             if(new_num_bosses_killed != self.num_bosses_killed):
                 self.num_bosses_killed = new_num_bosses_killed
                 limit_levels = [8, 16, 22, 27, 30, 30]
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    [(0x02aa90 + (self.jp_version * -0xdb0), [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 16
-                    (0x02aa80 + (self.jp_version * -0xdb0), [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 22
-                    (0x02aa70 + (self.jp_version * -0xdb0), [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 27
-                    (0x02aa78 + (self.jp_version * -0xdb0), [0xa], MAIN_RAM), #limit lvl 16 progression state check, lower to 0xa
-                    (0x02aa50 + (self.jp_version * -0xdb0), [0x4a, 0x6], MAIN_RAM)] #limit lvl 30 (chapter 6 check)
+                await self.write_ram(
+                    ctx,
+                    [(self.address.limit_lvl_16, [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 16
+                    (self.address.limit_lvl_22, [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 22
+                    (self.address.limit_lvl_27, [limit_levels[self.num_bosses_killed]], MAIN_RAM), #limit lvl 27
+                    (self.address.limit_lvl_16_state_check, [0xa], MAIN_RAM), #limit lvl 16 progression state check, lower to 0xa
+                    (self.address.limit_lvl_30, [0x4a, 0x6], MAIN_RAM)] #limit lvl 30 (chapter 6 check)
                 )
 
-            if(ctx.slot_data["tech_sanity"] == True):
-                save_data = game_state[5:12]
-            #    save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, tech_check_locations[self.jp_version]))
-                new_tech_checks: List[bool] = []
-                for i in range(len(save_data)):
-                    new_tech_checks = new_tech_checks + [int.from_bytes(save_data[i], "little")>(2+(i==2))]
-            else:
-                new_tech_checks = self.tech_checks
-
-            if(ctx.slot_data["level_sanity"] == True):
-                save_data = game_state[12:16]
-            #    save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, level_memory_ids[self.jp_version]))
-                new_body_lvl: int = int.from_bytes(save_data[0], byteorder='little')
-                new_mind_lvl: int = int.from_bytes(save_data[1], byteorder='little')
-                new_fus_lvl: int = int.from_bytes(save_data[2], byteorder='little')
-                new_lum_lvl: int = int.from_bytes(save_data[3], byteorder='little')
-            else:
-                new_body_lvl = self.curr_body_lvl
-                new_mind_lvl = self.curr_mind_lvl
-                new_fus_lvl = self.curr_fus_lvl
-                new_lum_lvl = self.curr_lum_lvl
+            if(not skip_decode):
+                save_data: bytes = game_state[1]
+                #save_data: bytes = (await bizhawk.read(
+                #    ctx.bizhawk_ctx,
+                #    [(0x0ae671 + (self.jp_version * -0xea0), 9, MAIN_RAM)] #jp version 0x0ad7d1
+                #))[0]
+                #bytes 4-8 hold bincho bits 32-34, then bakery 3-9, restaurant 10-16, grocery 17-28 and scrolls 29-33
+                shop_bits = int.from_bytes(save_data[4:9], byteorder='little')
+                new_masks["bincho"] = int.from_bytes(save_data[0:4], byteorder='little') | ((shop_bits & 0b111) << 32)
+                if(ctx.slot_data["bakery_sanity"] == True):
+                    new_masks["bakery"] = (shop_bits >> 3) & 0x7f
+                if(ctx.slot_data["restaurant_sanity"] == True):
+                    new_masks["restaurant"] = (shop_bits >> 10) & 0x7f
+                if(ctx.slot_data["grocery_sanity"] == True):
+                    new_masks["grocery"] = (shop_bits >> 17) & 0xfff
+                new_masks["scroll"] = (shop_bits >> 29) & 0x1f
+                save_data = game_state[2]
+                #save_data = (await bizhawk.read(
+                #    ctx.bizhawk_ctx,
+                #    [(0x0ae650 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+                #))[0]
+                new_masks["minku"] = int.from_bytes(save_data[0:2], byteorder='little') & 0x1fff
+            
+                save_data = game_state[3]
+                #save_data: bytes = (await bizhawk.read(
+                #    ctx.bizhawk_ctx,
+                #    [(0x0ae651 + (self.jp_version * -0xea0), 5, MAIN_RAM)]
+                #))[0]
+                chest_bits = int.from_bytes(save_data[0:4], byteorder='little') #bits 0-4 and 25 are not chests
+                new_masks["chest"] = ((chest_bits >> 5) & 0xfffff) | (((chest_bits >> 26) & 0x3f) << 20) | ((save_data[4] & 0x7f) << 26)
 
-            #curr_location_data: bytes = (await bizhawk.read(
-            #    ctx.bizhawk_ctx,
-            #    [(0x0b9a08 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
-            #))[0]
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                #save_data = game_state[17:25]
-                new_quest_item_checks = [False] * 29
-                if(self.quest_item_checks[0] == False): #Well water
-                    well_H20 = 0x4c
-                    if(well_H20 in game_state[19]):
-                        #logger.info("well water found")
-                        new_quest_item_checks[0] = True
-                        if(not item_name_to_id["Well H20"] in received_list):
-                            new_inventory: List[int] = [val * (well_H20 != val) for val in game_state[19]] 
-                            #new_inventory: List[int] = [val for val in save_data[19]] 
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba1e7 + (self.jp_version * -0xea0), new_inventory, MAIN_RAM),
-                                (well_water_id[self.jp_version][curr_location], [0x0], MAIN_RAM)]
-                            )
+                if(ctx.slot_data["tech_sanity"] == True):
+                    save_data = game_state[5:12]
+                #    save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, self.address.tech_checks))
+                    new_masks["tech"] = encode_booleans(int.from_bytes(save_data[i], "little") > (2+(i==2)) for i in range(len(save_data)))
+
+                if(ctx.slot_data["level_sanity"] == True):
+                    save_data = game_state[12:16]
+                #    save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, self.address.level_ids))
+                    new_body_lvl: int = int.from_bytes(save_data[0], byteorder='little')
+                    new_mind_lvl: int = int.from_bytes(save_data[1], byteorder='little')
+                    new_fus_lvl: int = int.from_bytes(save_data[2], byteorder='little')
+                    new_lum_lvl: int = int.from_bytes(save_data[3], byteorder='little')
                 else:
-                    new_quest_item_checks[0] = True
-                #Jon's Key
-                new_quest_item_checks[1] = game_state[17][11] & 0b1000000 == 0b1000000
-                #Logs
-                num_logs = game_state[22].count(0b11)
-                new_quest_item_checks[2] = num_logs > 0
-                new_quest_item_checks[3] = num_logs > 1
-                new_quest_item_checks[4] = num_logs > 2
-                new_quest_item_checks[5] = num_logs > 3
-                #Manual (moved to mayor cutscene)
-                new_quest_item_checks[6] = game_state[17][12] & 0b10000 == 0b10000
-                #Mayor Berry
-                new_quest_item_checks[7] = game_state[17][12] & 0b10000000 == 0b10000000
-                #Key from Wid
-                new_quest_item_checks[8] = self.progression_state == 0xdc and curr_location == 0x1052
-                #new_quest_item_checks[8] = int.from_bytes(game_state[24], byteorder='little') >= 0x47
-                #Misteria
-                new_quest_item_checks[9] = (self.progression_state == 0xe6 and curr_location == 0x3047)
-                #Aqualin
-                new_quest_item_checks[10] = self.progression_state == 0x10e or (game_state[17][14] & 0b10 == 0b10)
-                #save tim/orange
-                new_quest_item_checks[11] = game_state[17][14] & 0b1000 == 0b1000
-                #Ugly Belt
-                new_quest_item_checks[12] = self.progression_state == 0x17c
-                #Rope
-                new_quest_item_checks[13] = game_state[20][0] & 0b10000000 == 0b10000000 and curr_location == 0x1052
-                #Angel Statue
-                new_quest_item_checks[14] = int.from_bytes(game_state[18], byteorder='little') == 0x1052
-                #Pie
-                new_quest_item_checks[15] = self.progression_state == 0x280
-                #Gondola Gizmo
-                gizmo_state = int.from_bytes(game_state[23], byteorder='little')
-                new_quest_item_checks[16] = gizmo_state == 4
-                new_quest_item_checks[17] = gizmo_state == 3
-                new_quest_item_checks[18] = gizmo_state == 2
-                new_quest_item_checks[19] = gizmo_state == 1
-                #Calendar/Rocksalt
-                new_quest_item_checks[20] = self.progression_state == 0x2bc and curr_location == 0x1077 
-                new_quest_item_checks[21] = self.progression_state == 0x2bc and curr_location == 0x1077
-                #Handles
-                new_quest_item_checks[22] = self.progression_state == 0x3ca or (game_state[17][6] & 0b100000 == 0b100000)
-                new_quest_item_checks[23] = game_state[17][6] & 0b1000000 == 0b1000000
-                new_quest_item_checks[24] = game_state[17][6] & 0b10000000 == 0b10000000
-                new_quest_item_checks[25] = game_state[17][7] & 0b1 == 0b1
-                #profits
-                new_quest_item_checks[26] = game_state[21][0] & 0b10000000 == 0b10000000
-                #Musashi's share of the profits
-                new_quest_item_checks[27] = game_state[17][20] & 0b100000 == 0b100000
-                #Jon's Note
-                new_quest_item_checks[28] = game_state[17][22] & 0b1 == 0b1
-            else:
-                new_quest_item_checks = self.quest_item_checks
+                    new_body_lvl = self.curr_body_lvl
+                    new_mind_lvl = self.curr_mind_lvl
+                    new_fus_lvl = self.curr_fus_lvl
+                    new_lum_lvl = self.curr_lum_lvl
+
+                #curr_location_data: bytes = (await bizhawk.read(
+                #    ctx.bizhawk_ctx,
+                #    [(0x0b9a08 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+                #))[0]
+                if(ctx.slot_data["quest_item_sanity"] == True):
+                    #save_data = game_state[17:25]
+                    new_quest_item_checks = [False] * 29
+                    if(self.quest_item_checks[0] == False): #Well water
+                        well_H20 = 0x4c
+                        if(well_H20 in game_state[19]):
+                            #logger.info("well water found")
+                            new_quest_item_checks[0] = True
+                            if(not item_name_to_id["Well H20"] in received_list):
+                                new_inventory: List[int] = [val * (well_H20 != val) for val in game_state[19]] 
+                                #new_inventory: List[int] = [val for val in save_data[19]] 
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.inventory, new_inventory, MAIN_RAM),
+                                    (self.address.well_water[curr_location], [0x0], MAIN_RAM)]
+                                )
+                    else:
+                        new_quest_item_checks[0] = True
+                    #Jon's Key
+                    new_quest_item_checks[1] = game_state[17][11] & 0b1000000 == 0b1000000
+                    #Logs
+                    num_logs = list(game_state[22]).count(0b11)
+                    new_quest_item_checks[2] = num_logs > 0
+                    new_quest_item_checks[3] = num_logs > 1
+                    new_quest_item_checks[4] = num_logs > 2
+                    new_quest_item_checks[5] = num_logs > 3
+                    #Manual (moved to mayor cutscene)
+                    new_quest_item_checks[6] = game_state[17][12] & 0b10000 == 0b10000
+                    #Mayor Berry
+                    new_quest_item_checks[7] = game_state[17][12] & 0b10000000 == 0b10000000
+                    #Key from Wid
+                    new_quest_item_checks[8] = self.progression_state == 0xdc and curr_location == 0x1052
+                    #new_quest_item_checks[8] = int.from_bytes(game_state[24], byteorder='little') >= 0x47
+                    #Misteria
+                    new_quest_item_checks[9] = (self.progression_state == 0xe6 and curr_location == 0x3047)
+                    #Aqualin
+                    new_quest_item_checks[10] = self.progression_state == 0x10e or (game_state[17][14] & 0b10 == 0b10)
+                    #save tim/orange
+                    new_quest_item_checks[11] = game_state[17][14] & 0b1000 == 0b1000
+                    #Ugly Belt
+                    new_quest_item_checks[12] = self.progression_state == 0x17c
+                    #Rope
+                    new_quest_item_checks[13] = game_state[20][0] & 0b10000000 == 0b10000000 and curr_location == 0x1052
+                    #Angel Statue
+                    new_quest_item_checks[14] = int.from_bytes(game_state[18], byteorder='little') == 0x1052
+                    #Pie
+                    new_quest_item_checks[15] = self.progression_state == 0x280
+                    #Gondola Gizmo
+                    gizmo_state = int.from_bytes(game_state[23], byteorder='little')
+                    new_quest_item_checks[16] = gizmo_state == 4
+                    new_quest_item_checks[17] = gizmo_state == 3
+                    new_quest_item_checks[18] = gizmo_state == 2
+                    new_quest_item_checks[19] = gizmo_state == 1
+                    #Calendar/Rocksalt
+                    new_quest_item_checks[20] = self.progression_state == 0x2bc and curr_location == 0x1077 
+                    new_quest_item_checks[21] = self.progression_state == 0x2bc and curr_location == 0x1077
+                    #Handles
+                    new_quest_item_checks[22] = self.progression_state == 0x3ca or (game_state[17][6] & 0b100000 == 0b100000)
+                    new_quest_item_checks[23] = game_state[17][6] & 0b1000000 == 0b1000000
+                    new_quest_item_checks[24] = game_state[17][6] & 0b10000000 == 0b10000000
+                    new_quest_item_checks[25] = game_state[17][7] & 0b1 == 0b1
+                    #profits
+                    new_quest_item_checks[26] = game_state[21][0] & 0b10000000 == 0b10000000
+                    #Musashi's share of the profits
+                    new_quest_item_checks[27] = game_state[17][20] & 0b100000 == 0b100000
+                    #Jon's Note
+                    new_quest_item_checks[28] = game_state[17][22] & 0b1 == 0b1
+                    new_masks["quest"] = encode_booleans(new_quest_item_checks)
 
-            if(ctx.slot_data["bp_sanity"] == True):
-                save_data: bytes = bytes([save_data_toys[11], save_data_toys[17], save_data_toys[23], save_data_toys[29], save_data_toys[35]])
-                new_bp_checks = new_bincho_checks + [val & 0b10000000 == 0b10000000 for val in save_data] + [game_state[17][23] & 0b10000 == 0b10000]
-            else:
-                new_bp_checks = self.bp_checks
-
-            locations_to_send_to_server = []
-            #logger.info("What was read 1 in 0aae671 %s",new_bincho_checks)
-            if(new_bincho_checks != self.bincho_checks):
-                for i in range(len(new_bincho_checks)):
-                    if(new_bincho_checks[i]):
-                        locations_to_send_to_server.append(location_base_id + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                #logger.info("Sending Bincho checks")
-                if(new_bincho_checks[0] == True and self.bincho_checks[0] == False):
-                    #logger.info("Sending Guard bincho check")
-                    self.update_list_of_received_items(ctx)
-                    #logger.info("items receieved %s", self.list_of_received_items)
-                    if(not item_name_to_id["Guard"] in received_list):
-                        save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                            0x0ae666 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                        )]))[0]
-                        guard_state = int.from_bytes(save_data, byteorder='little')
-                        if(guard_state & 0x1 == 0x1):
-                            if(self.message_level > 0):
-                                logger.info("Sending Macho back to Twinpeak")
-                            guard_state = guard_state & 0xfe
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae666 + (self.jp_version * -0xea0), [guard_state], MAIN_RAM)]
-                            )
+                if(ctx.slot_data["bp_sanity"] == True):
+                    save_data: bytes = bytes([save_data_toys[11], save_data_toys[17], save_data_toys[23], save_data_toys[29], save_data_toys[35]])
+                    new_masks["bp"] = new_masks["bincho"] | (flag_mask(save_data, 0b10000000) << 35) | ((game_state[17][23] & 0b10000 == 0b10000) << 40)
+
+                #only the bits that were not set before are sent, the masks are compared instead of bool lists
+                id_offset = (ctx.slot_data["set_lang"] - 1) * jp_id_offset
+                old_masks = self.check_masks
+                locations_to_send_to_server = []
+                #logger.info("What was read 1 in 0aae671 %s",new_masks["bincho"])
+                if(new_masks["bincho"] != old_masks["bincho"]):
+                    locations_to_send_to_server += newly_checked("bincho", old_masks["bincho"], new_masks["bincho"], id_offset)
+                    #logger.info("Sending Bincho checks")
+                    if(new_masks["bincho"] & 0b1 and not old_masks["bincho"] & 0b1):
+                        #logger.info("Sending Guard bincho check")
+                        if(not item_name_to_id["Guard"] in received_list):
+                            save_data: bytes = (await self.read_ram(ctx, [(
+                                self.address.guard, 1, MAIN_RAM
+                            )]))[0]
+                            guard_state = int.from_bytes(save_data, byteorder='little')
+                            if(guard_state & 0x1 == 0x1):
+                                if(self.message_level > 0):
+                                    logger.info("Sending Macho back to Twinpeak")
+                                guard_state = guard_state & 0xfe
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.guard, [guard_state], MAIN_RAM)]
+                                )
+
+                    #logger.info("What was read in 0ae671 %s",save_data)
+                    #logger.info("Trying to send %s",locations_to_send_to_server)
+                    #await ctx.send_msgs([{
+                    #    "cmd": "LocationChecks",
+                    #    "locations": locations_to_send_to_server
+                    #}])
+                #logger.info("items Received %s",ctx.items_received)
 
-                #logger.info("What was read in 0ae671 %s",save_data)
-                #logger.info("Trying to send %s",locations_to_send_to_server)
-                #await ctx.send_msgs([{
-                #    "cmd": "LocationChecks",
-                #    "locations": locations_to_send_to_server
-                #}])
-                #self.bincho_checks = new_bincho_checks
-            #logger.info("items Received %s",ctx.items_received)
-
-            if(new_minku_checks != self.minku_checks):
-                for i in range(len(new_minku_checks)):
-                    if(new_minku_checks[i]):
-                        locations_to_send_to_server.append(location_base_id + i + 35 + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                #logger.info("What was read in 0ae671 %s",save_data)
-                #logger.info("Trying to send %s",locations_to_send_to_server)
-
-            if(new_chest_checks != self.chest_checks):
-                for i in range(len(new_chest_checks)):
-                    if(new_chest_checks[i]):
-                        locations_to_send_to_server.append(location_base_id + i + 48 + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(new_masks["minku"] != old_masks["minku"]):
+                    locations_to_send_to_server += newly_checked("minku", old_masks["minku"], new_masks["minku"], id_offset)
+                    #logger.info("Trying to send %s",locations_to_send_to_server)
+
+                if(new_masks["chest"] != old_masks["chest"]):
+                    locations_to_send_to_server += newly_checked("chest", old_masks["chest"], new_masks["chest"], id_offset)
             
-            if(new_bakery_checks != self.bakery_checks):
-                #logger.info("bakery checks %s", new_bakery_checks)
-                for i in range(len(new_bakery_checks)):
-                    if(new_bakery_checks[i]):
-                        locations_to_send_to_server.append(location_base_id + i + 82 + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                        if(i*2 < len(self.bakery_dialog)):
-                            if(not "Purchased" in self.bakery_dialog[i*2] and not "かいもの" in self.bakery_dialog[i*2]):
-                                if(self.jp_version == False):
-                                    self.bakery_dialog[i*2] = "Purchased"
-                                else:
-                                    self.bakery_dialog[i*2] = "かいもの"
-                                self.fix_dialog(self.bakery_dialog)
-
-            if(new_restaurant_checks != self.restaurant_checks):
-                #logger.info("bakery checks %s", new_bakery_checks)
-                for i in range(len(new_restaurant_checks)):
-                    if(new_restaurant_checks[i]):
-                        locations_to_send_to_server.append(location_base_id + i + 89 + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                        if(i*2 < len(self.restaurant_dialog)):
-                            if(not "Purchased" in self.restaurant_dialog[i*2] and not "かいもの" in self.restaurant_dialog[i*2]):
-                                if(self.jp_version == False):
-                                    self.restaurant_dialog[i*2] = "Purchased"
-                                else:
-                                    self.restaurant_dialog[i*2] = "かいもの"
-                                self.fix_dialog(self.restaurant_dialog)
-
-            if(new_grocery_checks != self.grocery_checks):
-                #logger.info("bakery checks %s", new_bakery_checks)
-                for i in range(len(new_grocery_checks)):
-                    if(new_grocery_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                        if(i*2 < len(self.grocery_dialog)):
-                            if(not "Purchased" in self.grocery_dialog[i*2] and not "かいもの" in self.grocery_dialog[i*2]):
-                                if(self.jp_version == False):
-                                    self.grocery_dialog[i*2] = "Purchased"
-                                else:
-                                    self.grocery_dialog[i*2] = "かいもの"
-                                self.fix_dialog(self.grocery_dialog)
+                if(new_masks["bakery"] != old_masks["bakery"]):
+                    locations_to_send_to_server += newly_checked("bakery", old_masks["bakery"], new_masks["bakery"], id_offset)
+                    for i in set_bits(new_masks["bakery"]):
+                        if(i < len(self.bakery_dialog)):
+                            if(not self.bakery_dialog.purchased(i)):
+                                self.bakery_dialog.set_item(i, PURCHASED[self.jp_version])
+
+                if(new_masks["restaurant"] != old_masks["restaurant"]):
+                    locations_to_send_to_server += newly_checked("restaurant", old_masks["restaurant"], new_masks["restaurant"], id_offset)
+                    for i in set_bits(new_masks["restaurant"]):
+                        if(i < len(self.restaurant_dialog)):
+                            if(not self.restaurant_dialog.purchased(i)):
+                                self.restaurant_dialog.set_item(i, PURCHASED[self.jp_version])
+
+                if(new_masks["grocery"] != old_masks["grocery"]):
+                    locations_to_send_to_server += newly_checked("grocery", old_masks["grocery"], new_masks["grocery"], id_offset)
+                    for i in set_bits(new_masks["grocery"]):
+                        if(i < len(self.grocery_dialog)):
+                            if(not self.grocery_dialog.purchased(i)):
+                                self.grocery_dialog.set_item(i, PURCHASED[self.jp_version])
             
-            if(new_toy_checks != self.toy_checks):
-                #logger.info("bakery checks %s", new_bakery_checks)
-                for i in range(len(new_toy_checks)):
-                    if(new_toy_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(new_masks["toy"] != old_masks["toy"]):
+                    locations_to_send_to_server += newly_checked("toy", old_masks["toy"], new_masks["toy"], id_offset)
+                    for i in set_bits(new_masks["toy"]):
                         if(new_toy_purchased_awaiting[i]):
                             if(item_name_to_id["Musashi Action Figure"] + i in received_list):
                                 if(self.message_level > 0):
                                     logger.info("adding %s toy to storage", item_id_to_name[item_name_to_id["Musashi Action Figure"] + i])
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba21b+i + (self.jp_version * -0xea0), 1, MAIN_RAM)]
+                                save_data: bytes = (await self.read_ram(
+                                    ctx,
+                                    [(self.address.toys + i, 1, MAIN_RAM)]
                                 ))[0]
                                 toy_data = save_data[0] | 0b1000000
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba21b+i + (self.jp_version * -0xea0), [toy_data], MAIN_RAM)]
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.toys + i, [toy_data], MAIN_RAM)]
                                 )
                                 new_toy_in_storage[i] = True
                                 new_toy_purchased_awaiting[i] = False
 
 
-            if(new_toy_inventory != self.toy_inventory):
-                toys_for_sale = []
-                for i in range(len(new_toy_inventory)):
-                    if(new_toy_inventory[i] and not self.toy_inventory[i]):
-                        toys_for_sale = toys_for_sale + [item_id_to_name[item_name_to_id["Musashi Action Figure"] + i]]
-                if(len(toys_for_sale)>0):
-                    if(self.message_level > 0):
-                        logger.info("new toys for sale %s",toys_for_sale)
-                self.toy_inventory = new_toy_inventory
+                if(new_toy_inventory != self.toy_inventory):
+                    toys_for_sale = []
+                    for i in range(len(new_toy_inventory)):
+                        if(new_toy_inventory[i] and not self.toy_inventory[i]):
+                            toys_for_sale = toys_for_sale + [item_id_to_name[item_name_to_id["Musashi Action Figure"] + i]]
+                    if(len(toys_for_sale)>0):
+                        if(self.message_level > 0):
+                            logger.info("new toys for sale %s",toys_for_sale)
+                    self.toy_inventory = new_toy_inventory
             
-            if(new_tech_checks != self.tech_checks):
-                for i in range(len(new_tech_checks)):
-                    if(new_tech_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-
-            if(new_core_checks != self.core_checks):
-                for i in range(len(new_core_checks)):
-                    if(new_core_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(new_masks["tech"] != old_masks["tech"]):
+                    locations_to_send_to_server += newly_checked("tech", old_masks["tech"], new_masks["tech"], id_offset)
+
+                if(new_masks["core"] != old_masks["core"]):
+                    locations_to_send_to_server += newly_checked("core", old_masks["core"], new_masks["core"], id_offset)
             
 
-            if(new_scroll_checks != self.scroll_checks):
-                for i in range(len(new_scroll_checks)):
-                    if(new_scroll_checks[i]):
+                if(new_masks["scroll"] != old_masks["scroll"]):
+                    if(ctx.slot_data["scroll_sanity"] == True):
+                        locations_to_send_to_server += newly_checked("scroll", old_masks["scroll"], new_masks["scroll"], id_offset)
+                    for i in set_bits(new_masks["scroll"]):
                         if(ctx.slot_data["scroll_sanity"] == True):
-                            locations_to_send_to_server.append(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
                             if(i == 3):
                                 self.found_wind_scroll = True
                                 if(curr_location == 0x3023):
                                     if(not item_name_to_id["Wind Scroll"] in received_list):
                                         if(self.message_level > 0):
                                             logger.info("digging hole")
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(0x1206da + (self.jp_version * 0xa70), [0x23, 0xfb], MAIN_RAM)]
+                                        await self.write_ram(
+                                            ctx,
+                                            [(self.address.wind_scroll_hole, [0x23, 0xfb], MAIN_RAM)]
                                         )
                         else:
                             if(i == 3):
                                 self.found_wind_scroll = True
                             if(i < 2):
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64a + (self.jp_version * -0xea0), 1, MAIN_RAM)]
+                                save_data: bytes = (await self.read_ram(
+                                    ctx,
+                                    [(self.address.save_flags, 1, MAIN_RAM)]
                                 ))[0]
-                                
+                            
                                 scroll_data = save_data[0] | (0b1 << (i + 6))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64a + (self.jp_version * -0xea0), [scroll_data], MAIN_RAM)]
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.save_flags, [scroll_data], MAIN_RAM)]
                                 )
                             else:
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64b + (self.jp_version * -0xea0), 1, MAIN_RAM)]
+                                save_data: bytes = (await self.read_ram(
+                                    ctx,
+                                    [(self.address.legendary_armor, 1, MAIN_RAM)]
                                 ))[0]
                                 scroll_data = save_data[0] | (0b1 << (i - 2))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64b + (self.jp_version * -0xea0), [scroll_data], MAIN_RAM)]
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.legendary_armor, [scroll_data], MAIN_RAM)]
                                 )
 
-            if(self.curr_body_lvl != new_body_lvl):
-                for i in range(new_body_lvl):
-                    locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Body - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                stats_to_write = [(0x0638fa + (self.jp_version * -0xea4) + 16 * (new_body_lvl), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                if(new_body_lvl < 29):
-                    stats_to_write.append((0x0638fa + (self.jp_version * -0xea4) + 16 * (new_body_lvl + 1), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM))
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    stats_to_write
-                )
+                if(self.curr_body_lvl != new_body_lvl):
+                    for i in range(new_body_lvl):
+                        locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Body - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    stats_to_write = [(self.address.body_stat + 16 * (new_body_lvl), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM)]
+                    if(new_body_lvl < 29):
+                        stats_to_write.append((self.address.body_stat + 16 * (new_body_lvl + 1), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM))
+                    await self.write_ram(
+                        ctx,
+                        stats_to_write
+                    )
             
-            if(self.curr_mind_lvl != new_mind_lvl):
-                for i in range(new_mind_lvl):
-                    locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Mind - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                stats_to_write = [(0x0638fe + (self.jp_version * -0xea4) + 16 * (new_mind_lvl), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                if(new_mind_lvl < 29):
-                    stats_to_write.append((0x0638fe + (self.jp_version * -0xea4) + 16 * (new_mind_lvl + 1), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM))
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    stats_to_write
-                )
+                if(self.curr_mind_lvl != new_mind_lvl):
+                    for i in range(new_mind_lvl):
+                        locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Mind - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    stats_to_write = [(self.address.mind_stat + 16 * (new_mind_lvl), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM)]
+                    if(new_mind_lvl < 29):
+                        stats_to_write.append((self.address.mind_stat + 16 * (new_mind_lvl + 1), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM))
+                    await self.write_ram(
+                        ctx,
+                        stats_to_write
+                    )
 
-            if(self.curr_fus_lvl != new_fus_lvl):
-                for i in range(new_fus_lvl):
-                    locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Fus - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                stats_to_write = [(0x063906 + (self.jp_version * -0xea4) + 16 * (new_fus_lvl), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                if(new_fus_lvl < 29):
-                    stats_to_write.append((0x063906 + (self.jp_version * -0xea4) + 16 * (new_fus_lvl + 1), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM))
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    stats_to_write
-                )
+                if(self.curr_fus_lvl != new_fus_lvl):
+                    for i in range(new_fus_lvl):
+                        locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Fus - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    stats_to_write = [(self.address.fusion_stat + 16 * (new_fus_lvl), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM)]
+                    if(new_fus_lvl < 29):
+                        stats_to_write.append((self.address.fusion_stat + 16 * (new_fus_lvl + 1), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM))
+                    await self.write_ram(
+                        ctx,
+                        stats_to_write
+                    )
 
-            if(self.curr_lum_lvl != new_lum_lvl):
-                for i in range(new_lum_lvl):
-                    locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Lum - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                stats_to_write = [(0x063902 + (self.jp_version * -0xea4) + 16 * (new_lum_lvl), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                if(new_lum_lvl < 29):
-                    stats_to_write.append((0x063902 + (self.jp_version * -0xea4) + 16 * (new_lum_lvl + 1), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM))
-                await bizhawk.write(
-                    ctx.bizhawk_ctx,
-                    stats_to_write
-                )
-            if(new_quest_item_checks != self.quest_item_checks):
-                for i in range(len(new_quest_item_checks)):
-                    if(new_quest_item_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Well H20 - Grillin Village"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-
-            if(new_bp_checks != self.bp_checks):
-                for i in range(len(new_bp_checks)):
-                    if(new_bp_checks[i]):
-                        locations_to_send_to_server.append(standard_location_name_to_id["Guard BP Up - Somnolent Forest"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-
-
-            #if(new_bincho_checks != self.bincho_checks or new_minku_checks != self.minku_checks or new_chest_checks != self.chest_checks or new_bakery_checks != self.bakery_checks or new_restaurant_checks != self.restaurant_checks or new_grocery_checks != self.grocery_checks or new_toy_checks != self.toy_checks or new_tech_checks != self.tech_checks or new_scroll_checks != self.scroll_checks or new_core_checks != self.core_checks):
-            if(len(locations_to_send_to_server) > 0):
-                await ctx.check_locations(locations_to_send_to_server)
-                #await ctx.send_msgs([{
-                #    "cmd": "LocationChecks",
-                #    "locations": locations_to_send_to_server
-                #}])
-                self.bincho_checks = new_bincho_checks
-                self.minku_checks = new_minku_checks
-                self.chest_checks = new_chest_checks
-                self.bakery_checks = new_bakery_checks
-                self.restaurant_checks = new_restaurant_checks
-                self.grocery_checks = new_grocery_checks
-                self.toy_checks = new_toy_checks
-                self.tech_checks = new_tech_checks
-                self.scroll_checks = new_scroll_checks
-                self.core_checks = new_core_checks
-                self.curr_body_lvl = new_body_lvl
-                self.curr_mind_lvl = new_mind_lvl
-                self.curr_fus_lvl = new_fus_lvl
-                self.curr_lum_lvl = new_lum_lvl
-                self.quest_item_checks = new_quest_item_checks
-                self.bp_checks = new_bp_checks
+                if(self.curr_lum_lvl != new_lum_lvl):
+                    for i in range(new_lum_lvl):
+                        locations_to_send_to_server.append(standard_location_name_to_id["lvl 2 Lum - Menu"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    stats_to_write = [(self.address.lumina_stat + 16 * (new_lum_lvl), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM)]
+                    if(new_lum_lvl < 29):
+                        stats_to_write.append((self.address.lumina_stat + 16 * (new_lum_lvl + 1), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM))
+                    await self.write_ram(
+                        ctx,
+                        stats_to_write
+                    )
+                if(new_masks["quest"] != old_masks["quest"]):
+                    locations_to_send_to_server += newly_checked("quest", old_masks["quest"], new_masks["quest"], id_offset)
+
+                if(new_masks["bp"] != old_masks["bp"]):
+                    locations_to_send_to_server += newly_checked("bp", old_masks["bp"], new_masks["bp"], id_offset)
+
+
+                #if(new_bincho_checks != self.bincho_checks or new_minku_checks != self.minku_checks or new_chest_checks != self.chest_checks or new_bakery_checks != self.bakery_checks or new_restaurant_checks != self.restaurant_checks or new_grocery_checks != self.grocery_checks or new_toy_checks != self.toy_checks or new_tech_checks != self.tech_checks or new_scroll_checks != self.scroll_checks or new_core_checks != self.core_checks):
+                if(len(locations_to_send_to_server) > 0):
+                    await ctx.check_locations(locations_to_send_to_server)
+                    #await ctx.send_msgs([{
+                    #    "cmd": "LocationChecks",
+                    #    "locations": locations_to_send_to_server
+                    #}])
+                    self.check_masks = new_masks
+                    #the shops still index these lists
+                    self.bakery_checks = self.decode_booleans(new_masks["bakery"], 7)
+                    self.restaurant_checks = self.decode_booleans(new_masks["restaurant"], 7)
+                    self.grocery_checks = self.decode_booleans(new_masks["grocery"], 12)
+                    self.toy_checks = self.decode_booleans(new_masks["toy"], 30)
+                    self.tech_checks = self.decode_booleans(new_masks["tech"], 7)
+                    self.quest_item_checks = self.decode_booleans(new_masks["quest"], 29)
+                    self.curr_body_lvl = new_body_lvl
+                    self.curr_mind_lvl = new_mind_lvl
+                    self.curr_fus_lvl = new_fus_lvl
+                    self.curr_lum_lvl = new_lum_lvl
+                self.decode_watch.finish(len(locations_to_send_to_server) == 0 and self.write_buffer.writes == writes_before_decode and self.toy_inventory is toy_inventory_before_decode)
 
             
             if(curr_location == 0x3005): #main menu/first moon cutscene
@@ -1052,20 +1065,20 @@ class BFMClient(BizHawkClient):
                 self.level_transition = 1
                 self.received_count = 0
                 self.old_step_count = 0
-                self.death_link_timer = 240
+                self.death_link_timer = 60
                 self.has_died = 0
                 self.check_if_lumina_needs_removed = 1
                 self.max_hp_updated = False
-                curr_hp_bytes: bytes = (await bizhawk.read(
-                    ctx.bizhawk_ctx,
-                    [(0x078eb4 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+                curr_hp_bytes: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.hp, 2, MAIN_RAM)]
                 ))[0]
                 curr_hp: int = int.from_bytes(curr_hp_bytes, byteorder='little')
                 if curr_hp < 5:
                     new_hp = 150
-                    await bizhawk.write(
-                        ctx.bizhawk_ctx,
-                        [(0x078eb4+ (self.jp_version * -0xea0), new_hp.to_bytes(2, 'little'), MAIN_RAM)]
+                    await self.write_ram(
+                        ctx,
+                        [(self.address.hp, new_hp.to_bytes(2, 'little'), MAIN_RAM)]
                     )   
 
             #logger.info("curr_location %s",curr_location)
@@ -1075,387 +1088,14 @@ class BFMClient(BizHawkClient):
             #if(curr_location != 12296):
 
             if(self.old_step_count != 0 and self.level_transition != 1):
-                for _ in range(4):
-                    if(self.received_count < len(ctx.items_received)):
-                        #logger.info("list %s",ctx.items_received[self.received_count])
-                        item_id = ctx.items_received[self.received_count][0]
-                        if(item_id > jp_id_offset):
-                            item_id = item_id - jp_id_offset
-                        #logger.info("list %s",item_id)
-                        if(item_id>0x0ba1f7 and item_id<0x0ba21b):
-                            npc_state: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(item_id + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                            ))[0]
-                            if(npc_state[0] == 0b0):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(item_id + (self.jp_version * -0xea0), [0b1], MAIN_RAM)]
-                                )
-                                if(self.message_level > 0):
-                                    logger.info("adding to rescue list %s",item_id_to_name[item_id])
-                                #logger.info("IDs of receieved items %s",set(received_list))
-                                #logger.info("IDs of all NPCs %s",set(npc_ids))
-                            else:
-                                if(self.message_level > 0):
-                                    logger.info("already in rescue list: %s",item_id_to_name[item_id])
-                            if(item_id == item_name_to_id["Guard"]):
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x0ae666 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                                )]))[0]
-                                guard_state = int.from_bytes(save_data, byteorder='little')
-                                if(guard_state & 0x1 == 0x0):
-                                    if(self.message_level > 0):
-                                        logger.info("Sending Guard to Twinpeak")
-                                    guard_state = guard_state | 0x1
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ae666 + (self.jp_version * -0xea0), [guard_state], MAIN_RAM)]
-                                    )
-                        elif(item_id==0x0ba21b): #found max health berry
-                            await self.update_max_hp(ctx, self.received_count+1)
-                            if(self.message_level > 0):
-                                logger.info("Longevity Berry Found")
-                            """curr_max_hp_bytes: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x078eb2, 2, MAIN_RAM)]
-                            ))[0]
-                            curr_max_hp: int = int.from_bytes(curr_max_hp_bytes, byteorder='little')
-                            new_hp = ctx.slot_data["starting_hp"] + 25
-                            for i in range(self.received_count+1):
-                                if(ctx.items_received[i][0] == 0x0ba21b):
-                                    new_hp += 25
-                            if(curr_max_hp < new_hp):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x078eb2, new_hp.to_bytes(2, 'little'), MAIN_RAM)]
-                                )#max hp
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x078eb4, new_hp.to_bytes(2, 'little'), MAIN_RAM)]
-                                )#current hp"""
-                        elif(item_id == 0xa):
-                            if(ctx.slot_data["grocery_s_revive"] == True):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x10ee64 + (self.jp_version * 0x1d10), [0x1e, 0, 0x1e, 0], MAIN_RAM)]
-                                )#lower s-revive price
-                        elif((item_id < 0x68 and item_id > 0x12) or item_id == 0x6c or item_id == 0x6e):
-                            if(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x56, 0x58, 0x59, 0x5a] and not 0xc8 in self.completed_progression):
-                                if(not item_id in self.chapter3_items):
-                                    self.chapter3_items.append(item_id)
-                                    if(self.message_level > 0):
-                                        logger.info("Witholding %s until completing chapter 2", item_id_to_name[item_id])
-                            elif(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x5e, 0x5f, 0x63, 0x64, 0x65, 0x66] and not (0x258 in self.completed_progression and 0x1e0 in self.completed_progression and 0x1ae in self.completed_progression)):
-                                if(not item_id in self.chapter4_items):
-                                    self.chapter4_items.append(item_id)
-                                    if(self.message_level > 0):
-                                        logger.info("Witholding %s until completing chapter 3", item_id_to_name[item_id])
-                            elif(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x67, 0x5b, 0x5c, 0x5d, 0x6c, 0x6e] and not 0x384 in self.completed_progression):
-                                if(not item_id in self.chapter5_items):
-                                    self.chapter4_items.append(item_id)
-                                    if(self.message_level > 0):
-                                        logger.info("Witholding %s until completing chapter 4", item_id_to_name[item_id])
-                            else:
-                                if(not item_id in self.bakery_inventory_expansion):
-                                    self.bakery_inventory_expansion.append(item_id)
-                                    if(self.message_level > 0):
-                                        logger.info("%s added to Bakery",item_id_to_name[item_id])
-                            if(item_name_to_id["Key"] == item_id or ctx.slot_data["quest_item_sanity"] == False):
-                                if(item_name_to_id["Water Boss Core"] in received_list or (ctx.slot_data["core_sanity"] == False and save_data_toys[17] & 0b10000000 == 0b10000000)):
-                                    if(self.message_level > 0):
-                                        logger.info("adding Water Boss Core")
-                                    i = item_name_to_id["Water Boss Core"] - 0x28a + 2
-                                    save_data: bytes = (await bizhawk.read(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ae659 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                    ))[0]
-                                    
-                                    core_data = save_data[0] | (0b1 << i)
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ae659 + (self.jp_version * -0xea0), [core_data], MAIN_RAM)]
-                                    )
-                        elif(item_id == 0x78):
-                            curr_money_bytes: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x078e8C + (self.jp_version * -0xea0), 4, MAIN_RAM)]
-                            ))[0]
-                            curr_money: int = int.from_bytes(curr_money_bytes, byteorder='little')
-                            new_money = curr_money
-                            num_boons_byte: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba246 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                            ))[0]
-                            num_boons: int = int.from_bytes(num_boons_byte, byteorder='little')
-                            boon_count = 0
-                            for i in range(self.received_count+1):
-                                if(ctx.items_received[i][0] == 0x78 + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                                    boon_count += 1
-                                    if(boon_count > num_boons):
-                                        new_money += 100
-                            if(curr_money < new_money):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x078e8C + (self.jp_version * -0xea0), new_money.to_bytes(4, 'little'), MAIN_RAM)]
-                                )
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba246 + (self.jp_version * -0xea0), boon_count.to_bytes(1, 'little'), MAIN_RAM)]  #0x0ba238 is queen ant toy, maybe 0x0ba246
-                                )
-                                if(self.message_level > 0):
-                                    logger.info("added 1000 Drans to wallet")
-                        elif(item_id == 0x79):
-                            if(self.message_level > 0):
-                                logger.info("Returning Lumina")
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                0x0ae658 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                            )]))[0]
-                            lumina_state = int.from_bytes(save_data, byteorder='little')
-                            lumina_state = lumina_state | 0b1
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae658 + (self.jp_version * -0xea0), [lumina_state], MAIN_RAM)]
-                            )
-                            """
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                0x078ec0, 1, MAIN_RAM
-                            )]))[0]
-                            lumina_state = int.from_bytes(save_data, byteorder='little')
-                            lumina_state = lumina_state | 0b1
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x078ec0, [lumina_state], MAIN_RAM)]
-                            )"""
-                        elif(item_id == 0x80):
-                            if(self.message_level > 0):
-                                logger.info("New stock added to Bakery")
-                        elif(item_id < 0x78 and item_id > 0x70):
-                            if(self.message_level > 0):
-                                logger.info("%s added to Restaurant",item_id_to_name[item_id])
-                        elif(item_id < 0xc or item_id == 0x6a or item_id == 0x6b or item_id== 0x6d):
-                            if(self.message_level > 0):
-                                logger.info("%s added to Grocery",item_id_to_name[item_id])
-                        elif(item_id >= item_name_to_id["Musashi Action Figure"] and item_id < item_name_to_id["Musashi Action Figure"] + len(item_name_groups["Toy Shop"])):
-                            if(ctx.slot_data["toy_sanity"] == True):
-                                val = item_id - item_name_to_id["Musashi Action Figure"]
-                                if(new_toy_purchased_awaiting[val] == False):
-                                    if(new_toy_in_storage[val]):
-                                        if(self.message_level > 0):
-                                            logger.info("%s toy already in storage", item_id_to_name[item_id])
-                                    else:
-                                        if(self.message_level > 0):
-                                            logger.info("received %s toy but was not yet purchased", item_id_to_name[item_id])
-                                else:
-                                    if(self.message_level > 0):
-                                        logger.info("adding %s toy to storage", item_id_to_name[item_id])
-                                    save_data: bytes = (await bizhawk.read(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ba21b+val + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                    ))[0]
-                                    toy_data = save_data[0] | 0b1000000
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ba21b+val + (self.jp_version * -0xea0), [toy_data], MAIN_RAM)]
-                                    )
-                                    new_toy_in_storage[val] = True
-                                    new_toy_purchased_awaiting[val] = False
-                            else:
-                                if(self.message_level > 0):
-                                    logger.info("received toy when toysanity was disabled, something went wrong")
-                        elif(item_id>0x80 and item_id<0x88):
-                            if(self.message_level > 0):
-                                logger.info("adding %s to Tech",item_id_to_name[item_id])
-                            if(item_id == 0x87):
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae659 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                tech_data = save_data[0] | 0b10
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae659 + (self.jp_version * -0xea0), [tech_data], MAIN_RAM)]
-                                )
-                            else:
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae658 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                tech_data = save_data[0] | (0b1 << (item_id - 0x80 + (item_id > 0x83)))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae658 + (self.jp_version * -0xea0), [tech_data], MAIN_RAM)]
-                                )
-                        elif(item_id > 0x215 and item_id < 0x21b):
-                            if(self.message_level > 0):
-                                logger.info("adding %s",item_id_to_name[item_id])
-                            i = item_id - 0x216
-                            if(i < 2):
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64a + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                
-                                scroll_data = save_data[0] | (0b1 << (i + 6))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64a + (self.jp_version * -0xea0), [scroll_data], MAIN_RAM)]
-                                )
-                            else:
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64b + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                scroll_data = save_data[0] | (0b1 << (i - 2))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae64b + (self.jp_version * -0xea0), [scroll_data], MAIN_RAM)]
-                                )
-                        elif(item_id > 0x289 and item_id < 0x28e): #boss cores
-                            if(item_name_to_id["Water Boss Core"] == item_id and not item_name_to_id["Key"] in received_list and ctx.slot_data["quest_item_sanity"] == True):
-                                if(self.message_level > 0):
-                                    logger.info("witholding water boss core until Key is found to prevent softlocks")
-                            else:
-                                if(self.message_level > 0):
-                                    logger.info("adding %s",item_id_to_name[item_id])
-                                i = item_id - 0x28a + 2
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae659 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                
-                                core_data = save_data[0] | (0b1 << i)
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae659 + (self.jp_version * -0xea0), [core_data], MAIN_RAM)]
-                                )
-                        elif(item_id == 0x401): #body stat up
-                            new_stat_value = 40
-                            stat_up_found = 0
-                            for i in range(len(ctx.items_received)):
-                                if(ctx.items_received[i][0] == item_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                                    stat_up_found = stat_up_found + 1
-                            stat_up_found = min(stat_up_found, ctx.slot_data["level_bundles"])
-                            if(ctx.slot_data["stat_gain_modifier"] == 1): #Early
-                                new_stat_value = 4 + round(32 * math.sqrt(stat_up_found / ctx.slot_data["level_bundles"]))
-                            elif(ctx.slot_data["stat_gain_modifier"] == 2): #Vanilla
-                                new_stat_value = body_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])]
-                            else: #Enhanced
-                                new_stat_value = body_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])] + round(math.pow(stat_up_found / ctx.slot_data["level_bundles"], 10) * 100)
-                            if(new_stat_value != self.curr_body_stat):
-                                if(self.message_level > 0):
-                                    logger.info("%s: %s -> %s",item_id_to_name[item_id], self.curr_body_stat, new_stat_value)
-                                self.curr_body_stat = new_stat_value
-                                stats_to_write = [(0x0638fa + (self.jp_version * -0xea4) + 16 * (self.curr_body_lvl), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                                if(self.curr_body_lvl < 29):
-                                    stats_to_write.append((0x0638fa + (self.jp_version * -0xea4) + 16 * (self.curr_body_lvl + 1), self.curr_body_stat.to_bytes(2, 'little'), MAIN_RAM))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    stats_to_write
-                                )
-                        elif(item_id == 0x402): #mind stat up
-                            new_stat_value = 40
-                            stat_up_found = 0
-                            for i in range(len(ctx.items_received)):
-                                if(ctx.items_received[i][0] == item_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                                    stat_up_found = stat_up_found + 1
-                            stat_up_found = min(stat_up_found, ctx.slot_data["level_bundles"])
-                            if(ctx.slot_data["stat_gain_modifier"] == 1): #Early
-                                new_stat_value = 6 + round(38 * math.sqrt(stat_up_found / ctx.slot_data["level_bundles"]))
-                            elif(ctx.slot_data["stat_gain_modifier"] == 2): #Vanilla
-                                new_stat_value = mind_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])]
-                            else: #Enhanced
-                                new_stat_value = mind_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])] + round(math.pow(stat_up_found / ctx.slot_data["level_bundles"], 10) * 100)
-                            if(new_stat_value != self.curr_mind_stat):
-                                if(self.message_level > 0):
-                                    logger.info("%s: %s -> %s",item_id_to_name[item_id], self.curr_mind_stat, new_stat_value)
-                                self.curr_mind_stat = new_stat_value
-                                stats_to_write = [(0x0638fe + (self.jp_version * -0xea4) + 16 * (self.curr_mind_lvl), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                                if(self.curr_mind_lvl < 29):
-                                    stats_to_write.append((0x0638fe + (self.jp_version * -0xea4) + 16 * (self.curr_mind_lvl + 1), self.curr_mind_stat.to_bytes(2, 'little'), MAIN_RAM))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    stats_to_write
-                                )
-                        elif(item_id == 0x403): #fusion stat up
-                            new_stat_value = 40
-                            stat_up_found = 0
-                            for i in range(len(ctx.items_received)):
-                                if(ctx.items_received[i][0] == item_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                                    stat_up_found = stat_up_found + 1
-                            stat_up_found = min(stat_up_found, ctx.slot_data["level_bundles"])
-                            if(ctx.slot_data["stat_gain_modifier"] == 1): #Early
-                                new_stat_value = 4 + round(34 * math.sqrt(stat_up_found / ctx.slot_data["level_bundles"]))
-                            elif(ctx.slot_data["stat_gain_modifier"] == 2): #Vanilla
-                                new_stat_value = fusion_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])]
-                            else: #Enhanced
-                                new_stat_value = fusion_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])] + round(math.pow(stat_up_found / ctx.slot_data["level_bundles"], 10) * 100)
-                            if(new_stat_value != self.curr_fus_stat):
-                                if(self.message_level > 0):
-                                    logger.info("%s: %s -> %s",item_id_to_name[item_id], self.curr_fus_stat, new_stat_value)
-                                self.curr_fus_stat = new_stat_value
-                                stats_to_write = [(0x063906 + (self.jp_version * -0xea4) + 16 * (self.curr_fus_lvl), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                                if(self.curr_fus_lvl < 29):
-                                    stats_to_write.append((0x063906 + (self.jp_version * -0xea4) + 16 * (self.curr_fus_lvl + 1), self.curr_fus_stat.to_bytes(2, 'little'), MAIN_RAM))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    stats_to_write
-                                )
-                        elif(item_id == 0x404): #Lumina stat up
-                            new_stat_value = 40
-                            stat_up_found = 0
-                            for i in range(len(ctx.items_received)):
-                                if(ctx.items_received[i][0] == item_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                                    stat_up_found = stat_up_found + 1
-                            stat_up_found = min(stat_up_found, ctx.slot_data["level_bundles"])
-                            if(ctx.slot_data["stat_gain_modifier"] == 1): #Early
-                                new_stat_value = 8 + round(68 * math.sqrt(stat_up_found / ctx.slot_data["level_bundles"]))
-                            elif(ctx.slot_data["stat_gain_modifier"] == 2): #Vanilla
-                                new_stat_value = lumina_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])]
-                            else: #Enhanced
-                                new_stat_value = lumina_stat[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])] + round(math.pow(stat_up_found / ctx.slot_data["level_bundles"], 10) * 1000)
-                            if(new_stat_value != self.curr_lum_stat):
-                                if(self.message_level > 0):
-                                    logger.info("%s: %s -> %s",item_id_to_name[item_id], self.curr_lum_stat, new_stat_value)
-                                self.curr_lum_stat = new_stat_value
-                                stats_to_write = [(0x063902 + (self.jp_version * -0xea4) + 16 * (self.curr_lum_lvl), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM)]
-                                if(self.curr_lum_lvl < 29):
-                                    stats_to_write.append((0x063902 + (self.jp_version * -0xea4) + 16 * (self.curr_lum_lvl + 1), self.curr_lum_stat.to_bytes(2, 'little'), MAIN_RAM))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    stats_to_write
-                                )
-                        elif(item_id in [0x405, 0x406]): #found bp up
-                            await self.update_max_bp(ctx, self.received_count+1)
-                            if(self.message_level > 0):
-                                logger.info("BP Up Found")
-                        elif(item_id == 0x500): #Well H20
-                            if(self.message_level > 0):
-                                logger.info("Well H20 returned to well")
-                        elif(item_id == 0x501): #Log
-                            log_ids = [0x4e, 0x50, 0x51, 0x52]
-                            log_ids = log_ids[:received_list.count(item_name_to_id["Log"])]
-                            for log_id in log_ids:
-                                if(not log_id in self.bakery_inventory_expansion):
-                                    self.bakery_inventory_expansion.append(log_id)
-                                    if(self.message_level > 0):
-                                        logger.info("%s added to Bakery",item_id_to_name[item_id])
-                        elif(item_id == 0x502): #Aqualin
-                            if(self.message_level > 0):
-                                logger.info("Aqualin available during minigame")
-                        elif(item_id == 0x503): #Manual
-                            if(self.message_level > 0):
-                                logger.info("Manual available during minigame")
-                        else:
-                            if(self.message_level > 0):
-                                logger.info("unhandled item receieved %s",item_id_to_name[item_id])
-                        self.received_count += 1
+                if(self.received_count < len(ctx.items_received)):
+                    await self.apply_received_items(ctx, received_list, save_data_toys, new_toy_in_storage, new_toy_purchased_awaiting)
                 if(self.checked_cores == False):
                     self.checked_cores = True
                     if(ctx.slot_data["core_sanity"] == True):
-                        save_data: bytes = (await bizhawk.read(
-                            ctx.bizhawk_ctx,
-                            [(0x0ae659 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
+                        save_data: bytes = (await self.read_ram(
+                            ctx,
+                            [(self.address.cores, 1, MAIN_RAM)]
                         ))[0]
                         cores_collected: List[bool] = self.decode_booleans_with_exclusions(save_data[0], 6, [0,1])
                         need_to_update_cores = False
@@ -1468,17 +1108,17 @@ class BFMClient(BizHawkClient):
                         if(need_to_update_cores == True):
                             if(self.message_level > 0):
                                 logger.info("Removing extra cores acquired") 
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae659 + (self.jp_version * -0xea0), [new_core_data], MAIN_RAM)]
+                            await self.write_ram(
+                                ctx,
+                                [(self.address.cores, [new_core_data], MAIN_RAM)]
                             )
                 if(self.max_hp_updated == False):
                     self.max_hp_updated = True
                     await self.update_max_hp(ctx, self.received_count)
                     await self.update_max_bp(ctx, self.received_count)
-                    bytes_to_update_progression: bytes = (await bizhawk.read(
-                        ctx.bizhawk_ctx,
-                        [(0x0ba247 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+                    bytes_to_update_progression: bytes = (await self.read_ram(
+                        ctx,
+                        [(self.address.manual_progression, 2, MAIN_RAM)]
                     ))[0]
                     if(self.message_level == 3):
                         logger.info("bytes %s", bytes_to_update_progression)
@@ -1521,31 +1161,31 @@ class BFMClient(BizHawkClient):
                             xp_factor_mind = 100
                         write_instructions = []
                         for i in range(29):
-                            write_instructions.append((0x0638f8 + (self.jp_version * -0xea4)+16*i, math.ceil(body_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x0638fc + (self.jp_version * -0xea4)+16*i, math.ceil(mind_xp[i] / xp_factor_mind).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x063900 + (self.jp_version * -0xea4)+16*i, math.ceil(lumina_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x063904 + (self.jp_version * -0xea4)+16*i, math.ceil(fusion_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
+                            write_instructions.append((self.address.body_xp+16*i, math.ceil(body_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
+                            write_instructions.append((self.address.mind_xp+16*i, math.ceil(mind_xp[i] / xp_factor_mind).to_bytes(2, 'little'), MAIN_RAM))
+                            write_instructions.append((self.address.lumina_xp+16*i, math.ceil(lumina_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
+                            write_instructions.append((self.address.fusion_xp+16*i, math.ceil(fusion_xp[i] / xp_factor).to_bytes(2, 'little'), MAIN_RAM))
+                        await self.write_ram(
+                            ctx,
                             write_instructions
                         )
                     else:
                         write_instructions = [
-                            (0x02aa98 + (self.jp_version * -0xdb0), [0, 0, 0x2, 0x24], MAIN_RAM), #limit lvl 8
-                            (0x02aa90 + (self.jp_version * -0xdb0), [0], MAIN_RAM), #limit lvl 16
-                            (0x02aa80 + (self.jp_version * -0xdb0), [0], MAIN_RAM), #limit lvl 22
-                            (0x02aa70 + (self.jp_version * -0xdb0), [0], MAIN_RAM), #limit lvl 27
-                            (0x02aa50 + (self.jp_version * -0xdb0), [0x4a, 0x6], MAIN_RAM), #limit lvl 30 (chapter 6 check)
-                            (0x078ee4 + (self.jp_version * -0xdb0), [0] * 32, MAIN_RAM) #set lvl to 1 and xp to 0
+                            (self.address.limit_lvl_8, [0, 0, 0x2, 0x24], MAIN_RAM), #limit lvl 8
+                            (self.address.limit_lvl_16, [0], MAIN_RAM), #limit lvl 16
+                            (self.address.limit_lvl_22, [0], MAIN_RAM), #limit lvl 22
+                            (self.address.limit_lvl_27, [0], MAIN_RAM), #limit lvl 27
+                            (self.address.limit_lvl_30, [0x4a, 0x6], MAIN_RAM), #limit lvl 30 (chapter 6 check)
+                            (self.address.levels, [0] * 32, MAIN_RAM) #set lvl to 1 and xp to 0
                         ]
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
+                        await self.write_ram(
+                            ctx,
                             write_instructions
                         )
             if(self.hair_color_updated == 0):
-                curr_hair_color: bytes = (await bizhawk.read(
-                    ctx.bizhawk_ctx,
-                    [(hair_color_addresses[0] + (self.jp_version * 0x1d10), 3, MAIN_RAM)]
+                curr_hair_color: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.hair_color[0], 3, MAIN_RAM)]
                 ))[0]
                 if("message_level" in ctx.slot_data):
                     self.message_level = ctx.slot_data["message_level"]
@@ -1577,8 +1217,8 @@ class BFMClient(BizHawkClient):
                             write_instructions.append((0x0283f0, data, MAIN_RAM))
                             data = archive.read("bfm/patch/jp/updateProgressionHooks.bin")
                             write_instructions.append((0x0d08cc, data, MAIN_RAM))
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
+                            await self.write_ram(
+                                ctx,
                                 write_instructions
                             )
                         else:
@@ -1602,8 +1242,8 @@ class BFMClient(BizHawkClient):
                             write_instructions.append((0x0291a0, data, MAIN_RAM))
                             data = archive.read("bfm/patch/en/updateProgressionHooks.bin")
                             write_instructions.append((0x0d17dc, data, MAIN_RAM))
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
+                            await self.write_ram(
+                                ctx,
                                 write_instructions
                             )
                             #logger.info("This version of the game appears to be unpatched, this could result in unexpected behavior and maybe uncompletable. Please close and reopen this client after selecting the patched version of the game in bizhawk.")
@@ -1612,42 +1252,42 @@ class BFMClient(BizHawkClient):
                             #logger.info("For further assistance please consider joining the Archipelago discord server (found on https://archipelago.gg/) going to future game design and then Brave Fencer Musashi")
                         logger.info("patching completed")
                     else:
-                        save_data: bytes = (await bizhawk.read(
-                            ctx.bizhawk_ctx,
-                            [(0x047dc0 + (self.jp_version * -0xe94), 3, MAIN_RAM)]
+                        save_data: bytes = (await self.read_ram(
+                            ctx,
+                            [(self.address.patch_version, 3, MAIN_RAM)]
                         ))[0]
                         s = str(save_data[0]) + "." + str(save_data[1]) + "." + str(save_data[2])
                         logger.info(f"v{s} Current game patch") 
                         logger.info("Try to have all version numbers match if possible for best compatibility")     
                     logger.info("Coloring Hair")
-                    for address in hair_color_addresses:
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(address + (self.jp_version * 0x1d10), bytes.fromhex(ctx.slot_data["hair_color"]), MAIN_RAM)]
+                    for address in self.address.hair_color:
+                        await self.write_ram(
+                            ctx,
+                            [(address, bytes.fromhex(ctx.slot_data["hair_color"]), MAIN_RAM)]
                         )
                     write_instructions = []
-                    write_instructions.append((0x0d1490 + (self.jp_version * -0xe80), [0x0], MAIN_RAM))#set Minku healing to 0
-                    for cost in appraisal_items_buy_cost:
-                        write_instructions.append((cost + (self.jp_version * 0x1d10), [0xf6, 0xff], MAIN_RAM))
-                    for cost in appraisal_l_armor_buy_cost:
-                        write_instructions.append((cost + (self.jp_version * 0x1d10), [0xf5, 0xff], MAIN_RAM))
-                    for cost in key_item_buy_cost:
-                        write_instructions.append((cost + (self.jp_version * 0x1d10), [0x0a, 0x00], MAIN_RAM))
+                    write_instructions.append((self.address.minku_healing, [0x0], MAIN_RAM))#set Minku healing to 0
+                    for cost in self.address.appraisal_items_buy_cost:
+                        write_instructions.append((cost, [0xf6, 0xff], MAIN_RAM))
+                    for cost in self.address.appraisal_l_armor_buy_cost:
+                        write_instructions.append((cost, [0xf5, 0xff], MAIN_RAM))
+                    for cost in self.address.key_item_buy_cost:
+                        write_instructions.append((cost, [0x0a, 0x00], MAIN_RAM))
                     if(ctx.slot_data["quest_item_sanity"] == True):
-                        for cost in quest_item_buy_cost:
-                            write_instructions.append((cost + (self.jp_version * 0x1d10), [0x0a, 0x00], MAIN_RAM))
-                    write_instructions.append((store_sanity_buy_cost[0] + (self.jp_version * 0x1d10), [0x1e, 0x00], MAIN_RAM))#bakery
-                    write_instructions.append((store_sanity_buy_cost[1]  + (self.jp_version * 0x1d10), [0x64, 0x00], MAIN_RAM))#restaurant
-                    write_instructions.append((store_sanity_buy_cost[2]  + (self.jp_version * 0x1d10), [0x32, 0x00], MAIN_RAM))#Grocery
-                    await bizhawk.write(
-                        ctx.bizhawk_ctx,
+                        for cost in self.address.quest_item_buy_cost:
+                            write_instructions.append((cost, [0x0a, 0x00], MAIN_RAM))
+                    write_instructions.append((self.address.store_sanity_buy_cost[0], [0x1e, 0x00], MAIN_RAM))#bakery
+                    write_instructions.append((self.address.store_sanity_buy_cost[1], [0x64, 0x00], MAIN_RAM))#restaurant
+                    write_instructions.append((self.address.store_sanity_buy_cost[2], [0x32, 0x00], MAIN_RAM))#Grocery
+                    await self.write_ram(
+                        ctx,
                         write_instructions
                     )
                                 
         
             if(curr_location != self.old_location):
-                steps_bytes: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                    0x078E7C + (self.jp_version * -0xea0), 4, MAIN_RAM #replaced by timer (for steps0x078F08, 4, MAIN_RAM)
+                steps_bytes: bytes = (await self.read_ram(ctx, [(
+                    self.address.steps, 4, MAIN_RAM #replaced by timer (for steps0x078F08, 4, MAIN_RAM)
                 )]))[0]
                 step_count = int.from_bytes(steps_bytes,byteorder='little')
                 if(self.level_transition == 0 or curr_location == 0x3005):
@@ -1688,2049 +1328,2034 @@ class BFMClient(BizHawkClient):
                         if(len(self.hint_dictionary[curr_location]) > 0 and self.hint_dictionary[curr_location] != self.last_displayed_hint):
                             logger.info(self.hint_dictionary[curr_location])
                             self.last_displayed_hint = self.hint_dictionary[curr_location]
-                    if(curr_location in dialog_location_table): 
-                        for loc_id, dialog_id in dialog_location_table[curr_location].items():
-                            if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                if(loc_id in short_text_boxes):
-                                    barray = await self.assemble_short_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
-                                else:
-                                    barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(dialog_id[self.jp_version]+4, barray, MAIN_RAM)]
+                    #only the handlers registered for this area run, in the order they are defined below
+                    for handler in area_entry_handlers.handlers_for(curr_location):
+                        await handler(self, ctx, curr_location, game_state, received_list)
+                    #if(ctx.slot_data["fast_walk"] == True):
+                    #    await bizhawk.write(
+                    #        ctx.bizhawk_ctx,
+                    #        [(0x15a7e4 + (self.jp_version * 0x2a8), [0xa0, 0xff, 0x03, 0x3c, 0x2c, 0x00, 0x23, 0xae, 0x1e + (self.jp_version * 0xaa), 0x6a, 0x05, 0x08, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
+                    #    ) #jmp c8 6a 05 08 for jp version JP 8015ab20
+                self.old_step_count = step_count
+
+            if(self.level_transition == 0):
+                if(curr_location == 0x300b and ctx.slot_data["boulder_chase_zoom"] != 2): #running from boulder
+                    if(self.poll_scheduler.due("boulder_zoom", 1.25)):
+                        save_data: bytes = (await self.read_ram(ctx, [(
+                            self.address.zoom, 2, MAIN_RAM
+                        )]))[0]
+                        zoom = int.from_bytes(save_data, byteorder='little')
+                        if(zoom == 0x64):
+                            if(self.message_level > 0):
+                                logger.info("applying zoom")
+                            if(ctx.slot_data["boulder_chase_zoom"] == 1):
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.zoom, [0x30], MAIN_RAM)] 
                                 )
                             else:
-                                logger.info("no scout information found try reentering area (after taking a couple steps)")
-                                await ctx.send_msgs([{
-                                    "cmd": "LocationScouts",
-                                    "locations": self.table_ids_to_hint,
-                                    "create_as_hint": 0
-                                }])
-                                break
-                    if(ctx.slot_data["scroll_sanity"] == True):
-                        #await bizhawk.write(
-                        #    ctx.bizhawk_ctx,
-                        #    [(0x13f430 + (self.jp_version * 0x344), [0x06, 0x01, 0x02, 0x24], MAIN_RAM)] #fix scroll cursor
-                        #)    
-                        save_data: bytes = (await bizhawk.read(
-                            ctx.bizhawk_ctx,
-                            [(0x0ae65b + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                        ))[0]
-                        if(save_data[0] & 0b10000000 == 0b00000000):
-                            if(self.message_level > 0):
-                                logger.info("Removing Rock on Twinpeak")
-                            rock_data = save_data[0] | (0b10000000)
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae65b + (self.jp_version * -0xea0), [rock_data], MAIN_RAM)]
-                            )           
-                        if(curr_location in scroll_dialog):
-                            for loc_id, dialog_id in scroll_dialog[curr_location].items():
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.zoom, [0x20, 0x1], MAIN_RAM)] 
+                                )
+                if(curr_location == 0x301d or curr_location == 0x3020): #steamwood
+                    if(ctx.slot_data["steamwood_elevator_logic"] != 1 or (curr_location == 0x3020 and ctx.slot_data["quest_item_sanity"])): #not vanilla elevator
+                        if(self.poll_scheduler.due("elevator", 0.75)):
+                            save_data: bytes = bytes([0,0,0])
+                            if(curr_location == 0x301d):
+                                save_data = (await self.read_ram(ctx, [(address, 1 + (i == 1), MAIN_RAM) for i, address in enumerate(self.address.steamwood_elevator)]))
+                                #is_musashi_on_elevator = int.from_bytes(save_data[0], byteorder='little')
+                                #elevator_state = int.from_bytes(save_data[2], byteorder='little')
+                                #elevator_floor = int.from_bytes(save_data[3], byteorder='little')
+                            else:
+                                save_data = (await self.read_ram(ctx, [(address, 1 + (i == 1), MAIN_RAM) for i, address in enumerate(self.address.steamwood_2_elevator)]))
+                            is_musashi_on_elevator = max(int.from_bytes(save_data[0], byteorder='little'),int.from_bytes(save_data[4], byteorder='little'))
+                                #logger.info("elevator data %s", save_data)
+                                #is_musashi_on_elevator: int = save_data[0]
+                            elevator_state = max(int.from_bytes(save_data[2], byteorder='little'),int.from_bytes(save_data[5], byteorder='little'))
+                            elevator_floor = max(int.from_bytes(save_data[3], byteorder='little'),int.from_bytes(save_data[6], byteorder='little'))
+                            musashi_z = int.from_bytes(save_data[1], byteorder='little')
+                            musashi_floor = 1
+                            if(musashi_z > 0xfdc0):
+                                musashi_floor_handle = 0
+                                musashi_floor = 1
+                            elif(musashi_z > 0xfbc0):
+                                musashi_floor_handle = 0
+                                musashi_floor = 2
+                            elif(musashi_z > 0xf9c0):
+                                musashi_floor_handle = 1
+                                musashi_floor = 3
+                            elif(musashi_z > 0xf7c0):
+                                musashi_floor_handle = 2
+                            if(curr_location == 0x3020 and ctx.slot_data["quest_item_sanity"] and musashi_floor_handle != self.musashi_old_floor):
+                                self.musashi_old_floor = musashi_floor_handle
+                                loc_id = standard_location_name_to_id["Handle #1 - Steamwood 2"] + musashi_floor_handle
                                 if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                    barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(dialog_id[self.jp_version]+4, barray, MAIN_RAM)]
-                                    )
-                                else:
-                                    logger.info("no scout information found try reentering area (after taking a couple steps)")
-                                    if(not standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                        for i in range(5):
-                                            self.table_ids_to_hint.append(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    await ctx.send_msgs([{
-                                        "cmd": "LocationScouts",
-                                        "locations": self.table_ids_to_hint,
-                                        "create_as_hint": 0
-                                    }])
-                                    break
-                    if(curr_location in bakery_locations): # 0x2015chapter 2 Jam, also changes to 0x2056 chapter 3
-
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x11514A + (self.jp_version * 0xa70), [0x0], MAIN_RAM)]
-                        )
-                        #if(curr_location == 0x207b or curr_location == 0x2098):
-                        if(self.num_bosses_killed > 1):
-                            if(not 0x68 in self.bakery_inventory_default):
-                                self.bakery_inventory_default = self.bakery_inventory_default + [0x69,0x68]
-                            if(len(self.bakery_inventory_sanity) < 7):
-                                self.bakery_inventory_sanity = [0x3e,0x3e,0x3e,0x3e,0x3e,0x3e,0x3e]
-                        self.bakery_inventory = [0x0d]
-                        await self.remove_extra_legendary_armor_from_bakery(ctx)
-                        #logger.info("bakery inventory %s",self.bakery_inventory)
-                        #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
-                        #logger.info("bakery inventory len %s",len(self.bakery_inventory))
-                        #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
-                        if(len(self.bakery_inventory_expansion)>1):
-                            self.bakery_inventory_expansion.sort(reverse=True)
-                        #await self.update_progression(ctx)
-                        if(ctx.slot_data["bakery_sanity"] == True):
-                            self.update_list_of_received_items(ctx)
-                            self.bakery_dialog = []
-                            self.cursor_pos = -1
-
-
-                            for i in range(len(self.bakery_inventory_sanity)):
-                                loc_id = standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
-                                if(loc_id in ctx.locations_info):
-                                    if(self.bakery_checks[i]==True):
-                                        if(self.jp_version == False):
-                                            s = "Purchased"
-                                        else:
-                                            s = "かいもの"
-                                    else:
-                                        s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
-                                    self.bakery_dialog = self.bakery_dialog + [s]
-                                    s = ctx.player_names[ctx.locations_info[loc_id].player]
-                                    self.bakery_dialog = self.bakery_dialog + [s]
-                                else:
-                                    if(not standard_location_name_to_id["Item 1 - Bakery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                        for i in range(7):
-                                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    #logger.info("no scout information found try reentering area (after taking a couple steps) %s", self.table_ids_to_hint)
-                                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                    await ctx.send_msgs([{
-                                        "cmd": "LocationScouts",
-                                        "locations": self.table_ids_to_hint,
-                                        "create_as_hint": 0
-                                    }])
-                                    break
-                            self.fix_dialog(self.bakery_dialog)
-
-                            #logger.info("bakery dialog %s", self.bakery_dialog)
-                            self.bakery_inventory = self.bakery_inventory_sanity.copy()
-
-                            for i in range(len(self.bakery_inventory)-1,-1,-1):
-                                if(self.bakery_checks[i]==True):
-                                    self.bakery_inventory.pop(i)
-                                else:
-                                    break
-
-                            bread_to_add = []
-                            if(item_name_to_id["Progressive Bread"] in self.list_of_received_items or (item_name_to_id["Progressive Bread"] + jp_id_offset) in self.list_of_received_items):
-                                bread_to_add = self.bakery_inventory_default[:(self.list_of_received_items.count(item_name_to_id["Progressive Bread"]) + self.list_of_received_items.count(item_name_to_id["Progressive Bread"] + jp_id_offset))]
+                                    if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
+                                        barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                                        if(self.message_level == 3):
+                                            logger.info("quest item dialog handle# %s", [1,4,8][musashi_floor_handle])
+                                        barray = barray[:47]
+                                        barray.append(0x00)
+                                        await self.write_ram(
+                                            ctx,
+                                            [(self.address.handle_dialog+4, barray, MAIN_RAM)]
+                                        )
+                                        #write_instructions.append((self.address.handle_dialog+4, barray, MAIN_RAM))
                             
-                            if((curr_location == 0x2015 or curr_location == 0x2056) and ctx.slot_data["restaurant_sanity"] == True and self.progression_state > 0x63):
-                                await self.fill_restaurant_dialog(ctx)
-                                for i in range(len(self.bakery_inventory)):
-                                    if(self.bakery_checks[i]==True and self.restaurant_checks[i]==False):
-                                        self.bakery_inventory[i]=0x40
-                                    elif(self.bakery_checks[i]==True):
-                                        if(len(bread_to_add)>0):
-                                            self.bakery_inventory[i]=bread_to_add.pop(0)
-                                for i in range(6,len(self.bakery_inventory)-1,-1):
-                                    if(self.restaurant_checks[i]==False):
-                                        self.bakery_inventory = self.bakery_inventory + [0x40] * (i-len(self.bakery_inventory)+1)
-                                        break
-                            else:
-                                for i in range(len(self.bakery_inventory)):
-                                    if(self.bakery_checks[i]==True):
-                                        if(len(bread_to_add)>0):
-                                            #logger.info("bread to add %s", bread_to_add)
-                                            #logger.info("bakery inventory %s", self.bakery_inventory)
-                                            #logger.info("bakery inventory sanity %s", self.bakery_inventory_sanity)
-                                            self.bakery_inventory[i]=bread_to_add.pop(0)
-                                    
-                            self.bakery_inventory = self.bakery_inventory + bread_to_add
-                            self.bakery_inventory = self.bakery_inventory + self.bakery_inventory_expansion
-                        elif((curr_location == 0x2015 or curr_location == 0x2056) and ctx.slot_data["restaurant_sanity"] == True and self.progression_state > 0x63):
-                            self.bakery_inventory = []
-                            self.cursor_pos = -1
-                            await self.fill_restaurant_dialog(ctx)
-                            for i in range(6,-1,-1):
-                                if(self.restaurant_checks[i]==False):
-                                    self.bakery_inventory = [0x40] * (i+1)
-                                    break
-                            bread_to_add = self.bakery_inventory_default.copy()
-                            for i in range(len(self.bakery_inventory)):
-                                if(self.bakery_checks[i]==True):
-                                    if(len(bread_to_add)>0):
-                                        self.bakery_inventory[i]=bread_to_add.pop(0)
-                            self.bakery_inventory = self.bakery_inventory + bread_to_add + self.bakery_inventory_expansion
-                        else:
-                            self.bakery_inventory = self.bakery_inventory_default + self.bakery_inventory_expansion
-                        self.bakery_inventory = self.bakery_inventory[:40]
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(store_table[curr_location][self.jp_version].inventory_id, self.bakery_inventory, MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.bakery_inventory)], MAIN_RAM)]
-                        )
-                        if(store_table[curr_location][self.jp_version].inventory_length_id_expanded):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(store_table[curr_location][self.jp_version].inventory_length_id_expanded, [len(self.bakery_inventory)], MAIN_RAM)]
-                            )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(store_table[curr_location][self.jp_version].inventory_pointer_upper_pointer, store_table[curr_location][self.jp_version].inventory_pointer_upper, MAIN_RAM)] #somehow coresponds to 0x801f
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(store_table[curr_location][self.jp_version].inventory_pointer_lower_pointer, store_table[curr_location][self.jp_version].inventory_pointer_lower, MAIN_RAM)]
-                        )
-                    if(curr_location in restaurant_locations):
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x11514A + (self.jp_version * 0xa70), [0x0], MAIN_RAM)]
-                        )
-                        #logger.info("entered restaurant")
-                        if(ctx.slot_data["restaurant_sanity"] == True):
-                            if(False in self.restaurant_checks or not set(received_list).issuperset(set(self.restaurant_inventory_default))):
-                                self.update_list_of_received_items(ctx)
-                                self.restaurant_dialog = []
-                                self.cursor_pos = -1
-
-                                for i in range(7):
-                                    loc_id = standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
-                                    if(loc_id in ctx.locations_info):
-                                        if(self.restaurant_checks[i]==True):
-                                            if(self.jp_version == False):
-                                                s = "Purchased"
-                                            else:
-                                                s = "かいもの"
-                                        else:
-                                            s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
-                                        self.restaurant_dialog = self.restaurant_dialog + [s]
-                                        s = ctx.player_names[ctx.locations_info[loc_id].player]
-                                        self.restaurant_dialog = self.restaurant_dialog + [s]
-                                    else:
-                                        if(not standard_location_name_to_id["Item 1 - Restaurant"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                            for i in range(7):
-                                                self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                        await ctx.send_msgs([{
-                                            "cmd": "LocationScouts",
-                                            "locations": self.table_ids_to_hint,
-                                            "create_as_hint": 0
-                                        }])
-                                        break
-                                self.fix_dialog(self.restaurant_dialog)
-
-                                #logger.info("bakery dialog %s", self.bakery_dialog)
-                                self.restaurant_inventory = self.restaurant_inventory_sanity.copy()
-
-                                for i in range(len(self.restaurant_inventory)-1,-1,-1):
-                                    if(self.restaurant_checks[i]==True):
-                                        self.restaurant_inventory.pop(i)
-                                    else:
-                                        break
-
-                                restaurant_to_add = list(set(self.restaurant_inventory_default) & set(received_list))
-                                for i in range(len(self.restaurant_inventory)):
-                                    if(self.restaurant_checks[i]==True):
-                                        if(len(restaurant_to_add)>0):
-                                            self.restaurant_inventory[i]=restaurant_to_add.pop(0)
-                                self.restaurant_inventory = self.restaurant_inventory + restaurant_to_add
-                                self.restaurant_inventory = self.restaurant_inventory[:7]
-
-                                restaurant_dialog_pointers = []
-                                for i in range(len(self.restaurant_inventory)):
-                                    restaurant_dialog_pointers = restaurant_dialog_pointers + restaurant_pointers[curr_location][self.jp_version][self.restaurant_inventory[i]]
-
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(store_table[curr_location][self.jp_version].inventory_id, self.restaurant_inventory, MAIN_RAM)]
-                                )
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.restaurant_inventory)], MAIN_RAM)]
-                                )
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(restaurant_pointers_pointers[curr_location][self.jp_version], restaurant_dialog_pointers, MAIN_RAM)]
-                                )
-                    if(curr_location in grocery_locations): # 0x2015chapter 2 Jam, also changes to 0x2056 chapter 3
-                        if(ctx.slot_data["grocery_sanity"] == True):
-                            #await self.update_progression(ctx)
-                            self.update_list_of_received_items(ctx)
-                            self.grocery_dialog = []
-                            self.cursor_pos = -1
-                            
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x11514A + (self.jp_version * 0xa70), [0x0], MAIN_RAM)] #set cursor to zero incase it is greater than the current index
-                            )
-                            if(len(self.grocery_inventory_sanity)<12 or 0 in self.grocery_inventory_sanity):
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0BA202 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                rice_ball = 0
-                                rice_state = int.from_bytes(save_data, byteorder='little')
-                                if(rice_state == 0x4):
-                                    if(self.message_level > 0):
-                                        logger.info("rice ball item available")
-                                    rice_ball = 1
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0BA213 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                neatball = 0
-                                neatball_state = int.from_bytes(save_data, byteorder='little')
-                                if(neatball_state == 0x3):
-                                    if(self.message_level > 0):
-                                        logger.info("neatball item available")
-                                    neatball = 1
-                                if(neatball == 1 or rice_ball == 1):
-                                    if(rice_ball == 1 and not 0x1 in self.grocery_inventory_default):
-                                        self.grocery_inventory_default = self.grocery_inventory_default + [0x1]
-                                    if(neatball == 1 and not 0x6a in self.grocery_inventory_default):
-                                        self.grocery_inventory_default = self.grocery_inventory_default + [0x6a]
-                                    if(len(self.grocery_inventory_sanity) < 11):
-                                        if(neatball == 1 and rice_ball == 0):
-                                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(11-len(self.grocery_inventory_sanity)) + [0x42]
-                                        elif(neatball == 0 and rice_ball == 1):
-                                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(10-len(self.grocery_inventory_sanity)) + [0x42] 
-                                        else:
-                                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(10-len(self.grocery_inventory_sanity)) + [0x42, 0x42]
-                                    elif(len(self.grocery_inventory_sanity) == 11 and neatball == 1): 
-                                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42]
-                                    elif(rice_ball == 1):
-                                        self.grocery_inventory_sanity[10] = 0x42
-
-                            if(not 0xb in self.grocery_inventory_default):
-                                #if(self.progression_state >= 0x12c):
-                                if(game_state[17][14] & 0b1000 == 0b1000): #tim is saved, add orange to inventory
-                                    if(len(self.grocery_inventory_sanity) < 11): #no Riceball or Neatball yet
-                                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42]
-                                        self.grocery_inventory_default = self.grocery_inventory_default + [0xb]
-                                    else: #have either Riceball or Neatball
-                                        self.grocery_inventory_sanity[7] = 0x42
-                                        self.grocery_inventory_default = self.grocery_inventory_default[:7] + [0xb] + self.grocery_inventory_default[7:]
-
-                            #if(curr_location == 0x207c or curr_location == 0x2099): #Chapter 4/5/6
-                            if(self.num_bosses_killed > 1): #Chapter 4/5/6
-                                if(not 0x7 in self.grocery_inventory_default):
-                                    self.grocery_inventory_default = self.grocery_inventory_default[:3] + [0x7] + self.grocery_inventory_default[3:5] + [0x6d] + self.grocery_inventory_default[5:] #EX-Drink and H-Mint
-                                    if(len(self.grocery_inventory_sanity) < 11): #no Riceball or Neatball yet
-                                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42,0x42]
-                                    else:
-                                        self.grocery_inventory_sanity[8] = 0x42
-                                        self.grocery_inventory_sanity[9] = 0x42
-                                    
-                            self.grocery_inventory = [0x0a]
-                            #logger.info("bakery inventory %s",self.bakery_inventory)
-                            #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
-                            #logger.info("bakery inventory len %s",len(self.bakery_inventory))
-                            #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
-
-
-                            for i in range(len(self.grocery_inventory_sanity)):
-                                loc_id = standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
-                                if(loc_id in ctx.locations_info):
-                                    if(self.grocery_checks[i]==True):
-                                        if(self.jp_version == False):
-                                            s = "Purchased"
-                                        else:
-                                            s = "かいもの"
-                                    else:
-                                        s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
-                                    self.grocery_dialog = self.grocery_dialog + [s]
-                                    s = ctx.player_names[ctx.locations_info[loc_id].player]
-                                    self.grocery_dialog = self.grocery_dialog + [s]
-                                else:
-                                    if(not standard_location_name_to_id["Item 1 - Grocery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                        for i in range(12):
-                                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    #logger.info("no scout information found try reentering area (after taking a couple steps) %s", self.table_ids_to_hint)
-                                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                    await ctx.send_msgs([{
-                                        "cmd": "LocationScouts",
-                                        "locations": self.table_ids_to_hint,
-                                        "create_as_hint": 0
-                                    }])
-                                    break
-                            self.fix_dialog(self.grocery_dialog)
-
-                            #logger.info("bakery dialog %s", self.bakery_dialog)
-                            self.grocery_inventory = self.grocery_inventory_sanity.copy()
-
-                            for i in range(len(self.grocery_inventory)-1,-1,-1):
-                                if(self.grocery_checks[i]==True or self.grocery_inventory[i]==0x0):
-                                    self.grocery_inventory.pop(i)
-                                else:
-                                    break
-
-                            #logger.info("starting inventory %s", self.grocery_inventory)
-                            #logger.info("grocery default %s", self.grocery_inventory_default)
-                            #grocery_to_add = list(set(self.grocery_inventory_default) & set(received_list))
-                            grocery_to_add = []
-                            for i in range(len(self.grocery_inventory_default)):
-                                if(self.grocery_inventory_default[i] in received_list or (ctx.slot_data["grocery_s_revive"] == True and self.grocery_inventory_default[i] == 0xa)):
-                                    grocery_to_add = grocery_to_add + [self.grocery_inventory_default[i]]
-                                    #logger.info("grocery to add %s", grocery_to_add)
-                            if(received_list.count(0x6) > 1 and 0x7 in self.grocery_inventory_default):
-                                grocery_to_add = [0x7 if x==0x6 else x for x in grocery_to_add]
-                            if(received_list.count(0x8) > 1 and 0x6d in self.grocery_inventory_default):
-                                grocery_to_add = [0x6d if x==0x8 else x for x in grocery_to_add]
-                            #logger.info("grocery to add %s", grocery_to_add)
-
-                            if(len(self.grocery_inventory) >= 4 and 0xa in grocery_to_add):
-                                if(self.grocery_checks[3]==True):
-                                    self.grocery_inventory[3] = 0xa
-                                    grocery_to_add.remove(0xa)
-                            
-                            for i in range(len(self.grocery_inventory)):
-                                if(self.grocery_checks[i]==True or self.grocery_inventory[i]==0x0):
-                                    if(self.grocery_inventory[i] != 0xa):
-                                        if(len(grocery_to_add)>0):
-                                            #logger.info("bread to add %s", bread_to_add)
-                                            #logger.info("bakery inventory %s", self.bakery_inventory)
-                                            #logger.info("bakery inventory sanity %s", self.bakery_inventory_sanity)
-                                            self.grocery_inventory[i]=grocery_to_add.pop(0)
-                            #logger.info("inventory after after grocery to add %s", self.grocery_inventory)
-                                    
-                            self.grocery_inventory = self.grocery_inventory + grocery_to_add
-
-                            if(len(self.grocery_inventory) >= 4 and 0xa in self.grocery_inventory):
-                                if(self.grocery_checks[3]==True):
-                                    if(self.grocery_inventory[3] != 0xa):
-                                        for i in range(len(self.grocery_inventory)):
-                                            if(self.grocery_inventory[i] == 0xa):
-                                                self.grocery_inventory[i] = self.grocery_inventory[3]
-                                        self.grocery_inventory[3] = 0xa
-                            #logger.info("inventory after after final adds grocery to add %s", self.grocery_inventory)
-                        
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(store_table[curr_location][self.jp_version].inventory_id, self.grocery_inventory, MAIN_RAM)]
-                            )
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.grocery_inventory)]*8, MAIN_RAM)]
-                            )
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(store_table[curr_location][self.jp_version].inventory_pointer_upper_pointer, store_table[curr_location][self.jp_version].inventory_pointer_upper, MAIN_RAM)] #somehow coresponds to 0x801f
-                            )
-                    
-                    if(curr_location in toy_shop_locations): # 0x2015chapter 2 Jam, also changes to 0x2056 chapter 3
-                        if(ctx.slot_data["toy_sanity"] == True):
-                            
-                            if(len(self.toy_dialog[29]) == 0):
-                                for i in range(len(self.toy_checks)):
-                                    loc_id = standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
-                                    if(loc_id in ctx.locations_info):
-                                        self.toy_dialog[i] = await self.assemble_binary_array_for_toyshop(ctx,loc_id,toy_shop_dialog_length[self.jp_version][i])
-                                    else:
-                                        if(not standard_location_name_to_id["Musashi - Toy Shop"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                            for i in range(30):
-                                                self.table_ids_to_hint.append(standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                        logger.info("no scout information found try reentering area (after taking a couple steps)")
-                                        #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                        await ctx.send_msgs([{
-                                            "cmd": "LocationScouts",
-                                            "locations": self.table_ids_to_hint,
-                                            "create_as_hint": 0
-                                        }])
-                                        break
-                            
-                            if(len(self.toy_dialog[29]) != 0):
-                                if(self.message_level > 0):
-                                    logger.info("writing toy dialog")
-                                for i in range(len(self.toy_inventory)):
-                                    if(self.toy_inventory[i]):
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(toy_shop_dialog[curr_location][self.jp_version][i], self.toy_dialog[i], MAIN_RAM)]
-                                        )
-                            
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(toy_shop_fix[curr_location][self.jp_version], [0x10], MAIN_RAM)]
-                            )
-
-                            save_data: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba239 + (self.jp_version * -0xea0), 13, MAIN_RAM)]
-                            ))[0]
-                            new_toy_purchased_to_update: List[bool] = [val & 0b11110000 == 0b10010000 for val in save_data]
-                            if(True in new_toy_purchased_to_update):
-                                for i in range(len(new_toy_purchased_to_update)):
-                                    if(new_toy_purchased_to_update[i]):
-                                        if(self.message_level > 0):
-                                            logger.info("adding yet to be randomized toy to storage")
-                                        save_data: bytes = (await bizhawk.read(
-                                            ctx.bizhawk_ctx,
-                                            [(0x0ba239+i + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                        ))[0]
-                                        toy_data = save_data[0] | 0b1000000
-                                        toy_data = toy_data & 0b11101111
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(0x0ba239+i + (self.jp_version * -0xea0), [toy_data], MAIN_RAM)]
+                            if(ctx.slot_data["steamwood_elevator_logic"] != 1):
+                                if(self.elevator_active == False and (is_musashi_on_elevator == 1 or (musashi_floor != elevator_floor and elevator_state == 1))):
+                                    self.elevator_active = True
+                                    #logger.info("Musashi floor %s", musashi_floor)
+                                    #logger.info("Elevator floor %s", elevator_floor)
+                                    #logger.info("Restarting Elevator")
+                                    if(curr_location == 0x301d):
+                                        await self.write_ram(
+                                            ctx,
+                                            [(self.address.steamwood_valves, [0xff, 0xff], MAIN_RAM)] 
                                         )
-                    if(curr_location == 0x3003): #At Geezer
-                        if(ctx.slot_data["tech_sanity"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                tech_fix[self.jp_version]
-                            )
-                            if(len(self.tech_dialog[6]) == 0):
-                                for i in range(len(self.tech_checks)):
-                                    loc_id = standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
-                                    if(loc_id in ctx.locations_info):
-                                        self.tech_dialog[i] = await self.assemble_binary_array_for_textbox(ctx,loc_id)
                                     else:
-                                        if(not standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                            for i in range(7):
-                                                self.table_ids_to_hint.append(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                        logger.info("no scout information found try reentering area (after taking a couple steps)")
-                                        #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                        await ctx.send_msgs([{
-                                            "cmd": "LocationScouts",
-                                            "locations": self.table_ids_to_hint,
-                                            "create_as_hint": 0
-                                        }])
-                                        break
-                            
-                            if(len(self.tech_dialog[6]) != 0):
-                                if(self.message_level > 0):
-                                    logger.info("writing tech dialog")
-                                for i in range(len(self.tech_dialog)):
-                                    if(self.tech_checks[i] == False):
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(castle_dialog[self.jp_version][i], self.tech_dialog[i], MAIN_RAM)]
+                                        await self.write_ram(
+                                            ctx,
+                                            [(self.address.steamwood_2_valves, [0xff, 0xff], MAIN_RAM)] 
                                         )
-                        if(ctx.slot_data["skip_minigame_town_on_fire"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x17f0e8 + (self.jp_version * 0x200), [0xb2], MAIN_RAM)]
-                            )
-                        if(self.progression_state == 0x28a): #Ask geezer about gondola gizmo and his state is too high
-                            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba1f3 + (self.jp_version * -0xea0), [0x7], MAIN_RAM)]
-                                )
-                            elif(int.from_bytes(game_state[27], byteorder='little') > 7):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba1f3 + (self.jp_version * -0xea0), [0x1], MAIN_RAM)]
-                                )
-                        if(int.from_bytes(game_state[8], "little") in [1, 2]): #KnightB state
-                            if(game_state[4][11] & 0b10000000 == 0b10000000): #skullpion killed
-                                if(self.message_level > 0):
-                                    logger.info("skullpion killed, can get crosswise cut")
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x18090c + (self.jp_version * 0x200), [0xa, 0x0], MAIN_RAM)]
-                                )
-                            else:
-                                if(self.message_level > 0):
-                                    logger.info("skullpion not killed, can't get crosswise cut")
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x18090c + (self.jp_version * 0x200), [0x40, 0x6], MAIN_RAM)]
-                                )
-                    if(curr_location == 0x1011): #chapter 2 upper town
-                        if(self.progression_state == 0x14):
-                            self.try_to_update_connections = True
-
-                    if(curr_location in boss_core_dialog): #At a Boss
-                        if(ctx.slot_data["core_sanity"] == False and curr_location == 0x3042 and ctx.slot_data["quest_item_sanity"] == True and not item_name_to_id["Key"] in received_list):
-                            for jump_id in boss_core_update[curr_location][self.jp_version]:
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(jump_id, [0,0,0,0], MAIN_RAM)]
-                                )
-                            if(self.message_level > 0):    
-                                logger.info("temporarily hiding water boss core until Key to mine is found to prevent soft locks")
-
-                        if(ctx.slot_data["core_sanity"] == True):
-                            for jump_id in boss_core_update[curr_location][self.jp_version]:
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(jump_id, [0,0,0,0], MAIN_RAM)]
-                                )
-                            for loc_id, dialog_id in boss_core_dialog[curr_location].items():
+                                elif(self.elevator_active == True and is_musashi_on_elevator == 0):
+                                    if(musashi_floor == 1):
+                                        if(elevator_state == 7):
+                                            #logger.info("Stopping Elevator")
+                                            self.elevator_active = False
+                                            if(curr_location == 0x301d):
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.steamwood_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                )
+                                            else:
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.steamwood_2_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                )
+                                    elif(ctx.slot_data["steamwood_elevator_logic"] == 2):
+                                        if(musashi_floor == 2):
+                                            if(elevator_state == 2):
+                                                #logger.info("Stopping Elevator")
+                                                self.elevator_active = False
+                                                if(curr_location == 0x301d):
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                                else:
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_2_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                        elif(musashi_floor == 3):
+                                            if(elevator_state == 3):
+                                                #logger.info("Stopping Elevator")
+                                                self.elevator_active = False
+                                                if(curr_location == 0x301d):
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                                else:
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_2_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                    elif(ctx.slot_data["steamwood_elevator_logic"] == 3):
+                                        if(musashi_floor == 2):
+                                            if(elevator_state == 6):
+                                                self.elevator_active = False
+                                                if(curr_location == 0x301d):
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                                else:
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_2_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                        elif(musashi_floor == 3):
+                                            if(elevator_state == 5):
+                                                self.elevator_active = False
+                                                if(curr_location == 0x301d):
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+                                                else:
+                                                    await self.write_ram(
+                                                        ctx,
+                                                        [(self.address.steamwood_2_valves, [0x00, 0x00], MAIN_RAM)] 
+                                                    )
+
+
+                if(curr_location == 0x3060 or curr_location == 0x3062 or curr_location == 0x305d or curr_location == 0x305e or curr_location == 0x3063):
+                    if(self.poll_scheduler.due("frozen_palace_dialog", 2.5)):
+                        if(curr_location in dialog_location_table):
+                            for loc_id, dialog_id in dialog_location_table[curr_location].items():
                                 if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                #for i in range(len(self.core_checks)):
-                                    #loc_id = standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i
-                                    #if(loc_id in ctx.locations_info):
-                                        #logger.info("loop index %s", i)
-                                        #logger.info("textbox length %s", boss_core_dialog[[boss_locations[i]][1])
-                                        #logger.info("location id %s", loc_id)
-
-
-                                    barray = await self.assemble_binary_array_for_boss_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset),dialog_id[self.jp_version][1])
-                                    if(self.message_level > 0):
-                                        logger.info("writing boss core dialog")
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(dialog_id[self.jp_version][0]+4, barray, MAIN_RAM)]
+                                    if(loc_id in short_text_boxes):
+                                        barray = await self.assemble_short_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
+                                    else:
+                                        barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
+                                    await self.write_ram(
+                                        ctx,
+                                        [(dialog_id[self.jp_version]+4, barray, MAIN_RAM)]
                                     )
-                                else:
-                                    if(not standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                        for i in range(4):
-                                            self.table_ids_to_hint.append(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    logger.info("no scout information found")
-                                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                    await ctx.send_msgs([{
-                                        "cmd": "LocationScouts",
-                                        "locations": self.table_ids_to_hint,
-                                        "create_as_hint": 0
-                                    }])
-                                    break
-                    if(curr_location == 0x3072):
-                        if(ctx.slot_data["skip_minigame_ant_gondola"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x18446c + (self.jp_version * 0x138), [0x74], MAIN_RAM)]
-                            )
-                    if(curr_location == 0x304e): #in well
-                        #await self.update_progression(ctx)
-                        if(ctx.slot_data["core_sanity"] == True or ctx.slot_data["scroll_sanity"] == True or ctx.slot_data["quest_item_sanity"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x182e1c + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #skip over water scroll updating progression state
+                if(curr_location == 0x3025): #Twinpeak Entrance
+                    await self.write_ram(
+                        ctx,
+                        [(self.address.bracelet_chest_progression, [0], MAIN_RAM)]
+                    ) #disable changing progression when opening bracelet chest
+                    #en
+                    #volatile uint32_t *disableBraceletProgression = 0x8018570c;
+                    #*(disableBraceletProgression)=0;
+                    #jp
+                    #volatile uint32_t *disableBraceletProgression = 0x8018590c;
+                    #*(disableBraceletProgression)=0;
+                if(curr_location == 0x3029 and self.check_for_logs): #Twinpeak second peak check if raft needs updated
+                    if(self.poll_scheduler.due("raft_logs", 3.25)):
+                        await self.update_inventory(ctx)
+                        if(0x4e in self.curr_inventory and 0x50 in self.curr_inventory and 0x51 in self.curr_inventory and 0x52 in self.curr_inventory):
+                            #logger.info("Raft complete, removing Logs")
+                            self.check_for_logs = 0
+                            save_data: bytes = (await self.read_ram(ctx, [(
+                                self.address.logs, 1, MAIN_RAM
+                            )]))[0]
+                            raft_state = int.from_bytes(save_data, byteorder='little')
+                            raft_state = raft_state | 0b11000000
+                            await self.write_ram(
+                                ctx,
+                                [(self.address.logs, [raft_state], MAIN_RAM)]
                             )
-                            if(self.progression_state < 0x19a): #before entering church
-                                if(self.message_level > 0):
-                                    logger.info("Hiding bell to prevent soft lock, return after Father White makes a request for the bell and learning how to enter the restaurant basement")
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x1207e6 + (self.jp_version * 0xa70), 2, MAIN_RAM)]
-                                ))[0]
-                                bell_z = int.from_bytes(save_data, byteorder='little')
-                                if(bell_z == 0xfe6e):
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x1207e6 + (self.jp_version * 0xa70), [0xff,0xfe], MAIN_RAM)] #hide the bell in a wall
+                            for i in range(len(self.curr_inventory)):
+                                if(self.curr_inventory[i] in [0x4d,0x4e,0x50,0x51,0x52]): #Jon's key and four logs
+                                    await self.write_ram(
+                                        ctx,
+                                        [(self.address.inventory + i, [0x0], MAIN_RAM)] 
                                     )
-                                else:
-                                    save_data: bytes = (await bizhawk.read(
-                                        ctx.bizhawk_ctx,
-                                        [(0x1209fe + (self.jp_version * 0xa70), 2, MAIN_RAM)]
-                                    ))[0]
-                                    bell_z = int.from_bytes(save_data, byteorder='little')
-                                    if(bell_z == 0xfe6e):
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(0x1209fe + (self.jp_version * 0xa70), [0xff,0xfe], MAIN_RAM)] #hide the bell in a wall
-                                        )
-                                    else:
-                                        logger.info("Could not find bell in memory")
-
-                            else:
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba1c2 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                bell_state: bool = save_data[0] == 0b1001110 #is in intial spawn position
-                                if(bell_state):
-                                    save_data: bytes = (await bizhawk.read(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ae65f + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                    ))[0]
-                                    water_level_changed: bool = save_data[0] & 0b1 == 0b1
-                                    if(water_level_changed):
-                                        if(self.message_level > 0):
-                                            logger.info("water level has risen, moving bell to prevent soft lock")
-
-                                        save_data: bytes = (await bizhawk.read(
-                                            ctx.bizhawk_ctx,
-                                            [(0x1207e6 + (self.jp_version * 0xa70), 2, MAIN_RAM)]
-                                        ))[0]
-                                        bell_z = int.from_bytes(save_data, byteorder='little')
-                                        if(bell_z == 0xfe6e):
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1207e2 + (self.jp_version * 0xa70), [0x27,0x06, 0x0, 0x0, 0x7e, 0xfd, 0x0, 0x0, 0x80, 0xff], MAIN_RAM)] #water level has risen but bell has not been rescued, move bell to higher ground
-                                            )
-                                        else:
-                                            save_data: bytes = (await bizhawk.read(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1209fe + (self.jp_version * 0xa70), 2, MAIN_RAM)]
-                                            ))[0]
-                                            bell_z = int.from_bytes(save_data, byteorder='little')
-                                            if(bell_z == 0xfe6e):
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1209fa + (self.jp_version * 0xa70), [0x27,0x06, 0x0, 0x0, 0x7e, 0xfd, 0x0, 0x0, 0x80, 0xff], MAIN_RAM)] #water level has risen but bell has not been rescued, move bell to higher ground
-                                                )
-                                            else:
-                                                logger.info("Could not find bell in memory")
-                            
-                        if(ctx.slot_data["core_sanity"] == True):
-                            if(self.progression_state < 0x258 or self.progression_state > 0x276): #before killing Relic Keeper or after fixing well
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x1845f4 + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #skip over water crest updating progression state
+                if(curr_location == 0x302a): #rafting minigame
+                    if(ctx.slot_data["raft_difficulty"] == 3 or ctx.slot_data["raft_hp"] != 4):
+                        if(self.poll_scheduler.due("raft", 1.25)):
+                            save_data: bytes = (await self.read_ram(ctx, [(self.address.raft_hp, 1, MAIN_RAM),(self.address.raft_hp_displayed, 1, MAIN_RAM)]))
+                            self.raft_hp = int.from_bytes(save_data[0], byteorder='little')
+                            #logger.info("log data %s", save_data)
+                            #self.raft_hp = save_data[0]
+                            if(ctx.slot_data["raft_hp"] != 4 and int.from_bytes(save_data[1], byteorder='little') == 4):
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.raft_hp, [ctx.slot_data["raft_hp"]], MAIN_RAM), (self.address.raft_hp_displayed, [ctx.slot_data["raft_hp"]], MAIN_RAM)] #fix starting raft hp
                                 )
-                    if(curr_location == 0x1052 or curr_location == 0x1077): #in chapter 3 and 4 town
-                        if(ctx.slot_data["core_sanity"] == True):
-                            save_data: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae65f + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                            ))[0]
-                            water_level_changed: bool = save_data[0] & 0b1 == 0b1
-                            if(water_level_changed):
-                                #await self.update_progression(ctx)
-                                if(self.progression_state >= 0x19a and self.progression_state < 0x1ae): #getting rope reward
-                                    if(self.message_level > 0):
-                                        logger.info("removing rope to prevent soft lock")
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x18f7b0 + (self.jp_version * 0x1f0), [0], MAIN_RAM)] #removing rope as a reward
-                                    )
-                                save_data: bytes = (await bizhawk.read(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae668 + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                                ))[0]
-                                rope_into_well: bool = save_data[0] & 0b1000000 == 0b1000000
-                                if(rope_into_well):
-                                    if(self.message_level > 0):
-                                        logger.info("removing rope to prevent soft lock")
-                                    remove_rope = save_data[0] & 0b10111111
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ae668 + (self.jp_version * -0xea0), [remove_rope], MAIN_RAM)] #water level has risen remove rope from well
-                                    )
-                                if(self.progression_state == 0x258): #defeated relic keeper
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x078e80 + (self.jp_version * -0xea0), [0x76], MAIN_RAM)] #well was fixed move progression state
+                            if(ctx.slot_data["raft_difficulty"] == 3):
+                                self.raft_regrow_timer += 1 
+                                if(self.raft_hp == 4):
+                                    self.raft_regrow_timer = 0
+                                if(self.raft_regrow_timer >= ctx.slot_data["raft_regrow"]):
+                                    self.raft_regrow_timer = 0
+                                    await self.write_ram(
+                                        ctx,
+                                        [(self.address.raft_hp, [self.raft_hp + 1], MAIN_RAM)] #add a log
                                     )
-                    if(curr_location == 0x3023): #at volcano near wind scroll
-                        if(ctx.slot_data["core_sanity"] == True):
-                            #await self.update_progression(ctx)
-                            if(self.progression_state < 0x3d4): #before steamwood 2
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x182d38 + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #dont update progression for wind scroll
-                                )
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x18386c + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #dont update progression for freed from bincho
-                                )
-                    #if(curr_location == 0x1094): #Chapter 5 town
-                    #    if(ctx.slot_data["core_sanity"] == True):
-                    #        #await self.update_progression(ctx)
-                    #        if(self.progression_state > 0x3d4 and self.progression_state < 0x460): #after steamwood 2
-                    #            if(self.found_wind_scroll): #already went to wind scroll
-                    #                await bizhawk.write(
-                    #                    ctx.bizhawk_ctx,
-                    #                    [(0x078e80 + (self.jp_version * -0xea0), [0x60, 0x04], MAIN_RAM)] #update progression to freed from bincho
-                    #                )
-                    if(curr_location == 0x301b): #entering Meandering Forest
+
+                    """if(ctx.slot_data["skip_minigame_follow_leno"] == True):
                         save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                            0x0ba284 + (self.jp_version * -0xea0), 1, MAIN_RAM
+                            0x0ba284, 1, MAIN_RAM
                         )]))[0]
                         leno_state = int.from_bytes(save_data, byteorder='little')
-                        if(leno_state > 0 and leno_state < 0xf and ctx.slot_data["leno_sniff_modifier"] != 100):
-                            snif_multiplier: float = 100.0
-                            snif_multiplier = ctx.slot_data["leno_sniff_modifier"] / snif_multiplier 
-                            write_instructions = []
-                            write_instructions.append((0x181434 + (self.jp_version * 0x188), math.ceil(0xb4 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d40 + (self.jp_version * 0x188), math.ceil(0xb4 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d4c + (self.jp_version * 0x188), math.ceil(0xd2 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x181488 + (self.jp_version * 0x188), math.ceil(0xd2 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d68 + (self.jp_version * 0x188), math.ceil(0xf0 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x1814a0 + (self.jp_version * 0x188), math.ceil(0xf0 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d74 + (self.jp_version * 0x188), math.ceil(0x10e * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x1814ac + (self.jp_version * 0x188), math.ceil(0x10e * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d90 + (self.jp_version * 0x188), math.ceil(0x12c * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x1814c4 + (self.jp_version * 0x188), math.ceil(0x12c * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x180d9c + (self.jp_version * 0x188), math.ceil(0x14a * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            write_instructions.append((0x1814d0 + (self.jp_version * 0x188), math.ceil(0x14a * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                write_instructions
-                            )
-                    if(curr_location == 0x3014): #entering Somnolent Forest
-                        if(ctx.slot_data["skip_minigame_follow_leno"] == True):
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                0x0ba284 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                            )]))[0]
-                            leno_state = int.from_bytes(save_data, byteorder='little')
-                            if(leno_state > 0 and leno_state < 0x3):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba284 + (self.jp_version * -0xea0), [0x0e], MAIN_RAM), (0x190614 + (self.jp_version * 0x5c), [0x22, 0x30, 0x00, 0x04], MAIN_RAM)] #graveyard 0x04003022
-                                )
-                    if(curr_location == 0x302a): #rafting minigame
-                        if(ctx.slot_data["raft_difficulty"] == 2):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x17ece0 + (self.jp_version * -0xea0), [0x0, 0x0], MAIN_RAM)] #remove damage calculation for rafting #, [0x200]????
-                            )
-                    if(curr_location == 0x1010 or curr_location == 0x1011 or curr_location == 0x301c or curr_location == 0x301d or curr_location == 0x301e or curr_location == 0x3020):
-                        if(ctx.slot_data["steamwood_timer"] != 100):
-                            #await self.update_progression(ctx)
-                            if((self.progression_state < 0x0082 and self.progression_state >= 0x0078) or (self.progression_state < 0x03d4 and self.progression_state >= 0x03ca)):
-                                time_modifier = math.ceil(ctx.slot_data["steamwood_timer"] * 0x1555 / 100.0)
-                                if(ctx.slot_data["steamwood_timer"] == 1):
-                                    time_modifier = 0x25
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x14ae6c + (self.jp_version * 0x2d0), time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix steamwood timer
-                                )
-                        gizmos_in_inventory = sum([val in [0x63, 0x64, 0x65, 0x66] for val in game_state[19]])
-                        if(gizmos_in_inventory > 1): #gondola gizmos in inventory
-                            #logger.info("gizmos in inventory %s", gizmos_in_inventory)
-                            new_inventory: List[int] = [val for val in game_state[19]] 
-                            for i in range(11,-1,-1):
-                                if(new_inventory[i] in [0x63, 0x64, 0x65, 0x66] and gizmos_in_inventory > 1):
-                                    new_inventory[i] = 0
-                                    gizmos_in_inventory = gizmos_in_inventory - 1
-
-                            #new_inventory: List[int] = [val for val in save_data[19]] 
+                        if(leno_state > 0 and leno_state < 0x3):
                             await bizhawk.write(
                                 ctx.bizhawk_ctx,
-                                [(0x0ba1e7 + (self.jp_version * -0xea0), new_inventory, MAIN_RAM)]
-                            )
-                            if(self.message_level > 0):
-                                logger.info("removing extra gondola gizmos from inventory (They are very heavy)")
-
-                    if(curr_location == 0x301d or curr_location == 0x3020): #steamwood
-                        write_instructions = []
-                        if(ctx.slot_data["steamwood_random_valves"] == True):
-                            if(curr_location == 0x301d):#steamwood 1
-                                write_instructions.append((0x183cf8 + (self.jp_version * 0x1c0), [0x99, 0xb] * 7, MAIN_RAM)) #fix steamwood 1 valve timer
-                            else:
-                                write_instructions.append((0x184ed0 + (self.jp_version * 0x1c0), [0x99, 0xb] * 7, MAIN_RAM)) #fix steamwood 2 valve timer
-                        elif(ctx.slot_data["steamwood_valve_timer"] != 100):
-                            valve_long_timer = math.ceil(0x708 * ctx.slot_data["steamwood_valve_timer"] / 100.0).to_bytes(2, 'little')
-                            valve_short_timer = math.ceil(0x41a * ctx.slot_data["steamwood_valve_timer"] / 100.0).to_bytes(2, 'little')
-                            valve_timers = [valve_long_timer[0], valve_long_timer[1]] * 3 + [valve_short_timer[0], valve_short_timer[1]] * 2 + [valve_long_timer[0], valve_long_timer[1]] + [valve_short_timer[0], valve_short_timer[1]]
-                            if(curr_location == 0x301d):#steamwood 1
-                                write_instructions.append((0x183cf8 + (self.jp_version * 0x1c0), valve_timers, MAIN_RAM)) #fix steamwood 1 valve timer
-                            else:
-                                write_instructions.append((0x184ed0 + (self.jp_version * 0x1c0), valve_timers, MAIN_RAM)) #fix steamwood 2 valve timer
-                        if(ctx.slot_data["steamwood_disable_countdown"] == True):
-                            if(curr_location == 0x301d):#steamwood 1
-                                write_instructions.append((0x17ed0c + (self.jp_version * 0x200), [0x0, 0x0], MAIN_RAM)) #remove valve countdown
-                            else:
-                                write_instructions.append((0x17f4d8 + (self.jp_version * 0x200), [0x0, 0x0], MAIN_RAM)) #remove valve countdown
-                        if(ctx.slot_data["steamwood_pressure_rise_rate"] == 2): #Faster
-                            if(curr_location == 0x301d):
-                                write_instructions.append((0x183a28 + (self.jp_version * 0x1c8), [0x4] * 4, MAIN_RAM)) #steamwood 1 pressure rise
-                            else:
-                                write_instructions.append((0x184a60 + (self.jp_version * 0x1c8), [0x4] * 4, MAIN_RAM)) #steamwood 2 pressure rise
-                        elif(ctx.slot_data["steamwood_pressure_rise_rate"] == 3): #Slower
-                            if(curr_location == 0x301d):
-                                write_instructions.append((0x183a2c + (self.jp_version * 0x1c8), [0x3, 0x3, 0x4, 0x5], MAIN_RAM)) #steamwood 1 pressure rise
-                            else:
-                                write_instructions.append((0x184a64 + (self.jp_version * 0x1c8), [0x3, 0x3, 0x4, 0x5], MAIN_RAM)) #steamwood 2 pressure rise
-                        elif(ctx.slot_data["steamwood_pressure_rise_rate"] == 4): #Even 
-                            if(curr_location == 0x301d):
-                                write_instructions.append((0x183a28 + (self.jp_version * 0x1c8), [0x3] * 8, MAIN_RAM)) #steamwood 1 pressure rise
-                            else:
-                                write_instructions.append((0x184a60 + (self.jp_version * 0x1c8), [0x3] * 8, MAIN_RAM)) #steamwood 2 pressure rise
-                        if(ctx.slot_data["steamwood_progress_lost"] != -16):
-                            write_instructions.append((0x17c598 + (self.jp_version * 0x200), ctx.slot_data["steamwood_progress_lost"].to_bytes(2, 'little', signed=True), MAIN_RAM))
-                        top_edge = 17
-                        bottom_edge = 68
-                        if(ctx.slot_data["steamwood_width_of_ok_pressure"] != 12):
-                            #mid_point = 74
-                            half_width = round(ctx.slot_data["steamwood_width_of_ok_pressure"] / 2)
-                            if(half_width > 16):
-                                top_edge = 0
-                            else:
-                                top_edge = top_edge - half_width
-                            bottom_edge = 96 - top_edge - ctx.slot_data["steamwood_width_of_ok_pressure"]
-                            write_instructions.append((0x17c540 + (self.jp_version * 0x200), (bottom_edge * -1).to_bytes(2, 'little', signed=True), MAIN_RAM)) #steamwood bottom edge calculation
-                            write_instructions.append((0x17c544 + (self.jp_version * 0x200), (ctx.slot_data["steamwood_width_of_ok_pressure"] + 1).to_bytes(2, 'little'), MAIN_RAM)) #steamwood top edge calculation
-                            if(curr_location == 0x301d):
-                                write_instructions.append((0x18397a + (self.jp_version * 0x1d4), [ctx.slot_data["steamwood_width_of_ok_pressure"]], MAIN_RAM)) #steamwood 1 ok bar thickness
-                                write_instructions.append((0x183976 + (self.jp_version * 0x1d4), [top_edge+1], MAIN_RAM)) #steamwood 1 top edge
-                            else:
-                                write_instructions.append((0x1849b2 + (self.jp_version * 0x1d4), [ctx.slot_data["steamwood_width_of_ok_pressure"]], MAIN_RAM)) #steamwood 2 ok bar thickness
-                                write_instructions.append((0x1849ae + (self.jp_version * 0x1d4), [top_edge+1], MAIN_RAM)) #steamwood 2 top edge
-                        if(ctx.slot_data["steamwood_valve_progress_modifier"] != 100):
-                            if(curr_location == 0x301d):
-                                write_instructions.append((0x183a30 + (self.jp_version * 0x1c8), [
-                                    math.ceil(0x30 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x28 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x20 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x18 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0)
-                                ], MAIN_RAM)) #steamwood 1 valve progress
-                            else:
-                                write_instructions.append((0x184a68 + (self.jp_version * 0x1c8), [
-                                    math.ceil(0x30 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x28 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x20 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x18 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
-                                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0)
-                                ], MAIN_RAM)) #steamwood 2 valve progress
-                        if(ctx.slot_data["steamwood_no_fail_over_pressure"] == True):
-                            write_instructions.append((0x17c6dc + (self.jp_version * 0x200), [97 - top_edge], MAIN_RAM)) #check if over pressure
-                            write_instructions.append((0x17c6e4 + (self.jp_version * 0x200), [bottom_edge, 0x00, 0x02, 0x24, 0x0e, 0x02, 0x82], MAIN_RAM)) #set new pressure level
-                        #li $v0, 0x0001
-                        #noop
-                        #addu $v0, $a0
-                        #bne $v1, $v0, 0x8017dbf4
-                        if(curr_location == 0x301d):
-                            write_instructions.append((0x17dbc4 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24, 0x00, 0x00, 0x00, 0x00, 0x21, 0x10, 0x44, 0x00, 0x08, 0x00, 0x62, 0x14], MAIN_RAM)) #fix if the correct valve was completed
-                        else:
-                            write_instructions.append((0x17df00 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24, 0x00, 0x00, 0x00, 0x00, 0x21, 0x10, 0x44, 0x00, 0x08, 0x00, 0x62, 0x14], MAIN_RAM)) #fix if the correct valve was completed
+                                [(0x0ba284, [0x0e], MAIN_RAM), (0x190614, [0x22, 0x30, 0x00, 0x04], MAIN_RAM)] #graveyard 0x04003022
+                            )"""
+                if(self.check_if_lumina_was_found):
+                    if(ctx.slot_data["lumina_randomzied"] == True):
+                        save_data: bytes = (await self.read_ram(ctx, [(
+                            self.address.lumina, 1, MAIN_RAM
+                        )]))[0]
+                        lumina_state = int.from_bytes(save_data, byteorder='little')
+                        lumina_state = lumina_state & 0b1
+                        if((lumina_state == 1 and not curr_location in [0x3005, 0x3006, 0x3008, 0x3009, 0x300a]) or self.progression_state >= 0xa):
+                            self.check_if_lumina_was_found = 0
 
-                        if(curr_location == 0x301d):
-                            write_instructions.append((0x17dbb0 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24], MAIN_RAM)) #fix check if current valve is less than next valve
-                        else:
-                            write_instructions.append((0x17deec + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24], MAIN_RAM)) #fix check if current valve is less than next valve
-                        write_instructions.append((0x17db40 + (self.jp_version * 0x200), [0x00, 0x00 , 0x00, 0x00, 0x02, 0x00, 0x63, 0x24], MAIN_RAM)) #fix check if current valve is less than active valve
-                        valve_order = [2, 3, 4, 5, 6, 7]
-                        if(ctx.slot_data["steamwood_number_valves"] == 1):
-                            valve_order = [8]
-                            write_instructions.append((0x0ba286 + (self.jp_version * -0xea0), [0x08], MAIN_RAM)) #fix active valve
-                        elif(ctx.slot_data["steamwood_number_valves"] == 2):
-                            valve_order = [1, 8]
-                        else:
-                            if(ctx.slot_data["steamwood_random_valves"] == True):
-                                random.shuffle(valve_order)
-                            while(len(valve_order) + 2 > ctx.slot_data["steamwood_number_valves"]):
-                                valve_order.pop(random.randrange(len(valve_order))) 
-                            valve_order = [1] + valve_order + [8]
-                        valve_update = [8] * 7
-
-                        for i in range(len(valve_order)-1):
-                            # 1 7 2 5 3 4 6 8
-                            # 1 2 3 4 5 6 8
-                            valve_update[valve_order[i]-1] = valve_order[i+1]
-                        #logger.info("valve order %s", valve_order)
-                        #logger.info("valve update %s", valve_update)
-                        if(curr_location == 0x301d):
-                            write_instructions.append((0x183bc5 + (self.jp_version * 0x1c8), valve_update, MAIN_RAM)) #steamwood 1 valve order
-                        else:
-                            write_instructions.append((0x184c59 + (self.jp_version * 0x1c8), valve_update, MAIN_RAM)) #steamwood 2 valve order
+                            await ctx.check_locations([standard_location_name_to_id["Lumina - Spiral Tower"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)])
+                            #await ctx.send_msgs([{
+                            #    "cmd": "LocationChecks",
+                            #    "locations": [standard_location_name_to_id["Lumina - Spiral Tower"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)]
+                            #}])
+                    else:
+                        self.check_if_lumina_was_found = 0
 
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            write_instructions
-                        )
-                    if(curr_location == 0x302c or curr_location == 0x3029):
-                        if(ctx.slot_data["aqualin_timer"] != 100):
-                            #await self.update_progression(ctx)
-                            if(self.progression_state < 0x012c and self.progression_state >= 0x00f0):
-                                time_modifier = math.ceil(ctx.slot_data["aqualin_timer"] * 0x1555 / 100.0)
-                                if(ctx.slot_data["aqualin_timer"] == 1):
-                                    time_modifier = 0x25
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x14ae6c + (self.jp_version * 0x2d0), time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix aqualin timer
-                                )
-                    if(ctx.slot_data["restaurant_teleport_maze_no_fail"] == True):
-                        if(curr_location == 0x3032):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x18f638 + (self.jp_version * 0x1d4), [0x32, 0x30, 0x05, 0x00], MAIN_RAM)] #fix left teleporter first room
-                            )
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x18f680 + (self.jp_version * 0x1d4), [0x32, 0x30, 0x08, 0x00], MAIN_RAM)] #fix left teleporter third room
-                            )
-                        if(curr_location == 0x3033):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x19061c + (self.jp_version * 0x1d4), [0x33, 0x30, 0x08, 0x00], MAIN_RAM)] #fix right teleporter second room
-                            )
-                    if(curr_location == 0x3051):
-                        if(ctx.slot_data["church_fight_time_modifier"] != 100):
-                            time_modifier = math.ceil(ctx.slot_data["church_fight_time_modifier"] * 0x1555 / 100.0)
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x14ae6c + (self.jp_version * 0x2d0), time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix steamwood timer
-                            )
-                    if(curr_location == 0x3000): #path to castle
-                        if(ctx.slot_data["skip_minigame_town_on_fire"] == True):
-                            #await self.update_progression(ctx)
-                            if(self.progression_state < 0x2b2 and self.progression_state >= 0x294):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x078e80 + (self.jp_version * -0xea0), [0xb2, 0x02], MAIN_RAM)]
+                if(self.check_if_lumina_needs_removed):
+                    if(ctx.slot_data["lumina_randomzied"] == True):
+                        if(curr_location < 0x3000 or curr_location > 0x300f): #check if past chapter 1
+                            if(not item_name_to_id["Lumina"] in received_list):
+                                if(self.message_level > 0):
+                                    logger.info("Yeeting Lumina")
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.lumina, 1, MAIN_RAM
+                                )]))[0]
+                                lumina_state = int.from_bytes(save_data, byteorder='little')
+                                lumina_state = lumina_state & 0b11111110
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.lumina, [lumina_state], MAIN_RAM)]
                                 )
-                        if(not 0x294 in self.completed_progression):
-                            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba1ff + (self.jp_version * -0xea0), [0x3], MAIN_RAM),
-                                    (0x0ba204 + (self.jp_version * -0xea0), [0x3], MAIN_RAM),
-                                    (0x0ba20d + (self.jp_version * -0xea0), [0x3], MAIN_RAM)]
-                                )#update so you dont need to talk to carpenters to deliver gondola gizmo
-
-                    if(curr_location == 0x301b): #meandering forest
-                        if(ctx.slot_data["skip_to_frozen_palace"] == True):
-                            #await self.update_progression(ctx)
-                            if(self.progression_state >= 0x2f0 or 0x2f0 in self.completed_progression):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x18adc4 + (self.jp_version * 0x118), [0x68, 0x30, 0x00, 0x04], MAIN_RAM)] #0x04003068 frost palace gates
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.equipped_lumina, 1, MAIN_RAM
+                                )]))[0]
+                                lumina_state = int.from_bytes(save_data, byteorder='little')
+                                lumina_state = lumina_state & 0b11111110
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.equipped_lumina, [lumina_state], MAIN_RAM)]
                                 )
-                    if(curr_location == 0x3090): #Ben Fight
-                        if(ctx.slot_data["skip_over_calendar_maze"] == True or ctx.slot_data["soda_fountain_boss_rush"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x1858c4 + (self.jp_version * 0x178), [0x88, 0x30, 0x00, 0x00], MAIN_RAM)] #0x00003088 ed fight
-                            )
-                    if(curr_location == 0x3093): #sky island to soda fountain cutscene
-                        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x1857bc + (self.jp_version * 0x1b8), [0x90, 0x30, 0x00, 0x00], MAIN_RAM)] #0x00003090 ben fight
-                            )
-                    if(curr_location == 0x3088): #ed fight
-                        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x188904 + (self.jp_version * 0x1d8), [0x8d, 0x30, 0x00, 0x00], MAIN_RAM)] #0x0000308d topo fight
-                            )
-                    if(curr_location == 0x308d): #topo fight
-                        if(ctx.slot_data["topo_dance_battle_logic"] != 1):
-                            topo_moves: List[int] = []
-                            if(ctx.slot_data["topo_dance_battle_logic"] == 2):
-                                #new_core_checks: List[bool] = [val & 0b10000000 == 0b10000000 for val in save_data] 
-                                simple_moves = [2, 0, 3, 1] * 6
-                                for _ in range(3):
-                                    flip = random.randint(0, 3)
-                                    if(flip > 0):
-                                        simple_moves.reverse()
-                                        #logger.info("reverse %s", simple_moves)
-                                    offset = random.randint(0, 3)
-                                    topo_moves = topo_moves + simple_moves[offset:offset+17]
+                                self.check_if_lumina_needs_removed = 0
                             else:
-                                topo_moves = [random.randint(0,3) for _ in range(51)]
-                            
-                            topo_addresses = [
-                                0x188a7c + (self.jp_version * 0x1c4),
-                                0x188b34 + (self.jp_version * 0x1c4),
-                                0x188bec + (self.jp_version * 0x1c4)
-                            ]
-                            musashi_addresses = [
-                                0x188aa4 + (self.jp_version * 0x1c4),
-                                0x188b5c + (self.jp_version * 0x1c4),
-                                0x188c14 + (self.jp_version * 0x1c4)
-                            ]
-                            write_instructions = []
-                            for i in range(3):
-                                for j in range(17):
-                                    write_instructions.append((topo_addresses[i]+j*2, [topo_moves[i*17+j]], MAIN_RAM))
-                                    write_instructions.append((musashi_addresses[i]+j*8, [topo_moves[i*17+j]], MAIN_RAM))
-                            #logger.info("all moves %s", topo_moves)
-                            if(self.message_level > 0):
-                                logger.info("writing Topo Dance Moves")
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                write_instructions
-                            )
-                            """
-                        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x1886a4, [0x8f, 0x30, 0x00, 0x00], MAIN_RAM)] #0x0000308f tod fight
-                            )"""
-                    #if(curr_location == 0x2017)
+                                self.check_if_lumina_needs_removed = 0
+                    else:
+                        self.check_if_lumina_needs_removed = 0
+                if(curr_location in bakery_locations):
+                    curr_inventory = set(game_state[19])
+                    if(0x56 in curr_inventory and not 0x56 in self.old_inventory):
+                        self.try_to_update_connections = True
+                    if(0x4d in curr_inventory and not 0x4d in self.old_inventory):
+                        self.try_to_update_connections = True
+                    self.old_inventory = curr_inventory
+                if(ctx.slot_data["bakery_sanity"] == True or ctx.slot_data["restaurant_sanity"] == True):
+                    if(curr_location in bakery_locations or curr_location in restaurant_locations):
+                        if(len(self.bakery_dialog)>0 or len(self.restaurant_dialog)>0):
+                            if(False in self.bakery_checks or False in self.restaurant_checks):
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.shop_state, 1, MAIN_RAM
+                                )]))[0]
+                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
 
-                    if(ctx.slot_data["quest_item_sanity"] == True):
-                        write_instructions = []
-                        if(curr_location in [0x1010, 0x1052, 0x1077, 0x1094] and ctx.slot_data["playthrough_method"] == 1): #in chapter 2/3/4/5/6 town
-                            if(len(self.chapter3_items) > 0 and 0xc8 in self.completed_progression):
-                                for item_id in self.chapter3_items:
-                                    if(not item_id in self.bakery_inventory_expansion):
-                                        self.bakery_inventory_expansion.append(item_id)
-                                        if(self.message_level > 0):
-                                            logger.info("%s added to Bakery",item_id_to_name[item_id])
-                                self.chapter3_items = []
-                            if(len(self.chapter4_items) > 0 and (0x258 in self.completed_progression and 0x1e0 in self.completed_progression and 0x1ae in self.completed_progression)):
-                                for item_id in self.chapter4_items:
-                                    if(not item_id in self.bakery_inventory_expansion):
-                                        self.bakery_inventory_expansion.append(item_id)
-                                        if(self.message_level > 0):
-                                            logger.info("%s added to Bakery",item_id_to_name[item_id])
-                                self.chapter4_items = []
-                            if(len(self.chapter5_items) > 0 and 0x384 in self.completed_progression):
-                                for item_id in self.chapter5_items:
-                                    if(not item_id in self.bakery_inventory_expansion):
-                                        self.bakery_inventory_expansion.append(item_id)
-                                        if(self.message_level > 0):
-                                            logger.info("%s added to Bakery",item_id_to_name[item_id])
-                                self.chapter5_items = []
-                        if(curr_location in [0x1010, 0x1077, 0x1094]): #in chapter 2/4/5/6 town
-                            if(not item_name_to_id["Well H20"] in received_list and self.quest_item_checks[0]):
-                                write_instructions.append((well_water_id[self.jp_version][curr_location], [0x0], MAIN_RAM)) #remove water from the well
-                        if(curr_location == 0x3022): #at graveyard
-                            write_instructions.append((0x17d844 + (self.jp_version * 0x200), [0x0], MAIN_RAM)) #remove jon's key
-                        if(curr_location == 0x3029): #at second peak
-                            write_instructions.append((0x18e294 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove first log
-                            write_instructions.append((0x18e298 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove second log
-                            write_instructions.append((0x18e29c + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove third log
-                            write_instructions.append((0x18e2a0 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove fourth log
-                        if(curr_location == 0x1052): #at Chapter 3 town
-                            write_instructions.append((0x18f068 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Key
-                            write_instructions.append((0x18f7b0 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Rope
-                            write_instructions.append((0x18fa84 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Angel Statue
-                        if(curr_location == 0x3047): #at underground lake
-                            write_instructions.append((0x188aa0 + (self.jp_version * 0x1d4), [0x0], MAIN_RAM)) #remove Misteria
-                        if(curr_location == 0x2057 and ctx.slot_data["grocery_sanity"] == True): #at Chapter 3 grocery
-                            write_instructions.append((0x1e3804 + (self.jp_version * -0x4b0), [0x0], MAIN_RAM)) #remove free Orange
-                        if(curr_location == 0x3034): #at Basement Lobby
-                            write_instructions.append((0x189178 + (self.jp_version * 0x1d4), [0x0], MAIN_RAM)) #remove Ugly Belt
-                        if(curr_location == 0x304b): #at Scrap Depository
-                            write_instructions.append((0x17d648 + (self.jp_version * 0x200), [0x0, 0x0, 0x5], MAIN_RAM)) #remove first Gondola Gizmo
-                            write_instructions.append((0x17d6d0 + (self.jp_version * 0x200), [0x0, 0x0, 0x5], MAIN_RAM)) #remove replacement Gondola Gizmo
-                        if(curr_location == 0x1077): #at Chapter 4 town
-                            write_instructions.append((0x1910dc + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Calendar
-                            write_instructions.append((0x1910f8 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Rock Salt
-                        if(curr_location == 0x301e): #at outside steamwood
-                            write_instructions.append((0x185858 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #0
-                        if(curr_location == 0x3020): #at steamwood 2
-                            write_instructions.append((0x184d5c + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #1
-                            write_instructions.append((0x184dc8 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #4
-                            write_instructions.append((0x184e24 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #8
-                            write_instructions.append((0x184f98 + (self.jp_version * 0x1c0), [0x0], MAIN_RAM)) #remove Profits
-                        if(curr_location == 0x1094): #at Chapter 5 town
-                            write_instructions.append((0x183df8 + (self.jp_version * 0x200), [0x0], MAIN_RAM)) #remove Musashi's share of the profits
-                        if(curr_location == 0x3014): #at Somnolent Forest
-                            write_instructions.append((0x190db0 + (self.jp_version * 0x5c), [0x0], MAIN_RAM)) #remove Jon's Note
-
-                        if(curr_location in [0x1052, 0x1077, 0x1094] and game_state[17][13] & 0b1000000 != 0b1000000): #in town chapter 3,4,5 gate not unlocked
-                            #save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, 
-                            #    [(gate_angles[self.jp_version][curr_location][0], 1, MAIN_RAM), 
-                            #    (gate_angles[self.jp_version][curr_location][1], 1, MAIN_RAM)]
-                            #))                            
-                            addresses = [(gate_angles[self.jp_version][curr_location][0] + ((i-30) * 0x84), 1, MAIN_RAM) for i in range(50)]
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, addresses))
-                            if(self.message_level == 3):
-                                logger.info("checking if gates are open %s", save_data)
-                            found_gates = False
-                            gate_index = -1
-                            if(len(save_data) > 1):
-                                for i in range(len(save_data)-1):
-                                    if(save_data[i][0] == 0xfa and save_data[i+1][0] == 0x6):
-                                        if(self.message_level == 3):
-                                            logger.info("found gate at index %s", i)
-                                        gate_index = i
-                                        found_gates = True
-                            if(found_gates):
-                                write_instructions.append((gate_angles[self.jp_version][curr_location][0] + ((gate_index-30) * 0x84), [0x0], MAIN_RAM)) #close doors
-                                write_instructions.append((gate_angles[self.jp_version][curr_location][0] + ((gate_index-29) * 0x84), [0x0], MAIN_RAM)) #close doors
-                                if(self.message_level == 3):
-                                    logger.info("closing gates")
-                            elif(self.message_level == 3):
-                                logger.info("no open gates found")
-
-                            #if(save_data[0][0] == 0x6 and save[1][0] == 0xfa): #door open
-                            #    write_instructions.append((gate_angles[self.jp_version][curr_location][0], [0x0], MAIN_RAM)) #close doors
-                            #    write_instructions.append((gate_angles[self.jp_version][curr_location][1], [0x0], MAIN_RAM)) #close doors
-                            #    if(self.message_level == 3):
-                            #        logger.info("closing gates")
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.shop_cursor, 1, MAIN_RAM
+                                )]))[0]
+                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
+                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0 or self.cursor_pos>0)):
+                                    self.cursor_pos = new_cursor_pos
+                                    #logger.info("cursor pos %s", self.cursor_pos)
+                                    if(ctx.slot_data["bakery_sanity"] == True and curr_location in bakery_locations):
+                                        if(self.cursor_pos < len(self.bakery_checks) and self.cursor_pos < len(self.bakery_dialog) and self.cursor_pos < len(self.bakery_inventory)):
+                                            if(self.bakery_inventory[self.cursor_pos]==0x3e):
+                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.shop_dialog, self.bakery_dialog.row(self.cursor_pos, self.jp_version), MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_pointer, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_state, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_shown, [0x01], MAIN_RAM)]
+                                                )
+                                    if(ctx.slot_data["restaurant_sanity"] == True and curr_location in bakery_locations):
+                                        if(self.cursor_pos < len(self.restaurant_checks) and self.cursor_pos < len(self.restaurant_dialog) and self.cursor_pos < len(self.bakery_inventory)):
+                                            if(self.bakery_inventory[self.cursor_pos]==0x40):
+                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.shop_dialog, self.restaurant_dialog.row(self.cursor_pos, self.jp_version), MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_pointer, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_state, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_shown, [0x01], MAIN_RAM)]
+                                                )
+                                    if(ctx.slot_data["restaurant_sanity"] == True and curr_location in restaurant_locations):
+                                        if(self.cursor_pos < len(self.restaurant_checks) and self.cursor_pos < len(self.restaurant_dialog) and self.cursor_pos < len(self.restaurant_inventory)):
+                                            if(self.restaurant_inventory[self.cursor_pos]==0x40):
+                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.shop_dialog, self.restaurant_dialog.row(self.cursor_pos, self.jp_version), MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_pointer, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_state, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                                )
+                                                await self.write_ram(
+                                                    ctx,
+                                                    [(self.address.dialog_shown, [0x01], MAIN_RAM)]
+                                                )
+
+                if(ctx.slot_data["grocery_sanity"] == True):
+                    if(curr_location in grocery_locations):
+                        if(len(self.grocery_dialog)>0):
+                            if(False in self.grocery_checks):
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.shop_state, 1, MAIN_RAM
+                                )]))[0]
+                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+
+                                save_data: bytes = (await self.read_ram(ctx, [(
+                                    self.address.shop_cursor, 1, MAIN_RAM
+                                )]))[0]
+                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
+                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0 or self.cursor_pos>0)):
+                                    self.cursor_pos = new_cursor_pos
+                                    #logger.info("cursor pos %s", self.cursor_pos)
+                                    if(self.cursor_pos < len(self.grocery_checks) and self.cursor_pos < len(self.grocery_dialog) and self.cursor_pos < len(self.grocery_inventory)):
+                                        if(self.grocery_inventory[self.cursor_pos]==0x42):
+                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                            await self.write_ram(
+                                                ctx,
+                                                [(self.address.shop_dialog, self.grocery_dialog.row(self.cursor_pos, self.jp_version), MAIN_RAM)]
+                                            )
+                                            await self.write_ram(
+                                                ctx,
+                                                [(self.address.dialog_pointer, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                            )
+                                            await self.write_ram(
+                                                ctx,
+                                                [(self.address.dialog_state, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                            )
+                                            await self.write_ram(
+                                                ctx,
+                                                [(self.address.dialog_shown, [0x01], MAIN_RAM)]
+                                            )
+                                        elif(self.grocery_inventory[self.cursor_pos]==0x0):
+                                            await self.write_ram(
+                                                ctx,
+                                                [(self.address.shop_cursor, [0xe8], MAIN_RAM)] #clear text box
+                                            )
+                if(curr_location == 0x1011): #at upper town chapter 2
+                    if(self.progression_state == 0x78):
+                        if(list(game_state[19]).count(0x4d) > 1):
+                            new_inventory: List[int] = []
+                            manual_counter = 0
+                            for val in game_state[19]:
+                                if(val == 0x4d):
+                                    manual_counter = manual_counter + 1
+                                if(manual_counter < 2 or val != 0x4d):
+                                    new_inventory.append(val) 
+                            await self.write_ram(
+                                ctx,
+                                [(self.address.inventory, new_inventory, MAIN_RAM)]
+                            )
+                            if(self.message_level > 0):
+                                logger.info("removing extra manual")
                 
-                        if(curr_location in quest_item_dialog): 
-                            for loc_id, dialog_id in quest_item_dialog[curr_location].items():
-                                if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                    if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
-                                        barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                        if(self.message_level == 3):
-                                            logger.info("quest item dialog %s", loc_id)
-
-                                        if(self.jp_version == 1 and loc_id in [standard_location_name_to_id["Handle #0 - Steamwood 2"],standard_location_name_to_id["Agree to Fix Steamwood - Grillin Village"]]):
-                                            barray = barray[:23]
-                                            barray.append(0x00)
-                                        else:
-                                            barray = barray[:39]
-                                            barray.append(0x00)
-                                        
-                                        write_instructions.append((dialog_id[self.jp_version]+4, barray, MAIN_RAM))
+                if(len(self.messagequeue) > 0):
+                    if(self.poll_scheduler.due("message", 0.5)):
+                        self.tick_round_trips += 1
+                        await bizhawk.display_message(ctx.bizhawk_ctx, self.messagequeue.pop(0))
+                        if(len(self.messagequeue) > 30):
+                            i = 0
+                            while i < len(self.messagequeue) and len(self.messagequeue) > 30:
+                                if(not "(Prog)" in self.messagequeue[i]):
+                                    self.messagequeue.pop(i)
                                 else:
-                                    if(not standard_location_name_to_id["Well H20 - Grillin Village"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                                        for i in range(29):
-                                            self.table_ids_to_hint.append(standard_location_name_to_id["Well H20 - Grillin Village"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                    logger.info("no scout information found")
-                                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
-                                    await ctx.send_msgs([{
-                                        "cmd": "LocationScouts",
-                                        "locations": self.table_ids_to_hint,
-                                        "create_as_hint": 0
-                                    }])
-                                    break
-                        
-                        if(len(write_instructions) > 0):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                write_instructions
-                            )
+                                    i = i + 1
+                            if(len(self.messagequeue) > 30):
+                                self.messagequeue = self.messagequeue[-30:]
+                            
+                if(curr_location == 0x304b and ctx.slot_data["quest_item_sanity"]):
+                    save_data = (await self.read_ram(ctx, [(self.address.musashi_position, 2, MAIN_RAM),(self.address.musashi_y, 2, MAIN_RAM)]))
+                    musashi_x = int.from_bytes(save_data[0], byteorder='little', signed = True)
+                    musashi_y = int.from_bytes(save_data[1], byteorder='little', signed = True)
+                    gizmo_positions = [[-204, 58], [-45, 18], [150, -43], [189, -289]]
+                    gizmo_distances = [abs(musashi_y - y) + abs(musashi_x - x) for x, y in gizmo_positions]
+                    closest_gizmo = min(range(len(gizmo_distances)), key=gizmo_distances.__getitem__)
+                    if(closest_gizmo != self.old_closest_gizmo):
+                        self.old_closest_gizmo = closest_gizmo
+                        loc_id = standard_location_name_to_id["Gondola Gizmo 1 - Scrap Depository"] + closest_gizmo
+                        if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
+                            if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
+                                barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                                if(self.message_level == 3):
+                                    logger.info("gondola gizmo dialog # %s : %s", closest_gizmo + 1, gizmo_distances)
+                                barray = barray[:47]
+                                barray.append(0x00)
+                                await self.write_ram(
+                                    ctx,
+                                    [(self.address.gizmo_dialog+4, barray, MAIN_RAM),
+                                    (self.address.gizmo_dialog_2+4, barray, MAIN_RAM)]
+                                )
+                """if(ctx.slot_data["bakery_sanity"] == True):
+                    if(curr_location in bakery_locations):
+                        if(len(self.bakery_dialog)>0):
+                            if(False in self.bakery_checks):
+                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
+                                    0x11514A, 1, MAIN_RAM
+                                )]))[0]
+                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+
+                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
+                                    0x115130, 1, MAIN_RAM
+                                )]))[0]
+                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
+                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0)):
+                                    self.cursor_pos = new_cursor_pos
+                                    #logger.info("cursor pos %s", self.cursor_pos)
+                                    if(self.cursor_pos < len(self.bakery_checks) and (self.cursor_pos+1) * 2 <= len(self.bakery_dialog)):
+                                        if(self.bakery_inventory[self.cursor_pos]==0x3e):
+                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1faae0, self.assemble_binary_array_for_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1269f0, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x126a00, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1269f4, [0x01], MAIN_RAM)]
+                                            )
+
+                if(ctx.slot_data["restaurant_sanity"] == True):
+                    if(curr_location in restaurant_locations):
+                        if(len(self.restaurant_dialog)>0):
+                            if(False in self.restaurant_checks):
+                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
+                                    0x11514A, 1, MAIN_RAM
+                                )]))[0]
+                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+
+                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
+                                    0x115130, 1, MAIN_RAM
+                                )]))[0]
+                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
+                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0)):
+                                    self.cursor_pos = new_cursor_pos
+                                    #logger.info("cursor pos %s", self.cursor_pos)
+                                    if(self.cursor_pos < len(self.restaurant_checks) and (self.cursor_pos+1) * 2 <= len(self.restaurant_dialog) and self.cursor_pos < len(self.restaurant_inventory)):
+                                        if(self.restaurant_checks[self.cursor_pos] == False or self.restaurant_inventory[self.cursor_pos]==0x40):
+                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1faae0, self.assemble_binary_array_for_dialog(self.restaurant_dialog[(self.cursor_pos)*2],self.restaurant_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1269f0, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x126a00, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
+                                            )
+                                            await bizhawk.write(
+                                                ctx.bizhawk_ctx,
+                                                [(0x1269f4, [0x01], MAIN_RAM)]
+                                            )"""
+
+
+
+
+            #if not ctx.finished_game and len(ctx.items_received) == 35:
+            if not ctx.finished_game:
+                if(ctx.slot_data["goal"] == 2): #Rescue x NPCs
+                    if len([npc_id for npc_id in set(npc_ids) if npc_id in received_list]) >= ctx.slot_data["npc_goal"]:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 3): #Skullpion goal
+                    if save_data_toys[11] & 0b10000000 == 0b10000000:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 4): #Relic Keeper goal
+                    if save_data_toys[17] & 0b10000000 == 0b10000000:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 5): #Frost Dragon goal
+                    if save_data_toys[23] & 0b10000000 == 0b10000000:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 6): #Ant Queen goal
+                    if save_data_toys[29] & 0b10000000 == 0b10000000:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 7): #ToD goal
+                    if save_data_toys[35] & 0b10000000 == 0b10000000:
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 8): #DL goal
+                    #if save_data_toys[40] & 0b10000000 == 0b10000000: #toy only happens with 6 legendary armors
+                    if(curr_location == 0x30A4 or curr_location == 0x30A2 or curr_location == 0x30A5):
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                elif(ctx.slot_data["goal"] == 9): #kill X crest guardian
+                    if(self.num_bosses_killed >= ctx.slot_data["guardian_goal"]):
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+                else: #Rescue all NPCs
+                    if all(npc_id in received_list for npc_id in npc_ids):
+                        await ctx.send_msgs([{
+                            "cmd": "StatusUpdate",
+                            "status": ClientStatus.CLIENT_GOAL
+                        }])
+            
+            if (self.request_hints == 0):
+                self.request_hints = 1 
+                if(ctx.slot_data["set_lang"] == 2):
+                    self.table_ids_to_hint = jp_table_ids_to_hint.copy()
+                else:
+                    self.table_ids_to_hint = en_table_ids_to_hint.copy()
+
+                if(ctx.slot_data["bakery_sanity"] == True):
+                    if(not standard_location_name_to_id["Item 1 - Bakery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(7):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["restaurant_sanity"] == True):
+                    if(not standard_location_name_to_id["Item 1 - Restaurant"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(7):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["grocery_sanity"] == True):
+                    if(not standard_location_name_to_id["Item 1 - Grocery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(12):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["toy_sanity"] == True):
+                    if(not standard_location_name_to_id["Musashi - Toy Shop"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(30):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["tech_sanity"] == True):
+                    if(not standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(7):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))       
+                if(ctx.slot_data["scroll_sanity"] == True):
+                    if(not standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(5):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["core_sanity"] == True):
+                    if(not standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(4):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                if(ctx.slot_data["quest_item_sanity"] == True):
+                    if(not standard_location_name_to_id["Well H20 - Grillin Village"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(29):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Well H20 - Grillin Village"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                await ctx.send_msgs([{
+                    "cmd": "LocationScouts",
+                    "locations": self.table_ids_to_hint,
+                    "create_as_hint": 0
+                }])
+
+            if((ctx.slot_data["deathlink"] and self.deathlink == -1) or self.deathlink == 1):
+                if self.death_link_timer > 0 and self.has_died == 0:
+                    self.death_link_timer = max(0, self.death_link_timer - self.poll_scheduler.elapsed)
+                    if self.death_link_timer == 0:
+                        logger.info("death link grace period has ended")
+                if "DeathLink" not in ctx.tags:
+                    await ctx.update_death_link(True)
+                    self.previous_death_link = ctx.last_death_link
+                if self.death_link_timer == 0:
+                    curr_hp_bytes: bytes = (await self.read_ram(
+                        ctx,
+                        [(self.address.hp, 2, MAIN_RAM)]
+                    ))[0]
+                    curr_hp: int = int.from_bytes(curr_hp_bytes, byteorder='little')
+                    if curr_hp == 0 and self.has_died == 0:
+                        self.has_died = 1
+                        curr_maxhp_bytes: bytes = (await self.read_ram(
+                            ctx,
+                            [(self.address.max_hp, 2, MAIN_RAM)]
+                        ))[0]
+                        max_hp: int = int.from_bytes(curr_hp_bytes, byteorder='little')
+                        if(max_hp > 0):
+                            logger.info("%s died",ctx.username)
+                            await ctx.send_death(f"{ctx.username} had a nightmare about a horrid death!")
+                            self.keep_tick_state("has_died") #the death went out, don't send it again
+                    if curr_hp > 0 and self.has_died == 1:
+                        self.has_died = 0
+                        logger.info("%s revived",ctx.username)
+                        self.death_link_timer = 60
+                    #ctx.handle_deathlink_state(curr_hp>0)
+                if self.previous_death_link != ctx.last_death_link:
+                    self.previous_death_link = ctx.last_death_link
+                    if self.death_link_timer == 0 and self.has_died == 0:
+                        logger.info("received death link")
+                        await self.kill_player(ctx)
+                        self.has_died = 1
+
+            latency_sensitive = self.level_transition != 0 or curr_location in fast_poll_locations or curr_location in bakery_locations or curr_location in restaurant_locations or curr_location in grocery_locations
+            busy = self.received_count < len(ctx.items_received) or len(self.messagequeue) > 0
+            snapshot = bytes(self.read_plan.get("save_flags")) + bytes(self.read_plan.get("save_world")) + bytes(self.read_plan.get("area"))
+            ctx.watcher_timeout = self.poll_scheduler.next_interval(latency_sensitive=latency_sensitive, snapshot=snapshot, busy=busy)
+            await self.flush_writes(ctx)
+        except bizhawk.RequestFailedError:
+            # The connector didn't respond. Exit handler and return to main loop to reconnect
+            self.write_buffer.clear()
+            self.portal_plans.reset() #the last plan may not have reached RAM
+            self.restore_tick_state()
+        finally:
+            self.round_trip_history.append(self.tick_round_trips)
+            if(self.message_level == 3 and self.tick_round_trips > 2):
+                from CommonClient import logger
+                logger.info("tick took %s round trips to the emulator", self.tick_round_trips)
+        #except KeyError:
+        #    logger.info("missing data for Key")
+
+    def calc_connections(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> Tuple[List[int], List[int], List[Tuple[int, Any, str]]]:
+        """Progression state of every connection out of curr_location and the portal rewrites, written when a zone loads.
+        Returns the destinations, their progression states and the extra RAM writes, the steps are recorded in debug_trace"""
+        from CommonClient import logger
+        completed_mask = self.completed_tracker.update(ctx, game_state) | progression_states_mask(self.manually_checked_progression)
+        if(completed_mask != self.completed_progression_mask):
+            self.completed_progression_mask = completed_mask
+            self.completed_progression = progression_states_in(completed_mask)
+        self.log_trace(self.debug_trace.record(COMPLETED, curr_location, self.progression_state, detail=completed_mask))
+        destinations = []
+        progression_states = []#[0,0]
+        fix_town_id = []
+        area = portal_indexes[self.jp_version].areas.get(curr_location)
+        if(area is not None):
+            self.progression_cache.sync(ctx, game_state, self.completed_progression, received_list)
+            self.log_trace(self.debug_trace.record(AREA, curr_location, self.progression_state))
+            sent = set()
+            for address, destination in zip(area.addresses, area.destinations):
+                dest = destination
+                rule = self.progression_cache.explain(ctx, dest, self.progression_state, game_state, self.completed_progression, received_list)
+                calc_progression, hint_text = (0, "") if rule is None else (rule.state, rule.hint)
+                if(curr_location in [0x3069, 0x3075] or area.is_cutscene): #Chapter 4 town on fire, queen ant, thirstquencher cutscenes
+                    calc_progression = 0
+                if(curr_location == 0x3021 and dest == 0x3003):
+                    calc_progression = 0
+                if(curr_location in [0x2018, 0x2059, 0x207e, 0x209b]): #in conners
+                    if(self.progression_state == 0x64): #appraised Bracelet
+                        calc_progression = 0
+                    elif(self.progression_state == 0x181 and (ctx.slot_data["playthrough_method"] == 2 or game_state[17][13] & 0b1000 == 0b1000)): #appraised ugly belt
+                        calc_progression = 0
+                if(curr_location == 0x3051): #church fight
+                    calc_progression = 0
+                if(curr_location == 0x2057 and self.progression_state in [0x118, 0x122]):#orange cutscene
+                    calc_progression = 0
+                if(curr_location == 0x3029 and dest == 0x302c): #twinpeak second peak
+                    #await self.update_progression(ctx)
+                    if(self.progression_state == 0xf0 or calc_progression == 0xf0): #about to meet Hotelo at twinpeak
+                        fix_town_id.append((self.address.hotelo_entrance, [0x0], MAIN_RAM)) #change entrance from 1 to 0 to prevent softlock
+                        if(self.message_level > 0):
+                            logger.info("applied shortcut to hotelo softlock fix")
+                dest, reset_door = resolve_destination(curr_location, dest, self.progression_state if calc_progression == 0 else calc_progression, game_state, ctx.slot_data["quest_item_sanity"] == True, received_list)
+                if(reset_door):
+                    fix_town_id.append((address + 0x2, [0], MAIN_RAM)) #change door
+                #if(dest in [0x207b, 0x2098] and self.num_bosses_killed <2): #bakery chapter 4, 5/6
+                #    dest = 0x2056
+                #if(dest in [0x207c, 0x2099] and self.num_bosses_killed <2): #grocery chapter 4, 5/6
+                #    dest = 0x2057
+                if(dest != destination or dest in [0x3034, 0x3043, 0x304e] or (curr_location in UPPER_TOWNS and dest in TOWNS)):
+                    fix_town_id.append((address, dest.to_bytes(2, 'little'), MAIN_RAM))
+                if(len(hint_text) > 0):
+                    #logger.info("destination %x, hint_text %s", dest, hint_text)
+                    self.hint_dictionary[dest] = hint_text
+                if((dest + 1 & 0xff) in sent):
+                    continue
+                sent.add((dest + 1) & 0xff)
+                destinations.append((dest + 1) & 0xff) #need to offset by 1 due to 0x3000
+                progression_states.append(calc_progression & 0xff)
+                progression_states.append(calc_progression >> 8)
+
+                self.log_trace(self.debug_trace.record(CONNECTION, curr_location, self.progression_state, dest, calc_progression, hint_text, None if rule is None else rule.why))
+            if(self.save_manual_progression == True):
+                self.save_manual_progression = False
+                if(self.message_level == 3):
+                    logger.info("saving manually checked progression : %s", list(map(hex,sorted(self.manually_checked_progression))))
+                vals = sum([(1 << i) * (val in self.manually_checked_progression) for i, val in enumerate(self.manually_checked_progression_states)])
+                fix_town_id.append((self.address.manual_progression, vals.to_bytes(2, 'little'), MAIN_RAM))
+                if(self.message_level == 3):
+                    logger.info("recording manual prog to RAM %s", vals.to_bytes(2, 'little'))
+            self.log_trace(self.debug_trace.record(DATA, curr_location, self.progression_state, detail=(destinations, progression_states, fix_town_id)))
+        return destinations, progression_states, fix_town_id
+
+    def log_trace(self, event: TraceEvent) -> None:
+        if(self.message_level == 3):
+            from CommonClient import logger
+            logger.info(format_event(event))
+
+    @area_entry_handlers.register(dialog_location_table) #npc dialog
+    async def enter_dialog_area(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        dialog = AreaDialog()
+        for loc_id, dialog_id in dialog_location_table[curr_location].items():
+            if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
+                if(loc_id in short_text_boxes):
+                    barray = await self.assemble_short_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
+                    dialog.add(dialog_id[self.jp_version]+4, barray, SHORT_TEXTBOX)
+                else:
+                    barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
+                    dialog.add(dialog_id[self.jp_version]+4, barray, TEXTBOX)
+            else:
+                logger.info("no scout information found try reentering area (after taking a couple steps)")
+                await ctx.send_msgs([{
+                    "cmd": "LocationScouts",
+                    "locations": self.table_ids_to_hint,
+                    "create_as_hint": 0
+                }])
+                break
+        await self.write_area_dialog(ctx, dialog)
+
+    @area_entry_handlers.register() #every area
+    async def remove_twinpeak_rock(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["scroll_sanity"] == True):
+            #await bizhawk.write(
+            #    ctx.bizhawk_ctx,
+            #    [(0x13f430 + (self.jp_version * 0x344), [0x06, 0x01, 0x02, 0x24], MAIN_RAM)] #fix scroll cursor
+            #)    
+            save_data: bytes = (await self.read_ram(
+                ctx,
+                [(self.address.twinpeak_rock, 1, MAIN_RAM)]
+            ))[0]
+            if(save_data[0] & 0b10000000 == 0b00000000):
+                if(self.message_level > 0):
+                    logger.info("Removing Rock on Twinpeak")
+                rock_data = save_data[0] | (0b10000000)
+                await self.write_ram(
+                    ctx,
+                    [(self.address.twinpeak_rock, [rock_data], MAIN_RAM)]
+                )           
+
+    @area_entry_handlers.register(scroll_dialog) #scroll dialog
+    async def enter_scroll_area(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["scroll_sanity"] == True):
+            dialog = AreaDialog()
+            for loc_id, dialog_id in scroll_dialog[curr_location].items():
+                if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
+                    barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    dialog.add(dialog_id[self.jp_version]+4, barray, TEXTBOX)
+                else:
+                    logger.info("no scout information found try reentering area (after taking a couple steps)")
+                    if(not standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(5):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    await ctx.send_msgs([{
+                        "cmd": "LocationScouts",
+                        "locations": self.table_ids_to_hint,
+                        "create_as_hint": 0
+                    }])
+                    break
+            await self.write_area_dialog(ctx, dialog)
+
+    @area_entry_handlers.register(bakery_locations) # 0x2015chapter 2 Jam, also changes to 0x2056 chapter 3
+    async def enter_bakery(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+
+        await self.write_ram(
+            ctx,
+            [(self.address.shop_state, [0x0], MAIN_RAM)]
+        )
+        #if(curr_location == 0x207b or curr_location == 0x2098):
+        if(self.num_bosses_killed > 1):
+            if(not 0x68 in self.bakery_inventory_default):
+                self.bakery_inventory_default = self.bakery_inventory_default + [0x69,0x68]
+            if(len(self.bakery_inventory_sanity) < 7):
+                self.bakery_inventory_sanity = [0x3e,0x3e,0x3e,0x3e,0x3e,0x3e,0x3e]
+        self.bakery_inventory = [0x0d]
+        await self.remove_extra_legendary_armor_from_bakery(ctx)
+        #logger.info("bakery inventory %s",self.bakery_inventory)
+        #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
+        #logger.info("bakery inventory len %s",len(self.bakery_inventory))
+        #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
+        if(len(self.bakery_inventory_expansion)>1):
+            self.bakery_inventory_expansion.sort(reverse=True)
+        #await self.update_progression(ctx)
+        if(ctx.slot_data["bakery_sanity"] == True):
+            self.bakery_dialog = ShopDialog()
+            self.cursor_pos = -1
+
+
+            for i in range(len(self.bakery_inventory_sanity)):
+                loc_id = standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+                if(loc_id in ctx.locations_info):
+                    if(self.bakery_checks[i]==True):
+                        s = PURCHASED[self.jp_version]
+                    else:
+                        s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
+                    self.bakery_dialog.add(s, ctx.player_names[ctx.locations_info[loc_id].player])
+                else:
+                    if(not standard_location_name_to_id["Item 1 - Bakery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(7):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    #logger.info("no scout information found try reentering area (after taking a couple steps) %s", self.table_ids_to_hint)
+                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
+                    await ctx.send_msgs([{
+                        "cmd": "LocationScouts",
+                        "locations": self.table_ids_to_hint,
+                        "create_as_hint": 0
+                    }])
+                    break
+
+            #logger.info("bakery dialog %s", self.bakery_dialog)
+            self.bakery_inventory = self.bakery_inventory_sanity.copy()
+
+            for i in range(len(self.bakery_inventory)-1,-1,-1):
+                if(self.bakery_checks[i]==True):
+                    self.bakery_inventory.pop(i)
+                else:
+                    break
+
+            bread_to_add = []
+            if(item_name_to_id["Progressive Bread"] in self.received_items or (item_name_to_id["Progressive Bread"] + jp_id_offset) in self.received_items):
+                bread_to_add = self.bakery_inventory_default[:(self.received_items.count(item_name_to_id["Progressive Bread"]) + self.received_items.count(item_name_to_id["Progressive Bread"] + jp_id_offset))]
+
+            if((curr_location == 0x2015 or curr_location == 0x2056) and ctx.slot_data["restaurant_sanity"] == True and self.progression_state > 0x63):
+                await self.fill_restaurant_dialog(ctx)
+                for i in range(len(self.bakery_inventory)):
+                    if(self.bakery_checks[i]==True and self.restaurant_checks[i]==False):
+                        self.bakery_inventory[i]=0x40
+                    elif(self.bakery_checks[i]==True):
+                        if(len(bread_to_add)>0):
+                            self.bakery_inventory[i]=bread_to_add.pop(0)
+                for i in range(6,len(self.bakery_inventory)-1,-1):
+                    if(self.restaurant_checks[i]==False):
+                        self.bakery_inventory = self.bakery_inventory + [0x40] * (i-len(self.bakery_inventory)+1)
+                        break
+            else:
+                for i in range(len(self.bakery_inventory)):
+                    if(self.bakery_checks[i]==True):
+                        if(len(bread_to_add)>0):
+                            #logger.info("bread to add %s", bread_to_add)
+                            #logger.info("bakery inventory %s", self.bakery_inventory)
+                            #logger.info("bakery inventory sanity %s", self.bakery_inventory_sanity)
+                            self.bakery_inventory[i]=bread_to_add.pop(0)
+
+            self.bakery_inventory = self.bakery_inventory + bread_to_add
+            self.bakery_inventory = self.bakery_inventory + self.bakery_inventory_expansion
+        elif((curr_location == 0x2015 or curr_location == 0x2056) and ctx.slot_data["restaurant_sanity"] == True and self.progression_state > 0x63):
+            self.bakery_inventory = []
+            self.cursor_pos = -1
+            await self.fill_restaurant_dialog(ctx)
+            for i in range(6,-1,-1):
+                if(self.restaurant_checks[i]==False):
+                    self.bakery_inventory = [0x40] * (i+1)
+                    break
+            bread_to_add = self.bakery_inventory_default.copy()
+            for i in range(len(self.bakery_inventory)):
+                if(self.bakery_checks[i]==True):
+                    if(len(bread_to_add)>0):
+                        self.bakery_inventory[i]=bread_to_add.pop(0)
+            self.bakery_inventory = self.bakery_inventory + bread_to_add + self.bakery_inventory_expansion
+        else:
+            self.bakery_inventory = self.bakery_inventory_default + self.bakery_inventory_expansion
+        self.bakery_inventory = self.bakery_inventory[:40]
+        await self.write_ram(
+            ctx,
+            [(store_table[curr_location][self.jp_version].inventory_id, self.bakery_inventory, MAIN_RAM)]
+        )
+        await self.write_ram(
+            ctx,
+            [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.bakery_inventory)], MAIN_RAM)]
+        )
+        if(store_table[curr_location][self.jp_version].inventory_length_id_expanded):
+            await self.write_ram(
+                ctx,
+                [(store_table[curr_location][self.jp_version].inventory_length_id_expanded, [len(self.bakery_inventory)], MAIN_RAM)]
+            )
+        await self.write_ram(
+            ctx,
+            [(store_table[curr_location][self.jp_version].inventory_pointer_upper_pointer, store_table[curr_location][self.jp_version].inventory_pointer_upper, MAIN_RAM)] #somehow coresponds to 0x801f
+        )
+        await self.write_ram(
+            ctx,
+            [(store_table[curr_location][self.jp_version].inventory_pointer_lower_pointer, store_table[curr_location][self.jp_version].inventory_pointer_lower, MAIN_RAM)]
+        )
+
+    @area_entry_handlers.register(restaurant_locations) #restaurant
+    async def enter_restaurant(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        await self.write_ram(
+            ctx,
+            [(self.address.shop_state, [0x0], MAIN_RAM)]
+        )
+        #logger.info("entered restaurant")
+        if(ctx.slot_data["restaurant_sanity"] == True):
+            if(False in self.restaurant_checks or not all(item_id in received_list for item_id in self.restaurant_inventory_default)):
+                self.restaurant_dialog = ShopDialog()
+                self.cursor_pos = -1
+
+                for i in range(7):
+                    loc_id = standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+                    if(loc_id in ctx.locations_info):
+                        if(self.restaurant_checks[i]==True):
+                            s = PURCHASED[self.jp_version]
+                        else:
+                            s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
+                        self.restaurant_dialog.add(s, ctx.player_names[ctx.locations_info[loc_id].player])
+                    else:
+                        if(not standard_location_name_to_id["Item 1 - Restaurant"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                            for i in range(7):
+                                self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                        await ctx.send_msgs([{
+                            "cmd": "LocationScouts",
+                            "locations": self.table_ids_to_hint,
+                            "create_as_hint": 0
+                        }])
+                        break
 
+                #logger.info("bakery dialog %s", self.bakery_dialog)
+                self.restaurant_inventory = self.restaurant_inventory_sanity.copy()
 
+                for i in range(len(self.restaurant_inventory)-1,-1,-1):
+                    if(self.restaurant_checks[i]==True):
+                        self.restaurant_inventory.pop(i)
+                    else:
+                        break
+
+                restaurant_to_add = list(set(item_id for item_id in self.restaurant_inventory_default if item_id in received_list))
+                for i in range(len(self.restaurant_inventory)):
+                    if(self.restaurant_checks[i]==True):
+                        if(len(restaurant_to_add)>0):
+                            self.restaurant_inventory[i]=restaurant_to_add.pop(0)
+                self.restaurant_inventory = self.restaurant_inventory + restaurant_to_add
+                self.restaurant_inventory = self.restaurant_inventory[:7]
+
+                restaurant_dialog_pointers = []
+                for i in range(len(self.restaurant_inventory)):
+                    restaurant_dialog_pointers = restaurant_dialog_pointers + restaurant_pointers[curr_location][self.jp_version][self.restaurant_inventory[i]]
+
+                await self.write_ram(
+                    ctx,
+                    [(store_table[curr_location][self.jp_version].inventory_id, self.restaurant_inventory, MAIN_RAM)]
+                )
+                await self.write_ram(
+                    ctx,
+                    [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.restaurant_inventory)], MAIN_RAM)]
+                )
+                await self.write_ram(
+                    ctx,
+                    [(restaurant_pointers_pointers[curr_location][self.jp_version], restaurant_dialog_pointers, MAIN_RAM)]
+                )
 
-                        
+    @area_entry_handlers.register(grocery_locations) #grocery
+    async def enter_grocery(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["grocery_sanity"] == True):
+            #await self.update_progression(ctx)
+            self.grocery_dialog = ShopDialog()
+            self.cursor_pos = -1
+
+            await self.write_ram(
+                ctx,
+                [(self.address.shop_state, [0x0], MAIN_RAM)] #set cursor to zero incase it is greater than the current index
+            )
+            if(len(self.grocery_inventory_sanity)<12 or 0 in self.grocery_inventory_sanity):
+                save_data: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.rice_ball, 1, MAIN_RAM)]
+                ))[0]
+                rice_ball = 0
+                rice_state = int.from_bytes(save_data, byteorder='little')
+                if(rice_state == 0x4):
+                    if(self.message_level > 0):
+                        logger.info("rice ball item available")
+                    rice_ball = 1
+                save_data: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.neatball, 1, MAIN_RAM)]
+                ))[0]
+                neatball = 0
+                neatball_state = int.from_bytes(save_data, byteorder='little')
+                if(neatball_state == 0x3):
+                    if(self.message_level > 0):
+                        logger.info("neatball item available")
+                    neatball = 1
+                if(neatball == 1 or rice_ball == 1):
+                    if(rice_ball == 1 and not 0x1 in self.grocery_inventory_default):
+                        self.grocery_inventory_default = self.grocery_inventory_default + [0x1]
+                    if(neatball == 1 and not 0x6a in self.grocery_inventory_default):
+                        self.grocery_inventory_default = self.grocery_inventory_default + [0x6a]
+                    if(len(self.grocery_inventory_sanity) < 11):
+                        if(neatball == 1 and rice_ball == 0):
+                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(11-len(self.grocery_inventory_sanity)) + [0x42]
+                        elif(neatball == 0 and rice_ball == 1):
+                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(10-len(self.grocery_inventory_sanity)) + [0x42] 
+                        else:
+                            self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0]*(10-len(self.grocery_inventory_sanity)) + [0x42, 0x42]
+                    elif(len(self.grocery_inventory_sanity) == 11 and neatball == 1): 
+                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42]
+                    elif(rice_ball == 1):
+                        self.grocery_inventory_sanity[10] = 0x42
+
+            if(not 0xb in self.grocery_inventory_default):
+                #if(self.progression_state >= 0x12c):
+                if(game_state[17][14] & 0b1000 == 0b1000): #tim is saved, add orange to inventory
+                    if(len(self.grocery_inventory_sanity) < 11): #no Riceball or Neatball yet
+                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42]
+                        self.grocery_inventory_default = self.grocery_inventory_default + [0xb]
+                    else: #have either Riceball or Neatball
+                        self.grocery_inventory_sanity[7] = 0x42
+                        self.grocery_inventory_default = self.grocery_inventory_default[:7] + [0xb] + self.grocery_inventory_default[7:]
+
+            #if(curr_location == 0x207c or curr_location == 0x2099): #Chapter 4/5/6
+            if(self.num_bosses_killed > 1): #Chapter 4/5/6
+                if(not 0x7 in self.grocery_inventory_default):
+                    self.grocery_inventory_default = self.grocery_inventory_default[:3] + [0x7] + self.grocery_inventory_default[3:5] + [0x6d] + self.grocery_inventory_default[5:] #EX-Drink and H-Mint
+                    if(len(self.grocery_inventory_sanity) < 11): #no Riceball or Neatball yet
+                        self.grocery_inventory_sanity = self.grocery_inventory_sanity + [0x42,0x42]
+                    else:
+                        self.grocery_inventory_sanity[8] = 0x42
+                        self.grocery_inventory_sanity[9] = 0x42
 
-                                    
+            self.grocery_inventory = [0x0a]
+            #logger.info("bakery inventory %s",self.bakery_inventory)
+            #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
+            #logger.info("bakery inventory len %s",len(self.bakery_inventory))
+            #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
 
 
+            for i in range(len(self.grocery_inventory_sanity)):
+                loc_id = standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+                if(loc_id in ctx.locations_info):
+                    if(self.grocery_checks[i]==True):
+                        s = PURCHASED[self.jp_version]
+                    else:
+                        s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
+                    self.grocery_dialog.add(s, ctx.player_names[ctx.locations_info[loc_id].player])
+                else:
+                    if(not standard_location_name_to_id["Item 1 - Grocery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(12):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    #logger.info("no scout information found try reentering area (after taking a couple steps) %s", self.table_ids_to_hint)
+                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
+                    await ctx.send_msgs([{
+                        "cmd": "LocationScouts",
+                        "locations": self.table_ids_to_hint,
+                        "create_as_hint": 0
+                    }])
+                    break
+
+            #logger.info("bakery dialog %s", self.bakery_dialog)
+            self.grocery_inventory = self.grocery_inventory_sanity.copy()
+
+            for i in range(len(self.grocery_inventory)-1,-1,-1):
+                if(self.grocery_checks[i]==True or self.grocery_inventory[i]==0x0):
+                    self.grocery_inventory.pop(i)
+                else:
+                    break
+
+            #logger.info("starting inventory %s", self.grocery_inventory)
+            #logger.info("grocery default %s", self.grocery_inventory_default)
+            #grocery_to_add = list(set(self.grocery_inventory_default) & set(received_list))
+            grocery_to_add = []
+            for i in range(len(self.grocery_inventory_default)):
+                if(self.grocery_inventory_default[i] in received_list or (ctx.slot_data["grocery_s_revive"] == True and self.grocery_inventory_default[i] == 0xa)):
+                    grocery_to_add = grocery_to_add + [self.grocery_inventory_default[i]]
+                    #logger.info("grocery to add %s", grocery_to_add)
+            if(received_list.count(0x6) > 1 and 0x7 in self.grocery_inventory_default):
+                grocery_to_add = [0x7 if x==0x6 else x for x in grocery_to_add]
+            if(received_list.count(0x8) > 1 and 0x6d in self.grocery_inventory_default):
+                grocery_to_add = [0x6d if x==0x8 else x for x in grocery_to_add]
+            #logger.info("grocery to add %s", grocery_to_add)
+
+            if(len(self.grocery_inventory) >= 4 and 0xa in grocery_to_add):
+                if(self.grocery_checks[3]==True):
+                    self.grocery_inventory[3] = 0xa
+                    grocery_to_add.remove(0xa)
+
+            for i in range(len(self.grocery_inventory)):
+                if(self.grocery_checks[i]==True or self.grocery_inventory[i]==0x0):
+                    if(self.grocery_inventory[i] != 0xa):
+                        if(len(grocery_to_add)>0):
+                            #logger.info("bread to add %s", bread_to_add)
+                            #logger.info("bakery inventory %s", self.bakery_inventory)
+                            #logger.info("bakery inventory sanity %s", self.bakery_inventory_sanity)
+                            self.grocery_inventory[i]=grocery_to_add.pop(0)
+            #logger.info("inventory after after grocery to add %s", self.grocery_inventory)
+
+            self.grocery_inventory = self.grocery_inventory + grocery_to_add
+
+            if(len(self.grocery_inventory) >= 4 and 0xa in self.grocery_inventory):
+                if(self.grocery_checks[3]==True):
+                    if(self.grocery_inventory[3] != 0xa):
+                        for i in range(len(self.grocery_inventory)):
+                            if(self.grocery_inventory[i] == 0xa):
+                                self.grocery_inventory[i] = self.grocery_inventory[3]
+                        self.grocery_inventory[3] = 0xa
+            #logger.info("inventory after after final adds grocery to add %s", self.grocery_inventory)
+
+            await self.write_ram(
+                ctx,
+                [(store_table[curr_location][self.jp_version].inventory_id, self.grocery_inventory, MAIN_RAM)]
+            )
+            await self.write_ram(
+                ctx,
+                [(store_table[curr_location][self.jp_version].inventory_length_id, [len(self.grocery_inventory)]*8, MAIN_RAM)]
+            )
+            await self.write_ram(
+                ctx,
+                [(store_table[curr_location][self.jp_version].inventory_pointer_upper_pointer, store_table[curr_location][self.jp_version].inventory_pointer_upper, MAIN_RAM)] #somehow coresponds to 0x801f
+            )
 
-                        """
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1fab10, bakery_inventory, MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189aa0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189ab0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189ab4, [0x20, 0x80], MAIN_RAM)] #somehow coresponds to 0x801f
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189ab8, [0x10, 0xab], MAIN_RAM)]
-                        )
-                    elif(curr_location == 0x2056): #chapter 3 Jam
-                        await self.remove_extra_legendary_armor_from_bakery(ctx)
-                        #logger.info("bakery inventory %s",self.bakery_inventory)
-                        #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
-                        #logger.info("bakery inventory len %s",len(self.bakery_inventory))
-                        #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1fab10, bakery_inventory, MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186718, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186708, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x18671c, [0x20, 0x80], MAIN_RAM)] #somehow coresponds to 0x801f
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186720, [0x10, 0xab], MAIN_RAM)]
-                        )
-                    elif(curr_location == 0x207b): #chapter 4 Jam
-                        await self.remove_extra_legendary_armor_from_bakery(ctx)
-                        #logger.info("bakery inventory %s",self.bakery_inventory)
-                        #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
-                        #logger.info("bakery inventory len %s",len(self.bakery_inventory))
-                        #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
-                        if(not 0x68 in bakery_inventory):
-                            bakery_inventory = [0x69,0x68] + bakery_inventory
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1fab10, bakery_inventory, MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186fe0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186ff0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186ff4, [0x20, 0x80], MAIN_RAM)] #somehow coresponds to 0x801f
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186ff8, [0x10, 0xab], MAIN_RAM)]
-                        )
-                    elif(curr_location == 0x2098): #chapter 5 Jam
-                        await self.remove_extra_legendary_armor_from_bakery(ctx)
-                        #logger.info("bakery inventory %s",self.bakery_inventory)
-                        #logger.info("bakery inventory bytes %s",bytes(self.bakery_inventory))
-                        #logger.info("bakery inventory len %s",len(self.bakery_inventory))
-                        #logger.info("bakery inventory len bytes %s",bytes(len(self.bakery_inventory)))
-                        if(not 0x68 in bakery_inventory):
-                            bakery_inventory = [0x69,0x68] + bakery_inventory
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1fab10, bakery_inventory, MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186cf0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186ce0, [len(bakery_inventory)], MAIN_RAM)]
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186cf4, [0x20, 0x80], MAIN_RAM)] #somehow coresponds to 0x801f
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x186cf8, [0x10, 0xab], MAIN_RAM)]
-                        )"""
-                    if(curr_location == 0x2018): #chapter 2 Conners
-                        await self.check_if_bracelet_needs_removed(ctx)
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x18c630 + (self.jp_version * 0x258), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x18c578 + (self.jp_version * 0x258), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                    if(curr_location == 0x2059): #chapter 3 Conners
-                        await self.check_if_bracelet_needs_removed(ctx)
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1891e0 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189298 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                    if(curr_location == 0x207e): #chapter 4 Conners
-                        await self.check_if_bracelet_needs_removed(ctx)
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189ab8 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189b70 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                    if(curr_location == 0x209b): #chapter 5 Conners
-                        await self.check_if_bracelet_needs_removed(ctx)
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x1897b8 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                        )
-                        await bizhawk.write(
-                            ctx.bizhawk_ctx,
-                            [(0x189870 + (self.jp_version * 0x21c), [0x9, 0x0], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
+    @area_entry_handlers.register(toy_shop_locations) #toy shop
+    async def enter_toy_shop(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["toy_sanity"] == True):
+
+            if(len(self.toy_dialog[29]) == 0):
+                for i in range(len(self.toy_checks)):
+                    loc_id = standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+                    if(loc_id in ctx.locations_info):
+                        self.toy_dialog[i] = await self.assemble_binary_array_for_toyshop(ctx,loc_id,toy_shop_dialog_length[self.jp_version][i])
+                    else:
+                        if(not standard_location_name_to_id["Musashi - Toy Shop"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                            for i in range(30):
+                                self.table_ids_to_hint.append(standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                        logger.info("no scout information found try reentering area (after taking a couple steps)")
+                        #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
+                        await ctx.send_msgs([{
+                            "cmd": "LocationScouts",
+                            "locations": self.table_ids_to_hint,
+                            "create_as_hint": 0
+                        }])
+                        break
+
+            if(len(self.toy_dialog[29]) != 0):
+                if(self.message_level > 0):
+                    logger.info("writing toy dialog")
+                dialog = AreaDialog()
+                for i in range(len(self.toy_inventory)):
+                    if(self.toy_inventory[i]):
+                        dialog.add(toy_shop_dialog[curr_location][self.jp_version][i], self.toy_dialog[i], TOYSHOP, toy_shop_dialog_length[self.jp_version][i])
+                await self.write_area_dialog(ctx, dialog)
+
+            await self.write_ram(
+                ctx,
+                [(toy_shop_fix[curr_location][self.jp_version], [0x10], MAIN_RAM)]
+            )
+
+            save_data: bytes = (await self.read_ram(
+                ctx,
+                [(self.address.toy_storage, 13, MAIN_RAM)]
+            ))[0]
+            new_toy_purchased_to_update: List[bool] = [val & 0b11110000 == 0b10010000 for val in save_data]
+            if(True in new_toy_purchased_to_update):
+                for i in range(len(new_toy_purchased_to_update)):
+                    if(new_toy_purchased_to_update[i]):
+                        if(self.message_level > 0):
+                            logger.info("adding yet to be randomized toy to storage")
+                        save_data: bytes = (await self.read_ram(
+                            ctx,
+                            [(self.address.toy_storage + i, 1, MAIN_RAM)]
+                        ))[0]
+                        toy_data = save_data[0] | 0b1000000
+                        toy_data = toy_data & 0b11101111
+                        await self.write_ram(
+                            ctx,
+                            [(self.address.toy_storage + i, [toy_data], MAIN_RAM)]
                         )
-                    if(curr_location == 0x3029): #twinpeak second peak
-                        #await self.update_progression(ctx)
-                        if(self.progression_state == 0xf0): #about to meet Hotelo at twinpeak
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x18e096 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)] #change entrance from 1 to 0 to prevent softlock
-                            )
-                            if(self.message_level > 0):
-                                logger.info("applied shortcut to hotelo softlock fix")
 
-                        if(self.progression_state > 0x59 and False): #Jon has left the peak
-                            save_data: bytes = (await bizhawk.read(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae65a + (self.jp_version * -0xea0), 1, MAIN_RAM)]
-                            ))[0]
-                            raft_state = int.from_bytes(save_data, byteorder='little')
-                            if(raft_state & 0b11000000 != 0b11000000):
-                                #logger.info("Raft incomplete, checking for logs")
-                                self.check_for_logs = 1
-                    #if(ctx.slot_data["fast_walk"] == True):
-                    #    await bizhawk.write(
-                    #        ctx.bizhawk_ctx,
-                    #        [(0x15a7e4 + (self.jp_version * 0x2a8), [0xa0, 0xff, 0x03, 0x3c, 0x2c, 0x00, 0x23, 0xae, 0x1e + (self.jp_version * 0xaa), 0x6a, 0x05, 0x08, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)] #andi $v0 $s0 0x4000 to andi $v0 $s0 0x09
-                    #    ) #jmp c8 6a 05 08 for jp version JP 8015ab20
-                self.old_step_count = step_count
+    @area_entry_handlers.register([0x3003]) #At Geezer
+    async def enter_geezer(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["tech_sanity"] == True):
+            await self.write_ram(
+                ctx,
+                tech_fix[self.jp_version]
+            )
+            if(len(self.tech_dialog[6]) == 0):
+                for i in range(len(self.tech_checks)):
+                    loc_id = standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
+                    if(loc_id in ctx.locations_info):
+                        self.tech_dialog[i] = await self.assemble_binary_array_for_textbox(ctx,loc_id)
+                    else:
+                        if(not standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                            for i in range(7):
+                                self.table_ids_to_hint.append(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                        logger.info("no scout information found try reentering area (after taking a couple steps)")
+                        #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
+                        await ctx.send_msgs([{
+                            "cmd": "LocationScouts",
+                            "locations": self.table_ids_to_hint,
+                            "create_as_hint": 0
+                        }])
+                        break
 
-            if(self.level_transition == 0):
-                if(curr_location == 0x300b and ctx.slot_data["boulder_chase_zoom"] != 2): #running from boulder
-                    self.counter_for_delayed_check += 1
-                    if(self.counter_for_delayed_check>4):
-                        self.counter_for_delayed_check = 0
-                        save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                            0x12695C + (self.jp_version * 0xa70), 2, MAIN_RAM
-                        )]))[0]
-                        zoom = int.from_bytes(save_data, byteorder='little')
-                        if(zoom == 0x64):
-                            if(self.message_level > 0):
-                                logger.info("applying zoom")
-                            if(ctx.slot_data["boulder_chase_zoom"] == 1):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [((0x12695C + (self.jp_version * 0xa70)), [0x30], MAIN_RAM)] 
-                                )
-                            else:
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [((0x12695C + (self.jp_version * 0xa70)), [0x20, 0x1], MAIN_RAM)] 
-                                )
-                if(curr_location == 0x301d or curr_location == 0x3020): #steamwood
-                    if(ctx.slot_data["steamwood_elevator_logic"] != 1 or (curr_location == 0x3020 and ctx.slot_data["quest_item_sanity"])): #not vanilla elevator
-                        self.counter_for_delayed_check += 1
-                        if(self.counter_for_delayed_check>2):
-                            self.counter_for_delayed_check = 0
-                            save_data: bytes = bytes([0,0,0])
-                            if(curr_location == 0x301d):
-                                save_data = (await bizhawk.read(ctx.bizhawk_ctx, [(0x120744 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x126b62 + (self.jp_version * 0xa70), 2, MAIN_RAM),(0x1206d2 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x120704 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x120638 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x1205C6 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x1205F8 + (self.jp_version * 0xa70), 1, MAIN_RAM)]))
-                                #is_musashi_on_elevator = int.from_bytes(save_data[0], byteorder='little')
-                                #elevator_state = int.from_bytes(save_data[2], byteorder='little')
-                                #elevator_floor = int.from_bytes(save_data[3], byteorder='little')
-                            else:
-                                save_data = (await bizhawk.read(ctx.bizhawk_ctx, [(0x120638 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x126b62 + (self.jp_version * 0xa70), 2, MAIN_RAM),(0x1205c6 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x1205f8 + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x12052c + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x1204ba + (self.jp_version * 0xa70), 1, MAIN_RAM),(0x1204ec + (self.jp_version * 0xa70), 1, MAIN_RAM)]))
-                            is_musashi_on_elevator = max(int.from_bytes(save_data[0], byteorder='little'),int.from_bytes(save_data[4], byteorder='little'))
-                                #logger.info("elevator data %s", save_data)
-                                #is_musashi_on_elevator: int = save_data[0]
-                            elevator_state = max(int.from_bytes(save_data[2], byteorder='little'),int.from_bytes(save_data[5], byteorder='little'))
-                            elevator_floor = max(int.from_bytes(save_data[3], byteorder='little'),int.from_bytes(save_data[6], byteorder='little'))
-                            musashi_z = int.from_bytes(save_data[1], byteorder='little')
-                            musashi_floor = 1
-                            if(musashi_z > 0xfdc0):
-                                musashi_floor_handle = 0
-                                musashi_floor = 1
-                            elif(musashi_z > 0xfbc0):
-                                musashi_floor_handle = 0
-                                musashi_floor = 2
-                            elif(musashi_z > 0xf9c0):
-                                musashi_floor_handle = 1
-                                musashi_floor = 3
-                            elif(musashi_z > 0xf7c0):
-                                musashi_floor_handle = 2
-                            if(curr_location == 0x3020 and ctx.slot_data["quest_item_sanity"] and musashi_floor_handle != self.musashi_old_floor):
-                                self.musashi_old_floor = musashi_floor_handle
-                                loc_id = standard_location_name_to_id["Handle #1 - Steamwood 2"] + musashi_floor_handle
-                                dialog_id = [0x19bf90, 0x19c0d4]
-                                if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                    if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
-                                        barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                        if(self.message_level == 3):
-                                            logger.info("quest item dialog handle# %s", [1,4,8][musashi_floor_handle])
-                                        barray = barray[:47]
-                                        barray.append(0x00)
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [(dialog_id[self.jp_version]+4, barray, MAIN_RAM)]
-                                        )
-                                        #write_instructions.append((dialog_id[self.jp_version]+4, barray, MAIN_RAM))
-                            
-                            if(ctx.slot_data["steamwood_elevator_logic"] != 1):
-                                if(self.elevator_active == False and (is_musashi_on_elevator == 1 or (musashi_floor != elevator_floor and elevator_state == 1))):
-                                    self.elevator_active = True
-                                    #logger.info("Musashi floor %s", musashi_floor)
-                                    #logger.info("Elevator floor %s", elevator_floor)
-                                    #logger.info("Restarting Elevator")
-                                    if(curr_location == 0x301d):
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [((0x17f6cc + (self.jp_version * 0x200)), [0xff, 0xff], MAIN_RAM)] 
-                                        )
-                                    else:
-                                        await bizhawk.write(
-                                            ctx.bizhawk_ctx,
-                                            [((0x180704 + (self.jp_version * 0x200)), [0xff, 0xff], MAIN_RAM)] 
-                                        )
-                                elif(self.elevator_active == True and is_musashi_on_elevator == 0):
-                                    if(musashi_floor == 1):
-                                        if(elevator_state == 7):
-                                            #logger.info("Stopping Elevator")
-                                            self.elevator_active = False
-                                            if(curr_location == 0x301d):
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [((0x17f6cc + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                )
-                                            else:
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [((0x180704 + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                )
-                                    elif(ctx.slot_data["steamwood_elevator_logic"] == 2):
-                                        if(musashi_floor == 2):
-                                            if(elevator_state == 2):
-                                                #logger.info("Stopping Elevator")
-                                                self.elevator_active = False
-                                                if(curr_location == 0x301d):
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x17f6cc + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                                else:
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x180704 + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                        elif(musashi_floor == 3):
-                                            if(elevator_state == 3):
-                                                #logger.info("Stopping Elevator")
-                                                self.elevator_active = False
-                                                if(curr_location == 0x301d):
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x17f6cc + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                                else:
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x180704 + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                    elif(ctx.slot_data["steamwood_elevator_logic"] == 3):
-                                        if(musashi_floor == 2):
-                                            if(elevator_state == 6):
-                                                self.elevator_active = False
-                                                if(curr_location == 0x301d):
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x17f6cc + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                                else:
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x180704 + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                        elif(musashi_floor == 3):
-                                            if(elevator_state == 5):
-                                                self.elevator_active = False
-                                                if(curr_location == 0x301d):
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x17f6cc + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
-                                                else:
-                                                    await bizhawk.write(
-                                                        ctx.bizhawk_ctx,
-                                                        [((0x180704 + (self.jp_version * 0x200)), [0x00, 0x00], MAIN_RAM)] 
-                                                    )
+            if(len(self.tech_dialog[6]) != 0):
+                if(self.message_level > 0):
+                    logger.info("writing tech dialog")
+                dialog = AreaDialog()
+                for i in range(len(self.tech_dialog)):
+                    if(self.tech_checks[i] == False):
+                        dialog.add(castle_dialog[self.jp_version][i], self.tech_dialog[i], TEXTBOX)
+                await self.write_area_dialog(ctx, dialog)
+        if(ctx.slot_data["skip_minigame_town_on_fire"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x17f0e8 + (self.jp_version * 0x200), [0xb2], MAIN_RAM)]
+            )
+        if(self.progression_state == 0x28a): #Ask geezer about gondola gizmo and his state is too high
+            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list):
+                await self.write_ram(
+                    ctx,
+                    [(self.address.geezer, [0x7], MAIN_RAM)]
+                )
+            elif(int.from_bytes(game_state[27], byteorder='little') > 7):
+                await self.write_ram(
+                    ctx,
+                    [(self.address.geezer, [0x1], MAIN_RAM)]
+                )
+        if(int.from_bytes(game_state[8], "little") in [1, 2]): #KnightB state
+            if(game_state[4][11] & 0b10000000 == 0b10000000): #skullpion killed
+                if(self.message_level > 0):
+                    logger.info("skullpion killed, can get crosswise cut")
+                await self.write_ram(
+                    ctx,
+                    [(0x18090c + (self.jp_version * 0x200), [0xa, 0x0], MAIN_RAM)]
+                )
+            else:
+                if(self.message_level > 0):
+                    logger.info("skullpion not killed, can't get crosswise cut")
+                await self.write_ram(
+                    ctx,
+                    [(0x18090c + (self.jp_version * 0x200), [0x40, 0x6], MAIN_RAM)]
+                )
 
+    @area_entry_handlers.register([0x1011]) #chapter 2 upper town
+    async def enter_upper_town(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(self.progression_state == 0x14):
+            self.try_to_update_connections = True
 
-                if(curr_location == 0x3060 or curr_location == 0x3062 or curr_location == 0x305d or curr_location == 0x305e or curr_location == 0x3063):
-                    self.counter_for_delayed_check += 1
-                    if(self.counter_for_delayed_check>9):
-                        self.counter_for_delayed_check = 0
-                        if(curr_location in dialog_location_table):
-                            for loc_id, dialog_id in dialog_location_table[curr_location].items():
-                                if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                                    if(loc_id in short_text_boxes):
-                                        barray = await self.assemble_short_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
-                                    else:
-                                        barray = await self.assemble_binary_array_for_textbox(ctx, loc_id + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset))
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(dialog_id[self.jp_version]+4, barray, MAIN_RAM)]
-                                    )
-                if(curr_location == 0x3025): #Twinpeak Entrance
-                    await bizhawk.write(
-                        ctx.bizhawk_ctx,
-                        [(0x18570c + (self.jp_version * 0x200), [0], MAIN_RAM)]
-                    ) #disable changing progression when opening bracelet chest
-                    #en
-                    #volatile uint32_t *disableBraceletProgression = 0x8018570c;
-                    #*(disableBraceletProgression)=0;
-                    #jp
-                    #volatile uint32_t *disableBraceletProgression = 0x8018590c;
-                    #*(disableBraceletProgression)=0;
-                if(curr_location == 0x3029 and self.check_for_logs): #Twinpeak second peak check if raft needs updated
-                    self.counter_for_delayed_check += 1
-                    if(self.counter_for_delayed_check>12):
-                        self.counter_for_delayed_check = 0
-                        await self.update_inventory(ctx)
-                        if(0x4e in self.curr_inventory and 0x50 in self.curr_inventory and 0x51 in self.curr_inventory and 0x52 in self.curr_inventory):
-                            #logger.info("Raft complete, removing Logs")
-                            self.check_for_logs = 0
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                0x0ae65a + (self.jp_version * -0xea0), 1, MAIN_RAM
-                            )]))[0]
-                            raft_state = int.from_bytes(save_data, byteorder='little')
-                            raft_state = raft_state | 0b11000000
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ae65a + (self.jp_version * -0xea0), [raft_state], MAIN_RAM)]
-                            )
-                            for i in range(len(self.curr_inventory)):
-                                if(self.curr_inventory[i] in [0x4d,0x4e,0x50,0x51,0x52]): #Jon's key and four logs
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [((0x0ba1e7+i + (self.jp_version * -0xea0)), [0x0], MAIN_RAM)] 
-                                    )
-                if(curr_location == 0x302a): #rafting minigame
-                    if(ctx.slot_data["raft_difficulty"] == 3 or ctx.slot_data["raft_hp"] != 4):
-                        self.counter_for_delayed_check += 1
-                        if(self.counter_for_delayed_check > 4):
-                            self.counter_for_delayed_check = 0
-                            save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(0x0ba287 + (self.jp_version * -0xea0), 1, MAIN_RAM),(0x17ec48 + (self.jp_version * 0x200), 1, MAIN_RAM)]))
-                            self.raft_hp = int.from_bytes(save_data[0], byteorder='little')
-                            #logger.info("log data %s", save_data)
-                            #self.raft_hp = save_data[0]
-                            if(ctx.slot_data["raft_hp"] != 4 and int.from_bytes(save_data[1], byteorder='little') == 4):
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ba287 + (self.jp_version * -0xea0), [ctx.slot_data["raft_hp"]], MAIN_RAM), (0x17ec48 + (self.jp_version * 0x200), [ctx.slot_data["raft_hp"]], MAIN_RAM)] #fix starting raft hp
-                                )
-                            if(ctx.slot_data["raft_difficulty"] == 3):
-                                self.raft_regrow_timer += 1 
-                                if(self.raft_hp == 4):
-                                    self.raft_regrow_timer = 0
-                                if(self.raft_regrow_timer >= ctx.slot_data["raft_regrow"]):
-                                    self.raft_regrow_timer = 0
-                                    await bizhawk.write(
-                                        ctx.bizhawk_ctx,
-                                        [(0x0ba287 + (self.jp_version * -0xea0), [self.raft_hp + 1], MAIN_RAM)] #add a log
-                                    )
+    @area_entry_handlers.register(boss_core_dialog) #At a Boss
+    async def enter_boss(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["core_sanity"] == False and curr_location == 0x3042 and ctx.slot_data["quest_item_sanity"] == True and not item_name_to_id["Key"] in received_list):
+            for jump_id in boss_core_update[curr_location][self.jp_version]:
+                await self.write_ram(
+                    ctx,
+                    [(jump_id, [0,0,0,0], MAIN_RAM)]
+                )
+            if(self.message_level > 0):    
+                logger.info("temporarily hiding water boss core until Key to mine is found to prevent soft locks")
+
+        if(ctx.slot_data["core_sanity"] == True):
+            for jump_id in boss_core_update[curr_location][self.jp_version]:
+                await self.write_ram(
+                    ctx,
+                    [(jump_id, [0,0,0,0], MAIN_RAM)]
+                )
+            for loc_id, dialog_id in boss_core_dialog[curr_location].items():
+                if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
+                #for i in range(len(self.core_checks)):
+                    #loc_id = standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i
+                    #if(loc_id in ctx.locations_info):
+                        #logger.info("loop index %s", i)
+                        #logger.info("textbox length %s", boss_core_dialog[[boss_locations[i]][1])
+                        #logger.info("location id %s", loc_id)
 
-                    """if(ctx.slot_data["skip_minigame_follow_leno"] == True):
-                        save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                            0x0ba284, 1, MAIN_RAM
-                        )]))[0]
-                        leno_state = int.from_bytes(save_data, byteorder='little')
-                        if(leno_state > 0 and leno_state < 0x3):
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba284, [0x0e], MAIN_RAM), (0x190614, [0x22, 0x30, 0x00, 0x04], MAIN_RAM)] #graveyard 0x04003022
-                            )"""
-                if(self.check_if_lumina_was_found):
-                    if(ctx.slot_data["lumina_randomzied"] == True):
-                        save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                            0x0ae658 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                        )]))[0]
-                        lumina_state = int.from_bytes(save_data, byteorder='little')
-                        lumina_state = lumina_state & 0b1
-                        if((lumina_state == 1 and not curr_location in [0x3005, 0x3006, 0x3008, 0x3009, 0x300a]) or self.progression_state >= 0xa):
-                            self.check_if_lumina_was_found = 0
 
-                            await ctx.check_locations([standard_location_name_to_id["Lumina - Spiral Tower"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)])
-                            #await ctx.send_msgs([{
-                            #    "cmd": "LocationChecks",
-                            #    "locations": [standard_location_name_to_id["Lumina - Spiral Tower"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)]
-                            #}])
+                    barray = await self.assemble_binary_array_for_boss_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset),dialog_id[self.jp_version][1])
+                    if(self.message_level > 0):
+                        logger.info("writing boss core dialog")
+                    await self.write_ram(
+                        ctx,
+                        [(dialog_id[self.jp_version][0]+4, barray, MAIN_RAM)]
+                    )
+                else:
+                    if(not standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                        for i in range(4):
+                            self.table_ids_to_hint.append(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                    logger.info("no scout information found")
+                    #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
+                    await ctx.send_msgs([{
+                        "cmd": "LocationScouts",
+                        "locations": self.table_ids_to_hint,
+                        "create_as_hint": 0
+                    }])
+                    break
+
+    @area_entry_handlers.register([0x3072]) #ant gondola minigame
+    async def enter_ant_gondola(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["skip_minigame_ant_gondola"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x18446c + (self.jp_version * 0x138), [0x74], MAIN_RAM)]
+            )
+
+    @area_entry_handlers.register([0x304e]) #in well
+    async def enter_well(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        #await self.update_progression(ctx)
+        if(ctx.slot_data["core_sanity"] == True or ctx.slot_data["scroll_sanity"] == True or ctx.slot_data["quest_item_sanity"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x182e1c + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #skip over water scroll updating progression state
+            )
+            if(self.progression_state < 0x19a): #before entering church
+                if(self.message_level > 0):
+                    logger.info("Hiding bell to prevent soft lock, return after Father White makes a request for the bell and learning how to enter the restaurant basement")
+                save_data: bytes = (await self.read_ram(
+                    ctx,
+                    [(0x1207e6 + (self.jp_version * 0xa70), 2, MAIN_RAM)]
+                ))[0]
+                bell_z = int.from_bytes(save_data, byteorder='little')
+                if(bell_z == 0xfe6e):
+                    await self.write_ram(
+                        ctx,
+                        [(0x1207e6 + (self.jp_version * 0xa70), [0xff,0xfe], MAIN_RAM)] #hide the bell in a wall
+                    )
+                else:
+                    save_data: bytes = (await self.read_ram(
+                        ctx,
+                        [(0x1209fe + (self.jp_version * 0xa70), 2, MAIN_RAM)]
+                    ))[0]
+                    bell_z = int.from_bytes(save_data, byteorder='little')
+                    if(bell_z == 0xfe6e):
+                        await self.write_ram(
+                            ctx,
+                            [(0x1209fe + (self.jp_version * 0xa70), [0xff,0xfe], MAIN_RAM)] #hide the bell in a wall
+                        )
                     else:
-                        self.check_if_lumina_was_found = 0
+                        logger.info("Could not find bell in memory")
 
-                if(self.check_if_lumina_needs_removed):
-                    if(ctx.slot_data["lumina_randomzied"] == True):
-                        self.update_list_of_received_items(ctx)
-                        if(curr_location < 0x3000 or curr_location > 0x300f): #check if past chapter 1
-                            if(not item_name_to_id["Lumina"] in received_list):
-                                if(self.message_level > 0):
-                                    logger.info("Yeeting Lumina")
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x0ae658 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                                )]))[0]
-                                lumina_state = int.from_bytes(save_data, byteorder='little')
-                                lumina_state = lumina_state & 0b11111110
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x0ae658 + (self.jp_version * -0xea0), [lumina_state], MAIN_RAM)]
-                                )
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x078ec0 + (self.jp_version * -0xea0), 1, MAIN_RAM
-                                )]))[0]
-                                lumina_state = int.from_bytes(save_data, byteorder='little')
-                                lumina_state = lumina_state & 0b11111110
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(0x078ec0 + (self.jp_version * -0xea0), [lumina_state], MAIN_RAM)]
+            else:
+                save_data: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.save_world, 1, MAIN_RAM)]
+                ))[0]
+                bell_state: bool = save_data[0] == 0b1001110 #is in intial spawn position
+                if(bell_state):
+                    save_data: bytes = (await self.read_ram(
+                        ctx,
+                        [(self.address.bell, 1, MAIN_RAM)]
+                    ))[0]
+                    water_level_changed: bool = save_data[0] & 0b1 == 0b1
+                    if(water_level_changed):
+                        if(self.message_level > 0):
+                            logger.info("water level has risen, moving bell to prevent soft lock")
+
+                        save_data: bytes = (await self.read_ram(
+                            ctx,
+                            [(0x1207e6 + (self.jp_version * 0xa70), 2, MAIN_RAM)]
+                        ))[0]
+                        bell_z = int.from_bytes(save_data, byteorder='little')
+                        if(bell_z == 0xfe6e):
+                            await self.write_ram(
+                                ctx,
+                                [(0x1207e2 + (self.jp_version * 0xa70), [0x27,0x06, 0x0, 0x0, 0x7e, 0xfd, 0x0, 0x0, 0x80, 0xff], MAIN_RAM)] #water level has risen but bell has not been rescued, move bell to higher ground
+                            )
+                        else:
+                            save_data: bytes = (await self.read_ram(
+                                ctx,
+                                [(0x1209fe + (self.jp_version * 0xa70), 2, MAIN_RAM)]
+                            ))[0]
+                            bell_z = int.from_bytes(save_data, byteorder='little')
+                            if(bell_z == 0xfe6e):
+                                await self.write_ram(
+                                    ctx,
+                                    [(0x1209fa + (self.jp_version * 0xa70), [0x27,0x06, 0x0, 0x0, 0x7e, 0xfd, 0x0, 0x0, 0x80, 0xff], MAIN_RAM)] #water level has risen but bell has not been rescued, move bell to higher ground
                                 )
-                                self.check_if_lumina_needs_removed = 0
                             else:
-                                self.check_if_lumina_needs_removed = 0
-                    else:
-                        self.check_if_lumina_needs_removed = 0
-                if(curr_location in bakery_locations):
-                    curr_inventory = set(game_state[19])
-                    if(0x56 in curr_inventory and not 0x56 in self.old_inventory):
-                        self.try_to_update_connections = True
-                    if(0x4d in curr_inventory and not 0x4d in self.old_inventory):
-                        self.try_to_update_connections = True
-                    self.old_inventory = curr_inventory
-                if(ctx.slot_data["bakery_sanity"] == True or ctx.slot_data["restaurant_sanity"] == True):
-                    if(curr_location in bakery_locations or curr_location in restaurant_locations):
-                        if(len(self.bakery_dialog)>0 or len(self.restaurant_dialog)>0):
-                            if(False in self.bakery_checks or False in self.restaurant_checks):
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x11514A + (self.jp_version * 0xa70), 1, MAIN_RAM
-                                )]))[0]
-                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+                                logger.info("Could not find bell in memory")
 
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x115130 + (self.jp_version * 0xa70), 1, MAIN_RAM
-                                )]))[0]
-                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
-                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0 or self.cursor_pos>0)):
-                                    self.cursor_pos = new_cursor_pos
-                                    #logger.info("cursor pos %s", self.cursor_pos)
-                                    if(ctx.slot_data["bakery_sanity"] == True and curr_location in bakery_locations):
-                                        if(self.cursor_pos < len(self.bakery_checks) and (self.cursor_pos+1) * 2 <= len(self.bakery_dialog) and self.cursor_pos < len(self.bakery_inventory)):
-                                            if(self.bakery_inventory[self.cursor_pos]==0x3e):
-                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1faae0, self.assemble_binary_array_for_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f0 + (self.jp_version * 0xa70), [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x126a00 + (self.jp_version * 0xa70), [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f4 + (self.jp_version * 0xa70), [0x01], MAIN_RAM)]
-                                                )
-                                    if(ctx.slot_data["restaurant_sanity"] == True and curr_location in bakery_locations):
-                                        if(self.cursor_pos < len(self.restaurant_checks) and (self.cursor_pos+1) * 2 <= len(self.restaurant_dialog) and self.cursor_pos < len(self.bakery_inventory)):
-                                            if(self.bakery_inventory[self.cursor_pos]==0x40):
-                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1faae0, self.assemble_binary_array_for_dialog(self.restaurant_dialog[(self.cursor_pos)*2],self.restaurant_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f0 + (self.jp_version * 0xa70), [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x126a00 + (self.jp_version * 0xa70), [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f4 + (self.jp_version * 0xa70), [0x01], MAIN_RAM)]
-                                                )
-                                    if(ctx.slot_data["restaurant_sanity"] == True and curr_location in restaurant_locations):
-                                        if(self.cursor_pos < len(self.restaurant_checks) and (self.cursor_pos+1) * 2 <= len(self.restaurant_dialog) and self.cursor_pos < len(self.restaurant_inventory)):
-                                            if(self.restaurant_inventory[self.cursor_pos]==0x40):
-                                                #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1faae0, self.assemble_binary_array_for_dialog(self.restaurant_dialog[(self.cursor_pos)*2],self.restaurant_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f0 + (self.jp_version * 0xa70), [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x126a00 + (self.jp_version * 0xa70), [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                                )
-                                                await bizhawk.write(
-                                                    ctx.bizhawk_ctx,
-                                                    [(0x1269f4 + (self.jp_version * 0xa70), [0x01], MAIN_RAM)]
-                                                )
+        if(ctx.slot_data["core_sanity"] == True):
+            if(self.progression_state < 0x258 or self.progression_state > 0x276): #before killing Relic Keeper or after fixing well
+                await self.write_ram(
+                    ctx,
+                    [(0x1845f4 + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #skip over water crest updating progression state
+                )
 
-                if(ctx.slot_data["grocery_sanity"] == True):
-                    if(curr_location in grocery_locations):
-                        if(len(self.grocery_dialog)>0):
-                            if(False in self.grocery_checks):
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x11514A + (self.jp_version * 0xa70), 1, MAIN_RAM
-                                )]))[0]
-                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+    @area_entry_handlers.register([0x1052, 0x1077]) #in chapter 3 and 4 town
+    async def enter_town_chapter_3_4(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["core_sanity"] == True):
+            save_data: bytes = (await self.read_ram(
+                ctx,
+                [(self.address.bell, 1, MAIN_RAM)]
+            ))[0]
+            water_level_changed: bool = save_data[0] & 0b1 == 0b1
+            if(water_level_changed):
+                #await self.update_progression(ctx)
+                if(self.progression_state >= 0x19a and self.progression_state < 0x1ae): #getting rope reward
+                    if(self.message_level > 0):
+                        logger.info("removing rope to prevent soft lock")
+                    await self.write_ram(
+                        ctx,
+                        [(0x18f7b0 + (self.jp_version * 0x1f0), [0], MAIN_RAM)] #removing rope as a reward
+                    )
+                save_data: bytes = (await self.read_ram(
+                    ctx,
+                    [(self.address.well_rope, 1, MAIN_RAM)]
+                ))[0]
+                rope_into_well: bool = save_data[0] & 0b1000000 == 0b1000000
+                if(rope_into_well):
+                    if(self.message_level > 0):
+                        logger.info("removing rope to prevent soft lock")
+                    remove_rope = save_data[0] & 0b10111111
+                    await self.write_ram(
+                        ctx,
+                        [(self.address.well_rope, [remove_rope], MAIN_RAM)] #water level has risen remove rope from well
+                    )
+                if(self.progression_state == 0x258): #defeated relic keeper
+                    await self.write_ram(
+                        ctx,
+                        [(self.address.progression_state, [0x76], MAIN_RAM)] #well was fixed move progression state
+                    )
 
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x115130 + (self.jp_version * 0xa70), 1, MAIN_RAM
-                                )]))[0]
-                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
-                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0 or self.cursor_pos>0)):
-                                    self.cursor_pos = new_cursor_pos
-                                    #logger.info("cursor pos %s", self.cursor_pos)
-                                    if(self.cursor_pos < len(self.grocery_checks) and (self.cursor_pos+1) * 2 <= len(self.grocery_dialog) and self.cursor_pos < len(self.grocery_inventory)):
-                                        if(self.grocery_inventory[self.cursor_pos]==0x42):
-                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1faae0, self.assemble_binary_array_for_dialog(self.grocery_dialog[(self.cursor_pos)*2],self.grocery_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f0 + (self.jp_version * 0xa70), [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x126a00 + (self.jp_version * 0xa70), [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f4 + (self.jp_version * 0xa70), [0x01], MAIN_RAM)]
-                                            )
-                                        elif(self.grocery_inventory[self.cursor_pos]==0x0):
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x115130 + (self.jp_version * 0xa70), [0xe8], MAIN_RAM)] #clear text box
-                                            )
-                if(curr_location == 0x1011): #at upper town chapter 2
-                    if(self.progression_state == 0x78):
-                        if(game_state[19].count(0x4d) > 1):
-                            new_inventory: List[int] = []
-                            manual_counter = 0
-                            for val in game_state[19]:
-                                if(val == 0x4d):
-                                    manual_counter = manual_counter + 1
-                                if(manual_counter < 2 or val != 0x4d):
-                                    new_inventory.append(val) 
-                            await bizhawk.write(
-                                ctx.bizhawk_ctx,
-                                [(0x0ba1e7 + (self.jp_version * -0xea0), new_inventory, MAIN_RAM)]
-                            )
-                            if(self.message_level > 0):
-                                logger.info("removing extra manual")
-                
-                if(len(self.messagequeue) > 0):
-                    self.messagetimer = self.messagetimer + 1
-                    if(self.messagetimer > 1):
-                        self.messagetimer = 0
-                        await bizhawk.display_message(ctx.bizhawk_ctx, self.messagequeue.pop(0))
-                        if(len(self.messagequeue) > 30):
-                            i = 0
-                            while i < len(self.messagequeue) and len(self.messagequeue) > 30:
-                                if(not "(Prog)" in self.messagequeue[i]):
-                                    self.messagequeue.pop(i)
-                                else:
-                                    i = i + 1
-                            if(len(self.messagequeue) > 30):
-                                self.messagequeue = self.messagequeue[-30:]
-                            
-                if(curr_location == 0x304b and ctx.slot_data["quest_item_sanity"]):
-                    save_data = (await bizhawk.read(ctx.bizhawk_ctx, [(0x126b5e + (self.jp_version * 0xa70), 2, MAIN_RAM),(0x126b66 + (self.jp_version * 0xa70), 2, MAIN_RAM)]))
-                    musashi_x = int.from_bytes(save_data[0], byteorder='little', signed = True)
-                    musashi_y = int.from_bytes(save_data[1], byteorder='little', signed = True)
-                    gizmo_positions = [[-204, 58], [-45, 18], [150, -43], [189, -289]]
-                    gizmo_distances = [abs(musashi_y - y) + abs(musashi_x - x) for x, y in gizmo_positions]
-                    closest_gizmo = min(range(len(gizmo_distances)), key=gizmo_distances.__getitem__)
-                    if(closest_gizmo != self.old_closest_gizmo):
-                        self.old_closest_gizmo = closest_gizmo
-                        loc_id = standard_location_name_to_id["Gondola Gizmo 1 - Scrap Depository"] + closest_gizmo
-                        dialog_id = [0x184360, 0x184424]
-                        dialog_id_2 = [0x184450, 0x1844ec]
-                        if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
-                            if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
-                                barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                                if(self.message_level == 3):
-                                    logger.info("gondola gizmo dialog # %s : %s", closest_gizmo + 1, gizmo_distances)
-                                barray = barray[:47]
-                                barray.append(0x00)
-                                await bizhawk.write(
-                                    ctx.bizhawk_ctx,
-                                    [(dialog_id[self.jp_version]+4, barray, MAIN_RAM),
-                                    (dialog_id_2[self.jp_version]+4, barray, MAIN_RAM)]
-                                )
-                """if(ctx.slot_data["bakery_sanity"] == True):
-                    if(curr_location in bakery_locations):
-                        if(len(self.bakery_dialog)>0):
-                            if(False in self.bakery_checks):
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x11514A, 1, MAIN_RAM
-                                )]))[0]
-                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+    @area_entry_handlers.register([0x3023]) #at volcano near wind scroll
+    async def enter_volcano(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["core_sanity"] == True):
+            #await self.update_progression(ctx)
+            if(self.progression_state < 0x3d4): #before steamwood 2
+                await self.write_ram(
+                    ctx,
+                    [(0x182d38 + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #dont update progression for wind scroll
+                )
+                await self.write_ram(
+                    ctx,
+                    [(0x18386c + (self.jp_version * 0x200), [0,0,0,0], MAIN_RAM)] #dont update progression for freed from bincho
+                )
 
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x115130, 1, MAIN_RAM
-                                )]))[0]
-                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
-                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0)):
-                                    self.cursor_pos = new_cursor_pos
-                                    #logger.info("cursor pos %s", self.cursor_pos)
-                                    if(self.cursor_pos < len(self.bakery_checks) and (self.cursor_pos+1) * 2 <= len(self.bakery_dialog)):
-                                        if(self.bakery_inventory[self.cursor_pos]==0x3e):
-                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1faae0, self.assemble_binary_array_for_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f0, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x126a00, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f4, [0x01], MAIN_RAM)]
-                                            )
+    @area_entry_handlers.register([0x301b]) #entering Meandering Forest
+    async def enter_meandering_forest_leno(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        save_data: bytes = (await self.read_ram(ctx, [(
+            self.address.leno, 1, MAIN_RAM
+        )]))[0]
+        leno_state = int.from_bytes(save_data, byteorder='little')
+        if(leno_state > 0 and leno_state < 0xf and ctx.slot_data["leno_sniff_modifier"] != 100):
+            snif_multiplier: float = 100.0
+            snif_multiplier = ctx.slot_data["leno_sniff_modifier"] / snif_multiplier 
+            write_instructions = []
+            write_instructions.append((0x181434 + (self.jp_version * 0x188), math.ceil(0xb4 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d40 + (self.jp_version * 0x188), math.ceil(0xb4 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d4c + (self.jp_version * 0x188), math.ceil(0xd2 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x181488 + (self.jp_version * 0x188), math.ceil(0xd2 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d68 + (self.jp_version * 0x188), math.ceil(0xf0 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x1814a0 + (self.jp_version * 0x188), math.ceil(0xf0 * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d74 + (self.jp_version * 0x188), math.ceil(0x10e * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x1814ac + (self.jp_version * 0x188), math.ceil(0x10e * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d90 + (self.jp_version * 0x188), math.ceil(0x12c * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x1814c4 + (self.jp_version * 0x188), math.ceil(0x12c * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x180d9c + (self.jp_version * 0x188), math.ceil(0x14a * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            write_instructions.append((0x1814d0 + (self.jp_version * 0x188), math.ceil(0x14a * snif_multiplier).to_bytes(2, 'little'), MAIN_RAM))
+            await self.write_ram(
+                ctx,
+                write_instructions
+            )
 
-                if(ctx.slot_data["restaurant_sanity"] == True):
-                    if(curr_location in restaurant_locations):
-                        if(len(self.restaurant_dialog)>0):
-                            if(False in self.restaurant_checks):
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x11514A, 1, MAIN_RAM
-                                )]))[0]
-                                new_cursor_pos = int.from_bytes(save_data, byteorder='little')
+    @area_entry_handlers.register([0x3014]) #entering Somnolent Forest
+    async def enter_somnolent_forest(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["skip_minigame_follow_leno"] == True):
+            save_data: bytes = (await self.read_ram(ctx, [(
+                self.address.leno, 1, MAIN_RAM
+            )]))[0]
+            leno_state = int.from_bytes(save_data, byteorder='little')
+            if(leno_state > 0 and leno_state < 0x3):
+                await self.write_ram(
+                    ctx,
+                    [(self.address.leno, [0x0e], MAIN_RAM), (0x190614 + (self.jp_version * 0x5c), [0x22, 0x30, 0x00, 0x04], MAIN_RAM)] #graveyard 0x04003022
+                )
 
-                                save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, [(
-                                    0x115130, 1, MAIN_RAM
-                                )]))[0]
-                                check_if_question_mark = int.from_bytes(save_data, byteorder='little')
-                                if(self.cursor_pos != new_cursor_pos and (check_if_question_mark == 0xec or new_cursor_pos > 0)):
-                                    self.cursor_pos = new_cursor_pos
-                                    #logger.info("cursor pos %s", self.cursor_pos)
-                                    if(self.cursor_pos < len(self.restaurant_checks) and (self.cursor_pos+1) * 2 <= len(self.restaurant_dialog) and self.cursor_pos < len(self.restaurant_inventory)):
-                                        if(self.restaurant_checks[self.cursor_pos] == False or self.restaurant_inventory[self.cursor_pos]==0x40):
-                                            #logger.info("bakery text %s",self.assemble_binary_array_for_bakery_dialog(self.bakery_dialog[(self.cursor_pos)*2],self.bakery_dialog[(self.cursor_pos)*2+1]))
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1faae0, self.assemble_binary_array_for_dialog(self.restaurant_dialog[(self.cursor_pos)*2],self.restaurant_dialog[(self.cursor_pos)*2+1]), MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f0, [0xe0, 0xaa, 0x1f, 0x80], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x126a00, [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], MAIN_RAM)]
-                                            )
-                                            await bizhawk.write(
-                                                ctx.bizhawk_ctx,
-                                                [(0x1269f4, [0x01], MAIN_RAM)]
-                                            )"""
+    @area_entry_handlers.register([0x302a]) #rafting minigame
+    async def enter_rafting(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["raft_difficulty"] == 2):
+            await self.write_ram(
+                ctx,
+                [(0x17ece0 + (self.jp_version * -0xea0), [0x0, 0x0], MAIN_RAM)] #remove damage calculation for rafting #, [0x200]????
+            )
+
+    @area_entry_handlers.register([0x1010, 0x1011, 0x301c, 0x301d, 0x301e, 0x3020]) #steamwood timer
+    async def enter_steamwood_timer_area(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["steamwood_timer"] != 100):
+            #await self.update_progression(ctx)
+            if((self.progression_state < 0x0082 and self.progression_state >= 0x0078) or (self.progression_state < 0x03d4 and self.progression_state >= 0x03ca)):
+                time_modifier = math.ceil(ctx.slot_data["steamwood_timer"] * 0x1555 / 100.0)
+                if(ctx.slot_data["steamwood_timer"] == 1):
+                    time_modifier = 0x25
+                await self.write_ram(
+                    ctx,
+                    [(self.address.minigame_timer, time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix steamwood timer
+                )
+        gizmos_in_inventory = sum([val in [0x63, 0x64, 0x65, 0x66] for val in game_state[19]])
+        if(gizmos_in_inventory > 1): #gondola gizmos in inventory
+            #logger.info("gizmos in inventory %s", gizmos_in_inventory)
+            new_inventory: List[int] = [val for val in game_state[19]] 
+            for i in range(11,-1,-1):
+                if(new_inventory[i] in [0x63, 0x64, 0x65, 0x66] and gizmos_in_inventory > 1):
+                    new_inventory[i] = 0
+                    gizmos_in_inventory = gizmos_in_inventory - 1
+
+            #new_inventory: List[int] = [val for val in save_data[19]] 
+            await self.write_ram(
+                ctx,
+                [(self.address.inventory, new_inventory, MAIN_RAM)]
+            )
+            if(self.message_level > 0):
+                logger.info("removing extra gondola gizmos from inventory (They are very heavy)")
+
+    @area_entry_handlers.register([0x301d, 0x3020]) #steamwood
+    async def enter_steamwood(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        write_instructions = []
+        if(ctx.slot_data["steamwood_random_valves"] == True):
+            if(curr_location == 0x301d):#steamwood 1
+                write_instructions.append((0x183cf8 + (self.jp_version * 0x1c0), [0x99, 0xb] * 7, MAIN_RAM)) #fix steamwood 1 valve timer
+            else:
+                write_instructions.append((0x184ed0 + (self.jp_version * 0x1c0), [0x99, 0xb] * 7, MAIN_RAM)) #fix steamwood 2 valve timer
+        elif(ctx.slot_data["steamwood_valve_timer"] != 100):
+            valve_long_timer = math.ceil(0x708 * ctx.slot_data["steamwood_valve_timer"] / 100.0).to_bytes(2, 'little')
+            valve_short_timer = math.ceil(0x41a * ctx.slot_data["steamwood_valve_timer"] / 100.0).to_bytes(2, 'little')
+            valve_timers = [valve_long_timer[0], valve_long_timer[1]] * 3 + [valve_short_timer[0], valve_short_timer[1]] * 2 + [valve_long_timer[0], valve_long_timer[1]] + [valve_short_timer[0], valve_short_timer[1]]
+            if(curr_location == 0x301d):#steamwood 1
+                write_instructions.append((0x183cf8 + (self.jp_version * 0x1c0), valve_timers, MAIN_RAM)) #fix steamwood 1 valve timer
+            else:
+                write_instructions.append((0x184ed0 + (self.jp_version * 0x1c0), valve_timers, MAIN_RAM)) #fix steamwood 2 valve timer
+        if(ctx.slot_data["steamwood_disable_countdown"] == True):
+            if(curr_location == 0x301d):#steamwood 1
+                write_instructions.append((0x17ed0c + (self.jp_version * 0x200), [0x0, 0x0], MAIN_RAM)) #remove valve countdown
+            else:
+                write_instructions.append((0x17f4d8 + (self.jp_version * 0x200), [0x0, 0x0], MAIN_RAM)) #remove valve countdown
+        if(ctx.slot_data["steamwood_pressure_rise_rate"] == 2): #Faster
+            if(curr_location == 0x301d):
+                write_instructions.append((0x183a28 + (self.jp_version * 0x1c8), [0x4] * 4, MAIN_RAM)) #steamwood 1 pressure rise
+            else:
+                write_instructions.append((0x184a60 + (self.jp_version * 0x1c8), [0x4] * 4, MAIN_RAM)) #steamwood 2 pressure rise
+        elif(ctx.slot_data["steamwood_pressure_rise_rate"] == 3): #Slower
+            if(curr_location == 0x301d):
+                write_instructions.append((0x183a2c + (self.jp_version * 0x1c8), [0x3, 0x3, 0x4, 0x5], MAIN_RAM)) #steamwood 1 pressure rise
+            else:
+                write_instructions.append((0x184a64 + (self.jp_version * 0x1c8), [0x3, 0x3, 0x4, 0x5], MAIN_RAM)) #steamwood 2 pressure rise
+        elif(ctx.slot_data["steamwood_pressure_rise_rate"] == 4): #Even 
+            if(curr_location == 0x301d):
+                write_instructions.append((0x183a28 + (self.jp_version * 0x1c8), [0x3] * 8, MAIN_RAM)) #steamwood 1 pressure rise
+            else:
+                write_instructions.append((0x184a60 + (self.jp_version * 0x1c8), [0x3] * 8, MAIN_RAM)) #steamwood 2 pressure rise
+        if(ctx.slot_data["steamwood_progress_lost"] != -16):
+            write_instructions.append((0x17c598 + (self.jp_version * 0x200), ctx.slot_data["steamwood_progress_lost"].to_bytes(2, 'little', signed=True), MAIN_RAM))
+        top_edge = 17
+        bottom_edge = 68
+        if(ctx.slot_data["steamwood_width_of_ok_pressure"] != 12):
+            #mid_point = 74
+            half_width = round(ctx.slot_data["steamwood_width_of_ok_pressure"] / 2)
+            if(half_width > 16):
+                top_edge = 0
+            else:
+                top_edge = top_edge - half_width
+            bottom_edge = 96 - top_edge - ctx.slot_data["steamwood_width_of_ok_pressure"]
+            write_instructions.append((0x17c540 + (self.jp_version * 0x200), (bottom_edge * -1).to_bytes(2, 'little', signed=True), MAIN_RAM)) #steamwood bottom edge calculation
+            write_instructions.append((0x17c544 + (self.jp_version * 0x200), (ctx.slot_data["steamwood_width_of_ok_pressure"] + 1).to_bytes(2, 'little'), MAIN_RAM)) #steamwood top edge calculation
+            if(curr_location == 0x301d):
+                write_instructions.append((0x18397a + (self.jp_version * 0x1d4), [ctx.slot_data["steamwood_width_of_ok_pressure"]], MAIN_RAM)) #steamwood 1 ok bar thickness
+                write_instructions.append((0x183976 + (self.jp_version * 0x1d4), [top_edge+1], MAIN_RAM)) #steamwood 1 top edge
+            else:
+                write_instructions.append((0x1849b2 + (self.jp_version * 0x1d4), [ctx.slot_data["steamwood_width_of_ok_pressure"]], MAIN_RAM)) #steamwood 2 ok bar thickness
+                write_instructions.append((0x1849ae + (self.jp_version * 0x1d4), [top_edge+1], MAIN_RAM)) #steamwood 2 top edge
+        if(ctx.slot_data["steamwood_valve_progress_modifier"] != 100):
+            if(curr_location == 0x301d):
+                write_instructions.append((0x183a30 + (self.jp_version * 0x1c8), [
+                    math.ceil(0x30 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x28 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x20 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x18 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0)
+                ], MAIN_RAM)) #steamwood 1 valve progress
+            else:
+                write_instructions.append((0x184a68 + (self.jp_version * 0x1c8), [
+                    math.ceil(0x30 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x28 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x20 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x18 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0),
+                    math.ceil(0x10 * ctx.slot_data["steamwood_valve_progress_modifier"] / 100.0)
+                ], MAIN_RAM)) #steamwood 2 valve progress
+        if(ctx.slot_data["steamwood_no_fail_over_pressure"] == True):
+            write_instructions.append((0x17c6dc + (self.jp_version * 0x200), [97 - top_edge], MAIN_RAM)) #check if over pressure
+            write_instructions.append((0x17c6e4 + (self.jp_version * 0x200), [bottom_edge, 0x00, 0x02, 0x24, 0x0e, 0x02, 0x82], MAIN_RAM)) #set new pressure level
+        #li $v0, 0x0001
+        #noop
+        #addu $v0, $a0
+        #bne $v1, $v0, 0x8017dbf4
+        if(curr_location == 0x301d):
+            write_instructions.append((0x17dbc4 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24, 0x00, 0x00, 0x00, 0x00, 0x21, 0x10, 0x44, 0x00, 0x08, 0x00, 0x62, 0x14], MAIN_RAM)) #fix if the correct valve was completed
+        else:
+            write_instructions.append((0x17df00 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24, 0x00, 0x00, 0x00, 0x00, 0x21, 0x10, 0x44, 0x00, 0x08, 0x00, 0x62, 0x14], MAIN_RAM)) #fix if the correct valve was completed
 
+        if(curr_location == 0x301d):
+            write_instructions.append((0x17dbb0 + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24], MAIN_RAM)) #fix check if current valve is less than next valve
+        else:
+            write_instructions.append((0x17deec + (self.jp_version * 0x200), [0x01, 0x00 , 0x02, 0x24], MAIN_RAM)) #fix check if current valve is less than next valve
+        write_instructions.append((0x17db40 + (self.jp_version * 0x200), [0x00, 0x00 , 0x00, 0x00, 0x02, 0x00, 0x63, 0x24], MAIN_RAM)) #fix check if current valve is less than active valve
+        valve_order = [2, 3, 4, 5, 6, 7]
+        if(ctx.slot_data["steamwood_number_valves"] == 1):
+            valve_order = [8]
+            write_instructions.append((0x0ba286 + (self.jp_version * -0xea0), [0x08], MAIN_RAM)) #fix active valve
+        elif(ctx.slot_data["steamwood_number_valves"] == 2):
+            valve_order = [1, 8]
+        else:
+            if(ctx.slot_data["steamwood_random_valves"] == True):
+                random.shuffle(valve_order)
+            while(len(valve_order) + 2 > ctx.slot_data["steamwood_number_valves"]):
+                valve_order.pop(random.randrange(len(valve_order))) 
+            valve_order = [1] + valve_order + [8]
+        valve_update = [8] * 7
+
+        for i in range(len(valve_order)-1):
+            # 1 7 2 5 3 4 6 8
+            # 1 2 3 4 5 6 8
+            valve_update[valve_order[i]-1] = valve_order[i+1]
+        #logger.info("valve order %s", valve_order)
+        #logger.info("valve update %s", valve_update)
+        if(curr_location == 0x301d):
+            write_instructions.append((0x183bc5 + (self.jp_version * 0x1c8), valve_update, MAIN_RAM)) #steamwood 1 valve order
+        else:
+            write_instructions.append((0x184c59 + (self.jp_version * 0x1c8), valve_update, MAIN_RAM)) #steamwood 2 valve order
 
+        await self.write_ram(
+            ctx,
+            write_instructions
+        )
 
+    @area_entry_handlers.register([0x302c, 0x3029]) #aqualin timer
+    async def enter_twinpeak_aqualin(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["aqualin_timer"] != 100):
+            #await self.update_progression(ctx)
+            if(self.progression_state < 0x012c and self.progression_state >= 0x00f0):
+                time_modifier = math.ceil(ctx.slot_data["aqualin_timer"] * 0x1555 / 100.0)
+                if(ctx.slot_data["aqualin_timer"] == 1):
+                    time_modifier = 0x25
+                await self.write_ram(
+                    ctx,
+                    [(self.address.minigame_timer, time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix aqualin timer
+                )
 
-            #if not ctx.finished_game and len(ctx.items_received) == 35:
-            if not ctx.finished_game:
-                if(ctx.slot_data["goal"] == 2): #Rescue x NPCs
-                    if len(set(received_list)&(set(npc_ids))) >= ctx.slot_data["npc_goal"]:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 3): #Skullpion goal
-                    if save_data_toys[11] & 0b10000000 == 0b10000000:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 4): #Relic Keeper goal
-                    if save_data_toys[17] & 0b10000000 == 0b10000000:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 5): #Frost Dragon goal
-                    if save_data_toys[23] & 0b10000000 == 0b10000000:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 6): #Ant Queen goal
-                    if save_data_toys[29] & 0b10000000 == 0b10000000:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 7): #ToD goal
-                    if save_data_toys[35] & 0b10000000 == 0b10000000:
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 8): #DL goal
-                    #if save_data_toys[40] & 0b10000000 == 0b10000000: #toy only happens with 6 legendary armors
-                    if(curr_location == 0x30A4 or curr_location == 0x30A2 or curr_location == 0x30A5):
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                elif(ctx.slot_data["goal"] == 9): #kill X crest guardian
-                    if(self.num_bosses_killed >= ctx.slot_data["guardian_goal"]):
-                        await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
-                        }])
-                else: #Rescue all NPCs
-                    if set(received_list).issuperset(set(npc_ids)):
+    @area_entry_handlers.register([0x3032, 0x3033]) #restaurant teleport maze
+    async def enter_teleport_maze(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["restaurant_teleport_maze_no_fail"] == True):
+            if(curr_location == 0x3032):
+                await self.write_ram(
+                    ctx,
+                    [(0x18f638 + (self.jp_version * 0x1d4), [0x32, 0x30, 0x05, 0x00], MAIN_RAM)] #fix left teleporter first room
+                )
+                await self.write_ram(
+                    ctx,
+                    [(0x18f680 + (self.jp_version * 0x1d4), [0x32, 0x30, 0x08, 0x00], MAIN_RAM)] #fix left teleporter third room
+                )
+            if(curr_location == 0x3033):
+                await self.write_ram(
+                    ctx,
+                    [(0x19061c + (self.jp_version * 0x1d4), [0x33, 0x30, 0x08, 0x00], MAIN_RAM)] #fix right teleporter second room
+                )
+
+    @area_entry_handlers.register([0x3051]) #church fight
+    async def enter_church(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["church_fight_time_modifier"] != 100):
+            time_modifier = math.ceil(ctx.slot_data["church_fight_time_modifier"] * 0x1555 / 100.0)
+            await self.write_ram(
+                ctx,
+                [(self.address.minigame_timer, time_modifier.to_bytes(2, 'little'), MAIN_RAM)] #fix steamwood timer
+            )
+
+    @area_entry_handlers.register([0x3000]) #path to castle
+    async def enter_path_to_castle(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["skip_minigame_town_on_fire"] == True):
+            #await self.update_progression(ctx)
+            if(self.progression_state < 0x2b2 and self.progression_state >= 0x294):
+                await self.write_ram(
+                    ctx,
+                    [(self.address.progression_state, [0xb2, 0x02], MAIN_RAM)]
+                )
+        if(not 0x294 in self.completed_progression):
+            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list):
+                await self.write_ram(
+                    ctx,
+                    [(0x0ba1ff + (self.jp_version * -0xea0), [0x3], MAIN_RAM),
+                    (0x0ba204 + (self.jp_version * -0xea0), [0x3], MAIN_RAM),
+                    (0x0ba20d + (self.jp_version * -0xea0), [0x3], MAIN_RAM)]
+                )#update so you dont need to talk to carpenters to deliver gondola gizmo
+
+    @area_entry_handlers.register([0x301b]) #meandering forest
+    async def enter_meandering_forest(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["skip_to_frozen_palace"] == True):
+            #await self.update_progression(ctx)
+            if(self.progression_state >= 0x2f0 or 0x2f0 in self.completed_progression):
+                await self.write_ram(
+                    ctx,
+                    [(0x18adc4 + (self.jp_version * 0x118), [0x68, 0x30, 0x00, 0x04], MAIN_RAM)] #0x04003068 frost palace gates
+                )
+
+    @area_entry_handlers.register([0x3090]) #Ben Fight
+    async def enter_ben_fight(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["skip_over_calendar_maze"] == True or ctx.slot_data["soda_fountain_boss_rush"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x1858c4 + (self.jp_version * 0x178), [0x88, 0x30, 0x00, 0x00], MAIN_RAM)] #0x00003088 ed fight
+            )
+
+    @area_entry_handlers.register([0x3093]) #sky island to soda fountain cutscene
+    async def enter_sky_island(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x1857bc + (self.jp_version * 0x1b8), [0x90, 0x30, 0x00, 0x00], MAIN_RAM)] #0x00003090 ben fight
+            )
+
+    @area_entry_handlers.register([0x3088]) #ed fight
+    async def enter_ed_fight(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
+            await self.write_ram(
+                ctx,
+                [(0x188904 + (self.jp_version * 0x1d8), [0x8d, 0x30, 0x00, 0x00], MAIN_RAM)] #0x0000308d topo fight
+            )
+
+    @area_entry_handlers.register([0x308d]) #topo fight
+    async def enter_topo_fight(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["topo_dance_battle_logic"] != 1):
+            topo_moves: List[int] = []
+            if(ctx.slot_data["topo_dance_battle_logic"] == 2):
+                #new_core_checks: List[bool] = [val & 0b10000000 == 0b10000000 for val in save_data] 
+                simple_moves = [2, 0, 3, 1] * 6
+                for _ in range(3):
+                    flip = random.randint(0, 3)
+                    if(flip > 0):
+                        simple_moves.reverse()
+                        #logger.info("reverse %s", simple_moves)
+                    offset = random.randint(0, 3)
+                    topo_moves = topo_moves + simple_moves[offset:offset+17]
+            else:
+                topo_moves = [random.randint(0,3) for _ in range(51)]
+
+            topo_addresses = [
+                0x188a7c + (self.jp_version * 0x1c4),
+                0x188b34 + (self.jp_version * 0x1c4),
+                0x188bec + (self.jp_version * 0x1c4)
+            ]
+            musashi_addresses = [
+                0x188aa4 + (self.jp_version * 0x1c4),
+                0x188b5c + (self.jp_version * 0x1c4),
+                0x188c14 + (self.jp_version * 0x1c4)
+            ]
+            write_instructions = []
+            for i in range(3):
+                for j in range(17):
+                    write_instructions.append((topo_addresses[i]+j*2, [topo_moves[i*17+j]], MAIN_RAM))
+                    write_instructions.append((musashi_addresses[i]+j*8, [topo_moves[i*17+j]], MAIN_RAM))
+            #logger.info("all moves %s", topo_moves)
+            if(self.message_level > 0):
+                logger.info("writing Topo Dance Moves")
+            await self.write_ram(
+                ctx,
+                write_instructions
+            )
+            """
+        if(ctx.slot_data["soda_fountain_boss_rush"] == True):
+            await bizhawk.write(
+                ctx.bizhawk_ctx,
+                [(0x1886a4, [0x8f, 0x30, 0x00, 0x00], MAIN_RAM)] #0x0000308f tod fight
+            )"""
+    #if(curr_location == 0x2017)
+
+    @area_entry_handlers.register(quest_item_areas) #quest item sanity
+    async def enter_quest_item_area(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        if(ctx.slot_data["quest_item_sanity"] == True):
+            write_instructions = []
+            if(curr_location in TOWNS and ctx.slot_data["playthrough_method"] == 1): #in chapter 2/3/4/5/6 town
+                if(len(self.chapter3_items) > 0 and 0xc8 in self.completed_progression):
+                    for item_id in self.chapter3_items:
+                        if(not item_id in self.bakery_inventory_expansion):
+                            self.bakery_inventory_expansion.append(item_id)
+                            if(self.message_level > 0):
+                                logger.info("%s added to Bakery",item_id_to_name[item_id])
+                    self.chapter3_items = []
+                if(len(self.chapter4_items) > 0 and (0x258 in self.completed_progression and 0x1e0 in self.completed_progression and 0x1ae in self.completed_progression)):
+                    for item_id in self.chapter4_items:
+                        if(not item_id in self.bakery_inventory_expansion):
+                            self.bakery_inventory_expansion.append(item_id)
+                            if(self.message_level > 0):
+                                logger.info("%s added to Bakery",item_id_to_name[item_id])
+                    self.chapter4_items = []
+                if(len(self.chapter5_items) > 0 and 0x384 in self.completed_progression):
+                    for item_id in self.chapter5_items:
+                        if(not item_id in self.bakery_inventory_expansion):
+                            self.bakery_inventory_expansion.append(item_id)
+                            if(self.message_level > 0):
+                                logger.info("%s added to Bakery",item_id_to_name[item_id])
+                    self.chapter5_items = []
+            if(curr_location in [0x1010, 0x1077, 0x1094]): #in chapter 2/4/5/6 town
+                if(not item_name_to_id["Well H20"] in received_list and self.quest_item_checks[0]):
+                    write_instructions.append((self.address.well_water[curr_location], [0x0], MAIN_RAM)) #remove water from the well
+            if(curr_location == 0x3022): #at graveyard
+                write_instructions.append((0x17d844 + (self.jp_version * 0x200), [0x0], MAIN_RAM)) #remove jon's key
+            if(curr_location == 0x3029): #at second peak
+                write_instructions.append((0x18e294 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove first log
+                write_instructions.append((0x18e298 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove second log
+                write_instructions.append((0x18e29c + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove third log
+                write_instructions.append((0x18e2a0 + (self.jp_version * 0xe8), [0x0], MAIN_RAM)) #remove fourth log
+            if(curr_location == 0x1052): #at Chapter 3 town
+                write_instructions.append((0x18f068 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Key
+                write_instructions.append((0x18f7b0 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Rope
+                write_instructions.append((0x18fa84 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Angel Statue
+            if(curr_location == 0x3047): #at underground lake
+                write_instructions.append((0x188aa0 + (self.jp_version * 0x1d4), [0x0], MAIN_RAM)) #remove Misteria
+            if(curr_location == 0x2057 and ctx.slot_data["grocery_sanity"] == True): #at Chapter 3 grocery
+                write_instructions.append((0x1e3804 + (self.jp_version * -0x4b0), [0x0], MAIN_RAM)) #remove free Orange
+            if(curr_location == 0x3034): #at Basement Lobby
+                write_instructions.append((0x189178 + (self.jp_version * 0x1d4), [0x0], MAIN_RAM)) #remove Ugly Belt
+            if(curr_location == 0x304b): #at Scrap Depository
+                write_instructions.append((0x17d648 + (self.jp_version * 0x200), [0x0, 0x0, 0x5], MAIN_RAM)) #remove first Gondola Gizmo
+                write_instructions.append((0x17d6d0 + (self.jp_version * 0x200), [0x0, 0x0, 0x5], MAIN_RAM)) #remove replacement Gondola Gizmo
+            if(curr_location == 0x1077): #at Chapter 4 town
+                write_instructions.append((0x1910dc + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Calendar
+                write_instructions.append((0x1910f8 + (self.jp_version * 0x1f0), [0x0], MAIN_RAM)) #remove Rock Salt
+            if(curr_location == 0x301e): #at outside steamwood
+                write_instructions.append((0x185858 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #0
+            if(curr_location == 0x3020): #at steamwood 2
+                write_instructions.append((0x184d5c + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #1
+                write_instructions.append((0x184dc8 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #4
+                write_instructions.append((0x184e24 + (self.jp_version * 0x1c8), [0x0], MAIN_RAM)) #remove Handle #8
+                write_instructions.append((0x184f98 + (self.jp_version * 0x1c0), [0x0], MAIN_RAM)) #remove Profits
+            if(curr_location == 0x1094): #at Chapter 5 town
+                write_instructions.append((0x183df8 + (self.jp_version * 0x200), [0x0], MAIN_RAM)) #remove Musashi's share of the profits
+            if(curr_location == 0x3014): #at Somnolent Forest
+                write_instructions.append((0x190db0 + (self.jp_version * 0x5c), [0x0], MAIN_RAM)) #remove Jon's Note
+
+            if(curr_location in [0x1052, 0x1077, 0x1094] and game_state[17][13] & 0b1000000 != 0b1000000): #in town chapter 3,4,5 gate not unlocked
+                #save_data: bytes = (await bizhawk.read(ctx.bizhawk_ctx, 
+                #    [(self.address.gate_angles[curr_location][0], 1, MAIN_RAM), 
+                #    (self.address.gate_angles[curr_location][1], 1, MAIN_RAM)]
+                #))                            
+                addresses = [(self.address.gate_angles[curr_location][0] + ((i-30) * 0x84), 1, MAIN_RAM) for i in range(50)]
+                save_data: bytes = (await self.read_ram(ctx, addresses))
+                if(self.message_level == 3):
+                    logger.info("checking if gates are open %s", save_data)
+                found_gates = False
+                gate_index = -1
+                if(len(save_data) > 1):
+                    for i in range(len(save_data)-1):
+                        if(save_data[i][0] == 0xfa and save_data[i+1][0] == 0x6):
+                            if(self.message_level == 3):
+                                logger.info("found gate at index %s", i)
+                            gate_index = i
+                            found_gates = True
+                if(found_gates):
+                    write_instructions.append((self.address.gate_angles[curr_location][0] + ((gate_index-30) * 0x84), [0x0], MAIN_RAM)) #close doors
+                    write_instructions.append((self.address.gate_angles[curr_location][0] + ((gate_index-29) * 0x84), [0x0], MAIN_RAM)) #close doors
+                    if(self.message_level == 3):
+                        logger.info("closing gates")
+                elif(self.message_level == 3):
+                    logger.info("no open gates found")
+
+                #if(save_data[0][0] == 0x6 and save[1][0] == 0xfa): #door open
+                #    write_instructions.append((self.address.gate_angles[curr_location][0], [0x0], MAIN_RAM)) #close doors
+                #    write_instructions.append((self.address.gate_angles[curr_location][1], [0x0], MAIN_RAM)) #close doors
+                #    if(self.message_level == 3):
+                #        logger.info("closing gates")
+
+            if(curr_location in quest_item_dialog): 
+                for loc_id, dialog_id in quest_item_dialog[curr_location].items():
+                    if(loc_id in ctx.locations_info or loc_id + jp_id_offset in ctx.locations_info):
+                        if(loc_id in ctx.missing_locations or loc_id + jp_id_offset in ctx.missing_locations):
+                            barray = await self.assemble_short_binary_array_for_textbox(ctx,loc_id + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                            if(self.message_level == 3):
+                                logger.info("quest item dialog %s", loc_id)
+
+                            if(self.jp_version == 1 and loc_id in [standard_location_name_to_id["Handle #0 - Steamwood 2"],standard_location_name_to_id["Agree to Fix Steamwood - Grillin Village"]]):
+                                barray = barray[:23]
+                                barray.append(0x00)
+                            else:
+                                barray = barray[:39]
+                                barray.append(0x00)
+
+                            write_instructions.append((dialog_id[self.jp_version]+4, barray, MAIN_RAM))
+                    else:
+                        if(not standard_location_name_to_id["Well H20 - Grillin Village"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
+                            for i in range(29):
+                                self.table_ids_to_hint.append(standard_location_name_to_id["Well H20 - Grillin Village"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
+                        logger.info("no scout information found")
+                        #logger.info("item 7 id %s", standard_location_name_to_id["Item 7 - Bakery"])
                         await ctx.send_msgs([{
-                            "cmd": "StatusUpdate",
-                            "status": ClientStatus.CLIENT_GOAL
+                            "cmd": "LocationScouts",
+                            "locations": self.table_ids_to_hint,
+                            "create_as_hint": 0
                         }])
-            
-            if (self.request_hints == 0):
-                self.request_hints = 1 
-                if(ctx.slot_data["set_lang"] == 2):
-                    self.table_ids_to_hint = jp_table_ids_to_hint.copy()
-                else:
-                    self.table_ids_to_hint = en_table_ids_to_hint.copy()
+                        break
 
-                if(ctx.slot_data["bakery_sanity"] == True):
-                    if(not standard_location_name_to_id["Item 1 - Bakery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(7):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Bakery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["restaurant_sanity"] == True):
-                    if(not standard_location_name_to_id["Item 1 - Restaurant"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(7):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["grocery_sanity"] == True):
-                    if(not standard_location_name_to_id["Item 1 - Grocery"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(12):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Item 1 - Grocery"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["toy_sanity"] == True):
-                    if(not standard_location_name_to_id["Musashi - Toy Shop"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(30):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Musashi - Toy Shop"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["tech_sanity"] == True):
-                    if(not standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(7):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))       
-                if(ctx.slot_data["scroll_sanity"] == True):
-                    if(not standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(5):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["core_sanity"] == True):
-                    if(not standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(4):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                if(ctx.slot_data["quest_item_sanity"] == True):
-                    if(not standard_location_name_to_id["Well H20 - Grillin Village"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
-                        for i in range(29):
-                            self.table_ids_to_hint.append(standard_location_name_to_id["Well H20 - Grillin Village"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset))
-                await ctx.send_msgs([{
-                    "cmd": "LocationScouts",
-                    "locations": self.table_ids_to_hint,
-                    "create_as_hint": 0
-                }])
+            if(len(write_instructions) > 0):
+                await self.write_ram(
+                    ctx,
+                    write_instructions
+                )
 
-            if((ctx.slot_data["deathlink"] and self.deathlink == -1) or self.deathlink == 1):
-                if self.death_link_timer > 0 and self.has_died == 0:
-                    self.death_link_timer -= 1
-                    if self.death_link_timer == 0:
-                        logger.info("death link grace period has ended")
-                if "DeathLink" not in ctx.tags:
-                    await ctx.update_death_link(True)
-                    self.previous_death_link = ctx.last_death_link
-                if self.death_link_timer == 0:
-                    curr_hp_bytes: bytes = (await bizhawk.read(
-                        ctx.bizhawk_ctx,
-                        [(PLAYER_CURR_HP_MEMORY + (self.jp_version * -0xea0), 2, MAIN_RAM)]
-                    ))[0]
-                    curr_hp: int = int.from_bytes(curr_hp_bytes, byteorder='little')
-                    if curr_hp == 0 and self.has_died == 0:
-                        self.has_died = 1
-                        curr_maxhp_bytes: bytes = (await bizhawk.read(
-                            ctx.bizhawk_ctx,
-                            [(0x078eb2 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
-                        ))[0]
-                        max_hp: int = int.from_bytes(curr_hp_bytes, byteorder='little')
-                        if(max_hp > 0):
-                            logger.info("%s died",ctx.username)
-                            await ctx.send_death(f"{ctx.username} had a nightmare about a horrid death!")
-                    if curr_hp > 0 and self.has_died == 1:
-                        self.has_died = 0
-                        logger.info("%s revived",ctx.username)
-                        self.death_link_timer = 240
-                    #ctx.handle_deathlink_state(curr_hp>0)
-                if self.previous_death_link != ctx.last_death_link:
-                    self.previous_death_link = ctx.last_death_link
-                    if self.death_link_timer == 0 and self.has_died == 0:
-                        logger.info("received death link")
-                        await self.kill_player(ctx)
-                        self.has_died = 1
-                    
-        except bizhawk.RequestFailedError:
-            # The connector didn't respond. Exit handler and return to main loop to reconnect
-            pass
-        #except KeyError:
-        #    logger.info("missing data for Key")
+    @area_entry_handlers.register(conners_bracelet_fix) #Conners
+    async def enter_conners(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        await self.check_if_bracelet_needs_removed(ctx)
+        addresses, jp_offset = conners_bracelet_fix[curr_location]
+        await self.write_ram(
+            ctx,
+            [(address + (self.jp_version * jp_offset), [0x9, 0x0], MAIN_RAM) for address in addresses]
+        )
+
+    @area_entry_handlers.register([0x3029]) #twinpeak second peak
+    async def enter_twinpeak_second_peak(self, ctx: "BizHawkClientContext", curr_location: int, game_state: List[memoryview], received_list: ReceivedItemIndex) -> None:
+        from CommonClient import logger
+        #await self.update_progression(ctx)
+        if(self.progression_state == 0xf0): #about to meet Hotelo at twinpeak
+            await self.write_ram(
+                ctx,
+                [(self.address.hotelo_entrance, [0x0], MAIN_RAM)] #change entrance from 1 to 0 to prevent softlock
+            )
+            if(self.message_level > 0):
+                logger.info("applied shortcut to hotelo softlock fix")
+
+        if(self.progression_state > 0x59 and False): #Jon has left the peak
+            save_data: bytes = (await self.read_ram(
+                ctx,
+                [(self.address.logs, 1, MAIN_RAM)]
+            ))[0]
+            raft_state = int.from_bytes(save_data, byteorder='little')
+            if(raft_state & 0b11000000 != 0b11000000):
+                #logger.info("Raft incomplete, checking for logs")
+                self.check_for_logs = 1
 
     def on_package(self, ctx: "BizHawkClientContext", cmd: str, args: dict) -> None:
         """For handling packages from the server. Called from `BizHawkClientContext.on_package`."""
+        if cmd == "Connected":
+            self.dialog_cache.clear() #names can change with the slot
+        if cmd == "LocationInfo":
+            self.dialog_cache.invalidate(NetworkItem(*item).location for item in args["locations"])
+            if(ctx.slot_data is not None):
+                Utils.async_start(self.prerender_dialog(ctx), name="bfm prerender dialog")
+        if cmd == "RoomUpdate" and "checked_locations" in args:
+            self.dialog_cache.invalidate(args["checked_locations"])
+        if cmd == "ReceivedItems" and ctx.slot_data is not None:
+            if args["index"] == 0: #the server sent the whole list again
+                self.received_items.clear()
+            self.received_items.sync(ctx.items_received, (ctx.slot_data["set_lang"] - 1) * jp_id_offset)
         #taken from ape escape https://github.com/Thedragon005/Archipelago-Ape-Escape/blob/12dace2cdecf019ae7cfcb49dfd64ecb56a6c409/worlds/apeescape/Client.py#L504
         if cmd == "Bounced":
             if "tags" in args and False:
@@ -3789,83 +3414,11 @@ class BFMClient(BizHawkClient):
 
 
 
-    def fix_dialog(self, text: List[str]):
-        if(len(text)>0):
-            line_1_max = 0
-            line_2_max = 0
-            for i in range(len(text)):
-                if(i%2 == 1):
-                    if(len(text[i])>line_1_max):
-                        line_1_max = len(text[i])
-                if(i%2 == 0):
-                    if(len(text[i])>line_2_max):
-                        line_2_max = len(text[i])
-            for i in range(len(text)):
-                if(i%2 == 1):
-                    if(len(text[i])<line_1_max):
-                        for _ in range(line_1_max - len(text[i])):
-                            text[i] = text[i] + " "
-                if(i%2 == 0):
-                    if(len(text[i])<line_2_max):
-                        for _ in range(line_2_max - len(text[i])):
-                            text[i] = text[i] + " "
-        pass
-
-    def encode_jp(self, s1: str) -> bytearray:
-        result: bytearray = []
-        count = 0
-        for character in s1:
-            if(character in jp_encoding):
-                result.append(jp_encoding[character])
-            else:
-                count = count + 1
-                result.append(jp_encoding["？"])
-            if(count > 2):
-                break
-        return result
-
-    def encode_jp_shop(self, s1: str) -> bytearray:
-        result: bytearray = []
-        count = 0
-        for character in s1:
-            if(character in jp_encoding):
-                result.append(jp_encoding[character])
-            else:
-                if(count > 2):
-                    result.append(jp_encoding[" "])
-                else:
-                    count = count + 1
-                    result.append(jp_encoding["？"])
-            #if(count > 2):
-                #break
-        return result
-
-    def assemble_binary_array_for_dialog(self, s1: str, s2: str) -> bytearray:
-        result: bytearray = []
-        result.append(0x01)
-        result.append(0x02)
-        if(self.jp_version == False):
-            result.extend(s1.encode("utf-8"))
-            result.append(0x01)
-            result.append(0x01)
-            result.append(0x0a)
-            s = "for "
-            result.extend(s.encode("utf-8"))
-            result.extend(s2.encode("utf-8"))
-        else:
-            result.extend(self.encode_jp_shop(s1))
-            result.append(0x01)
-            result.append(0x01)
-            result.append(0x0a)
-            result.extend(self.encode_jp_shop(s2))
-        result.append(0x00)
-        if(len(result) < 49):
-            return result
-        
-        result = result[:47]
-        result.append(0x00)
+    def encode_jp(self, s1: str) -> bytes:
+        return jp_encoder.encode(s1, STOP)
 
-        return result
+    def encode_jp_shop(self, s1: str) -> bytes:
+        return jp_encoder.encode(s1, PAD)
 
     def decode_booleans(self, val: int, bits: int):
         result = []
@@ -3882,45 +3435,245 @@ class BFMClient(BizHawkClient):
                 result.append((val & mask) == mask)
         return result
     
-    def update_list_of_received_items(self, ctx: "BizHawkClientContext"):
-        result = []
-        for i in range(len(ctx.items_received)):
-            result.append(ctx.items_received[i][0])
-        self.list_of_received_items = result
-        pass
+    async def apply_received_items(self, ctx: "BizHawkClientContext", received_list: ReceivedItemIndex, save_data_toys: bytes, new_toy_in_storage: List[bool], new_toy_purchased_awaiting: List[bool]):
+        """Applies every item received since the last call. Flag bits, money, stats, hp and bp are worked out for
+        the whole backlog first and then written with one read and one write, so a long backlog is applied in one tick"""
+        from CommonClient import logger
+        npc_rescues: List[int] = []
+        flag_bits: Dict[int, int] = {} #address: bits to set
+        stat_ups: List[int] = []
+        hp_up_received = False
+        bp_up_received = False
+        boon_received = False
+        s_revive_received = False
+        for item in ctx.items_received[self.received_count:]:
+            item_id = item[0]
+            if(item_id > jp_id_offset):
+                item_id = item_id - jp_id_offset
+            if(item_id>0x0ba1f7 and item_id<0x0ba21b):
+                npc_rescues.append(item_id)
+                if(item_id == item_name_to_id["Guard"]):
+                    flag_bits[0x0ae666] = flag_bits.get(0x0ae666, 0) | 0x1 #send guard to twinpeak
+            elif(item_id==0x0ba21b): #found max health berry
+                hp_up_received = True
+                if(self.message_level > 0):
+                    logger.info("Longevity Berry Found")
+            elif(item_id == 0xa):
+                s_revive_received = True
+            elif((item_id < 0x68 and item_id > 0x12) or item_id == 0x6c or item_id == 0x6e):
+                if(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x56, 0x58, 0x59, 0x5a] and not 0xc8 in self.completed_progression):
+                    if(not item_id in self.chapter3_items):
+                        self.chapter3_items.append(item_id)
+                        if(self.message_level > 0):
+                            logger.info("Witholding %s until completing chapter 2", item_id_to_name[item_id])
+                elif(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x5e, 0x5f, 0x63, 0x64, 0x65, 0x66] and not (0x258 in self.completed_progression and 0x1e0 in self.completed_progression and 0x1ae in self.completed_progression)):
+                    if(not item_id in self.chapter4_items):
+                        self.chapter4_items.append(item_id)
+                        if(self.message_level > 0):
+                            logger.info("Witholding %s until completing chapter 3", item_id_to_name[item_id])
+                elif(ctx.slot_data["playthrough_method"] == 1 and item_id in [0x67, 0x5b, 0x5c, 0x5d, 0x6c, 0x6e] and not 0x384 in self.completed_progression):
+                    if(not item_id in self.chapter5_items):
+                        self.chapter4_items.append(item_id)
+                        if(self.message_level > 0):
+                            logger.info("Witholding %s until completing chapter 4", item_id_to_name[item_id])
+                else:
+                    if(not item_id in self.bakery_inventory_expansion):
+                        self.bakery_inventory_expansion.append(item_id)
+                        if(self.message_level > 0):
+                            logger.info("%s added to Bakery",item_id_to_name[item_id])
+                if(item_name_to_id["Key"] == item_id or ctx.slot_data["quest_item_sanity"] == False):
+                    if(item_name_to_id["Water Boss Core"] in received_list or (ctx.slot_data["core_sanity"] == False and save_data_toys[17] & 0b10000000 == 0b10000000)):
+                        if(self.message_level > 0):
+                            logger.info("adding Water Boss Core")
+                        i = item_name_to_id["Water Boss Core"] - 0x28a + 2
+                        flag_bits[0x0ae659] = flag_bits.get(0x0ae659, 0) | (0b1 << i)
+            elif(item_id == 0x78):
+                boon_received = True
+            elif(item_id == 0x79):
+                if(self.message_level > 0):
+                    logger.info("Returning Lumina")
+                flag_bits[0x0ae658] = flag_bits.get(0x0ae658, 0) | 0b1
+            elif(item_id == 0x80):
+                if(self.message_level > 0):
+                    logger.info("New stock added to Bakery")
+            elif(item_id < 0x78 and item_id > 0x70):
+                if(self.message_level > 0):
+                    logger.info("%s added to Restaurant",item_id_to_name[item_id])
+            elif(item_id < 0xc or item_id == 0x6a or item_id == 0x6b or item_id== 0x6d):
+                if(self.message_level > 0):
+                    logger.info("%s added to Grocery",item_id_to_name[item_id])
+            elif(item_id >= item_name_to_id["Musashi Action Figure"] and item_id < item_name_to_id["Musashi Action Figure"] + len(item_name_groups["Toy Shop"])):
+                if(ctx.slot_data["toy_sanity"] == True):
+                    val = item_id - item_name_to_id["Musashi Action Figure"]
+                    if(new_toy_purchased_awaiting[val] == False):
+                        if(new_toy_in_storage[val]):
+                            if(self.message_level > 0):
+                                logger.info("%s toy already in storage", item_id_to_name[item_id])
+                        else:
+                            if(self.message_level > 0):
+                                logger.info("received %s toy but was not yet purchased", item_id_to_name[item_id])
+                    else:
+                        if(self.message_level > 0):
+                            logger.info("adding %s toy to storage", item_id_to_name[item_id])
+                        flag_bits[0x0ba21b+val] = flag_bits.get(0x0ba21b+val, 0) | 0b1000000
+                        new_toy_in_storage[val] = True
+                        new_toy_purchased_awaiting[val] = False
+                else:
+                    if(self.message_level > 0):
+                        logger.info("received toy when toysanity was disabled, something went wrong")
+            elif(item_id>0x80 and item_id<0x88):
+                if(self.message_level > 0):
+                    logger.info("adding %s to Tech",item_id_to_name[item_id])
+                if(item_id == 0x87):
+                    flag_bits[0x0ae659] = flag_bits.get(0x0ae659, 0) | 0b10
+                else:
+                    flag_bits[0x0ae658] = flag_bits.get(0x0ae658, 0) | (0b1 << (item_id - 0x80 + (item_id > 0x83)))
+            elif(item_id > 0x215 and item_id < 0x21b):
+                if(self.message_level > 0):
+                    logger.info("adding %s",item_id_to_name[item_id])
+                i = item_id - 0x216
+                if(i < 2):
+                    flag_bits[0x0ae64a] = flag_bits.get(0x0ae64a, 0) | (0b1 << (i + 6))
+                else:
+                    flag_bits[0x0ae64b] = flag_bits.get(0x0ae64b, 0) | (0b1 << (i - 2))
+            elif(item_id > 0x289 and item_id < 0x28e): #boss cores
+                if(item_name_to_id["Water Boss Core"] == item_id and not item_name_to_id["Key"] in received_list and ctx.slot_data["quest_item_sanity"] == True):
+                    if(self.message_level > 0):
+                        logger.info("witholding water boss core until Key is found to prevent softlocks")
+                else:
+                    if(self.message_level > 0):
+                        logger.info("adding %s",item_id_to_name[item_id])
+                    i = item_id - 0x28a + 2
+                    flag_bits[0x0ae659] = flag_bits.get(0x0ae659, 0) | (0b1 << i)
+            elif(item_id in [0x401, 0x402, 0x403, 0x404]): #body, mind, fusion and lumina stat up
+                if(not item_id in stat_ups):
+                    stat_ups.append(item_id)
+            elif(item_id in [0x405, 0x406]): #found bp up
+                bp_up_received = True
+                if(self.message_level > 0):
+                    logger.info("BP Up Found")
+            elif(item_id == 0x500): #Well H20
+                if(self.message_level > 0):
+                    logger.info("Well H20 returned to well")
+            elif(item_id == 0x501): #Log
+                log_ids = [0x4e, 0x50, 0x51, 0x52]
+                log_ids = log_ids[:received_list.count(item_name_to_id["Log"])]
+                for log_id in log_ids:
+                    if(not log_id in self.bakery_inventory_expansion):
+                        self.bakery_inventory_expansion.append(log_id)
+                        if(self.message_level > 0):
+                            logger.info("%s added to Bakery",item_id_to_name[item_id])
+            elif(item_id == 0x502): #Aqualin
+                if(self.message_level > 0):
+                    logger.info("Aqualin available during minigame")
+            elif(item_id == 0x503): #Manual
+                if(self.message_level > 0):
+                    logger.info("Manual available during minigame")
+            else:
+                if(self.message_level > 0):
+                    logger.info("unhandled item receieved %s",item_id_to_name[item_id])
+        self.received_count = len(ctx.items_received)
+
+        #one read for every byte the backlog touches, the money and the boon counter
+        addresses = sorted(set(npc_rescues) | set(flag_bits))
+        reads = [(address + self.address.save, 1, MAIN_RAM) for address in addresses]
+        if(boon_received):
+            reads = reads + [(self.address.money, 4, MAIN_RAM), (self.address.boons, 1, MAIN_RAM)]
+        writes = []
+        if(s_revive_received and ctx.slot_data["grocery_s_revive"] == True):
+            writes.append((self.address.s_revive_price, [0x1e, 0, 0x1e, 0], MAIN_RAM)) #lower s-revive price
+        for item_id in stat_ups:
+            writes = writes + self.stat_up_writes(ctx, item_id)
+        if(len(reads) > 0):
+            save_data = await self.read_ram(ctx, reads)
+            current = {address: save_data[i][0] for i, address in enumerate(addresses)}
+            for item_id in npc_rescues:
+                if(current[item_id] == 0b0):
+                    current[item_id] = 0b1
+                    writes.append((item_id + self.address.save, [0b1], MAIN_RAM))
+                    if(self.message_level > 0):
+                        logger.info("adding to rescue list %s",item_id_to_name[item_id])
+                else:
+                    if(self.message_level > 0):
+                        logger.info("already in rescue list: %s",item_id_to_name[item_id])
+            for address, bits in flag_bits.items():
+                if(current[address] | bits != current[address]):
+                    if(address == 0x0ae666 and self.message_level > 0):
+                        logger.info("Sending Guard to Twinpeak")
+                    writes.append((address + self.address.save, [current[address] | bits], MAIN_RAM))
+            if(boon_received):
+                curr_money: int = int.from_bytes(save_data[len(addresses)], byteorder='little')
+                num_boons: int = int.from_bytes(save_data[len(addresses) + 1], byteorder='little')
+                boon_count = received_list.count(0x78)
+                new_money = curr_money + 100 * max(0, boon_count - num_boons)
+                if(curr_money < new_money):
+                    writes.append((self.address.money, new_money.to_bytes(4, 'little'), MAIN_RAM))
+                    writes.append((self.address.boons, boon_count.to_bytes(1, 'little'), MAIN_RAM))  #0x0ba238 is queen ant toy, maybe 0x0ba246
+                    if(self.message_level > 0):
+                        logger.info("added 1000 Drans to wallet")
+        if(len(writes) > 0):
+            await self.write_ram(ctx, writes)
+        if(hp_up_received):
+            await self.update_max_hp(ctx, self.received_count)
+        if(bp_up_received):
+            await self.update_max_bp(ctx, self.received_count)
+
+    def stat_up_writes(self, ctx: "BizHawkClientContext", item_id: int) -> List[Tuple[int, bytes, str]]:
+        """Works out the stat a stat up item gives for the number received so far, returns the writes for the current and next level"""
+        from CommonClient import logger
+        #stat up item: (stat address, early base, early range, vanilla stats, enhanced bonus, client attribute of the stat, client attribute of the level)
+        stat, early_base, early_range, vanilla_stats, enhanced_bonus, stat_name, level_name = {
+            0x401: (0x0638fa, 4, 32, body_stat, 100, "curr_body_stat", "curr_body_lvl"), #body stat up
+            0x402: (0x0638fe, 6, 38, mind_stat, 100, "curr_mind_stat", "curr_mind_lvl"), #mind stat up
+            0x403: (0x063906, 4, 34, fusion_stat, 100, "curr_fus_stat", "curr_fus_lvl"), #fusion stat up
+            0x404: (0x063902, 8, 68, lumina_stat, 1000, "curr_lum_stat", "curr_lum_lvl"), #Lumina stat up
+        }[item_id]
+        stat_up_found = min(self.received_items.count(item_id), ctx.slot_data["level_bundles"])
+        if(ctx.slot_data["stat_gain_modifier"] == 1): #Early
+            new_stat_value = early_base + round(early_range * math.sqrt(stat_up_found / ctx.slot_data["level_bundles"]))
+        elif(ctx.slot_data["stat_gain_modifier"] == 2): #Vanilla
+            new_stat_value = vanilla_stats[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])]
+        else: #Enhanced
+            new_stat_value = vanilla_stats[round(29.0 * stat_up_found / ctx.slot_data["level_bundles"])] + round(math.pow(stat_up_found / ctx.slot_data["level_bundles"], 10) * enhanced_bonus)
+        if(new_stat_value != getattr(self, stat_name)):
+            if(self.message_level > 0):
+                logger.info("%s: %s -> %s",item_id_to_name[item_id], getattr(self, stat_name), new_stat_value)
+            setattr(self, stat_name, new_stat_value)
+            level = getattr(self, level_name)
+            stats_to_write = [(stat + self.address.level_table + 16 * (level), new_stat_value.to_bytes(2, 'little'), MAIN_RAM)]
+            if(level < 29):
+                stats_to_write.append((stat + self.address.level_table + 16 * (level + 1), new_stat_value.to_bytes(2, 'little'), MAIN_RAM))
+            return stats_to_write
+        return []
 
     async def update_max_hp(self, ctx: "BizHawkClientContext", item_count: int):
-        curr_max_hp_bytes: bytes = (await bizhawk.read(
-            ctx.bizhawk_ctx,
-            [(0x078eb2 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+        curr_max_hp_bytes: bytes = (await self.read_ram(
+            ctx,
+            [(self.address.max_hp, 2, MAIN_RAM)]
         ))[0]
         curr_max_hp: int = int.from_bytes(curr_max_hp_bytes, byteorder='little')
         new_hp = ctx.slot_data["starting_hp"]
         mayor_berry = ctx.slot_data["quest_item_sanity"]
-        for i in range(item_count):
-            if(ctx.items_received[i][0] == 0x0ba21b + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                new_hp += 25
+        new_hp += 25 * self.received_items.count_before(0x0ba21b, item_count)
         if(not mayor_berry and new_hp > ctx.slot_data["starting_hp"]):
             new_hp += 25
         max_hp = ctx.slot_data["starting_hp"]
-        for i in range(len(ctx.items_received)):
-            if(ctx.items_received[i][0] == 0x0ba21b + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                max_hp += 25
+        max_hp += 25 * self.received_items.count(0x0ba21b)
         if(not mayor_berry):
             max_hp += 25
         max_hp = min(max_hp, 500)
         new_hp = min(new_hp, 500)
         if(curr_max_hp != new_hp and curr_max_hp != max_hp):
-            await bizhawk.write(
-                ctx.bizhawk_ctx,
-                [(0x078eb2 + (self.jp_version * -0xea0), new_hp.to_bytes(2, 'little'), MAIN_RAM), #max hp
-                (0x078eb4 + (self.jp_version * -0xea0), new_hp.to_bytes(2, 'little'), MAIN_RAM)] #current hp
+            await self.write_ram(
+                ctx,
+                [(self.address.max_hp, new_hp.to_bytes(2, 'little'), MAIN_RAM), #max hp
+                (self.address.hp, new_hp.to_bytes(2, 'little'), MAIN_RAM)] #current hp
             )
 
     async def update_max_bp(self, ctx: "BizHawkClientContext", item_count: int):
-        curr_max_bp_bytes: bytes = (await bizhawk.read(
-            ctx.bizhawk_ctx,
-            [(0x078eb6 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+        curr_max_bp_bytes: bytes = (await self.read_ram(
+            ctx,
+            [(self.address.max_bp, 2, MAIN_RAM)]
         ))[0]
         curr_max_bp: int = int.from_bytes(curr_max_bp_bytes, byteorder='little')
         new_bp = ctx.slot_data["starting_bp"]
@@ -3930,39 +3683,35 @@ class BFMClient(BizHawkClient):
         else:
             small_bp = 175 / (ctx.slot_data["bp_bundles"] - 6)
         
-        for i in range(item_count):
-            if(ctx.items_received[i][0] == 0x405 + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                new_bp += small_bp
-            if(ctx.items_received[i][0] == 0x406 + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                large_bp += 25
+        for _ in range(self.received_items.count_before(0x405, item_count)):
+            new_bp += small_bp #added one at a time to round the same as before
+        large_bp += 25 * self.received_items.count_before(0x406, item_count)
         if(large_bp >= 150):
             large_bp += 25
         new_bp += large_bp
         max_bp = ctx.slot_data["starting_bp"]
         large_bp = 0
-        for i in range(len(ctx.items_received)):
-            if(ctx.items_received[i][0] == 0x405 + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                max_bp += small_bp
-            if(ctx.items_received[i][0] == 0x406 + ((ctx.slot_data["set_lang"] == 2) * jp_id_offset)):
-                large_bp += 25
+        for _ in range(self.received_items.count(0x405)):
+            max_bp += small_bp
+        large_bp += 25 * self.received_items.count(0x406)
         if(large_bp >= 150):
             large_bp += 25
         max_bp += large_bp
         max_bp = min(round(max_bp), 500)
         new_bp = min(round(new_bp), 500)
         if(curr_max_bp != new_bp and curr_max_bp != max_bp):
-            await bizhawk.write(
-                ctx.bizhawk_ctx,
-                [(0x078eb6 + (self.jp_version * -0xea0), new_bp.to_bytes(2, 'little'), MAIN_RAM), #max bp
-                (0x078eb8 + (self.jp_version * -0xea0), new_bp.to_bytes(2, 'little'), MAIN_RAM)] #current bp
+            await self.write_ram(
+                ctx,
+                [(self.address.max_bp, new_bp.to_bytes(2, 'little'), MAIN_RAM), #max bp
+                (self.address.bp, new_bp.to_bytes(2, 'little'), MAIN_RAM)] #current bp
             )
 
     async def update_legendary_armor(self, ctx: "BizHawkClientContext"):
         from CommonClient import logger
         #logger.info("updating legendary armor list")
-        save_data: bytes = (await bizhawk.read(
-            ctx.bizhawk_ctx,
-            [(0x0ae64b + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+        save_data: bytes = (await self.read_ram(
+            ctx,
+            [(self.address.legendary_armor, 2, MAIN_RAM)]
         ))[0]
         holdint = [save_data[0],save_data[1]]
         self.legendary_armor = self.decode_booleans_with_exclusions(int.from_bytes(holdint, byteorder='little'), 10, [0,1,2])
@@ -3972,9 +3721,9 @@ class BFMClient(BizHawkClient):
     async def update_inventory(self, ctx: "BizHawkClientContext"):
         #from CommonClient import logger
         #logger.info("updating inventory list")
-        save_data: bytes = (await bizhawk.read(
-            ctx.bizhawk_ctx,
-            [(0x0ba1e7 + (self.jp_version * -0xea0), 12, MAIN_RAM)]
+        save_data: bytes = (await self.read_ram(
+            ctx,
+            [(self.address.inventory, 12, MAIN_RAM)]
         ))[0]
         self.curr_inventory = list(save_data)
         #logger.info("inventory list %s", self.curr_inventory)
@@ -3983,9 +3732,9 @@ class BFMClient(BizHawkClient):
     async def update_progression(self, ctx: "BizHawkClientContext"):
         from CommonClient import logger
         #logger.info("updating inventory list")
-        save_data: bytes = (await bizhawk.read(
-            ctx.bizhawk_ctx,
-            [(0x078e80 + (self.jp_version * -0xea0), 2, MAIN_RAM)]
+        save_data: bytes = (await self.read_ram(
+            ctx,
+            [(self.address.progression_state, 2, MAIN_RAM)]
         ))[0]
         self.progression_state = int.from_bytes(save_data, byteorder='little')
         #logger.info("progression state %x", self.progression_state)
@@ -3999,9 +3748,9 @@ class BFMClient(BizHawkClient):
             await self.update_inventory(ctx)
             for i in range(len(self.curr_inventory)):
                 if(self.curr_inventory[i] == 0x49 or self.curr_inventory[i] == 0x47):
-                    await bizhawk.write(
-                        ctx.bizhawk_ctx,
-                        [((0x0ba1e7+i + (self.jp_version * -0xea0)), [0x0], MAIN_RAM)] 
+                    await self.write_ram(
+                        ctx,
+                        [(self.address.inventory + i, [0x0], MAIN_RAM)] 
                     )
                     if(self.message_level > 0):
                         logger.info("removing extra bracelet or glasses")
@@ -4033,15 +3782,10 @@ class BFMClient(BizHawkClient):
             loc_id = standard_location_name_to_id["Item 1 - Restaurant"] + i + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset)
             if(loc_id in ctx.locations_info):
                 if(self.restaurant_checks[i]==True):
-                    if(self.jp_version == False):
-                        s = "Purchased"
-                    else:
-                        s = "かいもの"
+                    s = PURCHASED[self.jp_version]
                 else:
                     s = ctx.item_names.lookup_in_slot(ctx.locations_info[loc_id].item, ctx.locations_info[loc_id].player)
-                self.restaurant_dialog = self.restaurant_dialog + [s]
-                s = ctx.player_names[ctx.locations_info[loc_id].player]
-                self.restaurant_dialog = self.restaurant_dialog + [s]
+                self.restaurant_dialog.add(s, ctx.player_names[ctx.locations_info[loc_id].player])
             else:
                 if(not standard_location_name_to_id["Item 1 - Restaurant"] + ((ctx.slot_data["set_lang"] - 1) * jp_id_offset) in self.table_ids_to_hint):
                     for i in range(7):
@@ -4052,9 +3796,37 @@ class BFMClient(BizHawkClient):
                     "create_as_hint": 0
                 }])
                 break
-        self.fix_dialog(self.restaurant_dialog)
         pass
     async def assemble_binary_array_for_boss_textbox(self, ctx: "BizHawkClientContext", loc_id: int, length: int):
+        return self.dialog_cache.get(loc_id, BOSS_TEXTBOX, self.jp_version, length, lambda: self.render_boss_textbox(ctx, loc_id, length))
+
+    async def assemble_binary_array_for_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
+        return self.dialog_cache.get(loc_id, TEXTBOX, self.jp_version, 0, lambda: self.render_textbox(ctx, loc_id))
+
+    async def assemble_short_binary_array_for_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
+        return self.dialog_cache.get(loc_id, SHORT_TEXTBOX, self.jp_version, 0, lambda: self.render_short_textbox(ctx, loc_id))
+
+    async def assemble_binary_array_for_toyshop(self, ctx: "BizHawkClientContext", loc_id: int, max: int):
+        return self.dialog_cache.get(loc_id, TOYSHOP, self.jp_version, max, lambda: self.render_toyshop(ctx, loc_id, max))
+
+    async def prerender_dialog(self, ctx: "BizHawkClientContext") -> int:
+        """Renders the textboxes of every scouted location so entering an area only has to write them, yielding to the
+        watcher between textboxes. Returns the number rendered"""
+        renders = {
+            TEXTBOX: lambda loc_id, max_len: self.render_textbox(ctx, loc_id),
+            SHORT_TEXTBOX: lambda loc_id, max_len: self.render_short_textbox(ctx, loc_id),
+            BOSS_TEXTBOX: lambda loc_id, max_len: self.render_boss_textbox(ctx, loc_id, max_len),
+            TOYSHOP: lambda loc_id, max_len: self.render_toyshop(ctx, loc_id, max_len),
+        }
+        rendered = 0
+        for loc_id, variant, max_len in scouted_textboxes(self.jp_version, (ctx.slot_data["set_lang"] - 1) * jp_id_offset):
+            if(loc_id in ctx.locations_info):
+                if(self.dialog_cache.fill(loc_id, variant, self.jp_version, max_len, lambda: renders[variant](loc_id, max_len))):
+                    rendered += 1
+                    await asyncio.sleep(0)
+        return rendered
+
+    def render_boss_textbox(self, ctx: "BizHawkClientContext", loc_id: int, length: int):
         result: bytearray = []
         if(self.jp_version == False):
             s = "<"+ctx.username+">"
@@ -4095,7 +3867,7 @@ class BFMClient(BizHawkClient):
                 result.extend(self.encode_jp(s))
         return result
 
-    async def assemble_binary_array_for_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
+    def render_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
         if(self.jp_version == False):
             s = "<"+ctx.username+">"
             result = bytearray(s,"utf-8")
@@ -4133,8 +3905,8 @@ class BFMClient(BizHawkClient):
 
         return result
 
-    async def assemble_short_binary_array_for_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
-        result = await self.assemble_binary_array_for_textbox(ctx,loc_id) 
+    def render_short_textbox(self, ctx: "BizHawkClientContext", loc_id: int):
+        result = self.render_textbox(ctx, loc_id)
         
         if(len(result) < 56):
             return result
@@ -4174,8 +3946,7 @@ class BFMClient(BizHawkClient):
 
         return result
 
-    async def assemble_binary_array_for_toyshop(self, ctx: "BizHawkClientContext", loc_id: int, max: int):
-
+    def render_toyshop(self, ctx: "BizHawkClientContext", loc_id: int, max: int):
         result: bytearray = bytearray([2,0,0])
         result.append(0x01)
         result.append(0x02)
@@ -0,0 +1,75 @@
+import json
+from collections import deque
+from typing import Any, Deque, IO, List, NamedTuple, Optional
+
+from .portals import bfm_portals
+from .progression_state import progression_state_table, progression_states_in
+
+COMPLETED = "completed" #detail is the completed progression mask
+AREA = "area" #connections of area are recalculated
+CONNECTION = "connection" #detail is why the rule that decided state matched, None if no rule did
+DATA = "data" #detail is (destinations, progression states, extra writes)
+
+
+class TraceEvent(NamedTuple):
+    tick: int
+    kind: str
+    area: int
+    progression_state: int #progression state of the game when the event was recorded
+    dest: int = 0
+    state: int = 0 #progression state sent for dest, 0 leaves the game's
+    hint: str = ""
+    detail: Any = None
+
+
+def format_event(event: TraceEvent) -> str:
+    if(event.kind == COMPLETED):
+        return "caclulating completed progression : %s" % list(map(hex, sorted(progression_states_in(event.detail))))
+    if(event.kind == AREA):
+        return "connections %s" % (bfm_portals[event.area],)
+    if(event.kind == DATA):
+        return "data: %s : %s : %s" % event.detail
+    s = "connection : %s : name : %s" % (hex(event.dest), bfm_portals[event.dest].region)
+    if(event.detail is not None):
+        s = s + "\nrule : %s" % event.detail
+    state = event.state
+    if(state == 0):
+        s = s + "\nno change to game state"
+        state = event.progression_state
+    if(state in progression_state_table):
+        s = s + "\ngame state : %s : name : %s" % (hex(state), progression_state_table[state])
+    else:
+        s = s + "\ngame state : %s " % hex(state)
+    if(len(event.hint) > 0):
+        s = s + "\nhint : %s" % event.hint
+    return s
+
+
+class DebugTrace:
+    """The last connection recalculations as events in a ring buffer. Nothing is formatted until /debug_dump asks"""
+
+    def __init__(self, size: int = 512):
+        self.events: Deque[TraceEvent] = deque(maxlen=size)
+        self.tick = 0
+
+    def start_tick(self) -> None:
+        self.tick += 1
+
+    def record(self, kind: str, area: int, progression_state: int, dest: int = 0, state: int = 0, hint: str = "", detail: Any = None) -> TraceEvent:
+        event = TraceEvent(self.tick, kind, area, progression_state, dest, state, hint, detail)
+        self.events.append(event)
+        return event
+
+    def lines(self, last: Optional[int] = None) -> List[str]:
+        """The events formatted with the tick they happened on, only those of the last recalculations if last is given"""
+        events = list(self.events)
+        if(last is not None):
+            starts = [i for i, event in enumerate(events) if event.kind == COMPLETED]
+            events = events[starts[-last]:] if len(starts) >= last else events
+        return ["[%s] %s" % (event.tick, format_event(event)) for event in events]
+
+    def export(self, file: IO[str]) -> int:
+        """Writes every event as a json line, returns the number written"""
+        for event in self.events:
+            file.write(json.dumps(event._asdict(), default=list) + "\n")
+        return len(self.events)
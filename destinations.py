@@ -0,0 +1,51 @@
+from bisect import bisect_right
+from typing import Callable, Dict, List, Tuple
+
+from .items import item_name_to_id
+from .received_items import ReceivedItemIndex
+
+#progression states at which the next chapter's version of the town is loaded
+CHAPTER_BOUNDARIES: Tuple[int, ...] = (0xc8, 0x258, 0x398)
+
+TOWNS: Tuple[int, ...] = (0x1010, 0x1052, 0x1077, 0x1094) #chapter 2, 3, 4, 5/6
+UPPER_TOWNS: Tuple[int, ...] = (0x1011, 0x1053, 0x1078, 0x1095)
+RESTAURANTS: Tuple[int, ...] = (0x2080, 0x209d) #chapter 4, 5/6
+BASEMENT_ENTRANCES: Tuple[int, ...] = (0x201a, 0x205b) + RESTAURANTS
+
+#any version of the town: every version of the same part of town
+town_families: Dict[int, Tuple[int, ...]] = {area: family for family in (TOWNS, UPPER_TOWNS) for area in family}
+
+KEY = item_name_to_id["Key"]
+ROPE = item_name_to_id["Rope"]
+
+
+def chapter_town(family: Tuple[int, ...], progression_state: int) -> int:
+    """The version of the town in family loaded at progression_state"""
+    return family[bisect_right(CHAPTER_BOUNDARIES, progression_state)]
+
+
+def restaurant_open(flags: List[memoryview]) -> bool:
+    return flags[17][14] & 0b1100000 != 0
+
+
+#destination: function of (curr_location, dest, progression_state, flags, quest_item_sanity, received_list) returning the
+#area the connection is sent to instead and whether its door has to be reset
+destination_redirects: Dict[int, Callable[[int, int, int, List[memoryview], bool, ReceivedItemIndex], Tuple[int, bool]]] = {}
+
+for area, family in town_families.items():
+    destination_redirects[area] = lambda curr, dest, state, flags, qis, received, family=family: (chapter_town(family, state), False)
+for area in RESTAURANTS:
+    destination_redirects[area] = lambda curr, dest, state, flags, qis, received: (dest if restaurant_open(flags) else 0x201a, False)
+destination_redirects[0x3034] = lambda curr, dest, state, flags, qis, received: (0x3000 if curr in BASEMENT_ENTRANCES and not restaurant_open(flags) else dest, False) #basement lobby
+destination_redirects[0x3043] = lambda curr, dest, state, flags, qis, received: (0x3000 if curr in TOWNS and qis and not KEY in received else dest, False) #Mine
+destination_redirects[0x304e] = lambda curr, dest, state, flags, qis, received: ((0x3000, True) if curr in TOWNS and (qis and not ROPE in received or flags[17][6] & 0b1 == 0b1) else (dest, False)) #Well
+
+
+def resolve_destination(curr_location: int, dest: int, progression_state: int, flags: List[memoryview], quest_item_sanity: bool, received_list: ReceivedItemIndex) -> Tuple[int, bool]:
+    """The area a connection out of curr_location loads when the game is set to progression_state: the town of that
+    chapter, or Castle Outside while the mine, well or basement can't be entered yet. Also whether the door of the
+    connection has to be set to 0"""
+    redirect = destination_redirects.get(dest)
+    if(redirect is None):
+        return dest, False
+    return redirect(curr_location, dest, progression_state, flags, quest_item_sanity, received_list)
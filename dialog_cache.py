@@ -0,0 +1,111 @@
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from .dialog_locations import dialog_location_table, short_text_boxes, castle_dialog, scroll_dialog, boss_core_dialog, quest_item_dialog
+from .locations import standard_location_name_to_id
+from .store_info import toy_shop_dialog_length
+from .write_buffer import MAIN_RAM
+
+#which textbox a blob was rendered for
+TEXTBOX = "textbox"
+SHORT_TEXTBOX = "short"
+BOSS_TEXTBOX = "boss" #padded or cut to max_len
+TOYSHOP = "toyshop" #cut to max_len
+
+DialogKey = Tuple[int, str, bool, int] #loc_id, variant, jp_version, max_len
+
+#bytes the game has room for, including the 0 that ends the text
+TEXTBOX_SIZE = 84
+SHORT_TEXTBOX_SIZE = 55
+
+
+def slot_size(variant: str, max_len: int) -> int:
+    if(variant == TEXTBOX):
+        return TEXTBOX_SIZE
+    if(variant == SHORT_TEXTBOX):
+        return SHORT_TEXTBOX_SIZE
+    return max_len
+
+
+class DialogCache:
+    """The dialog written for scouted locations, rendered once and kept until the server sends new information about the
+    location or it is checked. Blobs are kept as bytes and handed out as copies, callers cut and terminate them"""
+
+    def __init__(self):
+        self.blobs: Dict[DialogKey, bytes] = {}
+        self.keys_by_location: Dict[int, Set[DialogKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.prerendered = 0
+
+    def get(self, loc_id: int, variant: str, jp_version: bool, max_len: int, render: Callable[[], Iterable[int]]) -> bytearray:
+        key = (loc_id, variant, jp_version, max_len)
+        blob = self.blobs.get(key)
+        if(blob is None):
+            self.misses += 1
+            blob = self.store(key, render)
+        else:
+            self.hits += 1
+        return bytearray(blob)
+
+    def fill(self, loc_id: int, variant: str, jp_version: bool, max_len: int, render: Callable[[], Iterable[int]]) -> bool:
+        """Renders the blob ahead of the area entry that needs it, returns whether it wasn't cached yet"""
+        key = (loc_id, variant, jp_version, max_len)
+        if(key in self.blobs):
+            return False
+        self.prerendered += 1
+        self.store(key, render)
+        return True
+
+    def store(self, key: DialogKey, render: Callable[[], Iterable[int]]) -> bytes:
+        blob = bytes(render())
+        self.blobs[key] = blob
+        self.keys_by_location.setdefault(key[0], set()).add(key)
+        return blob
+
+    def invalidate(self, loc_ids: Iterable[int]) -> None:
+        for loc_id in loc_ids:
+            for key in self.keys_by_location.pop(loc_id, ()):
+                del self.blobs[key]
+
+    def clear(self) -> None:
+        self.blobs.clear()
+        self.keys_by_location.clear()
+
+
+class AreaDialog:
+    """The textboxes of one area entry, checked against the size of their slot and handed to write_ram together"""
+
+    def __init__(self):
+        self.writes: List[Tuple[int, Any, str]] = []
+        self.cut: List[int] = [] #addresses of the textboxes that didn't fit
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def add(self, address: int, blob: bytearray, variant: str, max_len: int = 0) -> None:
+        size = slot_size(variant, max_len)
+        if(len(blob) > size):
+            #text running past its slot would overwrite whatever the game keeps after it
+            self.cut.append(address)
+            blob = blob[:size] if variant == BOSS_TEXTBOX else blob[:size - 1] + bytearray([0x00])
+        self.writes.append((address, blob, MAIN_RAM))
+
+
+def scouted_textboxes(jp_version: int, lang_offset: int) -> List[Tuple[int, str, int]]:
+    """(loc_id, variant, max_len) of every textbox the area entry handlers write for a scouted location, lang_offset
+    is added to the english location ids"""
+    textboxes: List[Tuple[int, str, int]] = []
+    for dialogs in dialog_location_table.values():
+        textboxes += [(loc_id + lang_offset, SHORT_TEXTBOX if loc_id in short_text_boxes else TEXTBOX, 0) for loc_id in dialogs]
+    for dialogs in scroll_dialog.values():
+        textboxes += [(loc_id + lang_offset, TEXTBOX, 0) for loc_id in dialogs]
+    for dialogs in boss_core_dialog.values():
+        textboxes += [(loc_id + lang_offset, BOSS_TEXTBOX, dialog_id[jp_version][1]) for loc_id, dialog_id in dialogs.items()]
+    for dialogs in quest_item_dialog.values():
+        textboxes += [(loc_id + lang_offset, SHORT_TEXTBOX, 0) for loc_id in dialogs]
+    #the steamwood handle and gondola gizmo the textbox is for depends on where musashi stands
+    textboxes += [(standard_location_name_to_id["Handle #1 - Steamwood 2"] + i + lang_offset, SHORT_TEXTBOX, 0) for i in range(3)]
+    textboxes += [(standard_location_name_to_id["Gondola Gizmo 1 - Scrap Depository"] + i + lang_offset, SHORT_TEXTBOX, 0) for i in range(4)]
+    textboxes += [(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"] + i + lang_offset, TEXTBOX, 0) for i in range(len(castle_dialog[jp_version]))]
+    textboxes += [(standard_location_name_to_id["Musashi - Toy Shop"] + i + lang_offset, TOYSHOP, max_len) for i, max_len in enumerate(toy_shop_dialog_length[jp_version])]
+    return textboxes
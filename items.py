@@ -199,6 +199,8 @@ item_id_to_name: Dict[int, str] = {(item_base_id * (data.item_group == "NPC") +
 jp_item_id_to_name: Dict[int, str] = {(item_base_id * (data.item_group == "NPC") + data.item_id_offset + jp_id_offset): data.jp_name for name, data in item_table.items()}
 item_id_to_name.update(jp_item_id_to_name)
 
+item_bit: Dict[int, int] = {(item_base_id * (data.item_group == "NPC") + data.item_id_offset): 1 << bit for bit, data in enumerate(item_table.values())} #item id: bit in a received item bitset
+
 filler_items: List[str] = [name for name, data in item_table.items() if data.classification == IC.filler]
 
 npc_ids: List[int] = [item_base_id + data.item_id_offset for name, data in item_table.items() if data.item_group == "NPC"]
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from .jp_encoding import jp_encoding
+
+#what happens to characters the japanese font doesn't have
+STOP = "stop" #they become ？ and the text ends after the third one
+PAD = "pad" #the first three become ？ and the rest spaces, so shop columns keep their width
+
+UNKNOWN = "￿" #stands in for a character without a code until the policy decides what it becomes
+
+
+class JPTable(dict):
+    """jp_encoding as a str.translate table, each character maps to the bytes of its code as latin-1 text"""
+
+    def __missing__(self, key: int) -> str:
+        return UNKNOWN
+
+
+def code_text(code: int) -> str:
+    #codes above 0xff are 2 bytes, low byte first as the game reads them
+    return code.to_bytes(2 if code > 0xff else 1, "little").decode("latin-1")
+
+
+jp_table: JPTable = JPTable({ord(character): code_text(code) for character, code in jp_encoding.items()})
+QUESTION = code_text(jp_encoding["？"])
+SPACE = code_text(jp_encoding[" "])
+
+
+def encode_uncached(text: str, policy: str = STOP) -> bytes:
+    translated = text.translate(jp_table)
+    if(UNKNOWN in translated):
+        parts = translated.split(UNKNOWN)
+        if(policy == STOP):
+            translated = QUESTION.join(parts[:3]) + QUESTION if len(parts) > 3 else QUESTION.join(parts)
+        else:
+            translated = QUESTION.join(parts[:4]) + "".join(SPACE + part for part in parts[4:])
+    return translated.encode("latin-1")
+
+
+class JPEncoder:
+    """Encodes text for the japanese version, remembering the last size texts so item and player names shown again
+    are not encoded again"""
+
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self.cache: Dict[Tuple[str, str], bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, text: str, policy: str = STOP) -> bytes:
+        key = (text, policy)
+        encoded = self.cache.get(key)
+        if(encoded is not None):
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return encoded
+        self.misses += 1
+        encoded = encode_uncached(text, policy)
+        self.cache[key] = encoded
+        if(len(self.cache) > self.size):
+            self.cache.popitem(last=False)
+        return encoded
+
+
+jp_encoder = JPEncoder()
@@ -0,0 +1,54 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .locations import location_base_id, standard_location_name_to_id
+
+
+def location_range(first_location: int, bits: int) -> Tuple[int, ...]:
+    return tuple(range(first_location, first_location + bits))
+
+#location id of each bit in a check category mask, english ids (add jp_id_offset for the japanese version)
+check_location_ids: Dict[str, Tuple[int, ...]] = {
+    "bincho": location_range(location_base_id, 35),
+    "minku": location_range(location_base_id + 35, 13),
+    "chest": location_range(location_base_id + 48, 33),
+    "bakery": location_range(location_base_id + 82, 7),
+    "restaurant": location_range(location_base_id + 89, 7),
+    "grocery": location_range(standard_location_name_to_id["Item 1 - Grocery"], 12),
+    "toy": location_range(standard_location_name_to_id["Musashi - Toy Shop"], 30),
+    "tech": location_range(standard_location_name_to_id["Improved Fusion (Artisan) - Allucaneet Castle"], 7),
+    "core": location_range(standard_location_name_to_id["Defeat Earth Crest Guardian - Skullpion Arena"], 5),
+    "scroll": location_range(standard_location_name_to_id["Earth Scroll - Twinpeak First Peak"], 5),
+    "quest": location_range(standard_location_name_to_id["Well H20 - Grillin Village"], 29),
+    "bp": location_range(standard_location_name_to_id["Guard BP Up - Somnolent Forest"], 41),
+}
+
+
+def set_bits(mask: int) -> Iterator[int]:
+    """Index of every set bit, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def newly_checked(category: str, old_mask: int, new_mask: int, id_offset: int = 0) -> List[int]:
+    """Location ids of the bits set in new_mask that were not set in old_mask"""
+    location_ids = check_location_ids[category]
+    return [location_ids[bit] + id_offset for bit in set_bits(new_mask & ~old_mask)]
+
+
+def flag_mask(data: Iterable[int], flag: int) -> int:
+    """Bit i is set when flag is set in data[i]"""
+    mask = 0
+    for i, val in enumerate(data):
+        if(val & flag == flag):
+            mask |= 1 << i
+    return mask
+
+
+def encode_booleans(values: Iterable[bool]) -> int:
+    mask = 0
+    for i, val in enumerate(values):
+        if(val):
+            mask |= 1 << i
+    return mask
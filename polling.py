@@ -0,0 +1,66 @@
+import time
+from typing import Dict, Hashable, Optional
+
+#seconds between two game_watcher ticks for each phase
+POLL_FAST: float = 0.1 #area transitions, minigames, shop cursor
+POLL_NORMAL: float = 0.25
+POLL_IDLE: float = 0.5 #nothing in the save data changed for IDLE_AFTER seconds
+POLL_MENU: float = 1.5 #main menu or no save loaded
+IDLE_AFTER: float = 5.0
+
+#areas where the client reacts to the player in real time
+fast_poll_locations = {
+    0x301d, #Steamwood elevator
+    0x3020, #Steamwood 2 elevator
+    0x302a, #Twinpeak Rafting
+}
+
+
+class PollScheduler:
+    """Picks ctx.watcher_timeout for the next tick from what the game is doing and keeps the client's
+    delayed checks on wall clock time so they do not depend on how often the watcher runs"""
+
+    def __init__(self):
+        self.phase = "normal"
+        self.last_tick = time.monotonic()
+        self.elapsed = 0.0
+        self.last_change = self.last_tick
+        self.last_snapshot: Optional[bytes] = None
+        self.timers: Dict[Hashable, float] = {}
+
+    def start_tick(self) -> float:
+        """Returns the seconds since the previous tick"""
+        now = time.monotonic()
+        self.elapsed = now - self.last_tick
+        self.last_tick = now
+        return self.elapsed
+
+    def due(self, name: Hashable, interval: float) -> bool:
+        """True once every interval seconds, the first time interval seconds after the timer is first asked about"""
+        last = self.timers.get(name)
+        if(last is None):
+            self.timers[name] = self.last_tick
+            return False
+        if(self.last_tick - last >= interval):
+            self.timers[name] = self.last_tick
+            return True
+        return False
+
+    def reset(self, name: Hashable) -> None:
+        self.timers.pop(name, None)
+
+    def next_interval(self, in_menu: bool = False, latency_sensitive: bool = False, snapshot: bytes = b"", busy: bool = False) -> float:
+        if(snapshot != self.last_snapshot or busy):
+            self.last_snapshot = snapshot
+            self.last_change = self.last_tick
+        if(in_menu):
+            self.phase = "menu"
+            return POLL_MENU
+        if(latency_sensitive):
+            self.phase = "fast"
+            return POLL_FAST
+        if(self.last_tick - self.last_change >= IDLE_AFTER):
+            self.phase = "idle"
+            return POLL_IDLE
+        self.phase = "normal"
+        return POLL_NORMAL
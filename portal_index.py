@@ -0,0 +1,36 @@
+from typing import Dict, List, NamedTuple, Tuple
+
+from .portals import bfm_portals
+
+
+class AreaPortals(NamedTuple):
+    """The connections of one area that lead to a known area, in the order of bfm_portals"""
+    addresses: Tuple[int, ...] #where the game keeps the destination of each connection, offset for the language
+    destinations: Tuple[int, ...]
+    is_cutscene: bool
+
+
+class PortalIndex:
+    """bfm_portals flattened for one language, built once at import"""
+
+    def __init__(self, jp_version: int):
+        self.areas: Dict[int, AreaPortals] = {}
+        sources: Dict[int, List[int]] = {}
+        for area, connection_data in bfm_portals.items():
+            connections = [connection for connection in connection_data.connections if connection.destination in bfm_portals]
+            self.areas[area] = AreaPortals(
+                tuple(connection.memory + (jp_version * connection_data.jp_offset) for connection in connections),
+                tuple(connection.destination for connection in connections),
+                connection_data.is_cutscene == True,
+            )
+            for connection in connections:
+                if(not area in sources.setdefault(connection.destination, [])):
+                    sources[connection.destination].append(area)
+        self.sources: Dict[int, Tuple[int, ...]] = {area: tuple(leads_in) for area, leads_in in sources.items()}
+
+    def leads_into(self, area: int) -> Tuple[int, ...]:
+        """The areas with a connection to area"""
+        return self.sources.get(area, ())
+
+
+portal_indexes: Tuple[PortalIndex, PortalIndex] = (PortalIndex(0), PortalIndex(1)) #en, jp
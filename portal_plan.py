@@ -0,0 +1,50 @@
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from .write_buffer import MAIN_RAM
+
+PORTAL_TABLE_SIZE = 0x22 #zone loaded flag, up to 0x20 destinations and the 0 that ends them
+PORTAL_STATES_SIZE = 0x40 #2 bytes per destination
+
+
+class PortalPlan(NamedTuple):
+    """What one connection recalculation writes"""
+    area: int
+    table: bytes #zone loaded flag, destinations and the 0 that ends them
+    states: bytes
+    fixes: Tuple[Tuple[int, bytes], ...] #patches to the connections of the area, the game reloads them with the area
+
+
+class PortalPlanCache:
+    """Remembers the last plan written so a recalculation that comes to the same result only acknowledges the zone
+    load. The destination table is shared by every area so only the last plan can still be in RAM, and it is only
+    skipped when the table read back this tick still holds it. The code patches are written when the bytes read back
+    differ, once per emulator session unless a savestate or another image puts the original code back"""
+
+    def __init__(self):
+        self.last: Optional[PortalPlan] = None
+        self.written = 0
+        self.skipped = 0
+
+    def reset(self) -> None:
+        self.last = None
+
+    def writes(self, plan: PortalPlan, table_address: int, states_address: int, ram_table: Optional[Sequence[int]], zone_loaded: bool) -> List[Tuple[int, Any, str]]:
+        """The writes plan still needs, ram_table is the table and states as read this tick"""
+        writes: List[Tuple[int, Any, str]] = [(table_address, plan.table[:1], MAIN_RAM)] #always acknowledge the zone load
+        in_ram = ram_table is not None and bytes(ram_table[1:len(plan.table)]) == plan.table[1:] and \
+            bytes(ram_table[states_address - table_address:states_address - table_address + len(plan.states)]) == plan.states
+        if(self.last is None or self.last.table != plan.table or self.last.states != plan.states or not in_ram):
+            writes = [(table_address, plan.table, MAIN_RAM), (states_address, plan.states, MAIN_RAM)]
+        if(zone_loaded or self.last is None or self.last.area != plan.area or self.last.fixes != plan.fixes):
+            writes = writes + [(address, data, MAIN_RAM) for address, data in plan.fixes]
+        if(len(writes) == 1):
+            self.skipped += 1
+        else:
+            self.written += 1
+        self.last = plan
+        return writes
+
+
+def code_patch_writes(patches: List[Tuple[int, bytes]], ram: List[Optional[Sequence[int]]]) -> List[Tuple[int, Any, str]]:
+    """The code patches whose bytes read back this tick are not patched yet"""
+    return [(address, data, MAIN_RAM) for (address, data), current in zip(patches, ram) if current is None or bytes(current) != data]
@@ -1,6 +1,7 @@
-from typing import Dict, NamedTuple, Set, Optional, List
+from typing import Callable, Dict, Iterable, NamedTuple, Set, Optional, List, Tuple, Union
 from .locations import standard_location_name_to_id, jp_id_offset
-from .items import item_name_to_id
+from .items import item_name_to_id, item_bit
+from .received_items import ReceivedItemIndex
 
 progression_state_table: Dict[int, str] = {
     0x000a: "zipline down gondola",
@@ -90,710 +91,749 @@ progression_state_table: Dict[int, str] = {
     0x064a: "end of Credits (would you like to save)",
 }
 
-def calc_progression_state(ctx: "BizHawkClientContext", loc_id: int, old_progression_state: int, progression_flags: List[bool], completed_progression_states: Set[int], received_list: List[int]) -> (int, str):
-    if(loc_id == 0x3000): #Castle Outside 
-        if(old_progression_state in [0x0294, 0x29e] and ctx.slot_data["skip_minigame_town_on_fire"] == False): #0x029e: "A fire starts in the village",
-            return 0, ""
-        if(not 0x2b2 in completed_progression_states and 0x294 in completed_progression_states and ctx.slot_data["skip_minigame_town_on_fire"] == False): #02a8= Put out fire
-            return 0x29e, "" #"A fire starts in the village",
-        if(0x47e in completed_progression_states and not 0x488 in completed_progression_states):
-            return 0x47e, "" #0x047e: "See the mutant ant at the mountain entrance",
-        if(((0x0294 in completed_progression_states and ctx.slot_data["playthrough_method"] == 2) or (0x3c0 in completed_progression_states and ctx.slot_data["playthrough_method"] == 1)) and old_progression_state < 0x3c0 ):
-            return 0x3c0, "" #0x03c0: "go down fixed gondola",
-        if(not 0x0294 in completed_progression_states and old_progression_state >= 0x3c0 ):
-            return 0xa, "" #0x000a: "zipline down gondola",
-        #if(0x3b6 in completed_progression_states and not 0x3b6 in completed_progression_states and old_progression_state != 0x3ac): #0x03b6: "The princess disappeared and took the village profits with her",
-        #    return 0x3ac #0x03ac: "Talk to a shop about the missing profits"
-    if(loc_id == 0x3003): #Castle Meeting Room 
-        if(not 0xc8 in completed_progression_states): #0x00c8: "Acquire your first crest",
-            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["MercenC"] in received_list and item_name_to_id["SoldierA"] in received_list and item_name_to_id["KnightB"] in received_list):
-                if(((ctx.slot_data["scroll_sanity"] == False and 0x85 in completed_progression_states) or item_name_to_id["Earth Scroll"] in received_list)):
-                    if(ctx.slot_data["lumina_randomzied"] == False or item_name_to_id["Lumina"] in received_list or (ctx.slot_data["wind_scroll_logic"] == 3 and progression_flags[26][1] & 0b01 == 0b01)):
-                        if(ctx.slot_data["grocery_sanity"] or ctx.slot_data["grocery_sanity_heal_logic"] == False or item_name_to_id["W-Gel"] in received_list or item_name_to_id["Progressive Drink"] in received_list):
-                            return 0x8c, "" #0x008c: "Talk to Geezer about opening hells valley",
-        if(0x0280 in completed_progression_states and not 0x0294 in completed_progression_states): #0x0294: "Deliver the Gizmo Gondola",
-            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list):
-                if(ctx.slot_data["quest_item_sanity"] == True):
-                    if(item_name_to_id["Gondola Gizmo"] in received_list):
-                        return 0x028a, "" #0x028a: "Carpenters inform you of the appearance of the item needed to fix the Gondola Gizmo",
-                elif(item_name_to_id["Bracelet"] in received_list):
-                    return 0x028a, "" #0x028a: "Carpenters inform you of the appearance of the item needed to fix the Gondola Gizmo",
-
-        if(0x2e4 in completed_progression_states and not 0x2f0 in completed_progression_states): #0x02f0: "Reach the frost palace gate for the first time",
-            if(item_name_to_id["MercenA"] in received_list and item_name_to_id["MercenB"] in received_list and item_name_to_id["MercenC"] in received_list):
-                return 0x02ee, "" #0x02ee: "The mercenaries give you the location",
-        #might need to add something for delivery gondola gizmo
-        if(ctx.slot_data["playthrough_method"] == 1 and 0x50 in completed_progression_states and 0x85 in completed_progression_states and not 0xc8 in completed_progression_states): #0x00c8: "Acquire your first crest",
-            return 0x8c, "" #0x008c: "Talk to Geezer about opening hells valley",
-        if(0x280 in completed_progression_states and not 0x294 in completed_progression_states): #0x0294: "Deliver the Gizmo Gondola",
-            return 0x280, "" #0x0280: "The mayor's wife asks you to fix the Gondola Gizmo",
-        if(ctx.slot_data["playthrough_method"] == 1 and 0x2e4 in completed_progression_states and not 0x2f0 in completed_progression_states and old_progression_state != 0x2e4): #0x02f0: "Reach the frost palace gate for the first time",
-            return 0x02ee, "" #0x02ee: "The mercenaries give you the location",
-
-        if(ctx.slot_data["playthrough_method"] == 2 and not 0x2f0 in completed_progression_states and item_name_to_id["MercenA"] in received_list and item_name_to_id["MercenB"] in received_list and item_name_to_id["MercenC"] in received_list):
-            return 0x02ee, "" #0x02ee: "The mercenaries give you the location",
-    #0x3004: "Castle Gondola", 
-        #0x03b6: "The princess disappeared and took the village profits with her",
-        #0x03c0: "go down fixed gondola",
-    if(loc_id == 0x3014): #"Somnolent Forest", 
-        if(0x32 in completed_progression_states and not 0x3c in completed_progression_states): #0x003c: "Find Jon's Key",
-            if(old_progression_state != 0x32):
-                return 0x32, "" #0x0032: "Feed Jon",
-            return 0, ""
-        if(0x4b0 in completed_progression_states and progression_flags[17][22] & 0b1 != 0b1 and old_progression_state != 0x4b0): #0x04b0: "Defeat Queen Ant", get note
-            return 0x4b0, "" #0x04b0: "Defeat Queen Ant", 
-        if((0x02e4 in completed_progression_states or ctx.slot_data["playthrough_method"] == 2)): #0x02f0: "Reach the frost palace gate for the first time",
-            if(item_name_to_id["MercenA"] in received_list and item_name_to_id["MercenB"] in received_list and item_name_to_id["MercenC"] in received_list):
-                if(old_progression_state != 0x2f0):
-                    return 0x02ee, "" #0x02ee: "The mercenaries give you the location",
-                return 0, ""
-        if(old_progression_state == 0x2bc and not 0x2bc in completed_progression_states):
-            return 0xa, "" #0x000a: "zipline down gondola",
-        if(not 0x4b0 in completed_progression_states and old_progression_state > 0x492):
-            return 0xa, "" #0x000a: "zipline down gondola",
-    if(loc_id == 0x301b): #"Meandering Forest", 
-        if(0x32 in completed_progression_states and not 0x3c in completed_progression_states and old_progression_state != 0x32): #0x003c: "Find Jon's Key",
-            return 0x32, "" #0x0032: "Feed Jon",
-        if((0x02e4 in completed_progression_states or ctx.slot_data["playthrough_method"] == 2) and old_progression_state != 0x2f0): #0x02f0: "Reach the frost palace gate for the first time",
-            if(item_name_to_id["MercenA"] in received_list and item_name_to_id["MercenB"] in received_list and item_name_to_id["MercenC"] in received_list):
-                return 0x02ee, "" #0x02ee: "The mercenaries give you the location",
-	#0x301c: "Steamwood Forest", 
-    if(loc_id == 0x301e): #"Steamwood Outside", 
-        if(old_progression_state in [0x78, 0x82]):
-            return 0, ""
-        #from CommonClient import logger
-        #logger.info("Looking at rules for Steamwood 2")
-        if((0x03c0 in completed_progression_states or ctx.slot_data["playthrough_method"] == 2) and (not 0x3ca in completed_progression_states or (ctx.slot_data["quest_item_sanity"] == True and (not(standard_location_name_to_id["Handle #1 - Steamwood 2"] in ctx.checked_locations or standard_location_name_to_id["Handle #1 - Steamwood 2"] + jp_id_offset in ctx.checked_locations) or not(standard_location_name_to_id["Handle #4 - Steamwood 2"] in ctx.checked_locations or standard_location_name_to_id["Handle #4 - Steamwood 2"] + jp_id_offset in ctx.checked_locations) or not (standard_location_name_to_id["Handle #8 - Steamwood 2"] in ctx.checked_locations or standard_location_name_to_id["Handle #8 - Steamwood 2"] + jp_id_offset in ctx.checked_locations))))): #0x03ca: "Receive Handle 0",
-            #logger.info("One layer deep")
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                #logger.info("two layers deep")
-                if(item_name_to_id["Manual"] in received_list and item_name_to_id["Bracelet"] in received_list and item_name_to_id["Handle #0"] in received_list and item_name_to_id["Handle #1"] in received_list and item_name_to_id["Handle #4"] in received_list and item_name_to_id["Handle #8"] in received_list and item_name_to_id["Profits"] in received_list and item_name_to_id["Ugly Belt"] in received_list):
-                    if(len({0x5b, 0x5c, 0x5d, 0x67, 0x6c} & set(progression_flags[19])) == 5):
-                        #logger.info("three layers deep")
-                        return 0x3c0, "" #0x03c0: "go down fixed gondola", #check for all handles, manual, bracelet, profits 
-            elif(0x82 in completed_progression_states and 0x181 in completed_progression_states):
-                return 0x3c0, "" #0x03c0: "go down fixed gondola"
-        if(old_progression_state == 0x3c0):
-            return 0x64, "" #0x0064: "Equip L-Brace",
-        
-    if(loc_id == 0x3021): #"Island of Dragons",
-        #if(0x2bc in completed_progression_states and not 0x2c6 in completed_progression_states):
-        #    return 0x2bc #0x02bc: "Get the calendar and rock salt",
-        #if(not 0x2c6 in completed_progression_states and item_name_to_id["Rock Salt"] in received_list):
-        #    return 0x2bc #0x02bc: "Get the calendar and rock salt",
-        if(not 0x2c6 in completed_progression_states and 0x5f in set(progression_flags[19])): #and (ctx.slot_data["playthrough_method"] == 2 or 0x258 in completed_progression_states)): #rock salt in inventory
-            return 0x2bc, "" #0x02bc: "Get the calendar and rock salt",
-        if(old_progression_state < 0x2c6 and 0x2c6 in completed_progression_states):
-            return 0x2c6, "" #0x02c6: "Use salt on the slug"
-        if(0x2c6 in completed_progression_states and not 0x2d0 in completed_progression_states):
-            return 0x2c6, "" #0x02c6: "Use salt on the slug"
-        if(old_progression_state >= 0x2c6 and not 0x2c6 in completed_progression_states):
-            return 0xa, "" #0x000a: "zipline down gondola",
-    if(loc_id == 0x3022): #"Graveyard", 
-        if(old_progression_state !=  0x32):
-            return 0x32, "" #0x0032: "Feed Jon",
-    if(loc_id == 0x3024): #"Skullpion Arena", 
-        if(not 0xc8 in completed_progression_states and old_progression_state != 0xa0): #0x00c8: "Acquire your first crest",
-            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["MercenC"] in received_list and item_name_to_id["SoldierA"] in received_list and item_name_to_id["KnightB"] in received_list):
-                return 0xa0, "" #0x00a0: "Allies open the gate to Hell's Valley",
-        if(0xc8 in completed_progression_states):
-            return 0xc8, ""
-        #TODO add entrance rando logic if not all npcs present
-    if(loc_id == 0x3025): #"Twinpeak Entrance", 
-        if(not 0x14 in completed_progression_states and progression_flags[17][10] & 0b10000000 == 0b10000000): #agree to rescue dog but have yet to do so
-            if(old_progression_state != 0xa):
-                return 0xa, "" #0x000a: "zipline down gondola",
-            return 0, ""
-        if(not 0x46 in completed_progression_states and old_progression_state > 0x1e): #only allow lilypads after rescuing Jon
-            return 0x1e, "" #0x001e: "Talk to the mayor after rescuing Leno",
-        if(old_progression_state in [0xd2, 0xdc, 0xe6] and 0x46 in completed_progression_states and old_progression_state != 0x46): #make it so Hotelo does not block exploration
-            return 0x46, "" #0x0046: "Free Jon",
-        if(old_progression_state in [0xd2, 0xdc, 0xe6] and not 0x46 in completed_progression_states and old_progression_state != 0xa): #make it so Hotelo does not block exploration
-            return 0x1e, "" #0x001e: "Talk to the mayor after rescuing Leno",
-        if(old_progression_state == 0xa and 0x14 in completed_progression_states):
-            return 0x14, "" #0x0014: "Rescue Leno",
-    if(loc_id == 0x3026): #"Twinpeak Around the Bend", 
-        if(0x82 in completed_progression_states and progression_flags[17][2] & 0b1000000 != 0b1000000 and item_name_to_id["Bracelet"] in received_list and old_progression_state != 0x82):
-            return 0x82, "" #0x0082: "Fix Steamwood"
-        if(progression_flags[17][2] & 0b1000000 != 0b1000000 and old_progression_state > 0x82):
-            return 0xa, "" #0x000a: "zipline down gondola", to make it so player can't climb to earth scroll without doing minigame
-        if(old_progression_state in [0xd2, 0xdc, 0xe6] and 0x46 in completed_progression_states and old_progression_state != 0x46): #make it so Hotelo does not block exploration
-            return 0x46, "" #0x0046: "Free Jon",
-        if(old_progression_state in [0xd2, 0xdc, 0xe6] and not 0x46 in completed_progression_states and old_progression_state != 0xa): #make it so Hotelo does not block exploration
-            return 0xa, "" #0x000a: "zipline down gondola",
-    if(loc_id == 0x3029): #"Twinpeak Second Peak", 
-        if(old_progression_state in [0x104, 0x10e]): #0x0104: "Meet Hotelo on Twinpeak Mountain and go after Aqualin",
-            return 0, "" #don't interupt aqualin minigame
-        if(not 0x46 in completed_progression_states and old_progression_state <= 0x46):
-            return 0x5a, "" #0x005a: "Find Bracelet",
-        if(ctx.slot_data["quest_item_sanity"] == True):
-            if(received_list.count(item_name_to_id["Log"]) >= 4 and not 0x50 in completed_progression_states and 0x46 in completed_progression_states and old_progression_state != 0x46):
-                return 0x46, "" #0x0046: "Free Jon",
-            if(received_list.count(item_name_to_id["Log"]) < 4):
-                return 0x5a, "" #0x005a: "Find Bracelet",
+def item_bits(*names: str) -> int:
+    mask = 0
+    for name in names:
+        mask |= item_bit[item_name_to_id[name]]
+    return mask
+
+#masks of the items calc_progression_state checks, looked up once instead of on every call
+HELLS_VALLEY_ALLIES = item_bits("CarpentA", "MercenC", "SoldierA", "KnightB")
+CARPENTERS = item_bits("CarpentA", "CarpentB", "CarpentC")
+MERCENARIES = item_bits("MercenA", "MercenB", "MercenC")
+STEAMWOOD_2_ITEMS = item_bits("Manual", "Bracelet", "Handle #0", "Handle #1", "Handle #4", "Handle #8", "Profits", "Ugly Belt")
+BREAD_AND_WATER = item_bits("Progressive Bread", "Well H20")
+AQUALIN = item_bits("Aqualin")
+BRACELET = item_bits("Bracelet")
+EARTH_SCROLL = item_bits("Earth Scroll")
+GONDOLA_GIZMO = item_bits("Gondola Gizmo")
+JONS_KEY = item_bits("Jon's Key")
+KEY = item_bits("Key")
+LUMINA = item_bits("Lumina")
+MANUAL = item_bits("Manual")
+PROGRESSIVE_BREAD = item_bits("Progressive Bread")
+PROGRESSIVE_DRINK = item_bits("Progressive Drink")
+ROPE = item_bits("Rope")
+SKY_SCROLL = item_bits("Sky Scroll")
+W_GEL = item_bits("W-Gel")
+WATER_SCROLL = item_bits("Water Scroll")
+WELL_H20 = item_bits("Well H20")
+LOG_ID = item_name_to_id["Log"]
+
+class ProgressionInputs(NamedTuple):
+    """What a progression rule can look at when Musashi is about to enter an area"""
+    old: int #progression state before the area is entered
+    done: Set[int] #completed progression states
+    flags: List[bytes] #game_state segments
+    items: ReceivedItemIndex
+    bits: int #items.bits
+    checked: Set[int] #ctx.checked_locations
+
+class ProgressionRule(NamedTuple):
+    predicate: Callable[[ProgressionInputs], bool]
+    state: int #0 keeps the current progression state
+    hint: str
+    why: str #shown in the debug dump so the tracker can tell why the state was chosen
+
+Predicate = Callable[[ProgressionInputs], bool]
+
+def has_any(mask: int) -> Predicate:
+    return lambda s: s.bits & mask != 0
+
+def all_of(*predicates: Optional[Predicate]) -> Predicate:
+    """Joins the predicates that still apply for the slot options, None stands for one the options already satisfy"""
+    predicates = tuple(predicate for predicate in predicates if predicate is not None)
+    if(len(predicates) == 1):
+        return predicates[0]
+    first, rest = predicates[0], all_of(*predicates[1:])
+    return lambda s: first(s) and rest(s)
+
+rule_location_ids: Set[int] = set() #locations the rules look up in ctx.checked_locations, english and japanese ids
+
+def location_checked(location_name: str) -> Predicate:
+    location_id = standard_location_name_to_id[location_name]
+    rule_location_ids.update((location_id, location_id + jp_id_offset))
+    return lambda s: location_id in s.checked or location_id + jp_id_offset in s.checked
+
+def bell_items(o: dict, sky_scroll: bool) -> Optional[Predicate]:
+    """Key and the scroll that reaches the church bell, the sky scroll counts when sky_scroll_logic allows it"""
+    key = None if o["quest_item_sanity"] == False else has_any(KEY)
+    if(o["scroll_sanity"] == False):
+        scroll = None
+    elif(sky_scroll and o["sky_scroll_logic"] > 1):
+        scroll = has_any(WATER_SCROLL | SKY_SCROLL)
+    else:
+        scroll = has_any(WATER_SCROLL)
+    return all_of(key, scroll) if key or scroll else None
+
+HOTELO_STATES = (0xd2, 0xdc, 0xe6)
+handle_1_checked = location_checked("Handle #1 - Steamwood 2")
+handle_4_checked = location_checked("Handle #4 - Steamwood 2")
+handle_8_checked = location_checked("Handle #8 - Steamwood 2")
+well_water_checked = location_checked("Well H20 - Grillin Village")
+
+def castle_outside_rules(o: dict) -> List[ProgressionRule]:
+    rules = []
+    if(o["skip_minigame_town_on_fire"] == False):
+        rules.append(ProgressionRule(lambda s: s.old in (0x0294, 0x29e), 0, "", "the town on fire minigame is running"))
+        rules.append(ProgressionRule(lambda s: not 0x2b2 in s.done and 0x294 in s.done, 0x29e, "", "gizmo delivered but the fire is not out"))
+    rules.append(ProgressionRule(lambda s: 0x47e in s.done and not 0x488 in s.done, 0x47e, "", "the mutant ant was seen at the mountain entrance"))
+    if(o["playthrough_method"] == 2):
+        rules.append(ProgressionRule(lambda s: 0x294 in s.done and s.old < 0x3c0, 0x3c0, "", "the gondola gizmo was delivered"))
+    elif(o["playthrough_method"] == 1):
+        rules.append(ProgressionRule(lambda s: 0x3c0 in s.done and s.old < 0x3c0, 0x3c0, "", "the fixed gondola was taken"))
+    rules.append(ProgressionRule(lambda s: not 0x294 in s.done and s.old >= 0x3c0, 0xa, "", "the gondola is not fixed yet"))
+    return rules
+
+def castle_meeting_room_rules(o: dict) -> List[ProgressionRule]:
+    rules = []
+    if(o["scroll_sanity"] == False):
+        earth_scroll = lambda s: 0x85 in s.done or s.bits & EARTH_SCROLL
+    else:
+        earth_scroll = has_any(EARTH_SCROLL)
+    if(o["lumina_randomzied"] == False):
+        lumina = None
+    elif(o["wind_scroll_logic"] == 3):
+        lumina = lambda s: s.bits & LUMINA or s.flags[26][1] & 0b01 == 0b01
+    else:
+        lumina = has_any(LUMINA)
+    heal = None if o["grocery_sanity"] or o["grocery_sanity_heal_logic"] == False else has_any(W_GEL | PROGRESSIVE_DRINK)
+    rules.append(ProgressionRule(all_of(lambda s: not 0xc8 in s.done and s.items.has_all(HELLS_VALLEY_ALLIES), earth_scroll, lumina, heal), 0x8c, "", "ready for hell's valley"))
+    gizmo = GONDOLA_GIZMO if o["quest_item_sanity"] == True else BRACELET
+    rules.append(ProgressionRule(lambda s: 0x0280 in s.done and not 0x0294 in s.done and s.items.has_all(CARPENTERS) and s.bits & gizmo, 0x028a, "", "the carpenters can describe the gondola gizmo"))
+    rules.append(ProgressionRule(lambda s: 0x2e4 in s.done and not 0x2f0 in s.done and s.items.has_all(MERCENARIES), 0x02ee, "", "the mercenaries know the way to the frozen palace"))
+    if(o["playthrough_method"] == 1):
+        rules.append(ProgressionRule(lambda s: 0x50 in s.done and 0x85 in s.done and not 0xc8 in s.done, 0x8c, "", "Jon has his trees and the earth scroll was found"))
+    rules.append(ProgressionRule(lambda s: 0x280 in s.done and not 0x294 in s.done, 0x280, "", "the gondola gizmo still needs fixing"))
+    if(o["playthrough_method"] == 1):
+        rules.append(ProgressionRule(lambda s: 0x2e4 in s.done and not 0x2f0 in s.done and s.old != 0x2e4, 0x02ee, "", "the princess is back at the castle"))
+    if(o["playthrough_method"] == 2):
+        rules.append(ProgressionRule(lambda s: not 0x2f0 in s.done and s.items.has_all(MERCENARIES), 0x02ee, "", "the mercenaries know the way to the frozen palace"))
+    return rules
+
+def somnolent_forest_rules(o: dict) -> List[ProgressionRule]:
+    rules = [
+        ProgressionRule(lambda s: 0x32 in s.done and not 0x3c in s.done and s.old != 0x32, 0x32, "", "Jon was fed but his key is not found"),
+        ProgressionRule(lambda s: 0x32 in s.done and not 0x3c in s.done, 0, "", "Jon was fed but his key is not found"),
+        ProgressionRule(lambda s: 0x4b0 in s.done and s.flags[17][22] & 0b1 != 0b1 and s.old != 0x4b0, 0x4b0, "", "the queen ant is defeated and Jon's note is waiting"),
+    ]
+    if(o["playthrough_method"] == 2):
+        mercenaries = lambda s: s.items.has_all(MERCENARIES)
+    else:
+        mercenaries = lambda s: 0x02e4 in s.done and s.items.has_all(MERCENARIES)
+    rules.append(ProgressionRule(lambda s: mercenaries(s) and s.old != 0x2f0, 0x02ee, "", "the mercenaries know the way to the frozen palace"))
+    rules.append(ProgressionRule(mercenaries, 0, "", "the mercenaries know the way to the frozen palace"))
+    rules.append(ProgressionRule(lambda s: s.old == 0x2bc and not 0x2bc in s.done, 0xa, "", "the calendar and rock salt were not picked up"))
+    rules.append(ProgressionRule(lambda s: not 0x4b0 in s.done and s.old > 0x492, 0xa, "", "the queen ant is not defeated"))
+    return rules
+
+def meandering_forest_rules(o: dict) -> List[ProgressionRule]:
+    rules = [ProgressionRule(lambda s: 0x32 in s.done and not 0x3c in s.done and s.old != 0x32, 0x32, "", "Jon was fed but his key is not found")]
+    if(o["playthrough_method"] == 2):
+        rules.append(ProgressionRule(lambda s: s.old != 0x2f0 and s.items.has_all(MERCENARIES), 0x02ee, "", "the mercenaries know the way to the frozen palace"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x02e4 in s.done and s.old != 0x2f0 and s.items.has_all(MERCENARIES), 0x02ee, "", "the mercenaries know the way to the frozen palace"))
+    return rules
+
+def steamwood_outside_rules(o: dict) -> List[ProgressionRule]:
+    rules = [ProgressionRule(lambda s: s.old in (0x78, 0x82), 0, "", "the steamwood event is running")]
+    gondola = None if o["playthrough_method"] == 2 else (lambda s: 0x03c0 in s.done)
+    if(o["quest_item_sanity"] == True):
+        handles_left = lambda s: not 0x3ca in s.done or not handle_1_checked(s) or not handle_4_checked(s) or not handle_8_checked(s)
+        rules.append(ProgressionRule(all_of(gondola, handles_left, lambda s: s.items.has_all(STEAMWOOD_2_ITEMS) and len({0x5b, 0x5c, 0x5d, 0x67, 0x6c} & set(s.flags[19])) == 5), 0x3c0, "", "the handles, manual, bracelet and profits are ready for steamwood 2"))
+    else:
+        rules.append(ProgressionRule(all_of(gondola, lambda s: not 0x3ca in s.done and 0x82 in s.done and 0x181 in s.done), 0x3c0, "", "steamwood and the L-Belt are done"))
+    rules.append(ProgressionRule(lambda s: s.old == 0x3c0, 0x64, "", "leaving steamwood 2"))
+    return rules
+
+def island_of_dragons_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: not 0x2c6 in s.done and 0x5f in s.flags[19], 0x2bc, "", "rock salt is in the inventory"),
+        ProgressionRule(lambda s: s.old < 0x2c6 and 0x2c6 in s.done, 0x2c6, "", "the slug was salted"),
+        ProgressionRule(lambda s: 0x2c6 in s.done and not 0x2d0 in s.done, 0x2c6, "", "the fire scroll is not collected"),
+        ProgressionRule(lambda s: s.old >= 0x2c6 and not 0x2c6 in s.done, 0xa, "", "the slug was not salted"),
+    ]
+
+def graveyard_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: s.old != 0x32, 0x32, "", "graveyard")]
+
+def skullpion_arena_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: not 0xc8 in s.done and s.old != 0xa0 and s.items.has_all(HELLS_VALLEY_ALLIES), 0xa0, "", "the allies can open the gate to hell's valley"),
+        ProgressionRule(lambda s: 0xc8 in s.done, 0xc8, "", "skullpion is defeated"),
+    ]
+
+def twinpeak_entrance_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: not 0x14 in s.done and s.flags[17][10] & 0b10000000 == 0b10000000 and s.old != 0xa, 0xa, "", "agreed to rescue Leno"),
+        ProgressionRule(lambda s: not 0x14 in s.done and s.flags[17][10] & 0b10000000 == 0b10000000, 0, "", "agreed to rescue Leno"),
+        ProgressionRule(lambda s: not 0x46 in s.done and s.old > 0x1e, 0x1e, "", "the lilypads wait until Jon is free"),
+        ProgressionRule(lambda s: s.old in HOTELO_STATES and 0x46 in s.done and s.old != 0x46, 0x46, "", "keep Hotelo from blocking exploration"),
+        ProgressionRule(lambda s: s.old in HOTELO_STATES and not 0x46 in s.done and s.old != 0xa, 0x1e, "", "keep Hotelo from blocking exploration"),
+        ProgressionRule(lambda s: s.old == 0xa and 0x14 in s.done, 0x14, "", "Leno was rescued"),
+    ]
+
+def twinpeak_around_the_bend_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: 0x82 in s.done and s.flags[17][2] & 0b1000000 != 0b1000000 and s.bits & BRACELET and s.old != 0x82, 0x82, "", "steamwood is fixed, the earth scroll climb is open"),
+        ProgressionRule(lambda s: s.flags[17][2] & 0b1000000 != 0b1000000 and s.old > 0x82, 0xa, "", "no climbing to the earth scroll without the minigame"),
+        ProgressionRule(lambda s: s.old in HOTELO_STATES and 0x46 in s.done and s.old != 0x46, 0x46, "", "keep Hotelo from blocking exploration"),
+        ProgressionRule(lambda s: s.old in HOTELO_STATES and not 0x46 in s.done and s.old != 0xa, 0xa, "", "keep Hotelo from blocking exploration"),
+    ]
+
+def twinpeak_second_peak_rules(o: dict) -> List[ProgressionRule]:
+    rules = [
+        ProgressionRule(lambda s: s.old in (0x104, 0x10e), 0, "", "the aqualin minigame is running"),
+        ProgressionRule(lambda s: not 0x46 in s.done and s.old <= 0x46, 0x5a, "", "Jon is not free"),
+    ]
+    if(o["quest_item_sanity"] == True):
+        rules.append(ProgressionRule(lambda s: s.items.count(LOG_ID) >= 4 and not 0x50 in s.done and 0x46 in s.done and s.old != 0x46, 0x46, "", "all 4 logs were received"))
+        rules.append(ProgressionRule(lambda s: s.items.count(LOG_ID) < 4, 0x5a, "", "fewer than 4 logs were received"))
+    else:
+        if(o["lumina_randomzied"] == False):
+            rules.append(ProgressionRule(lambda s: not 0x50 in s.done and 0x46 in s.done and s.old != 0x46, 0x46, "", "Jon is free and needs his trees"))
+        else:
+            rules.append(ProgressionRule(lambda s: s.bits & LUMINA and not 0x50 in s.done and 0x46 in s.done and s.old != 0x46, 0x46, "", "Lumina was received and Jon needs his trees"))
+        if(o["lumina_randomzied"] == True):
+            rules.append(ProgressionRule(lambda s: not s.bits & LUMINA, 0x5a, "", "Lumina was not received"))
+    rules.append(ProgressionRule(lambda s: 0x50 in s.done and s.old != 0x5a, 0x5a, "", "Jon has his trees"))
+    return rules
+
+def twinpeak_path_to_skullpion_rules(o: dict) -> List[ProgressionRule]:
+    if(o["playthrough_method"] == 2):
+        geezer = lambda s: not 0xa0 in s.done and s.items.has_all(HELLS_VALLEY_ALLIES) and 0x96 != s.old
+    else:
+        geezer = lambda s: not 0xa0 in s.done and s.items.has_all(HELLS_VALLEY_ALLIES) and 0x96 != s.old and 0x50 in s.done and 0x85 in s.done
+    return [
+        ProgressionRule(geezer, 0x96, "", "the allies are ready to face the earth crest guardian"),
+        ProgressionRule(lambda s: 0xa0 in s.done and s.old < 0xa0, 0xa0, "", "the gate to hell's valley is open"),
+        ProgressionRule(lambda s: not 0xa0 in s.done and s.old >= 0xa0, 0xa, "", "the gate to hell's valley is closed"),
+    ]
+
+def twinpeak_waterfall_cave_2_rules(o: dict) -> List[ProgressionRule]:
+    aqualin = has_any(AQUALIN) if o["quest_item_sanity"] == True else None
+    if(o["sky_scroll_logic"] == 3):
+        scrolls = lambda s: s.flags[26][0] & 0b1000000 == 0b1000000 or s.flags[26][1] & 0b1000100 == 0b1000100
+    else:
+        scrolls = lambda s: s.flags[26][0] & 0b1000000 == 0b1000000
+    return [ProgressionRule(all_of(lambda s: not 0x118 in s.done and 0xf0 in s.done and not s.old in (0xf0, 0xfa, 0x104, 0x10e, 0x118), aqualin, scrolls), 0xf0, "", "aqualin and the earth scroll or double jump and sky scroll")]
+
+def restaurant_basement_entrance_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: not 0x14a in s.done and s.old != 0x140, 0x140, "", "Wanda talked about the vambees' nest"),
+        ProgressionRule(lambda s: not 0x17c in s.done and 0x172 in s.done and s.old != 0x172, 0x172, "", "all blue eyes are open"),
+        ProgressionRule(lambda s: not 0x17c in s.done and not 0x172 in s.done and 0x14a in s.done and s.old != 0x14a, 0x14a, "", "met the restaurant owner in the basement"),
+    ]
+
+def relic_keeper_arena_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: not 0x258 in s.done and s.old != 0x1e0, 0x1e0, "", "the relic keeper is not defeated")]
+
+def misteria_underground_lake_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: not 0xe6 in s.done and s.old != 0xdc, 0xdc, "", "misteria is not picked")]
+
+def lower_mine_scrap_depository_rules(o: dict) -> List[ProgressionRule]:
+    if(o["playthrough_method"] == 2):
+        return [ProgressionRule(lambda s: s.items.has_all(CARPENTERS) and s.old != 0x28a, 0x028a, "", "the carpenters can describe the gondola gizmo")]
+    return [ProgressionRule(lambda s: s.items.has_all(CARPENTERS) and s.old != 0x28a and 0x276 in s.done, 0x028a, "", "the carpenters can describe the gondola gizmo")]
+
+def grillin_reservoir_tunnel_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: s.old in (0x398, 0x3a2, 0x3ac, 0x3b6, 0x3c0, 0x3ca), 0xa, "", "chapter 5 before steamwood 2, no steam in the tunnel")]
+
+def grillin_reservoir_rules(o: dict) -> List[ProgressionRule]:
+    bell = bell_items(o, True)
+    return [
+        ProgressionRule(all_of(lambda s: int.from_bytes(s.flags[18], byteorder='little') != 0x1052 and 0x1ae in s.done and 0x12c in s.done and 0x136 in s.done, bell), 0x1ae, "", "the church bell can be retrieved"),
+        ProgressionRule(lambda s: int.from_bytes(s.flags[18], byteorder='little') != 0x1052 and (s.old <= 0x276 or s.old >= 0x190), 0xc8, "", "the angel statue is not in town"),
+    ]
+
+def frozen_palace_lobby_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: not 0x2f8 in s.done and 0x2f0 in s.done and s.old < 0x2f0, 0x2f0, "", "reached the frozen palace gate"),
+        ProgressionRule(lambda s: not 0x302 in s.done and 0x2f8 in s.done and s.old < 0x2f8, 0x2f8, "", "met Gingerelle"),
+        ProgressionRule(lambda s: not 0x30c in s.done and 0x302 in s.done and s.old < 0x302, 0x302, "", "the boss door is melted"),
+        ProgressionRule(lambda s: not 0x384 in s.done and 0x30c in s.done and s.old < 0x30c, 0x30c, "", "the gate of the 3 eyes is open"),
+        ProgressionRule(lambda s: (s.old > 0x398 or s.old < 0x30c) and 0x30c in s.done, 0x30c, "", "the gate of the 3 eyes is open"),
+        ProgressionRule(lambda s: (s.old > 0x398 or s.old < 0x302) and 0x302 in s.done, 0x302, "", "the boss door is melted"),
+        ProgressionRule(lambda s: (s.old > 0x398 or s.old < 0x2f8) and 0x2f8 in s.done, 0x2f8, "", "met Gingerelle"),
+    ]
+
+def frozen_palace_dragon_church_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: s.old != 0x30c, 0x30c, "", "frost dragon arena")]
+
+def upper_mine_rules(o: dict) -> List[ProgressionRule]:
+    return [ProgressionRule(lambda s: s.old != 0x492, 0x492, "", "the upper mines are open")]
+
+def village_rules(o: dict) -> List[ProgressionRule]:
+    nothing_to_do = "Nothing to do in town right now"
+    stocks = "The man in the stocks needs bread and water"
+    free_jon = "Jon requests that you free him from the stocks"
+    mayor_reward = "The Mayor has a reward for Musashi"
+    mayor_waiting = "The Mayor is waiting in the town square"
+    windmill = "You can get the key to the mine from Wid at the windmill"
+    misteria = "The Mayor is waiting for Misteria"
+    towst = "Need to talk to Towst and then Wanda"
+    father_white = "Father White at the church requires assistance"
+    earth_crest = "Nothing to do in town until the earth crest guardian is slain"
+    quest_items = o["quest_item_sanity"] == True
+    method_1 = o["playthrough_method"] == 1
+    method_2 = o["playthrough_method"] == 2
+    rules = [
+        ProgressionRule(lambda s: s.old in (0x78,), 0, "", "the steamwood event is running"),
+        ProgressionRule(lambda s: s.flags[17][10] & 0b10000000 != 0b10000000, 0xa, "Need to talk to Mayor to ask about the five scrolls", "have yet to talk to the mayor"),
+        ProgressionRule(lambda s: (s.old == 0x14 or 0x14 in s.done) and not 0x1e in s.done, 0x14, "Need to let Mayor know that Leno has been saved", "Leno was rescued"),
+    ]
+    if(o["bakery_sanity"] == True and quest_items):
+        food = lambda s: s.items.has_all(BREAD_AND_WATER)
+    elif(o["bakery_sanity"] == True):
+        food = has_any(PROGRESSIVE_BREAD)
+    elif(quest_items):
+        food = has_any(WELL_H20)
+    else:
+        food = None
+    rules.append(ProgressionRule(all_of(lambda s: 0x1e in s.done and not 0x32 in s.done and 0x28 in s.done, food), 0x28, stocks, "Jon can be fed"))
+    rules.append(ProgressionRule(all_of(lambda s: 0x1e in s.done and not 0x32 in s.done, food), 0x1e, stocks, "Jon can be fed"))
+    if(quest_items):
+        rules.append(ProgressionRule(lambda s: 0x32 in s.done and not 0x46 in s.done and 0x4d in s.flags[19], 0x3c, free_jon, "Jon's key is in the inventory"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x32 in s.done and not 0x46 in s.done and 0x3c in s.done, 0x3c, free_jon, "Jon's key was found"))
+    rules.append(ProgressionRule(lambda s: 0x64 in s.done and not 0x6e in s.done, 0x64, "", "need to accept fixing steamwood"))
+    rules.append(ProgressionRule(lambda s: 0x82 in s.done and s.flags[17][12] & 0b10000000 != 0b10000000, 0x82, mayor_reward, "the mayor berry was not handed out"))
+    if(quest_items):
+        rules.append(ProgressionRule(lambda s: not well_water_checked(s), 0xa, "Need to draw water from the well before it dries up", "the well water was not drawn"))
+    if(method_1):
+        rules.append(ProgressionRule(lambda s: not 0xc8 in s.done and s.old >= 0xc8, 0xa, earth_crest, "the earth crest guardian is not slain"))
+        rules.append(ProgressionRule(lambda s: not 0xc8 in s.done, 0, earth_crest, "the earth crest guardian is not slain"))
+    if(method_2):
+        save_tim = lambda s: not 0xd2 in s.done
+    else:
+        save_tim = lambda s: 0xc8 in s.done and not 0xd2 in s.done
+    rules.append(ProgressionRule(lambda s: save_tim(s) and s.old in (0xc8, 0xd2), 0, mayor_waiting, "the save Tim quest can start"))
+    rules.append(ProgressionRule(save_tim, 0xc8, mayor_waiting, "the save Tim quest can start"))
+    rules.append(ProgressionRule(lambda s: 0xd2 in s.done and not 0xdc in s.done and s.old == 0xd2, 0, windmill, "the mine key is at the windmill"))
+    rules.append(ProgressionRule(lambda s: 0xd2 in s.done and not 0xdc in s.done, 0xd2, windmill, "the mine key is at the windmill"))
+    rules.append(ProgressionRule(lambda s: 0x59 in s.flags[19], 0xdc, "With the Key in your inventory you can open the door to the mine", "the mine key is in the inventory"))
+    if(quest_items):
+        rules.append(ProgressionRule(lambda s: 0xdc in s.done and not 0xf0 in s.done and 0x56 in s.flags[19], 0xe6, misteria, "misteria is in the inventory"))
+        rules.append(ProgressionRule(lambda s: 0xdc in s.done and not 0xf0 in s.done and s.old == 0xe6 and s.flags[17][13] & 0b10000000 != 0b10000000, 0xdc, "", "misteria is not picked"))
+        rules.append(ProgressionRule(lambda s: 0xdc in s.done and not 0xf0 in s.done and s.flags[17][13] & 0b10000000 == 0b10000000, 0xe6, misteria, "misteria was picked"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0xdc in s.done and not 0xf0 in s.done and 0xe6 in s.done, 0xe6, misteria, "misteria was picked"))
+    rules.append(ProgressionRule(lambda s: 0x118 in s.done and not 0x12c in s.done, 0x122, "", "Tim was saved"))
+    rules.append(ProgressionRule(lambda s: 0x12c in s.done and not 0x140 in s.done and not s.old in (0x122, 0x12c, 0x136), 0x12c, towst, "Tim is saved, Towst and Wanda are next"))
+    rules.append(ProgressionRule(lambda s: 0x12c in s.done and not 0x140 in s.done, 0, towst, "Tim is saved, Towst and Wanda are next"))
+    rules.append(ProgressionRule(lambda s: 0x181 in s.done and not 0x186 in s.done and not 0x1ae in s.done, 0x181, "", "the L-Belt is equipped"))
+    if(o["wind_scroll_logic"] == 3):
+        rules.append(ProgressionRule(lambda s: (0x186 in s.done or s.flags[26][1] & 0b10 == 0b10) and not 0x190 in s.done, 0x186, father_white, "the rope is needed for the well"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x186 in s.done and not 0x190 in s.done, 0x186, father_white, "the rope is needed for the well"))
+    rules.append(ProgressionRule(lambda s: 0x190 in s.done and not 0x19a in s.done, 0x190, father_white, "something is happening at the church"))
+    rules.append(ProgressionRule(lambda s: 0x19a in s.done and not 0x1a4 in s.done, 0, father_white, "the church is infested with vambees"))
+    rules.append(ProgressionRule(lambda s: 0x1a4 in s.done and not 0x1ae in s.done, 0, father_white, "the vambees left the church"))
+    rules.append(ProgressionRule(lambda s: (int.from_bytes(s.flags[18], byteorder='little') & 0xff) in (0x43, 0x52) and not 0x1d6 in s.done, 0x1d1, "", "interacted with the church bell"))
+    if(method_1):
+        rules.append(ProgressionRule(all_of(lambda s: 0x1ae in s.done and 0x12c in s.done and 0x136 in s.done and not 0x1d6 in s.done, bell_items(o, True)), 0x1ae, "Need to find and return the Bell", "the church bell can be retrieved"))
+        rules.append(ProgressionRule(lambda s: not 0x258 in s.done and 0x1e0 in s.done, 0x1e0, "Need to defeat the water crest guardian", "the bell was returned"))
+        rules.append(ProgressionRule(lambda s: not (0x258 in s.done and 0x1d6 in s.done and 0x1ae in s.done), 0x190, father_white, "chapter 3 is not finished"))
+    rules.append(ProgressionRule(lambda s: 0x58 in s.flags[19] and s.flags[17][15] & 0b1000000 != 0b1000000 and (s.old < 0xc8 or s.old > 0x258) and not 0x1e0 in s.done, 0x1ae, "You can place the rope at the well", "the rope is in the inventory and was not placed"))
+    if(method_2):
+        rules.append(ProgressionRule(lambda s: s.flags[17][16] & 0b100000 != 0b100000 and not 0x280 in s.done and not 0x2b2 in s.done, 0x258, "You can talk to Mrs Govern about the state of the well", "the well is not fixed"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x258 in s.done and s.flags[17][16] & 0b100000 != 0b100000 and not 0x280 in s.done and not 0x2b2 in s.done, 0x258, "You can talk to Mrs Govern about the state of the well", "the well is not fixed"))
+    rules.append(ProgressionRule(lambda s: 0x276 in s.done and s.flags[17][16] & 0b100000 == 0b100000 and not 0x280 in s.done and not 0x2b2 in s.done, 0x276, "You can let Mrs Govern know that the well has been fixed", "the well was fixed"))
+    if(o["skip_minigame_town_on_fire"] == True):
+        rules.append(ProgressionRule(lambda s: (0x2b2 in s.done and not 0x2bc in s.done) or (not 0x2bc in s.done and 0x294 in s.done and 0x276 in s.done), 0x2b2, "You can check how Mr Govern is doing", "the fire is out"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x2b2 in s.done and not 0x2bc in s.done, 0x2b2, "You can check how Mr Govern is doing", "the fire is out"))
+    if(method_1):
+        rules.append(ProgressionRule(lambda s: not (0x384 in s.done and 0x2bc in s.done), 0x258, "Need to defeat the fire crest guardian and/or assist Mrs Govern ", "chapter 4 is not finished"))
+    shopkeeper = nothing_to_do if method_2 else "Need to talk to a shopkeeper about what happened"
+    if(method_2):
+        chapter_5 = lambda s: (0x398 in s.done or 0x3a2 in s.done or 0x294 in s.done) and not 0x3ac in s.done
+    else:
+        chapter_5 = lambda s: (0x398 in s.done or 0x3a2 in s.done) and not 0x3ac in s.done
+    rules.append(ProgressionRule(lambda s: chapter_5(s) and s.old == 0x3ac, 0, shopkeeper, "the village profits are missing"))
+    rules.append(ProgressionRule(chapter_5, 0x3a2, shopkeeper, "the village profits are missing"))
+    rules.append(ProgressionRule(lambda s: 0x3f2 in s.done and s.flags[17][20] & 0b100000 != 0b100000, 0x3f2, mayor_reward, "the profits were returned"))
+    if(quest_items):
+        rules.append(ProgressionRule(lambda s: 0x32 in s.done and not 0x46 in s.done and s.old == 0x3c and not s.bits & JONS_KEY, 0x32, "", "Jon's key was not received"))
+    rules.append(ProgressionRule(lambda s: s.bits & ROPE and not s.bits & KEY and (s.old >= 0x276 or s.old < 0xc8), 0xc8, nothing_to_do, "the rope was received without the key"))
+    rules.append(ProgressionRule(all_of(lambda s: 0x1ae in s.done and 0x12c in s.done and 0x136 in s.done and not 0x1d6 in s.done, bell_items(o, False)), 0x1ae, "Can return Bell to town", "the church bell can be returned"))
+    rules.append(ProgressionRule(lambda s: 0x4b0 in s.done and s.old < 0x4b0, 0x4b0, nothing_to_do, "the queen ant is defeated"))
+    rules.append(ProgressionRule(lambda s: 0x1e0 in s.done and s.old < 0x1d6 and s.old > 0xc8, 0x1e0, nothing_to_do, "the bell was returned"))
+    rules.append(ProgressionRule(lambda s: s.old < 0xc8 and s.old > 0x5a, 0xa, nothing_to_do, "the grocery is closed"))
+    rules.append(ProgressionRule(lambda s: s.old > 0x4b0, 0xa, nothing_to_do, "past the queen ant"))
+    rules.append(ProgressionRule(lambda s: s.old == 0x1e, 0xa, nothing_to_do, "Leno was brought back"))
+    rules.append(ProgressionRule(lambda s: s.old == 0x3c0, 0x4b0, nothing_to_do, "back from steamwood 2"))
+    rules.append(ProgressionRule(lambda s: True, 0x0, nothing_to_do, "nothing to do in town"))
+    return rules
+
+def upper_village_rules(o: dict) -> List[ProgressionRule]:
+    rules = [
+        ProgressionRule(lambda s: 0x118 in s.done and not 0x122 in s.done, 0x118, "", "aqualin was given to Hotelo"),
+        ProgressionRule(lambda s: not 0x14 in s.done and s.flags[17][10] & 0b10000000 == 0b10000000 and s.old == 0xa, 0, "", "Leno might be rescued soon"),
+    ]
+    if(o["quest_item_sanity"] == True):
+        rules.append(ProgressionRule(lambda s: 0x6e in s.done and not 0x82 in s.done and s.bits & MANUAL, 0x6e, "", "the manual was received"))
+        rules.append(ProgressionRule(lambda s: 0x6e in s.done and not 0x82 in s.done and s.old == 0x6e, 0xa, "", "the manual was not received"))
+    else:
+        rules.append(ProgressionRule(lambda s: 0x6e in s.done and not 0x82 in s.done, 0x6e, "", "agreed to help with steamwood"))
+    gizmo = GONDOLA_GIZMO | BRACELET if o["quest_item_sanity"] == False else GONDOLA_GIZMO
+    if(o["playthrough_method"] == 2):
+        bincho_field = lambda s: s.flags[17][6] & 0b1000 == 0b1000 and 0x294 in s.done and not 0x492 in s.done and not 0x47e in s.done
+    else:
+        bincho_field = lambda s: s.flags[17][6] & 0b1000 == 0b1000 and 0x294 in s.done and not 0x492 in s.done and not 0x47e in s.done and 0x03c0 in s.done
+    rules.append(ProgressionRule(lambda s: bincho_field(s) and s.items.has_all(CARPENTERS) and s.bits & gizmo, 0x460, "", "the carpenters can break the bincho field"))
+    rules.append(ProgressionRule(lambda s: 0x492 in s.done and s.old < 0x492, 0x492, "", "the upper mines are open"))
+    rules.append(ProgressionRule(lambda s: not 0x492 in s.done and s.old >= 0x492, 0x1e, "", "the upper mines are not open"))
+    return rules
+
+def toy_shop_rules(o: dict) -> List[ProgressionRule]:
+    if(o["playthrough_method"] == 2):
+        return [ProgressionRule(lambda s: True, 0x4b0, "", "every toy series is for sale")]
+    return []
+
+def two_bosses_killed(s: ProgressionInputs) -> bool:
+    return len({0xc8, 0x258, 0x384, 0x4b0} & s.done) > 1
+
+def bakery_rules(o: dict) -> List[ProgressionRule]:
+    if(o["bakery_sanity"] == False):
+        return [
+            ProgressionRule(lambda s: two_bosses_killed(s) and s.old < 0x258, 0x258, "", "two crest guardians are defeated"),
+            ProgressionRule(lambda s: not two_bosses_killed(s) and s.old >= 0x258, 0xa, "", "fewer than two crest guardians are defeated"),
+        ]
+    return []
+
+def grocery_rules(o: dict) -> List[ProgressionRule]:
+    rules = [
+        ProgressionRule(lambda s: s.old == 0x122 and not 0x122 in s.done, 0, "", "talking to Tim"),
+        ProgressionRule(lambda s: s.old == 0x122, 0x12c, "", "Tim is saved"),
+        ProgressionRule(lambda s: s.old == 0x118 and not 0x122 in s.done, 0x122, "", "Tim can be talked to"),
+        ProgressionRule(lambda s: s.old == 0x118, 0x12c, "", "Tim is saved"),
+    ]
+    if(o["grocery_sanity"] == False):
+        rules.append(ProgressionRule(lambda s: two_bosses_killed(s) and s.old < 0x258, 0x258, "", "two crest guardians are defeated"))
+        rules.append(ProgressionRule(lambda s: not two_bosses_killed(s) and s.old >= 0x258, 0x12c, "", "fewer than two crest guardians are defeated"))
+    return rules
+
+def restaurant_rules(o: dict) -> List[ProgressionRule]:
+    return [
+        ProgressionRule(lambda s: s.flags[17][14] & 0b1100000 != 0 and s.old < 0x140, 0x258, "", "talked to Wanda and Macho"),
+        ProgressionRule(lambda s: s.flags[17][14] & 0b1100000 == 0 and s.old >= 0x140, 0xa, "", "have not talked to Wanda and Macho"),
+    ]
+
+#destination id: builds the area's rules in the order they are tried from the slot options
+progression_rule_builders: Dict[int, Callable[[dict], List[ProgressionRule]]] = {
+    0x3000: castle_outside_rules,
+    0x3003: castle_meeting_room_rules,
+    0x3014: somnolent_forest_rules,
+    0x301b: meandering_forest_rules,
+    0x301e: steamwood_outside_rules,
+    0x3021: island_of_dragons_rules,
+    0x3022: graveyard_rules,
+    0x3024: skullpion_arena_rules,
+    0x3025: twinpeak_entrance_rules,
+    0x3026: twinpeak_around_the_bend_rules,
+    0x3029: twinpeak_second_peak_rules,
+    0x302b: twinpeak_path_to_skullpion_rules,
+    0x302c: twinpeak_waterfall_cave_2_rules,
+    0x3034: restaurant_basement_entrance_rules,
+    0x3042: relic_keeper_arena_rules,
+    0x3047: misteria_underground_lake_rules,
+    0x304b: lower_mine_scrap_depository_rules,
+    0x304d: grillin_reservoir_tunnel_rules,
+    0x304e: grillin_reservoir_rules,
+    0x305c: frozen_palace_lobby_rules,
+    0x3066: frozen_palace_dragon_church_rules,
+    0x3072: upper_mine_rules, #Upper Mine Gondola Station
+    0x3075: upper_mine_rules, #Queen Ant Arena
+    0x1010: village_rules, 0x1052: village_rules, 0x1077: village_rules, 0x1094: village_rules,
+    0x1011: upper_village_rules, 0x1053: upper_village_rules, 0x1078: upper_village_rules, 0x1095: upper_village_rules,
+    0x2013: toy_shop_rules, 0x2055: toy_shop_rules, 0x207a: toy_shop_rules, 0x2097: toy_shop_rules,
+    0x2015: bakery_rules, 0x2056: bakery_rules, 0x207b: bakery_rules, 0x2098: bakery_rules,
+    0x2016: grocery_rules, 0x2057: grocery_rules, 0x207c: grocery_rules, 0x2099: grocery_rules,
+    0x201a: restaurant_rules, 0x205b: restaurant_rules, 0x2080: restaurant_rules, 0x209d: restaurant_rules,
+}
+
+
+class ProgressionRuleTable:
+    """The rules of every destination compiled for one slot's options. Compiled again when the slot data changes,
+    so once per connection"""
+
+    def __init__(self):
+        self.slot_data: Optional[dict] = None
+        self.rules: Dict[int, Tuple[ProgressionRule, ...]] = {}
+
+    def compile(self, slot_data: dict) -> None:
+        built: Dict[Callable, Tuple[ProgressionRule, ...]] = {}
+        for builder in set(progression_rule_builders.values()):
+            built[builder] = tuple(builder(slot_data))
+        self.rules = {loc_id: built[builder] for loc_id, builder in progression_rule_builders.items() if len(built[builder]) > 0}
+        self.slot_data = slot_data
+
+    def rules_for(self, slot_data: dict, loc_id: int) -> Tuple[ProgressionRule, ...]:
+        if(slot_data is not self.slot_data):
+            self.compile(slot_data)
+        return self.rules.get(loc_id, ())
+
+progression_rules = ProgressionRuleTable()
+
+def explain_progression_state(ctx: "BizHawkClientContext", loc_id: int, old_progression_state: int, progression_flags: List[bytes], completed_progression_states: Set[int], received_list: ReceivedItemIndex) -> Optional[ProgressionRule]:
+    """The first rule of the destination that holds, None when the progression state is left alone"""
+    rules = progression_rules.rules_for(ctx.slot_data, loc_id)
+    if(not rules):
+        return None
+    inputs = ProgressionInputs(old_progression_state, completed_progression_states, progression_flags, received_list, received_list.bits, ctx.checked_locations)
+    for rule in rules:
+        if(rule.predicate(inputs)):
+            return rule
+    return None
+
+RULE_FLAG_SEGMENTS = (17, 18, 19, 26) #game_state segments the rules read
+
+class ProgressionDecisionCache:
+    """Remembers the rule picked for each (destination, progression state) while nothing the rules read has changed.
+    sync is called once per connection recalculation with the fresh inputs and drops every decision if any of them differ."""
+
+    def __init__(self):
+        self.slot_data: Optional[dict] = None
+        self.fingerprint: Optional[tuple] = None
+        self.decisions: Dict[Tuple[int, int], Optional[ProgressionRule]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def sync(self, ctx: "BizHawkClientContext", progression_flags: List[bytes], completed_progression_states: Set[int], received_list: ReceivedItemIndex) -> None:
+        fingerprint = (frozenset(completed_progression_states), received_list.version, b"".join(bytes(progression_flags[i]) for i in RULE_FLAG_SEGMENTS), frozenset(rule_location_ids.intersection(ctx.checked_locations)))
+        if(ctx.slot_data is not self.slot_data or fingerprint != self.fingerprint):
+            if(len(self.decisions) > 0):
+                self.invalidations += 1
+            self.decisions = {}
+            self.slot_data = ctx.slot_data
+            self.fingerprint = fingerprint
+
+    def explain(self, ctx: "BizHawkClientContext", loc_id: int, old_progression_state: int, progression_flags: List[bytes], completed_progression_states: Set[int], received_list: ReceivedItemIndex) -> Optional[ProgressionRule]:
+        """explain_progression_state for inputs that were passed to sync last"""
+        key = (loc_id, old_progression_state)
+        if(key in self.decisions):
+            self.hits += 1
+            return self.decisions[key]
+        self.misses += 1
+        rule = explain_progression_state(ctx, loc_id, old_progression_state, progression_flags, completed_progression_states, received_list)
+        self.decisions[key] = rule
+        return rule
+
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+def calc_progression_state(ctx: "BizHawkClientContext", loc_id: int, old_progression_state: int, progression_flags: List[bytes], completed_progression_states: Set[int], received_list: ReceivedItemIndex) -> (int, str):
+    rule = explain_progression_state(ctx, loc_id, old_progression_state, progression_flags, completed_progression_states, received_list)
+    if(rule is None):
+        return 0, ""
+    return rule.state, rule.hint
+
+
+progression_state_bit: Dict[int, int] = {state: 1 << i for i, state in enumerate(progression_state_table)} #progression state: bit in a completed progression mask
+
+def progression_states_mask(states: Iterable[int]) -> int:
+    mask = 0
+    for state in states:
+        mask |= progression_state_bit[state]
+    return mask
+
+progression_state_of_bit: Dict[int, int] = {bit: state for state, bit in progression_state_bit.items()}
+
+def progression_states_in(mask: int) -> Set[int]:
+    states = set()
+    while mask:
+        low = mask & -mask
+        states.add(progression_state_of_bit[low])
+        mask ^= low
+    return states
+
+#(game_state segment, byte, mask, progression states completed once every bit of mask is set), rows completing the same states are alternatives
+completed_progression_flags: List[Tuple[int, int, int, Tuple[int, ...]]] = [
+    (17, 11, 0b10, (0x0014,)), #Rescue Leno
+    (17, 11, 0b11, (0x001e,)), #Talk to the mayor after rescuing Leno
+    (17, 11, 0b1000, (0x0028,)), #Jon asks for food and water
+    (17, 11, 0b100000, (0x0032,)), #Feed Jon
+    (17, 11, 0b1000000, (0x003c,)), #Find Jon's Key
+    (17, 11, 0b10000000, (0x0046,)), #Free Jon
+    (17, 1, 0b1000000, (0x0050,)), #Give Jon the 4 trees
+    (26, 1, 0b10000000, (0x0064,)), #Equip L-Brace
+    (17, 12, 0b10000, (0x006e,)), #Agree to help the mayor with Steamwood
+    (17, 12, 0b100000, (0x0078,)), #Talk to Fores and start the Steamwood event
+    (17, 12, 0b1000000, (0x0082,)), #Fix Steamwood
+    (1, 7, 0b100000, (0x0085,)), #Collect the Earth Scroll
+    (17, 16, 0b100, (0x0087,)), #Meet Jon after collecting Earth Scroll
+    (17, 13, 0b1000, (0x00a0, 0x00c8)), #Allies open the gate to Hell's Valley, Skullpion Defeated #TODO check for something else for entrance rando
+    (17, 14, 0b1, (0x00f0,)), #Give Misteria to Mayor
+    (17, 16, 0b10, (0x0104, 0x010e, 0x0118)), #Meet Hotelo, Get Aqualin, Give Aqualin to Hotelo
+    (17, 14, 0b10, (0x0104, 0x010e, 0x0118)),
+    (17, 14, 0b1000, (0x0122, 0x012c)), #Talk to Tim after saving him, Tim is Saved
+    (17, 14, 0b100000, (0x0136, 0x0140)), #Talk to Towst, Wanda tells how to reach the basement
+    (17, 14, 0b1000000, (0x0136, 0x0140)),
+    (17, 5, 0b1000000, (0x014a,)), #Meet the restaurant owner at the basement
+    (17, 15, 0b11110, (0x0172,)), #Open all blue eyes
+    (26, 1, 0b1000000, (0x0181,)), #Equip the L-Belt
+    (20, 0, 0b10000000, (0x0186, 0x0190, 0x019a, 0x01a4, 0x01ae)), #the rope up to Father White asking for the bell
+    (1, 7, 0b1000000, (0x01cc,)), #Collected water scroll
+    (4, 17, 0b10000000, (0x0258,)), #Relic Keeper Defeated
+    (17, 6, 0b1, (0x0276,)), #Fix the Village Well
+    (1, 7, 0b10000000, (0x02c6, 0x02d0, 0x02da)), #Use salt on the slug, collect the fire scroll, Save the princess
+    (17, 17, 0b10000000, (0x02f0,)), #Reach the Frozen Palace gate for the first time
+    (17, 7, 0b10000000, (0x02f8,)), #Meet Gingerelle
+    (17, 9, 0b10000000, (0x0302, 0x030c)), #Melt boss door, enter the room past it
+    (4, 23, 0b10000000, (0x0384,)), #Frost Dragon Defeated
+    (17, 2, 0b10, (0x0398,)), #Complete 4 chapter
+    (17, 6, 0b100000, (0x03ca,)), #Receive Handle 0
+    (4, 27, 0b10000000, (0x03d4, 0x03e8, 0x03f2)), #Topo action figure, picked up and gave back the profits
+    (28, 0, 0b10, (0x03e8, 0x03f2)), #Give back the profits, Finish Steamwood 2
+    (1, 8, 0b1, (0x044c, 0x0460)), #Get the Wind Scroll, break your own bincho field
+    (17, 21, 0b10000000, (0x047e, 0x0488, 0x0492)), #clear poison mist, probably want to track manually as well
+    (4, 29, 0b10000000, (0x04b0,)), #Defeat Queen Ant
+]
+
+#(Geezer status in segment 27 it has to be greater than, progression states)
+completed_progression_geezer: List[Tuple[int, Tuple[int, ...]]] = [
+    (3, (0x008c,)), #Talk to Geezer about opening hells valley
+    (4, (0x0096,)), #have Geezer permission to face the Earth Crest Guardian
+    (6, (0x028a,)), #Carpenters describe the Gondola Gizmo
+    (9, (0x02ee,)), #The mercenaries tell you how to navigate to Frozen Palace
+]
+
+BELL_RETURNED = progression_states_mask((0x01d1, 0x01d6, 0x01e0)) #set while the bell status in segment 18 is 0x1052
+
+#(quest item location, progression states completed once it is checked when quest_item_sanity is on)
+completed_progression_quest_items: List[Tuple[str, Tuple[int, ...]]] = [
+    ("Key from Wid - Grillin Village", (0x00d2, 0x00dc)),
+    ("Misteria - Misteria Underground Lake", (0x00e6,)),
+    ("Ugly Belt - Restaurant Basement", (0x017c,)),
+    ("Mrs Govern's Pie - Grillin Village", (0x0280,)),
+    ("Reward #1 After Extinguishing Village - Grillin Village", (0x0294, 0x029e, 0x02a8, 0x02b2, 0x02bc)),
+]
+
+GEEZER_SEGMENT = 27
+BELL_SEGMENT = 18
+INVENTORY_SEGMENT = 19
+
+class CompletedProgressionTable:
+    """completed_progression_flags grouped by the segment each row reads and with the states as masks, together with the
+    rows that depend on the slot options. Compiled again when the slot data changes"""
+
+    def __init__(self):
+        self.slot_data: Optional[dict] = None
+        self.flag_rows: Dict[int, List[Tuple[int, int, int]]] = {} #segment: [(byte, mask, states mask)]
+        self.segments: List[int] = [] #every segment a row reads
+        self.dependent_rows: List[Tuple[int, int, int, int, int]] = [] #(segment, byte, mask, states mask that has to be done already, states mask)
+        self.inventory_rows: List[Tuple[int, int]] = [] #(item in the segment 19 inventory, states mask)
+        self.location_rows: List[Tuple[Tuple[int, int], int]] = [] #((english id, japanese id), states mask)
+        self.geezer_rows: List[Tuple[int, int]] = [(minimum, progression_states_mask(states)) for minimum, states in completed_progression_geezer]
+
+    def compile(self, slot_data: dict) -> None:
+        rows = list(completed_progression_flags)
+        self.dependent_rows = []
+        self.inventory_rows = []
+        self.location_rows = []
+        if(slot_data["quest_item_sanity"] == True):
+            for location_name, states in completed_progression_quest_items:
+                location_id = standard_location_name_to_id[location_name]
+                self.location_rows.append(((location_id, location_id + jp_id_offset), progression_states_mask(states)))
+        else:
+            rows.append((17, 13, 0b1000000, (0x00d2, 0x00dc))) #Key from Wid
+            self.inventory_rows.append((0x59, progression_states_mask((0x00d2, 0x00dc))))
+            rows.append((17, 14, 0b1, (0x00e6,))) #Misteria
+            rows.append((17, 13, 0b10000000, (0x00e6,)))
+            self.inventory_rows.append((0x56, progression_states_mask((0x00e6,))))
+            rows.append((26, 1, 0b1000000, (0x017c,))) #Ugly Belt
+            if(slot_data["playthrough_method"] == 2):
+                self.dependent_rows.append((17, 16, 0b100000, progression_states_mask((0x0276,)), progression_states_mask((0x0280,)))) #Mrs Govern asks about the gizmo once the well is fixed
+        self.flag_rows = {}
+        for segment, byte, mask, states in rows:
+            self.flag_rows.setdefault(segment, []).append((byte, mask, progression_states_mask(states)))
+        self.segments = sorted(set(self.flag_rows) | {GEEZER_SEGMENT, BELL_SEGMENT, INVENTORY_SEGMENT})
+        self.slot_data = slot_data
+
+    def evaluate_segment(self, segment: int, progression_flags: List[bytes]) -> int:
+        """States of the rows that only read this segment"""
+        val = 0
+        data = progression_flags[segment]
+        for byte, mask, states in self.flag_rows.get(segment, ()):
+            if(data[byte] & mask == mask):
+                val |= states
+        if(segment == GEEZER_SEGMENT):
+            geezer = int.from_bytes(data, byteorder='little')
+            for minimum, states in self.geezer_rows:
+                if(geezer > minimum):
+                    val |= states
+        elif(segment == BELL_SEGMENT):
+            if(int.from_bytes(data, byteorder='little') == 0x1052):
+                val |= BELL_RETURNED
+        elif(segment == INVENTORY_SEGMENT):
+            for item, states in self.inventory_rows:
+                if(item in data):
+                    val |= states
+        return val
+
+    def finish(self, ctx: "BizHawkClientContext", progression_flags: List[bytes], val: int) -> int:
+        """Adds the states of the rows that read other states or ctx.checked_locations to the states from the segments"""
+        for segment, byte, mask, required, states in self.dependent_rows:
+            if(progression_flags[segment][byte] & mask == mask and val & required == required):
+                val |= states
+        for location_ids, states in self.location_rows:
+            if(location_ids[0] in ctx.checked_locations or location_ids[1] in ctx.checked_locations):
+                val |= states
+        return val
+
+    def evaluate(self, ctx: "BizHawkClientContext", progression_flags: List[bytes]) -> int:
+        if(ctx.slot_data is not self.slot_data):
+            self.compile(ctx.slot_data)
+        val = 0
+        for segment in self.segments:
+            val |= self.evaluate_segment(segment, progression_flags)
+        return self.finish(ctx, progression_flags, val)
+
+completed_progression_table = CompletedProgressionTable()
+
+
+class CompletedProgressionTracker:
+    """Keeps the states each segment gave last time and re-derives only the segments whose bytes changed since.
+    The rows reading other states or checked locations are few and checked every time."""
+
+    def __init__(self, table: CompletedProgressionTable = completed_progression_table):
+        self.table = table
+        self.slot_data: Optional[dict] = None
+        self.last: Dict[int, bytes] = {} #segment: bytes the states were derived from
+        self.segment_states: Dict[int, int] = {} #segment: states mask of its rows
+        self.full_updates = 0
+        self.incremental_updates = 0
+
+    def reset(self) -> None:
+        self.slot_data = None
+
+    def update(self, ctx: "BizHawkClientContext", progression_flags: List[bytes]) -> int:
+        """Same mask as calc_completed_progression_state(ctx, progression_flags, as_mask=True)"""
+        if(ctx.slot_data is not self.slot_data or ctx.slot_data is not self.table.slot_data):
+            if(ctx.slot_data is not self.table.slot_data):
+                self.table.compile(ctx.slot_data)
+            self.slot_data = ctx.slot_data
+            self.last = {segment: bytes(progression_flags[segment]) for segment in self.table.segments}
+            self.segment_states = {segment: self.table.evaluate_segment(segment, progression_flags) for segment in self.table.segments}
+            self.full_updates += 1
         else:
-            if((item_name_to_id["Lumina"] in received_list or ctx.slot_data["lumina_randomzied"] == False) and not 0x50 in completed_progression_states and 0x46 in completed_progression_states and old_progression_state != 0x46):
-                return 0x46, "" #0x0046: "Free Jon",
-            if(not item_name_to_id["Lumina"] in received_list and ctx.slot_data["lumina_randomzied"] == True):
-                return 0x5a, "" #0x005a: "Find Bracelet",
-        if(0x50 in completed_progression_states and old_progression_state != 0x5a):
-            return 0x5a, "" #0x005a: "Find Bracelet",
-	#0x302a: "Twinpeak Rafting", 
-    if(loc_id == 0x302b): #"Twinpeak Path to Skullpion", 
-        if(not 0xa0 in completed_progression_states and item_name_to_id["CarpentA"] in received_list and item_name_to_id["MercenC"] in received_list and item_name_to_id["SoldierA"] in received_list and item_name_to_id["KnightB"] in received_list and 0x96 != old_progression_state):
-            if(ctx.slot_data["playthrough_method"] == 2 or (0x50 in completed_progression_states and 0x85 in completed_progression_states)): 
-                return 0x96, "" #0x0096: "have Geezer permission to face the Earth Crest Guardian",
-        if(0xa0 in completed_progression_states and old_progression_state < 0xa0):
-            return 0xa0, "" #0x00a0: "Allies open the gate to Hell's Valley",
-        if(not 0xa0 in completed_progression_states and old_progression_state >= 0xa0): #close gate
-            return 0xa, "" #0x000a: "zipline down gondola",
-    if(loc_id == 0x302c): #"Twinpeak Waterfall Cave 2", 
-        #from CommonClient import logger
-        #logger.info("Looking at rules for waterfall Cave 2")
-        if(not 0x118 in completed_progression_states and 0xf0 in completed_progression_states and not old_progression_state in [0xf0, 0xfa, 0x104, 0x10e, 0x118]):
-            #logger.info("Past first check for aqualin minigame")
-            if(((ctx.slot_data["quest_item_sanity"] == True and item_name_to_id["Aqualin"] in received_list) or ctx.slot_data["quest_item_sanity"] == False) and (progression_flags[26][0] & 0b1000000 == 0b1000000 or (progression_flags[26][1] & 0b1000100 == 0b1000100 and ctx.slot_data["sky_scroll_logic"] == 3))): #aqualin and earth scroll or double jump and sky
-                #logger.info("Past second check for aqualin minigame")
-                return 0xf0, "" #0x00f0: "Give Misteria to Mayor and Mayor wonders if Hotelo is alright",
-    if(loc_id == 0x3034): #"Restaurant Basement Entrance", 
-        if(not 0x14a in completed_progression_states and old_progression_state != 0x140):
-            return 0x140, "" #0x0140: "Wanda talks about the vambees' nest",
-        if(not 0x17c in completed_progression_states and 0x172 in completed_progression_states and old_progression_state != 0x172):
-            return 0x172, "" #0x0172: "Open all blue eyes",
-        if(not 0x17c in completed_progression_states and not 0x172 in completed_progression_states and 0x14a in completed_progression_states and old_progression_state != 0x14a):
-            return 0x14a, "" #0x014a: "Meet the restaurant owner at the basement",
-    if(loc_id == 0x3042): #"Relic Keeper Arena", 
-        if(not 0x258 in completed_progression_states and old_progression_state != 0x1e0):
-            return 0x1e0, "" #0x01e0: "Return the bell to the village",
-    if(loc_id == 0x3047): #"Misteria Underground Lake", 
-        if(not 0xe6 in completed_progression_states and old_progression_state != 0xdc):
-            return 0xdc, "" #0x00dc: "Acquire Mine's Key",
-    if(loc_id == 0x304b): #"Lower Mine Scrap Depository", 
-        if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list and old_progression_state != 0x28a and (ctx.slot_data["playthrough_method"] == 2 or 0x276 in completed_progression_states)):
-            return 0x028a, "" #0x028a: "Carpenters inform you of the appearance of the item needed to fix the Gondola Gizmo",
-	#0x304c: "Restaurant Basement Outside Relic Keeper", 
-    if(loc_id == 0x304d): #"Grillin Reservoir Tunnel", 
-        if(old_progression_state in [0x398, 0x3a2, 0x3ac, 0x3b6, 0x3c0, 0x3ca]): #anything chapter 5 before finishing steamwood turn off steam in tunnel
-            return 0xa, "" #0x000a: "zipline down gondola",
-    if(loc_id == 0x304e): #"Grillin Reservoir", 
-        if(int.from_bytes(progression_flags[18], byteorder='little') != 0x1052):
-            if(0x1ae in completed_progression_states and 0x12c in completed_progression_states and 0x136 in completed_progression_states):
-                if((ctx.slot_data["quest_item_sanity"] == False or item_name_to_id["Key"] in received_list) and (ctx.slot_data["scroll_sanity"] == False or (item_name_to_id["Water Scroll"] in received_list or (item_name_to_id["Sky Scroll"] in received_list and ctx.slot_data["sky_scroll_logic"] > 1)))):
-                    return 0x1ae, "" #0x01ae: "The Father asks you to retrieve Church Bell",
-            if(old_progression_state <= 0x276 or old_progression_state >= 0x190):
-                return 0xc8, "" #0x00c8: "Acquire your first crest",
-        #check if progression state affects Rope to climb
-	#0x3051: "Chapter 3 Church Vambee Fight",
-    if(loc_id == 0x305c): #"Frozen Palace Lobby",
-        #TODO for every area with an eye door make sure progression state isnt too high for entrance rando 
-        if(not 0x2f8 in completed_progression_states and 0x2f0 in completed_progression_states and old_progression_state < 0x2f0):
-            return 0x2f0, "" #0x02f0: "Reach the frost palace gate for the first time",
-        if(not 0x302 in completed_progression_states and 0x2f8 in completed_progression_states and old_progression_state < 0x2f8):
-            return 0x2f8, "" #0x02f8: "Meet Gingerelle",
-        if(not 0x30c in completed_progression_states and 0x302 in completed_progression_states and old_progression_state < 0x302):
-            return 0x302, "" #0x0302: "Melt boss door",
-        if(not 0x384 in completed_progression_states and 0x30c in completed_progression_states and old_progression_state < 0x30c):
-            return 0x30c, "" #0x030c: "Open and enter the big gate of the 3 eyes in the ice palace",
-        if((old_progression_state > 0x398 or old_progression_state < 0x30c) and 0x30c in completed_progression_states):
-            return 0x30c, "" #0x030c: "Open and enter the big gate of the 3 eyes in the ice palace",
-        if((old_progression_state > 0x398 or old_progression_state < 0x302) and 0x302 in completed_progression_states):
-            return 0x302, "" #0x0302: "Melt boss door",
-        if((old_progression_state > 0x398 or old_progression_state < 0x2f8) and 0x2f8 in completed_progression_states):
-            return 0x2f8, "" #0x02f8: "Meet Gingerelle",
-    if(loc_id == 0x3066): #"Frozen Palace Dragon Church", 
-        if(old_progression_state != 0x30c):
-            return 0x30c, "" #0x030c: "Open and enter the big gate of the 3 eyes in the ice palace",
-	#0x3068: "Frozen Palace Courtyard", 
-	#0x3069: "Chapter 4 Village on Fire", 
-	#0x306f: "Upper Mine Big Fan", 
-    if(loc_id == 0x3072): #"Upper Mine Gondola Station", 
-        if(old_progression_state != 0x492):
-            return 0x492, "" #0x0492: "GiAnt breaks open entrance to Upper Mines",
-	#0x3074: "Upper Mine Above Queen Ant", 
-    if(loc_id == 0x3075): #"Queen Ant Arena",
-        if(old_progression_state != 0x492):
-            return 0x492, "" #0x0492: "GiAnt breaks open entrance to Upper Mines",
-	#0x3081: "Sky Island",    
-    if(loc_id in [0x1010, 0x1052, 0x1077, 0x1094]): #"Chapter 2 Grillin Village", 
-        if(old_progression_state in [0x78]):
-            return 0, ""
-        if(progression_flags[17][10] & 0b10000000 != 0b10000000): #have yet to talk to mayor
-            return 0xa, "Need to talk to Mayor to ask about the five scrolls" #0x000a: "zipline down gondola",
-        #0x000a: "zipline down gondola",
-        #0x0014: "Rescue Leno",
-        if((old_progression_state == 0x14 or 0x14 in completed_progression_states) and not 0x1e in completed_progression_states): #need to check with mayor after saving leno
-            return 0x14, "Need to let Mayor know that Leno has been saved" #x0014: "Rescue Leno",
-        #0x001e: "Talk to the mayor after rescuing Leno",
-        if(0x1e in completed_progression_states and not 0x32 in completed_progression_states): #need to talk to and feed man in stocks
-            if(ctx.slot_data["bakery_sanity"] == True and ctx.slot_data["quest_item_sanity"] == True):
-                if(item_name_to_id["Progressive Bread"] in received_list and item_name_to_id["Well H20"] in received_list):
-                    if(0x28 in completed_progression_states):
-                        return 0x28, "The man in the stocks needs bread and water" #0x0028: "Jon asks for food and water",
-                    return 0x1e, "The man in the stocks needs bread and water" #0x001e: "Talk to the mayor after rescuing Leno",
-            elif(ctx.slot_data["bakery_sanity"] == True):
-                if(item_name_to_id["Progressive Bread"] in received_list):
-                    if(0x28 in completed_progression_states):
-                        return 0x28, "The man in the stocks needs bread and water" #0x0028: "Jon asks for food and water",
-                    return 0x1e, "The man in the stocks needs bread and water" #0x001e: "Talk to the mayor after rescuing Leno",
-            elif(ctx.slot_data["quest_item_sanity"] == True):
-                if(item_name_to_id["Well H20"] in received_list):
-                    if(0x28 in completed_progression_states):
-                        return 0x28, "The man in the stocks needs bread and water" #0x0028: "Jon asks for food and water",
-                    return 0x1e, "The man in the stocks needs bread and water" #0x001e: "Talk to the mayor after rescuing Leno",
-            else:
-                if(0x28 in completed_progression_states):
-                    return 0x28, "The man in the stocks needs bread and water" #0x0028: "Jon asks for food and water",
-                return 0x1e, "The man in the stocks needs bread and water" #0x001e: "Talk to the mayor after rescuing Leno",
-        #0x0028: "Jon asks for food and water",
-        #0x0032: "Feed Jon",
-        if(0x32 in completed_progression_states and not 0x46 in completed_progression_states): #need to free Jon
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                #if(item_name_to_id["Jon's Key"] in received_list):
-                if(0x4d in set(progression_flags[19])):
-                    return 0x3c, "Jon requests that you free him from the stocks" #0x003c: "Find Jon's Key",
-            else:
-                if(0x3c in completed_progression_states):
-                    return 0x3c, "Jon requests that you free him from the stocks" #0x003c: "Find Jon's Key",
-        #0x003c: "Find Jon's Key",
-        #0x0046: "Free Jon",
-        #0x0050: "Give Jon the 4 trees and understand about the five scrolls",
-        #0x005a: "Find Bracelet",
-        if(0x64 in completed_progression_states and not 0x6e in completed_progression_states): #need to accept fixing steamwood
-            return 0x64, "" #0x0064: "Equip L-Brace",
-        #0x0064: "Equip L-Brace",
-        #0x006e: "Agree to help the mayor with Steamwood",
-        #0x0078: "Talk to Fores and start the Steamwood event",#check for manual and bracelet
-        if(0x82 in completed_progression_states and progression_flags[17][12] & 0b10000000 != 0b10000000): #mayor Berry
-            return 0x82, "The Mayor has a reward for Musashi" #0x0082: "Fix Steamwood",
-        #0x0082: "Fix Steamwood",
-        #0x0085: "Collect the Earth Scroll",
-        #0x0087: "Meet Jon after collecting Earth Scroll",
-        #0x008c: "Talk to Geezer about opening hells valley",
-        #0x0096: "have Geezer permission to face the Earth Crest Guardian",
-        #0x00a0: "Allies open the gate to Hell's Valley",
-        if(ctx.slot_data["quest_item_sanity"] == True):
-            if(not standard_location_name_to_id["Well H20 - Grillin Village"] in ctx.checked_locations and not (standard_location_name_to_id["Well H20 - Grillin Village"] + jp_id_offset) in ctx.checked_locations): #grab water from well before it 'dries' up
-                return 0xa, "Need to draw water from the well before it dries up" #0x000a: "zipline down gondola",
-        if(ctx.slot_data["playthrough_method"] == 1 and not (0xc8 in completed_progression_states)):
-            if(old_progression_state >= 0xc8):
-                return 0xa, "Nothing to do in town until the earth crest guardian is slain" #0x000a: "zipline down gondola",
-            return 0, "Nothing to do in town until the earth crest guardian is slain"
-
-	#0x1052: "Chapter 3 Grillin Village", 
-        if((ctx.slot_data["playthrough_method"] == 2 or 0xc8 in completed_progression_states) and not 0xd2 in completed_progression_states): #start save tim quest
-            if(old_progression_state in [0xc8, 0xd2]):
-                return 0, "The Mayor is waiting in the town square"
-            return 0xc8, "The Mayor is waiting in the town square" #0x00c8: "Acquire your first crest",
-        #0x00c8: "Acquire your first crest",
-        if(0xd2 in completed_progression_states and not 0xdc in completed_progression_states): #start save tim quest
-            if(old_progression_state == 0xd2):
-                return 0, "You can get the key to the mine from Wid at the windmill"
-            return 0xd2, "You can get the key to the mine from Wid at the windmill" #0x00d2: "The Mayor says you can get the key to the coal mine with the man from the mill",
-        #0x00d2: "The Mayor says you can get the key to the coal mine with the man from the mill",
-        if(0x59 in set(progression_flags[19])):
-            return 0xdc, "With the Key in your inventory you can open the door to the mine" #0x00dc: "Acquire Mine Key",
-        if(0xdc in completed_progression_states and not 0xf0 in completed_progression_states): #need to turn in misteria #TODO check if dc works or if it needs e6 to turn in misteria, it needs e6
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                #if(item_name_to_id["Misteria"] in received_list):
-                if(0x56 in set(progression_flags[19])):
-                    return 0xe6, "The Mayor is waiting for Misteria" #0x00e6: "Acquire Misteria Bloom",
-                if(old_progression_state == 0xe6 and progression_flags[17][13] & 0b10000000 != 0b10000000):
-                    return 0xdc, "" #0x00dc: "Acquire Mine's Key",
-                if(progression_flags[17][13] & 0b10000000 == 0b10000000):
-                    return 0xe6, "The Mayor is waiting for Misteria" #0x00e6: "Acquire Misteria Bloom",
-            elif(0xe6 in completed_progression_states):
-                return 0xe6, "The Mayor is waiting for Misteria" #0x00e6: "Acquire Misteria Bloom",
-        #0x00dc: "Acquire Mine's Key",
-        #0x00e6: "Acquire Misteria Bloom",
-        #0x00f0: "Give Misteria to Mayor and Mayor wonders if Hotelo is alright",
-        #0x00fa: "Meet Hotelo on Twinpeak Mountain and return to village instead",
-        #0x0104: "Meet Hotelo on Twinpeak Mountain and go after Aqualin",
-        #0x010e: "Get Aqualin",
-        #if(0x118 in completed_progression_states and not 0x122 in completed_progression_states):
-        #    if(not old_progression_state in [0x118, 0x122]):
-        #        return 0x118 #0x0118: "Give Aqualin to Hotelo",
-        #0x0118: "Give Aqualin to Hotelo",
-        if(0x118 in completed_progression_states and not 0x12c in completed_progression_states):
-            return 0x122, "" #0x0122: "Talk to Tim after saving him",
-        #0x0122: "Talk to Tim after saving him",
-        if(0x12c in completed_progression_states and not 0x140 in completed_progression_states):
-            if(not old_progression_state in [0x122, 0x12c, 0x136]):
-                return 0x12c, "Need to talk to Towst and then Wanda" #0x012c: "Tim became a Vambee/ Tim is Saved",
-            return 0, "Need to talk to Towst and then Wanda"
-        #0x012c: "Tim became a Vambee/ Tim is Saved",
-        #if(0x136 in completed_progression_states and not 0x140 in completed_progression_states):
-            #return 0x136 #0x0136: "Talk to the drunk and discover you",
-        #0x0136: "Talk to the drunk and discover you",
-        #0x0140: "Wanda talks about the vambees' nest",
-        #0x014a: "Meet the restaurant owner at the basement",
-        #0x0172: "Open all blue eyes",
-        #0x017c: "Get the Ugly Belt",
-        if(0x181 in completed_progression_states and not 0x186 in completed_progression_states and not 0x1ae in completed_progression_states):
-            return 0x181, "" #0x0181: "Equip the L-Belt",
-        #0x0181: "Equip the L-Belt",
-        if((0x186 in completed_progression_states or (progression_flags[26][1] & 0b10 == 0b10 and ctx.slot_data["wind_scroll_logic"] == 3)) and not 0x190 in completed_progression_states):
-            return 0x186, "Father White at the church requires assistance" #0x0186: "The owner of the restaurant says he needs the rope",
-        #0x0186: "The owner of the restaurant says he needs the rope",
-        if(0x190 in completed_progression_states and not 0x19a in completed_progression_states):
-            return 0x190, "Father White at the church requires assistance" #0x0190: "Something is happening at the church at 2 am",
-        #0x0190: "Something is happening at the church at 2 am",
-        if(0x19a in completed_progression_states and not 0x1a4 in completed_progression_states):
-            return 0, "Father White at the church requires assistance" #
-        #0x019a: "Enter the church infested with vambees",
-        if(0x1a4 in completed_progression_states and not 0x1ae in completed_progression_states):
-            return 0, "Father White at the church requires assistance" #
-        #0x01a4: "Exit the church infested with vambees",
-        if((int.from_bytes(progression_flags[18], byteorder='little') & 0xff) in [0x43, 0x52] and not 0x1d6 in completed_progression_states):
-            return 0x1d1, "" #0x01d1: "Interacting with the church bell (does not require talking to priest)",
-
-        if(ctx.slot_data["playthrough_method"] == 1 and 0x1ae in completed_progression_states and 0x12c in completed_progression_states and 0x136 in completed_progression_states and not 0x1d6 in completed_progression_states): #TODO make less dumb
-            if((ctx.slot_data["quest_item_sanity"] == False or item_name_to_id["Key"] in received_list) and (ctx.slot_data["scroll_sanity"] == False or (item_name_to_id["Water Scroll"] in received_list or (item_name_to_id["Sky Scroll"] in received_list and ctx.slot_data["sky_scroll_logic"] > 1)))):
-                return 0x1ae, "Need to find and return the Bell" ##0x01ae: "The Father asks you to retrieve Church Bell",
-        
-        if(ctx.slot_data["playthrough_method"] == 1 and not 0x258 in completed_progression_states and 0x1e0 in completed_progression_states):
-            return 0x1e0, "Need to defeat the water crest guardian" #0x01e0: "Return the bell to the village",
-
-        if(ctx.slot_data["playthrough_method"] == 1 and not (0x258 in completed_progression_states and 0x1d6 in completed_progression_states and 0x1ae in completed_progression_states)):
-            return 0x190, "Father White at the church requires assistance" #0x0190: "Something is happening at the church at 2 am",
-
-        if(0x58 in progression_flags[19] and progression_flags[17][15] & 0b1000000 != 0b1000000 and (old_progression_state < 0xc8 or old_progression_state > 0x258) and not 0x1e0 in completed_progression_states): #if rope is in inventory and no rope has been placed
-            return 0x1ae, "You can place the rope at the well" ##0x01ae: "The Father asks you to retrieve Church Bell",
-        #0x01ae: "The Father asks you to retrieve Church Bell",
-        #0x01cc: "Collected water scroll",
-        #0x01d1: "Interacting with the church bell (does not require talking to priest)",
-        #0x01d6: "Give the Church Bell to the priest",
-        #0x01e0: "Return the bell to the village",
-	#0x1077: "Chapter 4 Grillin Village",
-        if((ctx.slot_data["playthrough_method"] == 2 or 0x258 in completed_progression_states) and progression_flags[17][16] & 0b100000 != 0b100000 and not 0x280 in completed_progression_states and not 0x2b2 in completed_progression_states):
-            return 0x258, "You can talk to Mrs Govern about the state of the well" #0x0258: "Acquire your second crest",
-        #0x0258: "Acquire your second crest",
-        if(0x276 in completed_progression_states and progression_flags[17][16] & 0b100000 == 0b100000 and not 0x280 in completed_progression_states and not 0x2b2 in completed_progression_states):
-            return 0x276, "You can let Mrs Govern know that the well has been fixed" #0x0276: "Fix the Village Well",
-        #0x0276: "Fix the Village Well",
-        #0x0280: "The mayor's wife asks you to fix the Gondola",
-        #0x028a: "Carpenters inform you of the appearance of the item needed to fix the Gondola Gizmo",
-        #0x0294: "Deliver the Gizmo Gondola",
-        #0x029e: "A fire starts in the village",
-        #0x02a8: "Put out fire",
-        if((0x2b2 in completed_progression_states and not 0x2bc in completed_progression_states) or (ctx.slot_data["skip_minigame_town_on_fire"] == True and not 0x2bc in completed_progression_states and 0x294 in completed_progression_states and 0x276 in completed_progression_states)):
-            return 0x2b2, "You can check how Mr Govern is doing" #0x02b2: "Mrs. Govern thanks you and tells musashi about the thieves",
-        #0x02b2: "Mrs. Govern thanks you and tells musashi about the thieves",
-        #0x02bc: "Get the calendar and rock salt",
-        #0x02c6: "Use salt on the slug",
-        #0x02d0: "collect the fire scroll",
-        #0x02da: "Save the princess",
-        #0x02e4: "Rescue princess Filet and take her to the castle",
-        #0x02ee: "The mercenaries give you the location",
-        #0x02f0: "Reach the frost palace gate for the first time",
-        #0x02f8: "Meet Gingerelle",
-        #0x0302: "Melt boss door",
-        #0x030c: "Open and enter the big gate of the 3 eyes in the ice palace",
-        #0x0384: "Defeat Frost Dragon",
-        if(ctx.slot_data["playthrough_method"] == 1 and not (0x384 in completed_progression_states and 0x2bc in completed_progression_states)):
-            return 0x258, "Need to defeat the fire crest guardian and/or assist Mrs Govern " #0x0258: "Acquire your second crest",
-
-	#0x1094: "Chapter 5/6 Grillin Village"
-        #if(0x398 in completed_progression_states and not 0x3a2 in completed_progression_states):
-            #return 0x398 #0x0398: "Complete 4 chapter",
-        #0x0398: "Complete 4 chapter",
-        if((0x398 in completed_progression_states or 0x3a2 in completed_progression_states or (ctx.slot_data["playthrough_method"] == 2 and 0x294 in completed_progression_states)) and not 0x3ac in completed_progression_states):
-            if(old_progression_state == 0x3ac):
-                if(ctx.slot_data["playthrough_method"] == 2):
-                    return 0, "Nothing to do in town right now"
-                return 0, "Need to talk to a shopkeeper about what happened"
-            
-            if(ctx.slot_data["playthrough_method"] == 2):
-                return 0x3a2, "Nothing to do in town right now"
-            return 0x3a2, "Need to talk to a shopkeeper about what happened" #0x03a2: "Start 5 chapter mayor says to visit shops",
-        #0x03a2: "Start 5 chapter mayor says to visit shops",
-        #0x03ac: "Talk to a shop about the missing profits",
-        #0x03b6: "The princess disappeared and took the village profits with her",
-        #0x03c0: "go down fixed gondola",
-        #0x03ca: "Receive Handle 0",
-        #0x03d4: "Pick up Profits",
-        #0x03e8: "Give back the profits",
-        if(0x3f2 in completed_progression_states and progression_flags[17][20] & 0b100000 != 0b100000): #talk to mayor about profits
-            return 0x3f2, "The Mayor has a reward for Musashi" #0x03f2: "Finish the events of the second Steamwood",
-        #0x03f2: "Finish the events of the second Steamwood",
-        #0x044c: "Get the Wind Scroll",
-        #0x0460: "break your own bincho field",
-        #0x047e: "See the mutant ant at the mountain entrance",
-        #0x0488: "select to take gondola to ant",
-        
-        if(0x32 in completed_progression_states and not 0x46 in completed_progression_states and old_progression_state ==0x3c): #need to free Jon but not for free
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                if(not item_name_to_id["Jon's Key"] in received_list):
-                    return 0x32, "" #0x0032: "Feed Jon"
-        #0x0032: "Feed Jon",
-        #0x003c: "Find Jon's Key",
-        if(item_name_to_id["Rope"] in received_list and not item_name_to_id["Key"] in received_list):
-            if(old_progression_state >= 0x276 or old_progression_state < 0xc8):
-                return 0xc8, "Nothing to do in town right now" #0x00c8: "Acquire your first crest",
-        
-        if(0x1ae in completed_progression_states and 0x12c in completed_progression_states and 0x136 in completed_progression_states and not 0x1d6 in completed_progression_states): #TODO make less dumb
-            if((ctx.slot_data["quest_item_sanity"] == False or item_name_to_id["Key"] in received_list) and (ctx.slot_data["scroll_sanity"] == False or item_name_to_id["Water Scroll"] in received_list)):
-                return 0x1ae, "Can return Bell to town" ##0x01ae: "The Father asks you to retrieve Church Bell",
-        #0x01ae: "The Father asks you to retrieve Church Bell",
-        
-        if(0x4b0 in completed_progression_states and old_progression_state < 0x4b0):
-            return 0x4b0, "Nothing to do in town right now" #0x04b0: "Defeat Queen Ant",\
-
-        if(0x1e0 in completed_progression_states and old_progression_state < 0x1d6 and old_progression_state > 0xc8):
-            return 0x1e0, "Nothing to do in town right now" #0x01e0: "Return the bell to the village",
-
-        if(old_progression_state < 0xc8 and old_progression_state > 0x5a): #grocery closed
-            return 0xa, "Nothing to do in town right now" #0x000a: "zipline down gondola",
-
-        if(old_progression_state > 0x4b0):
-            return 0xa, "Nothing to do in town right now" #0x000a: "zipline down gondola",
-
-        if(old_progression_state == 0x1e):
-            return 0xa, "Nothing to do in town right now" #0x000a: "zipline down gondola",
-
-        if(old_progression_state == 0x3c0):
-            return 0x4b0, "Nothing to do in town right now" #0x04b0: "Defeat Queen Ant",\
-        #0x005a: "Find Bracelet",
-        #0x0064: "Equip L-Brace",
-        #0x006e: "Agree to help the mayor with Steamwood",
-        #0x0078: "Talk to Fores and start the Steamwood event",
-        #0x0082: "Fix Steamwood",
-        #0x0085: "Collect the Earth Scroll",
-        #0x0087: "Meet Jon after collecting Earth Scroll",
-        #0x008c: "Talk to Geezer about opening hells valley",
-        #0x0096: "have Geezer permission to face the Earth Crest Guardian",
-        #0x00a0: "Allies open the gate to Hell's Valley",
-        #0x00c8: "Skullpion Defeated",
-        #TODO logic for when there is nothing that needs to be done right now in the town
-        return 0x0, "Nothing to do in town right now" #0x000a: "zipline down gondola",
-    if(loc_id in [0x1011, 0x1053, 0x1078, 0x1095]): #"Chapter 2 Upper Village", 
-	#0x1053: "Chapter 3 Upper Village", 
-	#0x1078: "Chapter 4 Upper Village", 
-    #0x1095: "Chapter 5/6 Upper Village"
-        if(0x118 in completed_progression_states and not 0x122 in completed_progression_states):
-            return 0x118, "" #0x0118: "Give Aqualin to Hotelo",
-        #0x0118: "Give Aqualin to Hotelo",
-        #if(0x14 in completed_progression_states and progression_flags[17][16] & 0b1000 != 0b1000): #rescued leno but no cutscene
-        #    return 0x14 #0x0014: "Rescue Leno",
-
-        if(not 0x14 in completed_progression_states and progression_flags[17][10] & 0b10000000 == 0b10000000 and old_progression_state == 0xa): #yet to rescue leno... but might soon
-            return 0, "" #0x0014: "Rescue Leno",
-        #0x0064: "Equip L-Brace",
-        if(0x6e in completed_progression_states and not 0x82 in completed_progression_states):
-            if(ctx.slot_data["quest_item_sanity"] == True):
-                if(item_name_to_id["Manual"] in received_list):
-                    return 0x6e, "" #0x006e: "Agree to help the mayor with Steamwood",
-                elif(old_progression_state == 0x6e):
-                    return 0xa, "" #0x000a: "zipline down gondola",
-            else:
-                return 0x6e, "" #0x006e: "Agree to help the mayor with Steamwood",
-        #0x006e: "Agree to help the mayor with Steamwood",
-        #0x0078: "Talk to Fores and start the Steamwood event",
-        #0x0082: "Fix Steamwood",
-        #0x044c: "Get the Wind Scroll",
-        if(progression_flags[17][6] & 0b1000 == 0b1000 and 0x294 in completed_progression_states and not 0x492 in completed_progression_states and not 0x47e in completed_progression_states and (ctx.slot_data["playthrough_method"] == 2 or 0x03c0 in completed_progression_states)):
-            if(item_name_to_id["CarpentA"] in received_list and item_name_to_id["CarpentB"] in received_list and item_name_to_id["CarpentC"] in received_list and (item_name_to_id["Gondola Gizmo"] in received_list or (ctx.slot_data["quest_item_sanity"] == False and item_name_to_id["Bracelet"] in received_list))):
-                return 0x460, "" #0x0460: "break your own bincho field",
-        if(0x492 in completed_progression_states and old_progression_state < 0x492):
-            return 0x492, "" #0x0492: "GiAnt breaks open entrance to Upper Mines",
-        if(not 0x492 in completed_progression_states and old_progression_state >= 0x492):
-            return 0x1e, "" #0x001e: "Talk to the mayor after rescuing Leno",
-        #0x0460: "break your own bincho field",
-        #0x047e: "See the mutant ant at the mountain entrance",
-        #0x0488: "hop on gondola to squish ant",
-        #0x0492: "GiAnt breaks open entrance to Upper Mines",
-        #0x04b0: "Defeat Queen Ant",
-    if(loc_id in [0x2013, 0x2055, 0x207a, 0x2097] and ctx.slot_data["playthrough_method"] == 2): #toy shop
-        return 0x4b0, "" #0x0514: "Defeat Ben", 0x04b0: "Defeat Queen Ant",
-    #0x2013: "Chapter 2 Toy Shop", 
-	#0x2055: "Chapter 3 Toy Shop", 
-	#0x207a: "Chapter 4 Toy Shop", 
-    #0x2097: "Chapter 5/6 Toy Shop", 
-    if(loc_id in [0x2015, 0x2056, 0x207b, 0x2098]): #"Chapter 2-6 Bakery", 
-        if(ctx.slot_data["bakery_sanity"] == False):
-            if(len({0xc8, 0x258, 0x384, 0x4b0} & completed_progression_states) > 1):
-                if(old_progression_state < 0x258):
-                    return 0x258, "" #0x0258: "Acquire your second crest",
-            else:
-                if(old_progression_state >= 0x258):
-                    return 0xa, "" #0x000a: "zipline down gondola",
-    #0x2015: "Chapter 2 Bakery", 
-	#0x2056: "Chapter 3 Bakery", 
-	#0x207b: "Chapter 4 Bakery", #two bosses killed
-	#0x2098: "Chapter 5/6 Bakery", 
-    if(loc_id in [0x2016, 0x2057, 0x207c, 0x2099]): #"Chapter 2-6 Grocery", 
-        if(old_progression_state == 0x122):
-            if(not 0x122 in completed_progression_states):
-                return 0, ""
-            return 0x12c, ""
-        if(old_progression_state == 0x118):
-            if(not 0x122 in completed_progression_states):
-                return 0x122, ""
-            return 0x12c, ""
-        #if(old_progression_state in [0x118, 0x122]):
-        #    return 0
-        if(ctx.slot_data["grocery_sanity"] == False):
-            if(len({0xc8, 0x258, 0x384, 0x4b0} & completed_progression_states) > 1):
-                if(old_progression_state < 0x258):
-                    return 0x258, "" #0x0258: "Acquire your second crest",
-            else:
-                if(old_progression_state >= 0x258):
-                    return 0x12c, "" #0x012c: "Tim became a Vambee/ Tim is Saved",
-	#0x2057: "Chapter 3 Grocery", 
-	#0x207c: "Chapter 4 Grocery",#two bosses killed
-	#0x2099: "Chapter 5/6 Grocery", 
-    if(loc_id in [0x201a, 0x205b, 0x2080, 0x209d]): #"Chapter 2-6 Restaurant", 
-        if((progression_flags[17][14] & 0b100000 == 0b100000 or progression_flags[17][14] & 0b1000000 == 0b1000000) and old_progression_state < 0x140): #talk to wanda and macho
-            return 0x258, "" #0x0258: "Acquire your second crest",
-        if(not (progression_flags[17][14] & 0b100000 == 0b100000 or progression_flags[17][14] & 0b1000000 == 0b1000000) and old_progression_state >= 0x140): #have not talked to wanda and macho
-            return 0xa, "" #0x000a: "zipline down gondola",
-	#0x205b: "Chapter 3 Restaurant", #check if tim was saved
-	#0x2080: "Chapter 4 Restaurant", 
-    #0x209d: "Chapter 5/6 Restaurant"
-
-    return 0, ""
-
-def calc_completed_progression_state(ctx: "BizHawkClientContext", progression_flags: List[List[bytes]]) -> Set[int]:
-    val = set()
-    if(progression_flags[17][11] & 0b10 == 0b10): # or progression_flags[17][16] & 0b1000 == 0b1000):
-        val.add(0x0014)#: "Rescue Leno",
-    if(progression_flags[17][11] & 0b11 == 0b11):
-        val.add(0x001e)#: "Talk to the mayor after rescuing Leno",
-    if(progression_flags[17][11] & 0b1000 == 0b1000):
-        val.add(0x0028)#: "Jon asks for food and water",
-    if(progression_flags[17][11] & 0b100000 == 0b100000):
-        val.add(0x0032)#: "Feed Jon",
-    if(progression_flags[17][11] & 0b1000000 == 0b1000000):
-        val.add(0x003c)#: "Find Jon's Key",
-    if(progression_flags[17][11] & 0b10000000 == 0b10000000):
-        val.add(0x0046)#: "Free Jon",
-    if(progression_flags[17][1] & 0b1000000 == 0b1000000):
-        val.add(0x0050)#: "Give Jon the 4 trees and understand about the five scrolls",
-        #val.add(0x005a)#: "Find Bracelet",
-    if(progression_flags[26][1] & 0b10000000 == 0b10000000):
-        val.add(0x0064)#: "Equip L-Brace",
-    if(progression_flags[17][12] & 0b10000 == 0b10000):
-        val.add(0x006e)#: "Agree to help the mayor with Steamwood",
-    if(progression_flags[17][12] & 0b100000 == 0b100000):
-        val.add(0x0078)#: "Talk to Fores and start the Steamwood event",
-    if(progression_flags[17][12] & 0b1000000 == 0b1000000):
-        val.add(0x0082)#: "Fix Steamwood",
-    if(progression_flags[1][7] & 0b100000 == 0b100000):
-        val.add(0x0085)#: "Collect the Earth Scroll",
-    if(progression_flags[17][16] & 0b100 == 0b100):
-        val.add(0x0087)#: "Meet Jon after collecting Earth Scroll",
-    if(int.from_bytes(progression_flags[27], byteorder='little') > 3):
-        val.add(0x008c)#: "Talk to Geezer about opening hells valley",
-    if(int.from_bytes(progression_flags[27], byteorder='little') > 4):
-        val.add(0x0096)#: "have Geezer permission to face the Earth Crest Guardian",
-    if(progression_flags[17][13] & 0b1000 == 0b1000): #TODO check for something else for entrance rando
-        val.add(0x00a0)#: "Allies open the gate to Hell's Valley", 
-    if(progression_flags[17][13] & 0b1000 == 0b1000):
-        val.add(0x00c8)#: "Acquire your first crest",
-    #if(False): #TODO manually record when this happens Probably
-    #if(int.from_bytes(progression_flags[24], byteorder='little') >= 0xa7):
-        #val.add(0x00d2)#: "The Mayor says you can get the key to the coal mine with the man from the mill",
-    #if(False): #TODO manually record when this happens Probably
-    #if(int.from_bytes(progression_flags[24], byteorder='little') >= 0xa7):
-    if((ctx.slot_data["quest_item_sanity"] == True and (standard_location_name_to_id["Key from Wid - Grillin Village"] in ctx.checked_locations or standard_location_name_to_id["Key from Wid - Grillin Village"] + jp_id_offset in ctx.checked_locations)) or (ctx.slot_data["quest_item_sanity"] == False and (progression_flags[17][13] & 0b1000000 == 0b1000000 or 0x59 in progression_flags[19]))): #yuck
-        val.add(0x00d2)#: "The Mayor says you can get the key to the coal mine with the man from the mill",
-        val.add(0x00dc)#: "Acquire Mine's Key",
-    #if(False): #TODO manually record when this happens Probably
-    if((ctx.slot_data["quest_item_sanity"] == True and (standard_location_name_to_id["Misteria - Misteria Underground Lake"] in ctx.checked_locations or standard_location_name_to_id["Misteria - Misteria Underground Lake"] + jp_id_offset in ctx.checked_locations)) or (ctx.slot_data["quest_item_sanity"] == False and (progression_flags[17][14] & 0b1 == 0b1 or progression_flags[17][13] & 0b10000000 == 0b10000000 or 0x56 in progression_flags[19]))): #yuck
-        val.add(0x00e6)#: "Acquire Misteria Bloom",
-    if(progression_flags[17][14] & 0b1 == 0b1): #is this agreeing with mayor to find hotelo
-        val.add(0x00f0)#: "Give Misteria to Mayor and Mayor wonders if Hotelo is alright",
-        #val.add(0x00fa)#: "Meet Hotelo on Twinpeak Mountain and return to village instead",
-    if(progression_flags[17][16] & 0b10 == 0b10 or progression_flags[17][14] & 0b10 == 0b10): 
-        val.add(0x0104)#: "Meet Hotelo on Twinpeak Mountain and go after Aqualin",
-        val.add(0x010e)#: "Get Aqualin",
-        val.add(0x0118)#: "Give Aqualin to Hotelo",
-    #if(progression_flags[17][14] & 0b10 == 0b10): 
-    if(progression_flags[17][14] & 0b1000 == 0b1000): 
-        val.add(0x0122)#: "Talk to Tim after saving him",
-        val.add(0x012c)#: "Tim became a Vambee/ Tim is Saved",
-    if(progression_flags[17][14] & 0b100000 == 0b100000 or progression_flags[17][14] & 0b1000000 == 0b1000000): 
-        val.add(0x0136)#: "Talk to the drunk and discover you",
-        val.add(0x0140)#: "Wanda talks about the vambees' nest",
-    if(progression_flags[17][5] & 0b1000000 == 0b1000000): 
-        val.add(0x014a)#: "Meet the restaurant owner at the basement",
-    if(progression_flags[17][15] & 0b11110 == 0b11110): 
-        val.add(0x0172)#: "Open all blue eyes",
-    if((ctx.slot_data["quest_item_sanity"] == True and (standard_location_name_to_id["Ugly Belt - Restaurant Basement"] in ctx.checked_locations or standard_location_name_to_id["Ugly Belt - Restaurant Basement"] + jp_id_offset in ctx.checked_locations)) or (ctx.slot_data["quest_item_sanity"] == False and progression_flags[26][1] & 0b1000000 == 0b1000000)): #yuck
-        val.add(0x017c)#: "Get the Ugly Belt",
-    if(progression_flags[26][1] & 0b1000000 == 0b1000000):
-        val.add(0x0181)#: "Equip the L-Belt",
-        #val.add(0x0186)#: "The owner of the restaurant says he needs the rope", #TODO add manually?
-    if(progression_flags[20][0] & 0b10000000 == 0b10000000):
-        val.add(0x0186)#: "The owner of the restaurant says he needs the rope",
-        val.add(0x0190)#: "Something is happening at the church at 2 am",
-        val.add(0x019a)#: "Enter the church infested with vambees",
-        val.add(0x01a4)#: "Exit the church infested with vambees",
-        val.add(0x01ae)#: "The Father asks you to retrieve Church Bell",
-    if(progression_flags[1][7] & 0b1000000 == 0b1000000):
-        val.add(0x01cc)#: "Collected water scroll",
-    if(int.from_bytes(progression_flags[18], byteorder='little') == 0x1052):
-        val.add(0x01d1)#: "Interacting with the church bell (does not require talking to priest)",
-        val.add(0x01d6)#: "Give the Church Bell to the priest",
-        val.add(0x01e0)#: "Return the bell to the village",
-    if(progression_flags[4][17] & 0b10000000 == 0b10000000):
-        val.add(0x0258)#: "Acquire your second crest",
-    if(progression_flags[17][6] & 0b1 == 0b1): 
-        val.add(0x0276)#: "Fix the Village Well",
-    #if(progression_flags[17][16] & 0b100000 == 0b100000):
-    if((ctx.slot_data["quest_item_sanity"] == True and (standard_location_name_to_id["Mrs Govern's Pie - Grillin Village"] in ctx.checked_locations or standard_location_name_to_id["Mrs Govern's Pie - Grillin Village"] + jp_id_offset in ctx.checked_locations)) or (ctx.slot_data["quest_item_sanity"] == False and progression_flags[17][16] & 0b100000 == 0b100000 and progression_flags[17][6] & 0b1 == 0b1 and ctx.slot_data["playthrough_method"] == 2)):
-        val.add(0x0280)#: "The mayor's wife asks you to fix the Gondola Gizmo",
-    if(int.from_bytes(progression_flags[27], byteorder='little') > 6):
-        val.add(0x028a)#: "Carpenters inform you of the appearance of the item needed to fix the Gondola Gizmo",
-    #if(int.from_bytes(progression_flags[27], byteorder='little') == 8):
-        #val.add(0x0294)#: "Deliver the Gizmo Gondola",
-    #if(False): #TODO manually record when this happens Probably
-    if((ctx.slot_data["quest_item_sanity"] == True and (standard_location_name_to_id["Reward #1 After Extinguishing Village - Grillin Village"] in ctx.checked_locations or standard_location_name_to_id["Reward #1 After Extinguishing Village - Grillin Village"] + jp_id_offset in ctx.checked_locations))):
-        val.add(0x0294)#: "Deliver the Gizmo Gondola",
-        val.add(0x029e)#: "A fire starts in the village",
-        val.add(0x02a8)#: "Put out fire",
-        val.add(0x02b2)#: "Mrs. Govern thanks you and tells musashi about the thieves",
-        val.add(0x02bc)#: "Get the calendar and rock salt",
-    if(progression_flags[1][7] & 0b10000000 == 0b10000000):
-        val.add(0x02c6)#: "Use salt on the slug",
-        val.add(0x02d0)#: "collect the fire scroll",
-    #if(False): #TODO manually record when this happens Probably
-        val.add(0x02da)#: "Save the princess",
-        #val.add(0x02e4)#: "Rescue princess Filet and take her to the castle",
-    if(int.from_bytes(progression_flags[27], byteorder='little') > 9):
-        val.add(0x02ee)#: "The mercenaries give you the location",
-    if(progression_flags[17][17] & 0b10000000 == 0b10000000): 
-        val.add(0x02f0)#: "Reach the frost palace gate for the first time",
-    if(progression_flags[17][7] & 0b10000000 == 0b10000000): 
-        val.add(0x02f8)#: "Meet Gingerelle",
-    if(progression_flags[17][9] & 0b10000000 == 0b10000000): #enter room past boss door
-        val.add(0x0302)#: "Melt boss door",
-        val.add(0x030c)#: "Open and enter the big gate of the 3 eyes in the ice palace",
-    if(progression_flags[4][23] & 0b10000000 == 0b10000000):
-        val.add(0x0384)#: "Defeat Frost Dragon",
-    if(progression_flags[17][2] & 0b10 == 0b10): 
-        val.add(0x0398)#: "Complete 4 chapter",
-    if(False): #TODO manually record when this happens Probably
-        val.add(0x03a2)#: "Start 5 chapter mayor says to visit shops",
-        val.add(0x03ac)#: "Talk to a shop about the missing profits",
-    #if(int.from_bytes(progression_flags[27], byteorder='little') > 10):
-        #val.add(0x03b6)#: "The princess disappeared and took the village profits with her",
-    if(False): #TODO manually record when this happens Probably
-        val.add(0x03c0)#: "go down fixed gondola",
-    if(progression_flags[17][6] & 0b100000 == 0b100000): 
-        val.add(0x03ca)#: "Receive Handle 0",
-    if(progression_flags[4][27] & 0b10000000 == 0b10000000): #Topo action figure
-        val.add(0x03d4)#: "Pick up Profits",
-    if(progression_flags[28][0] & 0b10 == 0b10 or progression_flags[4][27] & 0b10000000 == 0b10000000):
-        val.add(0x03e8)#: "Give back the profits",
-        val.add(0x03f2)#: "Finish the events of the second Steamwood",
-    if(progression_flags[1][8] & 0b1 == 0b1):
-        val.add(0x044c)#: "Get the Wind Scroll",
-        val.add(0x0460)#: "break your own bincho field",
-    #if(False): #TODO manually record when this happens Probably
-    if(progression_flags[17][21] & 0b10000000 == 0b10000000): #clear poison mist, probably want to track manually as well
-        val.add(0x047e)#: "See the mutant ant at the mountain entrance",
-        val.add(0x0488)#: "hop on gondola to squish ant",
-        val.add(0x0492)#: "GiAnt breaks open entrance to Upper Mines",
-    if(progression_flags[4][29] & 0b10000000 == 0b10000000):
-        val.add(0x04b0)#: "Defeat Queen Ant",
-    return val
+            for segment, last in self.last.items():
+                if(progression_flags[segment] != last):
+                    self.last[segment] = bytes(progression_flags[segment])
+                    self.segment_states[segment] = self.table.evaluate_segment(segment, progression_flags)
+            self.incremental_updates += 1
+        val = 0
+        for states in self.segment_states.values():
+            val |= states
+        return self.table.finish(ctx, progression_flags, val)
+
+def calc_completed_progression_state(ctx: "BizHawkClientContext", progression_flags: List[bytes], as_mask: bool = False) -> Union[Set[int], int]:
+    """The progression states the game flags show as done, as a mask of progression_state_bit when as_mask is set"""
+    mask = completed_progression_table.evaluate(ctx, progression_flags)
+    if(as_mask):
+        return mask
+    return progression_states_in(mask)
@@ -0,0 +1,144 @@
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Sequence, Set, Tuple
+
+from .locations import jp_id_offset
+from .received_items import ReceivedItemIndex
+
+TRACE_VERSION = 1
+
+
+class TraceTick(NamedTuple):
+    """Everything calc_connections reads on one connection recalculation"""
+    location: int
+    progression_state: int
+    game_state: List[bytes]
+    received: List[int] #ids of every received item so far, as in ctx.items_received
+    checked: Set[int]
+    manual: Set[int] #manually checked progression states
+
+
+class TraceWriter:
+    """Writes a trace as json lines, a header with the slot data and then one line per recalculation holding only
+    the segments, items, locations and manual states that changed since the line before"""
+
+    def __init__(self, file: IO[str], slot_data: dict):
+        self.file = file
+        self.last_segments: List[bytes] = []
+        self.received = 0
+        self.checked: Set[int] = set()
+        self.manual: Set[int] = set()
+        self.ticks = 0
+        self.file.write(json.dumps({"version": TRACE_VERSION, "slot_data": slot_data}) + "\n")
+
+    def record(self, location: int, progression_state: int, game_state: Sequence[bytes], received: Sequence[int], checked: Set[int], manual: Set[int]) -> None:
+        segments = {}
+        for i, segment in enumerate(game_state):
+            if(i >= len(self.last_segments) or segment != self.last_segments[i]):
+                segments[i] = bytes(segment).hex()
+        self.last_segments = [bytes(segment) for segment in game_state]
+        line: Dict[str, Any] = {"location": location, "state": progression_state, "segments": segments}
+        if(len(received) != self.received):
+            line["received"] = list(received[self.received:])
+            self.received = len(received)
+        if(checked != self.checked):
+            line["checked"] = sorted(checked - self.checked)
+            self.checked = set(checked)
+        if(manual != self.manual):
+            line["manual"] = sorted(manual)
+            self.manual = set(manual)
+        self.file.write(json.dumps(line) + "\n")
+        self.ticks += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def read_trace(lines: Iterator[str]) -> Tuple[dict, List[TraceTick]]:
+    """The slot data and the full inputs of every recalculation of a trace written by TraceWriter"""
+    header = json.loads(next(lines))
+    if(header.get("version") != TRACE_VERSION):
+        raise ValueError("unsupported trace version %s" % header.get("version"))
+    game_state: List[bytes] = []
+    received: List[int] = []
+    checked: Set[int] = set()
+    manual: Set[int] = set()
+    ticks = []
+    for line in lines:
+        if(line.strip() == ""):
+            continue
+        data = json.loads(line)
+        for i, segment in data["segments"].items():
+            i = int(i)
+            game_state.extend([b""] * (i + 1 - len(game_state)))
+            game_state[i] = bytes.fromhex(segment)
+        received = received + data.get("received", [])
+        checked = checked | set(data.get("checked", []))
+        manual = set(data.get("manual", manual))
+        ticks.append(TraceTick(data["location"], data["state"], list(game_state), received, checked, manual))
+    return header["slot_data"], ticks
+
+
+def connections_output(destinations: List[int], progression_states: List[int], fix_town_id: List[Tuple[int, Any, str]]) -> dict:
+    """What a recalculation writes to RAM, in the form stored in golden files"""
+    return {"destinations": list(destinations), "states": list(progression_states), "writes": [[address, list(data)] for address, data, _ in fix_town_id]}
+
+
+class ReplayResult(NamedTuple):
+    outputs: List[dict]
+    latencies: Dict[int, List[float]] #location: seconds per recalculation
+    total: float
+
+
+def replay(client: Any, slot_data: dict, ticks: List[TraceTick]) -> ReplayResult:
+    """Feeds a trace through client.calc_connections, client is a fresh BFMClient"""
+    from .address_map import AddressMap
+    from .debug_trace import DebugTrace
+    from .progression_state import CompletedProgressionTracker, ProgressionDecisionCache
+    ctx = SimpleNamespace(slot_data=slot_data, checked_locations=set(), items_received=[])
+    client.message_level = 0
+    client.jp_version = slot_data["set_lang"] - 1
+    client.address = AddressMap(client.jp_version == 1)
+    client.hint_dictionary = {}
+    client.completed_progression = set()
+    client.completed_progression_mask = 0
+    client.manually_checked_progression = set()
+    client.save_manual_progression = False
+    client.progression_cache = ProgressionDecisionCache()
+    client.completed_tracker = CompletedProgressionTracker()
+    client.debug_trace = DebugTrace()
+    received_list = ReceivedItemIndex()
+    outputs = []
+    latencies: Dict[int, List[float]] = {}
+    total = 0.0
+    for tick in ticks:
+        ctx.checked_locations = tick.checked
+        ctx.items_received = [(item_id, 0, 0, 0) for item_id in tick.received]
+        client.manually_checked_progression = set(tick.manual)
+        client.progression_state = tick.progression_state
+        game_state = [memoryview(segment) for segment in tick.game_state]
+        start = time.perf_counter()
+        received_list.sync(ctx.items_received, (slot_data["set_lang"] - 1) * jp_id_offset)
+        destinations, progression_states, fix_town_id = client.calc_connections(ctx, tick.location, game_state, received_list)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        latencies.setdefault(tick.location, []).append(elapsed)
+        outputs.append(connections_output(destinations, progression_states, fix_town_id))
+    return ReplayResult(outputs, latencies, total)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def diff_outputs(golden: List[dict], outputs: List[dict]) -> List[str]:
+    """One line per recalculation whose output differs from the golden file"""
+    differences = []
+    if(len(golden) != len(outputs)):
+        differences.append("%s recalculations, golden has %s" % (len(outputs), len(golden)))
+    for i, (expected, actual) in enumerate(zip(golden, outputs)):
+        if(expected != actual):
+            differences.append("tick %s: expected %s got %s" % (i, expected, actual))
+    return differences
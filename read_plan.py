@@ -0,0 +1,63 @@
+from bisect import bisect_right
+from typing import Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+MAIN_RAM: str = "MainRAM"
+
+
+class PlannedRead(NamedTuple):
+    key: Hashable
+    address: int
+    size: int
+
+
+class ReadPlan:
+    """Collects every RAM range the client needs for one tick and fetches them with a single bizhawk.read.
+    Overlapping and adjacent ranges are merged into one block, each key gets a memoryview slice of its block."""
+
+    def __init__(self, domain: str = MAIN_RAM):
+        self.domain = domain
+        self.reads: List[PlannedRead] = []
+        self.views: Dict[Hashable, memoryview] = {}
+        self.block_starts: List[int] = []
+        self.blocks: List[memoryview] = []
+
+    def add(self, key: Hashable, address: int, size: int) -> None:
+        self.reads.append(PlannedRead(key, address, size))
+
+    def add_segments(self, first_key: int, segments: List[Tuple[int, int, str]]) -> None:
+        # takes the (address, size, domain) tables from quest_items, store_info and stats as is
+        for i, (address, size, _) in enumerate(segments):
+            self.add(first_key + i, address, size)
+
+    def merged_ranges(self) -> List[Tuple[int, int]]:
+        ranges: List[List[int]] = []
+        for address, end in sorted((read.address, read.address + read.size) for read in self.reads):
+            if(len(ranges) > 0 and address <= ranges[-1][1]):
+                if(end > ranges[-1][1]):
+                    ranges[-1][1] = end
+            else:
+                ranges.append([address, end])
+        return [(start, end - start) for start, end in ranges]
+
+    async def execute(self, read: Callable[[List[Tuple[int, int, str]]], Awaitable[List[bytes]]]) -> Dict[Hashable, memoryview]:
+        ranges = self.merged_ranges()
+        data = await read([(address, size, self.domain) for address, size in ranges])
+        self.block_starts = [address for address, _ in ranges]
+        self.blocks = [memoryview(block) for block in data]
+        self.views = {}
+        for read_request in self.reads:
+            self.views[read_request.key] = self.lookup(read_request.address, read_request.size)
+        return self.views
+
+    def get(self, key: Hashable) -> Optional[memoryview]:
+        return self.views.get(key)
+
+    def lookup(self, address: int, size: int) -> Optional[memoryview]:
+        """Returns the already fetched bytes for a range, or None if the range was not part of the plan"""
+        i = bisect_right(self.block_starts, address) - 1
+        if(i < 0):
+            return None
+        offset = address - self.block_starts[i]
+        if(offset + size > len(self.blocks[i])):
+            return None
+        return self.blocks[i][offset:offset + size]
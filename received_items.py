@@ -0,0 +1,64 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterator, List, Sequence
+
+from .items import item_bit
+
+
+class ReceivedItemIndex:
+    """The ids of the received items with the language offset removed, extended as ReceivedItems packages arrive
+    instead of being rebuilt every tick. Answers `in` and count in constant time and how many copies were among the
+    first n items with a binary search, it can be passed anywhere a received_list is expected.
+    bits has the item_bit of every received item set, so a group of items can be tested with one mask.
+    version changes whenever the indexed items do, so results computed from them can be cached."""
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self.counts: Counter = Counter()
+        self.positions: Dict[int, List[int]] = {} #item id: indices in ctx.items_received
+        self.offset = 0
+        self.bits = 0
+        self.version = 0
+
+    def sync(self, items_received: Sequence, offset: int = 0) -> None:
+        """Indexes the items not seen yet, starts over if the offset changed or the server resent the list"""
+        if(offset != self.offset or len(items_received) < len(self.ids)):
+            self.clear()
+            self.offset = offset
+        if(len(items_received) > len(self.ids)):
+            self.version += 1
+        for index in range(len(self.ids), len(items_received)):
+            item_id = items_received[index][0] - offset
+            self.ids.append(item_id)
+            self.counts[item_id] += 1
+            self.positions.setdefault(item_id, []).append(index)
+            self.bits |= item_bit.get(item_id, 0)
+
+    def clear(self) -> None:
+        self.ids = []
+        self.counts = Counter()
+        self.positions = {}
+        self.bits = 0
+        self.version += 1
+
+    def has(self, item_id: int) -> bool:
+        return self.counts.get(item_id, 0) > 0
+
+    def has_all(self, mask: int) -> bool:
+        return self.bits & mask == mask
+
+    def count(self, item_id: int) -> int:
+        return self.counts.get(item_id, 0)
+
+    def count_before(self, item_id: int, n: int) -> int:
+        """Copies of item_id among the first n received items"""
+        return bisect_left(self.positions.get(item_id, []), n)
+
+    def __contains__(self, item_id: int) -> bool:
+        return self.has(item_id)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids)
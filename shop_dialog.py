@@ -0,0 +1,67 @@
+from typing import List, Optional, Tuple
+
+from .jp_text import jp_encoder, PAD
+
+PURCHASED: Tuple[str, str] = ("Purchased", "かいもの") #en, jp
+DIALOG_SIZE = 48 #bytes the shop textbox has room for, including the 0 that ends the text
+
+
+class ShopDialog:
+    """The item and player name columns of a bakery, restaurant or grocery screen. Each column is padded to its widest
+    entry so the names line up, as the rows already padded keep it wide a column only narrows when its one row changes.
+    The bytes written for a row are kept until its item or the width of a column changes"""
+
+    def __init__(self):
+        self.items: List[str] = []
+        self.players: List[str] = []
+        self.item_width = 0
+        self.player_width = 0
+        self.blobs: List[Optional[Tuple[bool, bytes]]] = [] #jp_version and bytes of each rendered row
+        self.rendered = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: str, player: str) -> None:
+        self.items.append(item)
+        self.players.append(player)
+        self.blobs.append(None)
+        self.widen(item, player)
+
+    def set_item(self, row: int, item: str) -> None:
+        self.items[row] = item
+        self.blobs[row] = None
+        if(len(self.items) == 1):
+            #no other row is padded to the column, it is as wide as the new item
+            self.item_width = 0
+            self.blobs = [None]
+        self.widen(item, "")
+
+    def purchased(self, row: int) -> bool:
+        return self.items[row] in PURCHASED
+
+    def widen(self, item: str, player: str) -> None:
+        if(len(item) > self.item_width or len(player) > self.player_width):
+            self.item_width = max(self.item_width, len(item))
+            self.player_width = max(self.player_width, len(player))
+            self.blobs = [None] * len(self.blobs) #every row is padded again
+
+    def row(self, row: int, jp_version: bool) -> bytearray:
+        """What is written to the shop textbox while the cursor is on row"""
+        blob = self.blobs[row]
+        if(blob is None or blob[0] != jp_version):
+            blob = (jp_version, self.render(row, jp_version))
+            self.blobs[row] = blob
+        return bytearray(blob[1])
+
+    def render(self, row: int, jp_version: bool) -> bytes:
+        self.rendered += 1
+        item = self.items[row].ljust(self.item_width)
+        player = self.players[row].ljust(self.player_width)
+        if(jp_version == False):
+            result = b"\x01\x02" + item.encode("utf-8") + b"\x01\x01\x0afor " + player.encode("utf-8") + b"\x00"
+        else:
+            result = b"\x01\x02" + jp_encoder.encode(item, PAD) + b"\x01\x01\x0a" + jp_encoder.encode(player, PAD) + b"\x00"
+        if(len(result) > DIALOG_SIZE):
+            result = result[:DIALOG_SIZE - 1] + b"\x00"
+        return result
@@ -0,0 +1,96 @@
+"""Micro-benchmark of the area-entry dispatch in game_watcher.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_area_dispatch"""
+import timeit
+from typing import List
+
+from ..client import area_entry_handlers, conners_bracelet_fix
+from ..dialog_locations import dialog_location_table, scroll_dialog, boss_core_dialog, quest_item_dialog
+from ..portals import bfm_portals
+from ..store_info import bakery_locations, restaurant_locations, grocery_locations, toy_shop_locations
+
+
+def chained_dispatch(curr_location: int) -> List[str]:
+    """The area checks game_watcher evaluated on every area entry before the registry, in the same order"""
+    handlers = []
+    if(curr_location in dialog_location_table):
+        handlers.append("enter_dialog_area")
+    handlers.append("remove_twinpeak_rock")
+    if(curr_location in scroll_dialog):
+        handlers.append("enter_scroll_area")
+    if(curr_location in bakery_locations):
+        handlers.append("enter_bakery")
+    if(curr_location in restaurant_locations):
+        handlers.append("enter_restaurant")
+    if(curr_location in grocery_locations):
+        handlers.append("enter_grocery")
+    if(curr_location in toy_shop_locations):
+        handlers.append("enter_toy_shop")
+    if(curr_location == 0x3003):
+        handlers.append("enter_geezer")
+    if(curr_location == 0x1011):
+        handlers.append("enter_upper_town")
+    if(curr_location in boss_core_dialog):
+        handlers.append("enter_boss")
+    if(curr_location == 0x3072):
+        handlers.append("enter_ant_gondola")
+    if(curr_location == 0x304e):
+        handlers.append("enter_well")
+    if(curr_location == 0x1052 or curr_location == 0x1077):
+        handlers.append("enter_town_chapter_3_4")
+    if(curr_location == 0x3023):
+        handlers.append("enter_volcano")
+    if(curr_location == 0x301b):
+        handlers.append("enter_meandering_forest_leno")
+    if(curr_location == 0x3014):
+        handlers.append("enter_somnolent_forest")
+    if(curr_location == 0x302a):
+        handlers.append("enter_rafting")
+    if(curr_location == 0x1010 or curr_location == 0x1011 or curr_location == 0x301c or curr_location == 0x301d or curr_location == 0x301e or curr_location == 0x3020):
+        handlers.append("enter_steamwood_timer_area")
+    if(curr_location == 0x301d or curr_location == 0x3020):
+        handlers.append("enter_steamwood")
+    if(curr_location == 0x302c or curr_location == 0x3029):
+        handlers.append("enter_twinpeak_aqualin")
+    if(curr_location == 0x3032 or curr_location == 0x3033):
+        handlers.append("enter_teleport_maze")
+    if(curr_location == 0x3051):
+        handlers.append("enter_church")
+    if(curr_location == 0x3000):
+        handlers.append("enter_path_to_castle")
+    if(curr_location == 0x301b):
+        handlers.append("enter_meandering_forest")
+    if(curr_location == 0x3090):
+        handlers.append("enter_ben_fight")
+    if(curr_location == 0x3093):
+        handlers.append("enter_sky_island")
+    if(curr_location == 0x3088):
+        handlers.append("enter_ed_fight")
+    if(curr_location == 0x308d):
+        handlers.append("enter_topo_fight")
+    if(curr_location in [0x1010, 0x1052, 0x1077, 0x1094] or curr_location in [0x1010, 0x1077, 0x1094] or curr_location == 0x3022 or curr_location == 0x3029
+       or curr_location == 0x1052 or curr_location == 0x3047 or curr_location == 0x2057 or curr_location == 0x3034 or curr_location == 0x304b
+       or curr_location == 0x1077 or curr_location == 0x301e or curr_location == 0x3020 or curr_location == 0x1094 or curr_location == 0x3014
+       or curr_location in [0x1052, 0x1077, 0x1094] or curr_location in quest_item_dialog):
+        handlers.append("enter_quest_item_area")
+    if(curr_location == 0x2018 or curr_location == 0x2059 or curr_location == 0x207e or curr_location == 0x209b):
+        handlers.append("enter_conners")
+    if(curr_location == 0x3029):
+        handlers.append("enter_twinpeak_second_peak")
+    return handlers
+
+
+def registry_dispatch(curr_location: int) -> List[str]:
+    return [handler.__name__ for handler in area_entry_handlers.handlers_for(curr_location)]
+
+
+if __name__ == "__main__":
+    areas = sorted(set(bfm_portals) | set(conners_bracelet_fix))
+    for area in areas:
+        assert chained_dispatch(area) == registry_dispatch(area), hex(area)
+    runs = 200
+    before = timeit.timeit(lambda: [chained_dispatch(area) for area in areas], number=runs)
+    after = timeit.timeit(lambda: [registry_dispatch(area) for area in areas], number=runs)
+    entries = runs * len(areas)
+    print(f"{len(areas)} areas, {entries} area entries")
+    print(f"chained checks: {before / entries * 1e6:.2f} us per area entry")
+    print(f"registry:       {after / entries * 1e6:.2f} us per area entry ({before / after:.1f}x)")
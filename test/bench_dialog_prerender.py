@@ -0,0 +1,68 @@
+"""Benchmark of the time from entering an area to its location dialog being written, with the textboxes rendered on
+area entry and with them rendered in the background when the scout results arrived.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_dialog_prerender"""
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import List
+
+from NetUtils import NetworkItem
+
+from ..client import BFMClient
+from ..dialog_cache import scouted_textboxes
+from ..dialog_locations import dialog_location_table, scroll_dialog, boss_core_dialog
+from ..items import item_table, item_name_to_id
+from ..received_items import ReceivedItemIndex
+from .fake_client import FakeRAM, make_client
+
+ROUNDS = 50
+
+
+def make_ctx(jp_version: bool):
+    names = list(item_table)
+    loc_ids = [loc_id for loc_id, _, _ in scouted_textboxes(jp_version, 0)]
+    slot_data = {"set_lang": 1, "scroll_sanity": True, "core_sanity": True, "quest_item_sanity": True}
+    return SimpleNamespace(
+        slot_data=slot_data,
+        username="Musashi",
+        player_names={1: "Musashi", 2: "Another Player"},
+        locations_info={loc_id: NetworkItem(item_name_to_id[names[i % len(names)]], loc_id, 1 + i % 2, 0) for i, loc_id in enumerate(loc_ids)},
+        item_names=SimpleNamespace(lookup_in_slot=lambda item, player: names[item % len(names)]),
+    )
+
+
+async def enter_areas(client: BFMClient, ram: FakeRAM, ctx) -> List[float]:
+    """The time each area entry took until its last dialog write"""
+    entries = [(area, client.enter_dialog_area) for area in dialog_location_table] + \
+        [(area, client.enter_scroll_area) for area in scroll_dialog] + \
+        [(area, client.enter_boss) for area in boss_core_dialog]
+    latencies = []
+    for area, handler in entries:
+        start = time.perf_counter()
+        await handler(ctx, area, [], ReceivedItemIndex())
+        latencies.append(ram.last_write - start)
+    return latencies
+
+
+async def main() -> None:
+    ctx = make_ctx(False)
+    lazy: List[float] = []
+    prerendered: List[float] = []
+    prerender_time = 0.0
+    for _ in range(ROUNDS):
+        #before: the first entry of each area renders its textboxes
+        client, ram = make_client(False)
+        lazy += await enter_areas(client, ram, ctx)
+        #after: rendered when the LocationInfo reply came in
+        client, ram = make_client(False)
+        start = time.perf_counter()
+        rendered = await client.prerender_dialog(ctx)
+        prerender_time += time.perf_counter() - start
+        prerendered += await enter_areas(client, ram, ctx)
+    print(f"{len(lazy) // ROUNDS} area entries, {rendered} textboxes prerendered in {prerender_time / ROUNDS * 1000:.2f} ms")
+    print(f"rendered on entry: {sum(lazy) / len(lazy) * 1e6:7.1f} us average from area entry to dialog written")
+    print(f"prerendered:       {sum(prerendered) / len(prerendered) * 1e6:7.1f} us average from area entry to dialog written")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""Benchmark of encoding every japanese item name, as on area entries, shop visits and boss textboxes.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_jp_text"""
+import time
+from typing import List
+
+from ..items import jp_item_name_to_id
+from ..jp_encoding import jp_encoding
+from ..jp_text import JPEncoder, encode_uncached, STOP, PAD
+
+ROUNDS = 200
+
+
+def encode_per_character(s1: str, shop: bool) -> bytes:
+    #encode_jp and encode_jp_shop before the translation table
+    result: List[int] = []
+    count = 0
+    for character in s1:
+        if(character in jp_encoding):
+            result.append(jp_encoding[character])
+        elif(shop and count > 2):
+            result.append(jp_encoding[" "])
+        else:
+            count = count + 1
+            result.append(jp_encoding["？"])
+        if(not shop and count > 2):
+            break
+    encoded = bytearray()
+    for code in result:
+        encoded.extend(code.to_bytes(2 if code > 0xff else 1, "little"))
+    return bytes(encoded)
+
+
+def timed(encode) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for name in jp_item_name_to_id:
+            encode(name, STOP)
+            encode(name, PAD)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    names = list(jp_item_name_to_id)
+    calls = ROUNDS * len(names) * 2
+    same = all(encode_uncached(name, STOP) == encode_per_character(name, False) and
+               encode_uncached(name, PAD) == encode_per_character(name, True) for name in names)
+    per_character = timed(lambda name, policy: encode_per_character(name, policy == PAD))
+    table = timed(encode_uncached)
+    encoder = JPEncoder()
+    cached = timed(encoder.encode)
+    print(f"{len(names)} names, {calls} encodes, same bytes: {same}")
+    for label, elapsed in (("per character", per_character), ("translate", table), ("cached", cached)):
+        print(f"{label:14} {elapsed * 1000:8.1f} ms  {elapsed / calls * 1e6:6.2f} us per name")
+    print(f"cache: {encoder.hits} hits, {encoder.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark of calc_progression_state over every area in bfm_portals with a 300 item received list.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_progression_state"""
+import random
+import timeit
+from types import SimpleNamespace
+
+from NetUtils import NetworkItem
+
+from ..items import item_name_to_id, item_table
+from ..portals import bfm_portals
+from ..progression_state import calc_progression_state, progression_state_table, HELLS_VALLEY_ALLIES, ProgressionDecisionCache
+from ..received_items import ReceivedItemIndex
+
+RECEIVED = 300
+
+
+def main() -> None:
+    random.seed(0)
+    ids = [item_name_to_id[name] for name in item_table]
+    items = [random.choice(ids) for _ in range(RECEIVED)]
+    received_list = list(items)
+    received_index = ReceivedItemIndex()
+    received_index.sync([NetworkItem(item_id, 0, 1, 0) for item_id in items])
+
+    slot_data = {"bakery_sanity": True, "grocery_sanity": True, "grocery_sanity_heal_logic": True, "lumina_randomzied": True, "playthrough_method": 2,
+                 "quest_item_sanity": True, "scroll_sanity": True, "skip_minigame_town_on_fire": False, "sky_scroll_logic": 2, "wind_scroll_logic": 2}
+    ctx = SimpleNamespace(slot_data=slot_data, checked_locations=set())
+    game_state = [bytes(0x100) for _ in range(30)]
+    states = sorted(progression_state_table)
+    calls = [(loc_id, random.choice(states), set(random.sample(states, len(states) // 2))) for loc_id in bfm_portals]
+
+    runs = 20
+    total = timeit.timeit(lambda: [calc_progression_state(ctx, loc_id, state, game_state, completed, received_index) for loc_id, state, completed in calls], number=runs)
+    print(f"{len(calls)} areas, {len(received_index)} received items")
+    print(f"calc_progression_state: {total / (runs * len(calls)) * 1e6:.2f} us per area")
+
+    # a Grillin Village load where nothing changed since the last one, the connections are decided again
+    village = [connection.destination for connection in bfm_portals[0x1010].connections if connection.destination in bfm_portals]
+    completed = set(random.sample(states, len(states) // 2))
+    cache = ProgressionDecisionCache()
+    def recalculate_cached() -> None:
+        cache.sync(ctx, game_state, completed, received_index)
+        for dest in village:
+            cache.explain(ctx, dest, 0x258, game_state, completed, received_index)
+    loads = 2000
+    uncached = timeit.timeit(lambda: [calc_progression_state(ctx, dest, 0x258, game_state, completed, received_index) for dest in village], number=loads)
+    cached = timeit.timeit(recalculate_cached, number=loads)
+    print(f"village load, {len(village)} connections: {uncached / loads * 1e6:.2f} us uncached, {cached / loads * 1e6:.2f} us cached ({cache.hits} hits, {cache.misses} misses)")
+
+    # the four ally check that guards several areas, as list scans and as one mask
+    allies = [item_name_to_id[name] for name in ["CarpentA", "MercenC", "SoldierA", "KnightB"]]
+    checks = 20000
+    scans = timeit.timeit(lambda: all(item_id in received_list for item_id in allies), number=checks)
+    mask = timeit.timeit(lambda: received_index.has_all(HELLS_VALLEY_ALLIES), number=checks)
+    assert all(item_id in received_list for item_id in allies) == received_index.has_all(HELLS_VALLEY_ALLIES)
+    print(f"ally check, list scans: {scans / checks * 1e6:.3f} us")
+    print(f"ally check, bitset:     {mask / checks * 1e6:.3f} us ({scans / mask:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
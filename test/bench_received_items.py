@@ -0,0 +1,43 @@
+"""Benchmark of applying a synthetic 500 item backlog, as after reconnecting to a long async.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_received_items"""
+import asyncio
+import random
+import time
+
+from ..items import item_table, item_name_to_id
+from ..polling import POLL_NORMAL
+from .fake_client import make_client, received_items_ctx, apply_received_items
+
+BACKLOG = 500
+
+
+async def main() -> None:
+    random.seed(0)
+    ids = [item_name_to_id[name] for name in item_table]
+    items = [random.choice(ids) for _ in range(BACKLOG)]
+
+    # before: at most 4 items were applied per tick
+    client, ram = make_client()
+    ctx = received_items_ctx([])
+    ticks = 0
+    start = time.perf_counter()
+    for end in range(4, BACKLOG + 4, 4):
+        ctx.items_received = received_items_ctx(items[:end]).items_received
+        await apply_received_items(client, ctx)
+        ticks += 1
+    four_per_tick = time.perf_counter() - start
+    four_per_tick_ram = bytes(ram.ram)
+    print(f"4 items per tick: {ticks} ticks (~{ticks * POLL_NORMAL:.0f}s of polling), {ram.reads} reads, {ram.writes} writes, {four_per_tick * 1000:.1f} ms")
+
+    # after: the whole backlog in one tick
+    client, ram = make_client()
+    ctx = received_items_ctx(items)
+    start = time.perf_counter()
+    await apply_received_items(client, ctx)
+    bulk = time.perf_counter() - start
+    print(f"bulk apply:       1 tick, {ram.reads} reads, {ram.writes} writes, {bulk * 1000:.1f} ms")
+    print(f"same RAM afterwards: {four_per_tick_ram == bytes(ram.ram)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
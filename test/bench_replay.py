@@ -0,0 +1,155 @@
+"""Replays the progression traces in test/traces through BFMClient.calc_connections without BizHawk. Reports
+recalculations per second and per area latency and compares the output with the golden file next to each trace.
+Run from the Archipelago folder with: python -m worlds.bfm.test.bench_replay [--generate] [--update-golden] [trace ...]
+--generate writes the synthetic chapter 2-6 traces again, --update-golden stores the current output as golden.
+A trace recorded in game with /trace_progression can be passed by path."""
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Tuple
+
+from ..client import BFMClient
+from ..items import item_name_to_id
+from ..locations import standard_location_name_to_id
+from ..portals import bfm_portals
+from ..progression_state import completed_progression_flags, progression_state_table
+from ..progression_trace import TraceWriter, read_trace, replay, percentile, diff_outputs
+
+TRACE_DIR = os.path.join(os.path.dirname(__file__), "traces")
+TICKS = 120
+
+#game_state segment sizes as read by BFMClient.plan_tick_reads
+SEGMENT_SIZES = [1, 9, 2, 5, 43, 1, 1, 1, 1, 1, 1, 1, 4, 4, 4, 4, 2, 24, 2, 12, 1, 1, 4, 1, 2, 2, 3, 1, 1, 1]
+
+#chapter: (first progression state, state the chapter ends at, town, slot options that differ from the defaults)
+CHAPTERS: Dict[int, Tuple[int, int, int, dict]] = {
+    2: (0x000a, 0x00c8, 0x1010, {"playthrough_method": 1}),
+    3: (0x00c8, 0x0258, 0x1052, {"quest_item_sanity": False}),
+    4: (0x0258, 0x0398, 0x1077, {"skip_minigame_town_on_fire": True}),
+    5: (0x0398, 0x04b0, 0x1094, {"bakery_sanity": False, "grocery_sanity": False}),
+    6: (0x04b0, 0x064a, 0x1094, {"sky_scroll_logic": 3, "wind_scroll_logic": 3}),
+}
+
+DEFAULT_SLOT_DATA = {"set_lang": 1, "playthrough_method": 2, "quest_item_sanity": True, "scroll_sanity": True, "lumina_randomzied": True,
+                     "bakery_sanity": True, "grocery_sanity": True, "grocery_sanity_heal_logic": True, "skip_minigame_town_on_fire": False,
+                     "sky_scroll_logic": 2, "wind_scroll_logic": 2}
+
+TRACE_LOCATIONS = ["Handle #1 - Steamwood 2", "Handle #4 - Steamwood 2", "Handle #8 - Steamwood 2", "Well H20 - Grillin Village", "Key from Wid - Grillin Village",
+                   "Misteria - Misteria Underground Lake", "Ugly Belt - Restaurant Basement", "Mrs Govern's Pie - Grillin Village"]
+INVENTORY = [0x4d, 0x56, 0x58, 0x59, 0x5b, 0x5c, 0x5d, 0x5f, 0x67, 0x6c]
+
+
+def trace_path(name: str) -> str:
+    return os.path.join(TRACE_DIR, name + ".jsonl")
+
+
+def golden_path(path: str) -> str:
+    return path[:-len(".jsonl")] + ".golden.jsonl"
+
+
+def set_completed_flags(game_state: List[bytearray], last_state: int) -> None:
+    """Sets the flag of every progression state up to last_state"""
+    for segment, byte, mask, states in completed_progression_flags:
+        if(max(states) <= last_state):
+            game_state[segment][byte] |= mask
+
+
+def generate(chapter: int) -> str:
+    """Random walk through the connections of bfm_portals while the progression state moves through the chapter"""
+    rng = random.Random(chapter)
+    first, last, town, options = CHAPTERS[chapter]
+    slot_data = dict(DEFAULT_SLOT_DATA, **options)
+    states = [state for state in sorted(progression_state_table) if first <= state < last]
+    game_state = [bytearray(size) for size in SEGMENT_SIZES]
+    set_completed_flags(game_state, first)
+    game_state[27][0] = 3 if chapter == 2 else 10 #Geezer
+    if(chapter >= 4):
+        game_state[18][:] = (0x1052).to_bytes(2, 'little')
+    item_ids = list(item_name_to_id.values())
+    received = [rng.choice(item_ids) for _ in range(20 * (chapter - 1))]
+    checked = set()
+    manual = set()
+    location = town
+    state = first
+    path = trace_path("chapter%s" % chapter)
+    writer = TraceWriter(open(path, "w"), slot_data)
+    for _ in range(TICKS):
+        destinations = [connection.destination for connection in bfm_portals[location].connections if connection.destination in bfm_portals]
+        location = rng.choice(destinations) if len(destinations) > 0 and rng.random() < 0.9 else town
+        if(rng.random() < 0.15 and state < states[-1]):
+            state = states[states.index(state) + 1]
+            set_completed_flags(game_state, state)
+            if(state in (0x0d2, 0x136, 0x186, 0x280, 0x294, 0x2b2, 0x2bc, 0x2c6, 0x2e4, 0x3ac, 0x3b6, 0x3c0, 0x47e, 0x488, 0x492)):
+                manual.add(state)
+        if(rng.random() < 0.3):
+            received.append(rng.choice(item_ids))
+        if(rng.random() < 0.1):
+            checked.add(standard_location_name_to_id[rng.choice(TRACE_LOCATIONS)])
+        if(rng.random() < 0.1):
+            game_state[19][rng.randrange(12)] = rng.choice(INVENTORY)
+        if(rng.random() < 0.1):
+            game_state[17][rng.randrange(24)] |= 1 << rng.randrange(8)
+        game_state[16][:] = state.to_bytes(2, 'little')
+        game_state[25][:] = location.to_bytes(2, 'little')
+        writer.record(location, state, game_state, received, checked, manual)
+    writer.close()
+    return path
+
+
+def load(path: str):
+    with open(path) as file:
+        return read_trace(iter(file))
+
+
+def main() -> None:
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if("--generate" in sys.argv):
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        paths = [generate(chapter) for chapter in CHAPTERS]
+    elif(len(args) > 0):
+        paths = args
+    else:
+        paths = sorted(os.path.join(TRACE_DIR, name) for name in os.listdir(TRACE_DIR) if name.endswith(".jsonl") and not name.endswith(".golden.jsonl"))
+    update_golden = "--update-golden" in sys.argv or "--generate" in sys.argv
+
+    latencies: Dict[int, List[float]] = {}
+    calls = 0
+    total = 0.0
+    failed = False
+    for path in paths:
+        slot_data, ticks = load(path)
+        result = replay(BFMClient(), slot_data, ticks)
+        calls += len(ticks)
+        total += result.total
+        for location, values in result.latencies.items():
+            latencies.setdefault(location, []).extend(values)
+        if(update_golden):
+            with open(golden_path(path), "w") as file:
+                file.writelines(json.dumps(output) + "\n" for output in result.outputs)
+            print(f"{os.path.basename(path)}: {len(ticks)} recalculations, golden written")
+            continue
+        if(not os.path.exists(golden_path(path))):
+            print(f"{os.path.basename(path)}: {len(ticks)} recalculations, no golden file")
+            continue
+        with open(golden_path(path)) as file:
+            golden = [json.loads(line) for line in file if line.strip() != ""]
+        differences = diff_outputs(golden, result.outputs)
+        failed = failed or len(differences) > 0
+        print(f"{os.path.basename(path)}: {len(ticks)} recalculations, {len(differences)} differ from golden")
+        for difference in differences[:10]:
+            print("  " + difference)
+
+    every = [value for values in latencies.values() for value in values]
+    print(f"{calls} recalculations, {calls / total:.0f} per second")
+    print(f"latency p50 {percentile(every, 0.5) * 1e6:.1f} us, p95 {percentile(every, 0.95) * 1e6:.1f} us, p99 {percentile(every, 0.99) * 1e6:.1f} us")
+    print("slowest areas by p95:")
+    for location in sorted(latencies, key=lambda location: percentile(latencies[location], 0.95), reverse=True)[:5]:
+        values = latencies[location]
+        print(f"  {hex(location)} {bfm_portals[location].region}: {len(values)} calls, p50 {percentile(values, 0.5) * 1e6:.1f} us, p95 {percentile(values, 0.95) * 1e6:.1f} us")
+    if(failed):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark of a 12 row grocery screen where every item is bought one at a time, the cursor going over every row
+after each purchase. Run from the Archipelago folder with: python -m worlds.bfm.test.bench_shop_dialog"""
+import random
+import time
+from typing import List, Tuple
+
+from ..items import item_table, jp_item_name_to_id
+from ..jp_text import jp_encoder, PAD
+from ..shop_dialog import ShopDialog, PURCHASED
+
+ROWS = 12
+ROUNDS = 200
+
+
+def fix_dialog(text: List[str]) -> None:
+    #the padding before ShopDialog, items and players alternate in text
+    if(len(text)>0):
+        line_1_max = 0
+        line_2_max = 0
+        for i in range(len(text)):
+            if(i%2 == 1):
+                if(len(text[i])>line_1_max):
+                    line_1_max = len(text[i])
+            if(i%2 == 0):
+                if(len(text[i])>line_2_max):
+                    line_2_max = len(text[i])
+        for i in range(len(text)):
+            if(i%2 == 1):
+                if(len(text[i])<line_1_max):
+                    for _ in range(line_1_max - len(text[i])):
+                        text[i] = text[i] + " "
+            if(i%2 == 0):
+                if(len(text[i])<line_2_max):
+                    for _ in range(line_2_max - len(text[i])):
+                        text[i] = text[i] + " "
+
+
+def assemble_binary_array_for_dialog(s1: str, s2: str, jp_version: bool) -> bytes:
+    result: List[int] = [0x01, 0x02]
+    if(jp_version == False):
+        result.extend(s1.encode("utf-8"))
+        result.extend([0x01, 0x01, 0x0a])
+        result.extend("for ".encode("utf-8"))
+        result.extend(s2.encode("utf-8"))
+    else:
+        result.extend(jp_encoder.encode(s1, PAD))
+        result.extend([0x01, 0x01, 0x0a])
+        result.extend(jp_encoder.encode(s2, PAD))
+    result.append(0x00)
+    if(len(result) < 49):
+        return bytes(result)
+    return bytes(result[:47] + [0x00])
+
+
+def shop_with_lists(rows: List[Tuple[str, str]], jp_version: bool) -> List[bytes]:
+    text: List[str] = []
+    for item, player in rows:
+        text = text + [item, player]
+    fix_dialog(text)
+    written = []
+    for bought in range(len(rows)):
+        text[bought*2] = PURCHASED[jp_version]
+        fix_dialog(text)
+        written += [assemble_binary_array_for_dialog(text[row*2], text[row*2+1], jp_version) for row in range(len(rows))]
+    return written
+
+
+def shop_with_model(rows: List[Tuple[str, str]], jp_version: bool) -> List[bytes]:
+    dialog = ShopDialog()
+    for item, player in rows:
+        dialog.add(item, player)
+    written = []
+    for bought in range(len(rows)):
+        dialog.set_item(bought, PURCHASED[jp_version])
+        written += [bytes(dialog.row(row, jp_version)) for row in range(len(rows))]
+    return written
+
+
+def main() -> None:
+    rng = random.Random(0)
+    players = ["Musashi", "Another Player", "P3"]
+    for jp_version, names in ((False, list(item_table)), (True, list(jp_item_name_to_id))):
+        shops = [[(rng.choice(names), rng.choice(players)) for _ in range(ROWS)] for _ in range(ROUNDS)]
+        same = all(shop_with_lists(rows, jp_version) == shop_with_model(rows, jp_version) for rows in shops)
+        start = time.perf_counter()
+        for rows in shops:
+            shop_with_lists(rows, jp_version)
+        lists = time.perf_counter() - start
+        start = time.perf_counter()
+        for rows in shops:
+            shop_with_model(rows, jp_version)
+        model = time.perf_counter() - start
+        print(f"{'jp' if jp_version else 'en'}: {ROUNDS} shops of {ROWS} rows, same bytes: {same}")
+        print(f"  fix_dialog and assemble: {lists / ROUNDS * 1000:.3f} ms per shop")
+        print(f"  ShopDialog:              {model / ROUNDS * 1000:.3f} ms per shop ({lists / model:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""A BFMClient whose RAM reads and writes go to a bytearray instead of BizHawk, shared by the tests and benchmarks"""
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Iterator, List, Tuple
+from unittest.mock import patch
+
+from NetUtils import NetworkItem
+import worlds._bizhawk as bizhawk
+
+from ..address_map import AddressMap
+from ..client import BFMClient
+from ..dialog_cache import DialogCache
+from ..received_items import ReceivedItemIndex
+
+RECEIVED_ITEMS_SLOT_DATA = {"set_lang": 1, "grocery_s_revive": True, "playthrough_method": 2, "quest_item_sanity": True, "core_sanity": True,
+                            "toy_sanity": True, "level_bundles": 30, "stat_gain_modifier": 1, "starting_hp": 100, "starting_bp": 100, "bp_bundles": 10}
+
+#the slot data fill_slot_data gives for the default options
+DEFAULT_SLOT_DATA = {"version": "0.0.0", "set_lang": 1, "playthrough_method": 1, "skip_over_bosses": 0, "goal": 8, "npc_goal": 20, "guardian_goal": 3,
+                     "force_soda_fountain_last": 1, "starting_hp": 150, "starting_bp": 150, "max_hp_logic": 400, "deathlink": 0, "hair_color": "B751A7",
+                     "lumina_randomzied": 0, "bakery_sanity": 0, "restaurant_sanity": 0, "grocery_sanity": 0, "grocery_s_revive": 0, "grocery_sanity_heal_logic": 1,
+                     "toy_sanity": 0, "tech_sanity": 0, "scroll_sanity": 0, "wind_scroll_logic": 1, "sky_scroll_logic": 1, "core_sanity": 0, "level_sanity": 0,
+                     "level_bundles": 29, "stat_gain_modifier": 2, "xp_gain": 6, "xp_gain_mind": 1, "quest_item_sanity": 0, "bp_sanity": 0, "bp_bundles": 41,
+                     "early_skullpion": 0, "boulder_chase_zoom": 2, "leno_sniff_modifier": 80, "skip_minigame_follow_leno": 0, "raft_hp": 4, "raft_difficulty": 1,
+                     "raft_regrow": 20, "steamwood_timer": 50, "steamwood_valve_timer": 130, "steamwood_disable_countdown": 0, "steamwood_number_valves": 8,
+                     "steamwood_random_valves": 0, "steamwood_pressure_rise_rate": 4, "steamwood_progress_lost": -8, "steamwood_width_of_ok_pressure": 18,
+                     "steamwood_valve_progress_modifier": 100, "steamwood_no_fail_over_pressure": 0, "steamwood_elevator_logic": 2, "aqualin_timer": 50,
+                     "restaurant_teleport_maze_no_fail": 1, "church_fight_time_modifier": 100, "skip_minigame_town_on_fire": 0, "skip_to_frozen_palace": 1,
+                     "skip_minigame_ant_gondola": 0, "skip_over_calendar_maze": 0, "topo_dance_battle_logic": 1, "soda_fountain_boss_rush": 0, "message_level": 0,
+                     "fast_walk": 0}
+
+
+class FakeRAM:
+    """Stands in for the emulator, counts the calls that would each be a round trip to BizHawk and remembers when the
+    last write happened"""
+
+    def __init__(self):
+        self.ram = bytearray(0x200000)
+        self.reads = 0
+        self.writes = 0
+        self.last_write = 0.0
+        self.failing_writes = 0 #writes that raise RequestFailedError, as when the connector stops answering
+
+    async def read_ram(self, ctx, reads: List[Tuple[int, int, str]]) -> List[bytes]:
+        self.reads += 1
+        return [bytes(self.ram[address:address + size]) for address, size, _ in reads]
+
+    async def write_ram(self, ctx, writes) -> None:
+        if(self.failing_writes > 0):
+            self.failing_writes -= 1
+            raise bizhawk.RequestFailedError("fake connector did not answer")
+        self.writes += 1
+        for address, data, _ in writes:
+            self.ram[address:address + len(data)] = bytes(data)
+        self.last_write = time.perf_counter()
+
+    def read_int(self, address: int, size: int) -> int:
+        return int.from_bytes(self.ram[address:address + size], byteorder='little')
+
+
+def make_client(jp_version: bool = False) -> Tuple[BFMClient, FakeRAM]:
+    """A client with the state validate_rom and game_watcher would set up, the lists are its own rather than the class defaults"""
+    client = BFMClient()
+    client.jp_version = jp_version
+    client.address = AddressMap(jp_version)
+    client.message_level = 0
+    client.received_count = 0
+    client.bakery_inventory_expansion = []
+    client.chapter3_items = []
+    client.chapter4_items = []
+    client.chapter5_items = []
+    client.completed_progression = set()
+    client.received_items = ReceivedItemIndex()
+    client.dialog_cache = DialogCache()
+    ram = FakeRAM()
+    client.read_ram = ram.read_ram
+    client.write_ram = ram.write_ram
+    return client, ram
+
+
+def received_items_ctx(items: List[int], **slot_options):
+    """A context that has received items, in order"""
+    slot_data = dict(RECEIVED_ITEMS_SLOT_DATA, **slot_options)
+    return SimpleNamespace(slot_data=slot_data, items_received=[NetworkItem(item_id, 0, 1, 0) for item_id in items])
+
+
+async def apply_received_items(client: BFMClient, ctx) -> None:
+    """What game_watcher does when items came in: index them and apply the new ones, every toy was bought and waits for its item"""
+    client.received_items.sync(ctx.items_received)
+    await client.apply_received_items(ctx, client.received_items, bytes(43), [False] * 30, [True] * 30)
+
+
+async def ignore(*args, **kwargs) -> None:
+    pass
+
+
+def watcher_ctx(**slot_options):
+    """A context connected to a slot with the default options, nothing received or checked yet"""
+    async def check_locations(locations) -> None:
+        ctx.checked_locations |= set(locations)
+        ctx.missing_locations -= set(locations)
+    ctx = SimpleNamespace(slot_data=dict(DEFAULT_SLOT_DATA, **slot_options), items_received=[], checked_locations=set(), missing_locations=set(),
+                          locations_info={}, server=SimpleNamespace(socket=SimpleNamespace(closed=False)), bizhawk_ctx=None, slot=1, team=0,
+                          username="Musashi", player_names={1: "Musashi"}, tags=set(), finished_game=False, watcher_timeout=0.5, last_death_link=0.0,
+                          check_locations=check_locations, send_msgs=ignore, update_death_link=ignore, send_death=ignore)
+    return ctx
+
+
+@contextmanager
+def emulator(client: BFMClient, ram: FakeRAM) -> Iterator[None]:
+    """game_watcher's reads and writes go through its read plan and write buffer, BizHawk is answered from ram"""
+    vars(client).pop("read_ram", None)
+    vars(client).pop("write_ram", None)
+    with patch.object(bizhawk, "read", ram.read_ram), patch.object(bizhawk, "write", ram.write_ram), patch.object(bizhawk, "display_message", ignore):
+        yield
@@ -0,0 +1,37 @@
+import unittest
+
+from ..dialog_cache import AreaDialog, TEXTBOX, SHORT_TEXTBOX, BOSS_TEXTBOX, TOYSHOP, TEXTBOX_SIZE, SHORT_TEXTBOX_SIZE
+from ..store_info import toy_shop_dialog_length
+
+
+class TestAreaDialog(unittest.TestCase):
+    def test_fitting_dialog_is_unchanged(self) -> None:
+        dialog = AreaDialog()
+        dialog.add(0x191b3c, bytearray(b"a" * (TEXTBOX_SIZE - 1) + b"\x00"), TEXTBOX)
+        dialog.add(0x1913b0, bytearray(b"b" * (SHORT_TEXTBOX_SIZE - 1) + b"\x00"), SHORT_TEXTBOX)
+        self.assertEqual(len(dialog), 2)
+        self.assertEqual(dialog.cut, [])
+        self.assertEqual(len(dialog.writes[0][1]), TEXTBOX_SIZE)
+        self.assertEqual(len(dialog.writes[1][1]), SHORT_TEXTBOX_SIZE)
+
+    def test_long_dialog_is_cut_to_its_slot(self) -> None:
+        """Text that would run past its slot is cut and still ends with 0, boss textboxes are cut to their exact length"""
+        dialog = AreaDialog()
+        dialog.add(0x1913b0, bytearray(b"b" * 80), SHORT_TEXTBOX)
+        dialog.add(0x100000, bytearray(b"c" * 200), TOYSHOP, toy_shop_dialog_length[0][1])
+        dialog.add(0x191624, bytearray(b"d" * 100), BOSS_TEXTBOX, 78)
+        self.assertEqual(dialog.cut, [0x1913b0, 0x100000, 0x191624])
+        short, toy, boss = [data for _, data, _ in dialog.writes]
+        self.assertEqual(len(short), SHORT_TEXTBOX_SIZE)
+        self.assertEqual(short[-1], 0)
+        self.assertEqual(len(toy), toy_shop_dialog_length[0][1])
+        self.assertEqual(toy[-1], 0)
+        self.assertEqual(bytes(boss), b"d" * 78)
+
+    def test_rendered_toy_shop_dialog_fits(self) -> None:
+        """render_toyshop cuts to max_len bytes ending with 0, which is what its slot has room for"""
+        dialog = AreaDialog()
+        for i, max_len in enumerate(toy_shop_dialog_length[0]):
+            dialog.add(0x100000 + i * 0x100, bytearray(b"\x02\x00\x00\x01\x02" + b"e" * (max_len - 6) + b"\x00"), TOYSHOP, max_len)
+        self.assertEqual(dialog.cut, [])
+        self.assertEqual([len(data) for _, data, _ in dialog.writes], toy_shop_dialog_length[0])
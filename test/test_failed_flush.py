@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from .fake_client import FakeRAM, make_client, watcher_ctx, emulator
+
+
+class TestFailedFlush(unittest.TestCase):
+    """A tick whose write flush fails is put back, the next tick queues the same writes again"""
+
+    def setUp(self) -> None:
+        self.client, self.ram = make_client()
+        self.address = self.client.address
+        self.ram.ram[self.address.main_menu] = 0x0b #in game
+        self.ram.ram[self.address.current_location:self.address.current_location + 2] = (0x1010).to_bytes(2, "little")
+
+    def run_ticks(self, ctx, *failing: bool, before_tick=None) -> None:
+        async def ticks() -> None:
+            with emulator(self.client, self.ram):
+                for i, fail in enumerate(failing):
+                    if(before_tick is not None):
+                        before_tick(i)
+                    self.ram.failing_writes = int(fail)
+                    self.ram.ram[self.address.steps] += 1
+                    await self.client.game_watcher(ctx)
+        asyncio.run(ticks())
+
+    def portal_table(self, ram: FakeRAM) -> bytes:
+        return bytes(ram.ram[self.address.portal_table:self.address.portal_states + 0x40])
+
+    def test_connection_recalculation_is_written_again(self) -> None:
+        def ask_for_connections(i: int) -> None:
+            if(i == 1):
+                self.client.try_to_update_connections = True #as a new bakery item or the chapter 2 upper town does
+        self.run_ticks(watcher_ctx(), False, True, before_tick=ask_for_connections)
+        self.assertEqual(self.ram.ram[self.address.portal_table + 1], 0) #the recalculation never reached RAM
+        self.assertTrue(self.client.try_to_update_connections)
+        self.run_ticks(watcher_ctx(), False)
+        written = self.portal_table(self.ram)
+
+        self.setUp()
+        self.run_ticks(watcher_ctx(), False, False, before_tick=ask_for_connections)
+        self.assertNotEqual(self.ram.ram[self.address.portal_table + 1], 0)
+        self.assertEqual(written, self.portal_table(self.ram))
+
+    def test_lumina_removal_is_written_again(self) -> None:
+        self.ram.ram[self.address.lumina] = 0b1
+        self.ram.ram[self.address.equipped_lumina] = 0b1
+        ctx = watcher_ctx(lumina_randomzied=1)
+        self.run_ticks(ctx, False, True) #the first tick only notes the step count
+        self.assertEqual(self.ram.ram[self.address.lumina], 0b1)
+        self.assertEqual(self.client.check_if_lumina_needs_removed, 1)
+        self.run_ticks(ctx, False)
+        self.assertEqual(self.ram.ram[self.address.lumina], 0)
+        self.assertEqual(self.ram.ram[self.address.equipped_lumina], 0)
+        self.assertEqual(self.client.check_if_lumina_needs_removed, 0)
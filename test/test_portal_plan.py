@@ -0,0 +1,66 @@
+import unittest
+
+from ..portal_plan import PortalPlan, PortalPlanCache, code_patch_writes, PORTAL_TABLE_SIZE
+from ..write_buffer import MAIN_RAM
+
+TABLE = 0x075400
+STATES = 0x075422
+
+
+def plan(area: int = 0x1010, destinations: bytes = b"\x10\x11", fixes=((0x18e096, b"\x01"),)) -> PortalPlan:
+    return PortalPlan(area, b"\x02" + destinations + b"\x00", bytes(len(destinations) * 2), fixes)
+
+
+def ram_holding(portal_plan: PortalPlan) -> bytearray:
+    """The table and states as read back after portal_plan was written"""
+    ram = bytearray(PORTAL_TABLE_SIZE + len(portal_plan.states))
+    ram[:len(portal_plan.table)] = portal_plan.table
+    ram[STATES - TABLE:STATES - TABLE + len(portal_plan.states)] = portal_plan.states
+    return ram
+
+
+class TestPortalPlanCache(unittest.TestCase):
+    def test_first_plan_is_written(self) -> None:
+        cache = PortalPlanCache()
+        portal_plan = plan()
+        writes = cache.writes(portal_plan, TABLE, STATES, bytearray(PORTAL_TABLE_SIZE + 0x40), False)
+        self.assertEqual(writes, [(TABLE, portal_plan.table, MAIN_RAM), (STATES, portal_plan.states, MAIN_RAM), (0x18e096, b"\x01", MAIN_RAM)])
+        self.assertEqual((cache.written, cache.skipped), (1, 0))
+
+    def test_same_plan_in_ram_only_acknowledges_the_zone_load(self) -> None:
+        cache = PortalPlanCache()
+        portal_plan = plan()
+        cache.writes(portal_plan, TABLE, STATES, None, False)
+        self.assertEqual(cache.writes(portal_plan, TABLE, STATES, ram_holding(portal_plan), False), [(TABLE, b"\x02", MAIN_RAM)])
+        self.assertEqual((cache.written, cache.skipped), (1, 1))
+
+    def test_table_changed_in_ram_is_written_again(self) -> None:
+        cache = PortalPlanCache()
+        portal_plan = plan()
+        cache.writes(portal_plan, TABLE, STATES, None, False)
+        ram = ram_holding(portal_plan)
+        ram[1] = 0x20 #another area's destinations
+        writes = cache.writes(portal_plan, TABLE, STATES, ram, False)
+        self.assertEqual(writes[:2], [(TABLE, portal_plan.table, MAIN_RAM), (STATES, portal_plan.states, MAIN_RAM)])
+        self.assertEqual(writes[2:], [])
+
+    def test_fixes_are_written_again_when_the_zone_loads_or_the_area_changes(self) -> None:
+        cache = PortalPlanCache()
+        portal_plan = plan()
+        cache.writes(portal_plan, TABLE, STATES, None, False)
+        self.assertIn((0x18e096, b"\x01", MAIN_RAM), cache.writes(portal_plan, TABLE, STATES, ram_holding(portal_plan), True))
+        other = plan(area=0x1052)
+        self.assertIn((0x18e096, b"\x01", MAIN_RAM), cache.writes(other, TABLE, STATES, ram_holding(other), False))
+
+    def test_reset_writes_the_whole_plan_again(self) -> None:
+        """After a dropped flush the last plan never reached RAM, its fixes can't be checked against RAM so they are written again"""
+        cache = PortalPlanCache()
+        portal_plan = plan()
+        first = cache.writes(portal_plan, TABLE, STATES, None, False)
+        cache.reset()
+        self.assertEqual(cache.writes(portal_plan, TABLE, STATES, ram_holding(portal_plan), False), first)
+
+    def test_code_patches_already_in_ram_are_skipped(self) -> None:
+        patches = [(0x15a7e4, b"\xa0\xff"), (0x13f430, b"\x06\x01")]
+        self.assertEqual(code_patch_writes(patches, [b"\xa0\xff", b"\x00\x00"]), [(0x13f430, b"\x06\x01", MAIN_RAM)])
+        self.assertEqual(code_patch_writes(patches, [None, b"\x06\x01"]), [(0x15a7e4, b"\xa0\xff", MAIN_RAM)])
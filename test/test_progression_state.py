@@ -0,0 +1,40 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+from ..progression_state import CompletedProgressionTracker, calc_completed_progression_state
+from .bench_replay import TRACE_DIR, load
+
+
+def trace_paths():
+    return [os.path.join(TRACE_DIR, name) for name in sorted(os.listdir(TRACE_DIR)) if name.endswith(".jsonl") and not name.endswith(".golden.jsonl")]
+
+
+class TestCompletedProgressionTracker(unittest.TestCase):
+    def assert_same_as_full(self, tracker: CompletedProgressionTracker, slot_data: dict, tick) -> None:
+        ctx = SimpleNamespace(slot_data=slot_data, checked_locations=tick.checked)
+        self.assertEqual(tracker.update(ctx, tick.game_state), calc_completed_progression_state(ctx, tick.game_state, as_mask=True))
+
+    def test_traces_match_full_evaluation(self) -> None:
+        """Every tick of the traces in test/traces gives the mask calc_completed_progression_state gives"""
+        for path in trace_paths():
+            with self.subTest(trace=os.path.basename(path)):
+                slot_data, ticks = load(path)
+                tracker = CompletedProgressionTracker()
+                for tick in ticks:
+                    self.assert_same_as_full(tracker, slot_data, tick)
+                self.assertEqual(tracker.full_updates, 1)
+
+    def test_slot_data_change(self) -> None:
+        """The options the table depends on change halfway through the trace, as on connecting to another slot"""
+        for path in trace_paths():
+            with self.subTest(trace=os.path.basename(path)):
+                slot_data, ticks = load(path)
+                other = dict(slot_data, quest_item_sanity=not slot_data["quest_item_sanity"], playthrough_method=3 - slot_data["playthrough_method"])
+                tracker = CompletedProgressionTracker()
+                half = len(ticks) // 2
+                for tick in ticks[:half]:
+                    self.assert_same_as_full(tracker, slot_data, tick)
+                for tick in ticks[half:]:
+                    self.assert_same_as_full(tracker, other, tick)
+                self.assertEqual(tracker.full_updates, 2)
@@ -0,0 +1,74 @@
+import asyncio
+import math
+import random
+import unittest
+
+from ..items import item_table, item_name_to_id
+from .fake_client import make_client, received_items_ctx, apply_received_items
+
+
+class TestReceivedItems(unittest.TestCase):
+    def apply(self, items, **slot_options):
+        client, ram = make_client()
+        ctx = received_items_ctx(items, **slot_options)
+        asyncio.run(apply_received_items(client, ctx))
+        return client, ram
+
+    def test_backlog_in_one_tick_matches_four_items_per_tick(self) -> None:
+        """The bulk path leaves RAM as applying the backlog 4 items at a time did, in fewer round trips"""
+        rng = random.Random(0)
+        ids = [item_name_to_id[name] for name in item_table]
+        items = [rng.choice(ids) for _ in range(500)]
+
+        async def four_per_tick():
+            client, ram = make_client()
+            ctx = received_items_ctx([])
+            for end in range(4, len(items) + 4, 4):
+                ctx.items_received = received_items_ctx(items[:end]).items_received
+                await apply_received_items(client, ctx)
+            return client, ram
+        ticked, ticked_ram = asyncio.run(four_per_tick())
+        bulk, bulk_ram = self.apply(items)
+        self.assertEqual(bytes(bulk_ram.ram), bytes(ticked_ram.ram))
+        self.assertEqual(bulk.received_count, len(items))
+        self.assertLess(bulk_ram.reads + bulk_ram.writes, ticked_ram.reads + ticked_ram.writes)
+
+    def test_npc_rescues(self) -> None:
+        client, ram = self.apply([item_name_to_id["Guard"], item_name_to_id["Chef"], item_name_to_id["Chef"]])
+        self.assertEqual(ram.ram[item_name_to_id["Guard"]], 1)
+        self.assertEqual(ram.ram[item_name_to_id["Chef"]], 1)
+        self.assertEqual(ram.ram[client.address.guard] & 0x1, 0x1) #guard sent to twinpeak
+        self.assertEqual(ram.ram[item_name_to_id["Seer"]], 0)
+
+    def test_boons_add_money_once(self) -> None:
+        client, ram = make_client()
+        ram.ram[client.address.money:client.address.money + 4] = (500).to_bytes(4, 'little')
+        ram.ram[client.address.boons] = 1 #one boon was already paid out
+        ctx = received_items_ctx([item_name_to_id["1000 Drans"]] * 3)
+        asyncio.run(apply_received_items(client, ctx))
+        self.assertEqual(ram.read_int(client.address.money, 4), 700)
+        self.assertEqual(ram.ram[client.address.boons], 3)
+        asyncio.run(apply_received_items(client, ctx)) #nothing new received
+        self.assertEqual(ram.read_int(client.address.money, 4), 700)
+
+    def test_stat_ups(self) -> None:
+        received = 12
+        client, ram = self.apply([item_name_to_id["Body Stat Up"]] * received + [item_name_to_id["Mind Stat Up"]])
+        body = 4 + round(32 * math.sqrt(received / 30))
+        self.assertEqual(client.curr_body_stat, body)
+        self.assertEqual(ram.read_int(client.address.body_stat, 2), body) #current level
+        self.assertEqual(ram.read_int(client.address.body_stat + 16, 2), body) #next level
+        self.assertEqual(ram.read_int(client.address.mind_stat, 2), 6 + round(38 * math.sqrt(1 / 30)))
+        self.assertEqual(ram.read_int(client.address.fusion_stat, 2), 0)
+
+    def test_lumina_and_max_hp(self) -> None:
+        client, ram = self.apply([item_name_to_id["Lumina"], item_name_to_id["Longevity Berry"], item_name_to_id["Longevity Berry"]])
+        self.assertEqual(ram.ram[client.address.lumina] & 0x1, 0x1)
+        self.assertEqual(ram.read_int(client.address.max_hp, 2), 150)
+        self.assertEqual(ram.read_int(client.address.hp, 2), 150)
+
+    def test_s_revive_lowers_its_price(self) -> None:
+        client, ram = self.apply([item_name_to_id["S-Revive"]])
+        self.assertEqual(bytes(ram.ram[client.address.s_revive_price:client.address.s_revive_price + 4]), bytes([0x1e, 0, 0x1e, 0]))
+        client, ram = self.apply([item_name_to_id["S-Revive"]], grocery_s_revive=False)
+        self.assertEqual(ram.read_int(client.address.s_revive_price, 4), 0)
@@ -0,0 +1,21 @@
+import json
+import os
+import unittest
+
+from ..client import BFMClient
+from ..progression_trace import replay, diff_outputs
+from .bench_replay import TRACE_DIR, golden_path, load
+
+
+class TestReplayGolden(unittest.TestCase):
+    def test_traces_match_golden(self) -> None:
+        """Replays every trace in test/traces and compares the connection writes with the golden file"""
+        for name in sorted(os.listdir(TRACE_DIR)):
+            if(not name.endswith(".jsonl") or name.endswith(".golden.jsonl")):
+                continue
+            with self.subTest(trace=name):
+                path = os.path.join(TRACE_DIR, name)
+                slot_data, ticks = load(path)
+                with open(golden_path(path)) as file:
+                    golden = [json.loads(line) for line in file if line.strip() != ""]
+                self.assertEqual(diff_outputs(golden, replay(BFMClient(), slot_data, ticks).outputs), [])
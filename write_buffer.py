@@ -0,0 +1,65 @@
+from typing import Iterable, List, Tuple, Union
+
+MAIN_RAM: str = "MainRAM"
+
+
+class WriteBuffer:
+    """Collects the writes of one tick so they can be sent with a single bizhawk.write.
+    Adjacent and overlapping ranges are coalesced with the bytes enqueued later winning,
+    ranges keep the position of the first write that created them."""
+
+    def __init__(self, domain: str = MAIN_RAM):
+        self.domain = domain
+        self.ranges: List[Tuple[int, bytearray]] = []
+        self.writes = 0 #number of writes ever enqueued, lets a stage tell if it wrote anything
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def enqueue(self, address: int, data: Union[bytes, bytearray, Iterable[int]]) -> None:
+        data = bytearray(data)
+        if(len(data) == 0):
+            return
+        self.writes += 1
+        start = address
+        end = address + len(data)
+        merged: List[int] = []
+        for i, (range_start, range_data) in enumerate(self.ranges):
+            if(range_start <= end and start <= range_start + len(range_data)):
+                merged.append(i)
+        if(len(merged) == 0):
+            self.ranges.append((address, data))
+            return
+        for i in merged:
+            start = min(start, self.ranges[i][0])
+            end = max(end, self.ranges[i][0] + len(self.ranges[i][1]))
+        combined = bytearray(end - start)
+        for i in merged:
+            range_start, range_data = self.ranges[i]
+            combined[range_start - start:range_start - start + len(range_data)] = range_data
+        combined[address - start:address - start + len(data)] = data
+        self.ranges[merged[0]] = (start, combined)
+        for i in reversed(merged[1:]):
+            del self.ranges[i]
+
+    def overlay(self, address: int, data: bytes) -> bytes:
+        """Returns data read from the emulator at address with the still pending writes applied on top"""
+        end = address + len(data)
+        patched = None
+        for range_start, range_data in self.ranges:
+            range_end = range_start + len(range_data)
+            if(range_start < end and address < range_end):
+                if(patched is None):
+                    patched = bytearray(data)
+                low = max(address, range_start)
+                high = min(end, range_end)
+                patched[low - address:high - address] = range_data[low - range_start:high - range_start]
+        if(patched is None):
+            return data
+        return bytes(patched)
+
+    def pending(self) -> List[Tuple[int, bytes, str]]:
+        return [(address, bytes(data), self.domain) for address, data in self.ranges]
+
+    def clear(self) -> None:
+        self.ranges = []